@@ -36,7 +36,8 @@ def set_up_cruse_assistant(selected_agent):
     # Create session factory and agent session
     factory = AgentSessionFactory()
     session = factory.create_session(connection, agent_name, host, port, local_externals_direct, metadata)
-    sly_data = {"selected_agent": selected_agent, "agent_session": session}
+    # CallAgent talks to the selected agent through sessions of its own, taken from a shared pool
+    sly_data = {"selected_agent": selected_agent}
 
     # Initialize any conversation state here
     cruse_state_info = {
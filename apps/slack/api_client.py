@@ -14,23 +14,35 @@
 #
 # END COPYRIGHT
 
+import asyncio
+import json
 from typing import Any
+from typing import AsyncIterator
 
-from requests import get
-from requests import post
-from requests.exceptions import HTTPError
+import aiohttp
+from requests import Session
+
+# Seconds allowed between two chunks of a streaming_chat response before the call is abandoned
+STREAM_READ_TIMEOUT = 300
+# Maximum number of simultaneous connections to the neuro-san server; further calls wait for a free one
+DEFAULT_MAX_CONNECTIONS = 32
 
 
 class APIClient:
     """Handle API communication with neuro-san server."""
 
-    def __init__(self, port: str):
+    def __init__(self, port: str, max_connections: int = DEFAULT_MAX_CONNECTIONS):
         self.port = port
         self.base_url = f"http://localhost:{port}/api/v1"
+        self.max_connections = max_connections
+        # Pooled sessions keeping their connections open between calls: one for blocking calls such as "list",
+        # the other for the agent conversations run on an event loop
+        self.session = Session()
+        self._async_session: aiohttp.ClientSession | None = None
 
     def call(self, endpoint: str, payload: dict[str, Any] | None = None) -> dict[str, Any]:
         """
-        Make API call to endpoint.
+        Make blocking API call to endpoint.
 
         :param endpoint: Server endpoint
         :param payload: Request payload for HTTP POST
@@ -40,23 +52,70 @@ class APIClient:
         url = f"{self.base_url}/{endpoint}"
 
         if endpoint == "list":
-            response = get(url, timeout=30)
+            response = self.session.get(url, timeout=30)
         else:
-            response = post(url, json=payload, timeout=300)
+            response = self.session.post(url, json=payload, timeout=STREAM_READ_TIMEOUT)
 
         response.raise_for_status()
         return response.json()
 
-    def test_connection(self, network_name: str) -> bool:
+    async def stream(self, endpoint: str, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """
+        POST to a streaming endpoint and yield each message as soon as the server sends it.
+
+        :param endpoint: Server endpoint, e.g. "<network>/streaming_chat"
+        :param payload: Request payload
+
+        :return: Async iterator over the JSON messages of the response, one per line
+        """
+        session = self._get_async_session()
+        async with session.post(f"{self.base_url}/{endpoint}", json=payload) as response:
+            response.raise_for_status()
+            # Split the chunks into lines here, since the final message carries the whole chat_context
+            # and can be longer than the line length aiohttp's own line reader accepts
+            buffer = bytearray()
+            async for chunk in response.content.iter_any():
+                buffer.extend(chunk)
+                # Only the new chunk can hold the end of a line
+                end = buffer.rfind(b"\n", len(buffer) - len(chunk))
+                if end < 0:
+                    continue
+                for line in bytes(buffer[:end]).split(b"\n"):
+                    if line.strip():
+                        yield json.loads(line)
+                consumed = end + 1
+                del buffer[:consumed]
+            if buffer.strip():
+                yield json.loads(bytes(buffer))
+
+    async def test_connection(self, network_name: str) -> bool:
         """
-        Test if network exists.
+        Test if network exists, without waiting for the reply to the empty request.
 
         :param network_name: Name of the agent network to check connection
 
         :return: True if the connection is valid, False otherwise
         """
+        session = self._get_async_session()
         try:
-            self.call(f"{network_name}/streaming_chat", {})
-            return True
-        except HTTPError:
+            async with session.post(f"{self.base_url}/{network_name}/streaming_chat", json={}) as response:
+                return response.status < 400
+        except (aiohttp.ClientError, asyncio.TimeoutError):
             return False
+
+    async def close(self) -> None:
+        """Close the pooled connections of the async session."""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+
+    def _get_async_session(self) -> aiohttp.ClientSession:
+        """
+        :return: The async session, created on first use so it belongs to the event loop running the calls
+        """
+        if self._async_session is None:
+            self._async_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=STREAM_READ_TIMEOUT),
+            )
+        return self._async_session
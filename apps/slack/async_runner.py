@@ -0,0 +1,78 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import logging
+from concurrent.futures import Future
+from threading import Thread
+from typing import Any
+from typing import Coroutine
+
+
+class AsyncRunner:
+    """
+    Run coroutines on one event loop in a background thread.
+
+    Slack bolt calls its handlers on a small pool of worker threads. Handing the agent calls over to
+    this loop lets those threads return at once, while any number of conversations wait on the
+    neuro-san server concurrently.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = Thread(target=self._run, name="slack-async-runner", daemon=True)
+        self._thread.start()
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any], logger: Any = None) -> Future:
+        """
+        Schedule a coroutine on the loop without waiting for it.
+
+        :param coroutine: Coroutine to run
+        :param logger: Logger for an exception the coroutine raises, the module logger by default
+
+        :return: Future of the coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        future.add_done_callback(lambda done: self._log_exception(done, logger or logging.getLogger(__name__)))
+        return future
+
+    def run(self, coroutine: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+        """
+        Run a coroutine on the loop and wait for its result.
+
+        :param coroutine: Coroutine to run
+        :param timeout: Seconds to wait, None to wait for as long as it takes
+
+        :return: Result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(timeout)
+
+    def close(self) -> None:
+        """Stop the loop and wait for its thread to end."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+    def _run(self) -> None:
+        """Run the loop until close() is called."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    @staticmethod
+    def _log_exception(future: Future, logger: Any) -> None:
+        """Log the exception of a finished coroutine, which nothing else waits for."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Unhandled error in background task: {future.exception()}", exc_info=future.exception())
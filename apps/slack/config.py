@@ -23,3 +23,13 @@ load_dotenv()
 SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN")
 SLACK_APP_TOKEN = os.environ.get("SLACK_APP_TOKEN")
 NEURO_SAN_SERVER_HTTP_PORT = os.environ.get("NEURO_SAN_SERVER_HTTP_PORT", "8080")
+# Maximum number of agent calls open on the neuro-san server at the same time
+NEURO_SAN_MAX_CONNECTIONS = int(os.environ.get("NEURO_SAN_MAX_CONNECTIONS", "32"))
+# Minimum seconds between two updates of a reply while it streams in, within Slack's rate limit for chat.update
+SLACK_UPDATE_INTERVAL_SECONDS = float(os.environ.get("SLACK_UPDATE_INTERVAL_SECONDS", "1.0"))
+# SQLite file keeping the state of active threads across restarts; unset to keep it in memory only
+SLACK_STATE_DB = os.environ.get("SLACK_STATE_DB")
+# Limits of the thread state kept by the bot: idle seconds, number of threads and megabytes
+SLACK_THREAD_TTL_SECONDS = float(os.environ.get("SLACK_THREAD_TTL_SECONDS", str(7 * 24 * 3600)))
+SLACK_MAX_THREADS = int(os.environ.get("SLACK_MAX_THREADS", "10000"))
+SLACK_MAX_STATE_MB = float(os.environ.get("SLACK_MAX_STATE_MB", "256"))
@@ -14,48 +14,178 @@
 #
 # END COPYRIGHT
 
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import Any
+from typing import Callable
 
+from apps.slack.conversation_store import ConversationStore
 from apps.slack.dataclass.thread_context import ThreadContext
+from apps.slack.dataclass.thread_state import ThreadState
+
+# Seconds a thread is remembered after its last message
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_THREADS = 10000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
 
 
 class ConversationManager:
-    """Manage conversation contexts and thread data."""
+    """
+    Manage conversation contexts and thread data.
+
+    State is kept per Slack thread, least recently used first, so finding or clearing the contexts of a thread
+    does not depend on how many other threads there are. Threads idle for longer than ttl_seconds are forgotten,
+    as are the least recently used ones while there are more than max_threads of them or their states take
+    more than max_bytes. With a ConversationStore, the state of each thread is also kept on disk and loaded
+    again when the bot restarts.
+    """
 
-    def __init__(self):
-        self.contexts: dict[str, Any] = {}
-        self.networks: dict[str, str] = {}
-        self.sly_data: dict[str, dict[str, Any]] = {}
+    # pylint: disable=too-many-arguments,too-many-instance-attributes
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_threads: int = DEFAULT_MAX_THREADS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        store: ConversationStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param ttl_seconds: Seconds a thread is remembered after it was last used
+        :param max_threads: Maximum number of threads remembered
+        :param max_bytes: Maximum approximate memory used by the states of the threads
+        :param store: Optional store keeping the states on disk
+        :param clock: Source of the current time, in seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_threads = max_threads
+        self.max_bytes = max_bytes
+        self.store = store
+        self.clock = clock
+        self.threads: OrderedDict[str, ThreadState] = OrderedDict()
+        self.total_bytes = 0
+        self.evicted = 0
+        # Slack worker threads and the agent call loop use the manager at the same time
+        self._lock = threading.RLock()
+        if store is not None:
+            self.threads.update(store.load(self.clock() - ttl_seconds))
+            self.total_bytes = sum(state.size for state in self.threads.values())
+            self._evict()
 
     def get_network(self, thread_key: str) -> str | None:
         """Get network for a thread."""
-        return self.networks.get(thread_key)
+        with self._lock:
+            state = self._get_thread(thread_key)
+            return state.network if state else None
 
     def set_network(self, thread_key: str, network_name: str) -> None:
         """Set network for a thread."""
-        self.networks[thread_key] = network_name
+        with self._lock:
+            state = self._get_thread(thread_key, create=True)
+            state.network = network_name
+            self._save(thread_key, state)
 
     def get_sly_data(self, thread_key: str) -> dict[str, Any] | None:
         """Get sly_data for a thread."""
-        return self.sly_data.get(thread_key)
+        with self._lock:
+            state = self._get_thread(thread_key)
+            return state.sly_data if state else None
 
     def set_sly_data(self, thread_key: str, data: dict[str, Any]) -> None:
         """Set sly_data for a thread."""
-        self.sly_data[thread_key] = data
+        with self._lock:
+            state = self._get_thread(thread_key, create=True)
+            state.sly_data = data
+            self._save(thread_key, state)
 
     def get_context(self, conversation_key: str) -> dict[str, Any]:
         """Get conversation context."""
-        return self.contexts.get(conversation_key, {})
+        thread_key, network_name = self._split_conversation_key(conversation_key)
+        with self._lock:
+            state = self._get_thread(thread_key)
+            return state.contexts.get(network_name, {}) if state else {}
 
     def set_context(self, conversation_key: str, context: dict[str, Any]) -> None:
         """Set conversation context."""
-        self.contexts[conversation_key] = context
+        thread_key, network_name = self._split_conversation_key(conversation_key)
+        with self._lock:
+            state = self._get_thread(thread_key, create=True)
+            state.contexts[network_name] = context
+            self._save(thread_key, state)
 
     def clear_old_contexts(self, thread_ctx: ThreadContext, network_name: str, logger: Any) -> None:
         """Clear contexts from different networks in the same thread."""
-        prefix = f"{thread_ctx.channel_id}:{thread_ctx.conversation_thread}"
-        keys_to_delete = [k for k in self.contexts if k.startswith(prefix) and not k.endswith(f":{network_name}")]
+        with self._lock:
+            state = self._get_thread(thread_ctx.thread_key)
+            if not state:
+                return
+            old_networks = [name for name in state.contexts if name != network_name]
+            for name in old_networks:
+                del state.contexts[name]
+                logger.info(f"Cleared context for different network: {thread_ctx.thread_key}:{name}")
+            if old_networks:
+                self._save(thread_ctx.thread_key, state)
+
+    def stats(self) -> dict[str, int]:
+        """Get the number of threads remembered, the memory their states use and how many were evicted."""
+        with self._lock:
+            self._evict()
+            return {"threads": len(self.threads), "bytes": self.total_bytes, "evicted": self.evicted}
+
+    @staticmethod
+    def _split_conversation_key(conversation_key: str) -> tuple[str, str]:
+        """
+        :param conversation_key: "<channel>:<thread ts>:<network name>"
+
+        :return: Thread key and network name of the conversation
+        """
+        channel_id, thread_ts, network_name = conversation_key.split(":", 2)
+        return f"{channel_id}:{thread_ts}", network_name
+
+    def _get_thread(self, thread_key: str, create: bool = False) -> ThreadState | None:
+        """
+        Find the state of a thread and mark it as the most recently used. Caller holds the lock.
+
+        :param thread_key: Key of the thread
+        :param create: True to create the state if the thread is not remembered
+
+        :return: The state of the thread, None if it is not remembered and create is False
+        """
+        self._evict()
+        state = self.threads.get(thread_key)
+        if state is None:
+            if not create:
+                return None
+            state = self.threads[thread_key] = ThreadState()
+        self.threads.move_to_end(thread_key)
+        state.last_used = self.clock()
+        return state
+
+    def _save(self, thread_key: str, state: ThreadState) -> None:
+        """Account for the new size of a changed state, write it to the store and evict if over the limits."""
+        text = json.dumps(state.to_dict())
+        self.total_bytes += len(text) - state.size
+        state.size = len(text)
+        if self.store is not None:
+            self.store.save(thread_key, state, text)
+        self._evict()
 
-        for key in keys_to_delete:
-            del self.contexts[key]
-            logger.info(f"Cleared context for different network: {key}")
+    def _evict(self) -> None:
+        """Forget the least recently used threads while they are expired or over the limits. Caller holds the lock."""
+        expired_before = self.clock() - self.ttl_seconds
+        evicted = []
+        while self.threads:
+            thread_key, state = next(iter(self.threads.items()))
+            over_limits = len(self.threads) > self.max_threads or self.total_bytes > self.max_bytes
+            # The most recently used thread stays, whatever its size, as it is the one being answered
+            if state.last_used >= expired_before and (not over_limits or len(self.threads) == 1):
+                break
+            self.threads.popitem(last=False)
+            self.total_bytes -= state.size
+            evicted.append(thread_key)
+        if evicted:
+            self.evicted += len(evicted)
+            if self.store is not None:
+                self.store.delete(evicted)
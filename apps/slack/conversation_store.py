@@ -0,0 +1,88 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable
+
+from apps.slack.dataclass.thread_state import ThreadState
+
+
+class ConversationStore:
+    """
+    SQLite file keeping the state of active Slack threads, so a restarted bot carries on their conversations.
+
+    Each thread is one row, written whenever its state changes and deleted when it is evicted.
+    """
+
+    def __init__(self, db_file: str):
+        """
+        :param db_file: SQLite database file, created if missing
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(os.path.abspath(db_file)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_file, timeout=30.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS threads (thread_key TEXT PRIMARY KEY, last_used REAL NOT NULL, state TEXT)"
+            )
+
+    def load(self, since: float) -> dict[str, ThreadState]:
+        """
+        Read the threads used at or after a time, deleting the older ones.
+
+        :param since: Oldest last use time to keep, as returned by time.time()
+
+        :return: State per thread key, least recently used first
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM threads WHERE last_used < ?", (since,))
+            rows = self._connection.execute(
+                "SELECT thread_key, last_used, state FROM threads WHERE last_used >= ? ORDER BY last_used", (since,)
+            ).fetchall()
+        states = {}
+        for thread_key, last_used, text in rows:
+            states[thread_key] = ThreadState(**json.loads(text), last_used=last_used, size=len(text))
+        return states
+
+    def save(self, thread_key: str, state: ThreadState, text: str) -> None:
+        """
+        Write the state of a thread.
+
+        :param thread_key: Key of the thread
+        :param state: State of the thread
+        :param text: JSON form of the state, as returned by ThreadState.to_dict()
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO threads (thread_key, last_used, state) VALUES (?, ?, ?)",
+                (thread_key, state.last_used, text),
+            )
+
+    def delete(self, thread_keys: Iterable[str]) -> None:
+        """Delete the state of evicted threads."""
+        with self._lock:
+            self._connection.executemany("DELETE FROM threads WHERE thread_key = ?", [(key,) for key in thread_keys])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
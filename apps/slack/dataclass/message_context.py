@@ -19,6 +19,7 @@ from typing import Any
 
 # pylint: disable=import-error
 from slack_bolt import Say
+from slack_sdk import WebClient
 
 from apps.slack.dataclass.thread_context import ThreadContext
 
@@ -30,3 +31,5 @@ class MessageContext:
     thread_ctx: ThreadContext
     say: Say
     logger: Any
+    # Web API client, used to update a reply in place while it streams in
+    client: WebClient | None = None
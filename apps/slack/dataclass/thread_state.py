@@ -0,0 +1,36 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+
+@dataclass
+class ThreadState:
+    """Everything remembered about one Slack thread."""
+
+    network: str | None = None
+    sly_data: dict[str, Any] | None = None
+    # Chat context per network name
+    contexts: dict[str, Any] = field(default_factory=dict)
+    last_used: float = 0.0
+    # Approximate memory used by the state, the length of its JSON form
+    size: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the persisted fields of the state."""
+        return {"network": self.network, "sly_data": self.sly_data, "contexts": self.contexts}
@@ -21,11 +21,19 @@ from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
 
 from apps.slack.api_client import APIClient
+from apps.slack.async_runner import AsyncRunner
 from apps.slack.command_handler import CommandHandler
+from apps.slack.config import NEURO_SAN_MAX_CONNECTIONS
 from apps.slack.config import NEURO_SAN_SERVER_HTTP_PORT
 from apps.slack.config import SLACK_APP_TOKEN
 from apps.slack.config import SLACK_BOT_TOKEN
+from apps.slack.config import SLACK_MAX_STATE_MB
+from apps.slack.config import SLACK_MAX_THREADS
+from apps.slack.config import SLACK_STATE_DB
+from apps.slack.config import SLACK_THREAD_TTL_SECONDS
+from apps.slack.config import SLACK_UPDATE_INTERVAL_SECONDS
 from apps.slack.conversation_manager import ConversationManager
+from apps.slack.conversation_store import ConversationStore
 from apps.slack.event_handler import EventHandler
 from apps.slack.network_handler import NetworkHandler
 
@@ -36,9 +44,15 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(level
 app = App(token=SLACK_BOT_TOKEN)
 
 # Initialize dependencies
-conversation_manager = ConversationManager()
-api_client = APIClient(NEURO_SAN_SERVER_HTTP_PORT)
-network_handler = NetworkHandler(conversation_manager, api_client)
+conversation_manager = ConversationManager(
+    ttl_seconds=SLACK_THREAD_TTL_SECONDS,
+    max_threads=SLACK_MAX_THREADS,
+    max_bytes=int(SLACK_MAX_STATE_MB * 1024 * 1024),
+    store=ConversationStore(SLACK_STATE_DB) if SLACK_STATE_DB else None,
+)
+async_runner = AsyncRunner()
+api_client = APIClient(NEURO_SAN_SERVER_HTTP_PORT, NEURO_SAN_MAX_CONNECTIONS)
+network_handler = NetworkHandler(conversation_manager, api_client, async_runner, SLACK_UPDATE_INTERVAL_SECONDS)
 
 # Initialize and register handlers
 event_handlers = EventHandler(conversation_manager, network_handler)
@@ -54,7 +68,13 @@ def main():
         raise ValueError("NEURO_SAN_SERVER_HTTP_PORT required")
 
     print(f"Starting Slack bot on port {NEURO_SAN_SERVER_HTTP_PORT}")
-    SocketModeHandler(app, SLACK_APP_TOKEN).start()
+    try:
+        SocketModeHandler(app, SLACK_APP_TOKEN).start()
+    finally:
+        async_runner.run(api_client.close())
+        async_runner.close()
+        if conversation_manager.store is not None:
+            conversation_manager.store.close()
 
 
 if __name__ == "__main__":
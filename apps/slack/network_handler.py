@@ -14,23 +14,46 @@
 #
 # END COPYRIGHT
 
+import asyncio
 from json import dumps
 from typing import Any
 
-from requests.exceptions import RequestException
+import aiohttp
+
+# pylint: disable=import-error
+from slack_sdk.errors import SlackApiError
 
 from apps.slack.api_client import APIClient
+from apps.slack.async_runner import AsyncRunner
 from apps.slack.conversation_manager import ConversationManager
 from apps.slack.dataclass.message_context import MessageContext
 from apps.slack.dataclass.network_command import NetworkCommand
 
+PLACEHOLDER_TEXT = ":hourglass_flowing_sand: Working on it..."
+# Characters of a partial answer shown while the reply streams in
+MAX_PREVIEW_CHARS = 3000
+
 
 class NetworkHandler:
-    """Handle network message processing."""
+    """
+    Handle network message processing.
+
+    Agent calls run on the AsyncRunner's event loop, so the Slack worker thread that received a message
+    returns at once and many threads can converse at the same time. Each reply is posted as a placeholder
+    and updated in place as the streaming_chat response comes in.
+    """
 
-    def __init__(self, manager: ConversationManager, client: APIClient):
+    def __init__(
+        self, manager: ConversationManager, client: APIClient, runner: AsyncRunner, update_interval: float = 1.0
+    ):
         self.manager = manager
         self.client = client
+        self.runner = runner
+        self.update_interval = update_interval
+        # Messages of one Slack thread are answered one at a time, each with the context of the previous answer.
+        # Only touched on the runner's loop.
+        self._thread_locks: dict[str, asyncio.Lock] = {}
+        self._pending_messages: dict[str, int] = {}
 
     def setup_new_network(self, msg_ctx: MessageContext, command: NetworkCommand) -> None:
         """Set up a new network connection."""
@@ -50,10 +73,30 @@ class NetworkHandler:
         if command.input_prompt:
             self.process_message(msg_ctx, command.network_name, command.input_prompt)
         else:
-            self._acknowledge_connection(msg_ctx, command.network_name, command.sly_data)
+            self.runner.submit(
+                self._acknowledge_connection(msg_ctx, command.network_name, command.sly_data), msg_ctx.logger
+            )
 
     def process_message(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
-        """Process a message for a network."""
+        """Process a message for a network in the background, after earlier messages of the same thread."""
+        self.runner.submit(self._process_in_turn(msg_ctx, network_name, user_message), msg_ctx.logger)
+
+    async def _process_in_turn(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
+        """Wait for the messages of the thread received before this one, then process it."""
+        thread_key = msg_ctx.thread_ctx.thread_key
+        lock = self._thread_locks.setdefault(thread_key, asyncio.Lock())
+        self._pending_messages[thread_key] = self._pending_messages.get(thread_key, 0) + 1
+        try:
+            async with lock:
+                await self._process(msg_ctx, network_name, user_message)
+        finally:
+            self._pending_messages[thread_key] -= 1
+            if not self._pending_messages[thread_key]:
+                del self._pending_messages[thread_key]
+                del self._thread_locks[thread_key]
+
+    async def _process(self, msg_ctx: MessageContext, network_name: str, user_message: str) -> None:
+        """Stream the network's answer to a message into a reply."""
         conversation_key = f"{msg_ctx.thread_ctx.channel_id}:{msg_ctx.thread_ctx.conversation_thread}:{network_name}"
 
         # Clear old contexts
@@ -65,36 +108,63 @@ class NetworkHandler:
 
         # Build and send request
         payload = self._build_payload(user_message, context, sly_data, msg_ctx.logger)
+        placeholder_ts = await self._post_placeholder(msg_ctx)
 
         try:
             msg_ctx.logger.info(f"Calling network '{network_name}'")
-            data = self.client.call(f"{network_name}/streaming_chat", payload)
+            data, partial_text = await self._stream_answer(msg_ctx, network_name, payload, placeholder_ts)
 
             # Extract and send response
-            response_text = self._extract_response_text(data, msg_ctx.logger)
+            response_text = self._extract_response_text(data, msg_ctx.logger) if data else partial_text
             self._store_context(data, conversation_key, msg_ctx.logger)
-            self._send_response(response_text, data, msg_ctx)
+            await self._send_response(response_text or "No response available.", data, msg_ctx, placeholder_ts)
 
-        except RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
             msg_ctx.logger.error(f"API error for '{network_name}': {e}", exc_info=True)
-            msg_ctx.say(text=f"Error calling API: {e}", thread_ts=msg_ctx.thread_ctx.conversation_thread)
+            await self._reply(msg_ctx, f"Error calling API: {e}", placeholder_ts)
+        # pylint: disable=broad-exception-caught
+        except Exception as e:
+            # Never leave the placeholder as the last word in the thread
+            msg_ctx.logger.error(f"Error processing message for '{network_name}': {e}", exc_info=True)
+            await self._reply(msg_ctx, f"Error processing message: {e}", placeholder_ts)
+
+    async def _stream_answer(
+        self, msg_ctx: MessageContext, network_name: str, payload: dict[str, Any], placeholder_ts: str | None
+    ) -> tuple[dict[str, Any], str]:
+        """
+        Call the network, showing its latest partial answer in the placeholder at most once per update_interval.
+
+        :return: The final message of the response, empty if there was none, and the last partial answer
+        """
+        loop = asyncio.get_running_loop()
+        data: dict[str, Any] = {}
+        partial_text = ""
+        last_update = loop.time()
+        async for message in self.client.stream(f"{network_name}/streaming_chat", payload):
+            response = message.get("response", {})
+            if response.get("chat_context"):
+                # The final message, carrying the answer and the context of the conversation
+                data = message
+            elif response.get("text"):
+                partial_text = response["text"]
+                if placeholder_ts and loop.time() - last_update >= self.update_interval:
+                    last_update = loop.time()
+                    await self._update_placeholder(msg_ctx, placeholder_ts, self._preview(partial_text))
+        return data, partial_text
 
-    def _acknowledge_connection(
+    async def _acknowledge_connection(
         self, msg_ctx: MessageContext, network_name: str, sly_data: dict[str, Any] | None
     ) -> None:
         """Acknowledge new network connection."""
         sly_msg = f" with sly_data: `{dumps(sly_data)}`" if sly_data else ""
 
-        if self.client.test_connection(network_name):
-            msg_ctx.say(
-                text=f"Connected to *{network_name}*{sly_msg}. Please provide your input.",
-                thread_ts=msg_ctx.thread_ctx.conversation_thread,
-            )
+        if await self.client.test_connection(network_name):
+            await self._reply(msg_ctx, f"Connected to *{network_name}*{sly_msg}. Please provide your input.")
             msg_ctx.logger.info(f"Connected to network: {network_name}")
         else:
-            msg_ctx.say(
-                text=f"*{network_name}* is invalid. Please provide a valid agent network to open a new thread.",
-                thread_ts=msg_ctx.thread_ctx.conversation_thread,
+            await self._reply(
+                msg_ctx,
+                f"*{network_name}* is invalid. Please provide a valid agent network to open a new thread.",
             )
             msg_ctx.logger.warning(f"Invalid network: {network_name}")
 
@@ -139,8 +209,10 @@ class NetworkHandler:
             self.manager.set_context(conversation_key, context)
             logger.info(f"Stored context for {conversation_key}")
 
-    def _send_response(self, text: str, data: dict[str, Any], msg_ctx: MessageContext) -> None:
-        """Send response with optional sly_data."""
+    async def _send_response(
+        self, text: str, data: dict[str, Any], msg_ctx: MessageContext, placeholder_ts: str | None
+    ) -> None:
+        """Send response with optional sly_data, in place of the placeholder if there is one."""
         returned_sly = data.get("response", {}).get("sly_data", {})
         sly_text = ""
 
@@ -148,5 +220,50 @@ class NetworkHandler:
             sly_text = f"\nReturned sly_data:\n```\n{dumps(returned_sly, indent=2)}\n```"
             msg_ctx.logger.info(f"Received sly_data: {returned_sly}")
 
-        msg_ctx.say(text=text + sly_text, thread_ts=msg_ctx.thread_ctx.conversation_thread)
+        await self._reply(msg_ctx, text + sly_text, placeholder_ts)
         msg_ctx.logger.info("Response sent successfully")
+
+    @staticmethod
+    def _preview(text: str) -> str:
+        """:return: Placeholder text showing a partial answer"""
+        if len(text) > MAX_PREVIEW_CHARS:
+            text = text[:MAX_PREVIEW_CHARS] + "..."
+        return f"{PLACEHOLDER_TEXT}\n{text}"
+
+    async def _post_placeholder(self, msg_ctx: MessageContext) -> str | None:
+        """
+        Post the message to update as the answer streams in.
+
+        :return: Timestamp of the placeholder, or None when replies cannot be updated in place
+        """
+        if msg_ctx.client is None:
+            return None
+        try:
+            response = await asyncio.to_thread(
+                msg_ctx.say, text=PLACEHOLDER_TEXT, thread_ts=msg_ctx.thread_ctx.conversation_thread
+            )
+            return response.get("ts")
+        except SlackApiError as e:
+            msg_ctx.logger.warning(f"Could not post placeholder: {e}")
+            return None
+
+    async def _update_placeholder(self, msg_ctx: MessageContext, placeholder_ts: str, text: str) -> bool:
+        """
+        Replace the text of the placeholder.
+
+        :return: True if the placeholder was updated
+        """
+        try:
+            await asyncio.to_thread(
+                msg_ctx.client.chat_update, channel=msg_ctx.thread_ctx.channel_id, ts=placeholder_ts, text=text
+            )
+            return True
+        except SlackApiError as e:
+            msg_ctx.logger.warning(f"Could not update placeholder: {e}")
+            return False
+
+    async def _reply(self, msg_ctx: MessageContext, text: str, placeholder_ts: str | None = None) -> None:
+        """Post a reply in the thread, or put it in place of the placeholder."""
+        if placeholder_ts and await self._update_placeholder(msg_ctx, placeholder_ts, text):
+            return
+        await asyncio.to_thread(msg_ctx.say, text=text, thread_ts=msg_ctx.thread_ctx.conversation_thread)
@@ -14,29 +14,45 @@
 #
 # END COPYRIGHT
 
+import asyncio
 from argparse import ArgumentParser
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from hashlib import md5
+from multiprocessing import get_context
+from os import cpu_count
 from os import makedirs
 from random import choices
-from random import uniform
 from re import sub
 from string import ascii_lowercase
 from string import digits
-from time import sleep
+from time import monotonic
+from time import time
+from typing import Dict
 from typing import List
+from typing import NamedTuple
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from urllib.parse import urljoin
 from urllib.parse import urlparse
 
+from aiohttp import ClientError
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+from crawl_cache import CrawlCache
+from crawler import CrawlFrontier
+from crawler import FetchResult
+from crawler import PoliteFetcher
+from fanout import minhash_key
+from fanout import path_key
+from fanout import split_evenly
 from hocon_constants import HOCON_HEADER_REMAINDER
 from hocon_constants import HOCON_HEADER_START
 from hocon_constants import LEAF_NODE_AGENT_TEMPLATE
 from hocon_constants import REGULAR_AGENT_TEMPLATE
 from hocon_constants import TOP_AGENT_TEMPLATE
-from requests import RequestException
-from requests import get
 from tldextract import extract
 
 # Regex to replace all non-alphanumeric and non-hyphen characters with an empty string
@@ -54,15 +70,32 @@ URL_REGEX = r"https?://\S+"
 # Regex to remove scene7 junk or custom format @(...) from extracted text
 SCENE7_JUNK_REGEX = r"@\(.*?\)"
 
+# BeautifulSoup parser backend: lxml when it is installed, as it parses several times faster
+HTML_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
+
+class PageContent(NamedTuple):
+    """What the crawl needs from a page, extracted from a single parse of its HTML."""
+
+    text: str
+    title: str
+    links: List[str]
+
 
 class WebAgentNetworkBuilder:
+    # pylint: disable=too-many-instance-attributes
     TOTAL_AGENTS = 40
     MAX_CHILDREN = 10
+    GROUPINGS = ("order", "path", "similarity")
+    GROUPING = "order"
     MAX_NAME_LEN = 40  # Cannot be more than 55
     PAGE_LEN_MAX = 5000
     MIN_PAGE_LEN = 200
     START_URL = "https://www.cognizant.com/us/en"
     AGENT_NETWORK_NAME = f"autogenerated_agent_network_{TOTAL_AGENTS}"
+    # Seconds between checkpoints of the crawl state in the cache
+    CHECKPOINT_INTERVAL = 30
+    CACHE_FILE = "crawl_cache.sqlite"
     OUTPUT_PATH = "../../registries/"  # Make sure the new hocon is added to the manifest
     AGENT_INSTRUCTION_PREFACE = (
         "You represent the following content from a web page for the user and can answer "
@@ -80,6 +113,15 @@ class WebAgentNetworkBuilder:
     def __init__(self):
         self.agent_counter = 0
         self.politeness_delay = 0.0
+        self.max_concurrency = 16
+        self.per_host_concurrency = 4
+        self.respect_robots = True
+        # Processes parsing the fetched pages while others are fetched, 0 to parse in the crawling process
+        self.parse_workers = (cpu_count() or 1) - 1
+        # Optional CrawlCache of fetched pages and crawl checkpoints, and seconds a cached page is used without
+        # revalidating it
+        self.cache: Optional[CrawlCache] = None
+        self.cache_max_age = 0.0
         self.top_agent_name = None
 
     def create_intermediate_agents(self, parent: str, chunks: List[List[str]], new_agents: dict) -> List[str]:
@@ -108,77 +150,112 @@ class WebAgentNetworkBuilder:
             intermediate_names.append(intermediate_name)
         return intermediate_names
 
-    def enforce_max_fanout(self, agents: dict, max_children: int = None) -> dict:
+    def enforce_max_fanout(self, agents: dict, max_children: int = None, grouping: str = None) -> dict:
         """
         Ensures that no agent in the given agent hierarchy has more than `max_children` direct children.
 
         If an agent exceeds the allowed fan-out, intermediate agents (branches) are created to group
-        subsets of its children. These intermediate agents are inserted into the hierarchy, and the
-        original agent's down_chains are replaced with references to the new intermediate agents.
+        subsets of its children, bottom-up like the nodes of a B-tree, in a single pass over the agents.
+        Only as many children as needed are moved into branches, so the others stay one hop away, and
+        branches are themselves grouped when there are more of them than fit.
 
         Args:
             agents (dict): A dictionary representing the agent hierarchy. Each key is an agent name,
                            and each value is a dictionary with "instructions", "down_chains", and "top_agent".
             max_children (int): Maximum number of direct children allowed per agent.
+            grouping (str): How children are grouped into branches, one of GROUPINGS: "order" keeps the order
+                            in which they were discovered, "path" groups pages under the same URL path and
+                            "similarity" groups pages with similar content. Defaults to GROUPING.
 
         Returns:
             dict: A new dictionary with the same structure as `agents` but with fan-out constraints enforced.
         """
         if max_children is None:
             max_children = self.MAX_CHILDREN
+        if max_children < 2:
+            raise ValueError(f"max_children must be at least 2, not {max_children}.")
+        grouping = grouping or self.GROUPING
         new_agents = dict(agents)  # Shallow copy is safe here
 
         for parent, data in list(agents.items()):
             children = data.get("down_chains", [])
             if len(children) <= max_children:
                 continue
-
-            # Split into chunks using explicit loop
-            chunks = []
-            for i in range(0, len(children), max_children):
-                chunks.append(children[i : i + max_children])
-
-            chunks = [children[i : i + max_children] for i in range(0, len(children), max_children)]
-            intermediate_names = self.create_intermediate_agents(parent, chunks, new_agents)
-
-            # Overwrite the parent's down_chains with the new intermediate branches
-            new_agents[parent]["down_chains"] = intermediate_names
+            ordered = self._order_children(children, agents, grouping)
+            new_agents[parent] = {
+                **data,
+                "down_chains": self._group_children(parent, ordered, max_children, new_agents),
+            }
         return new_agents
 
-    def enforce_fanout_recursive(self, agents, max_children=None):
+    def enforce_fanout_recursive(self, agents, max_children=None, grouping=None):
         """
-        Recursively enforces the maximum fan-out constraint on a hierarchy of agents.
+        Enforces the maximum fan-out constraint on a hierarchy of agents.
 
-        Applies `enforce_max_fanout` repeatedly until all agents in the hierarchy have no more than
-        `max_children` direct children. This is necessary when intermediate agents introduced by a
-        previous enforcement may themselves exceed the limit.
+        `enforce_max_fanout` already groups the branches it creates, so a single pass leaves every agent
+        with no more than `max_children` direct children.
 
         Args:
             agents (dict): A dictionary representing the agent hierarchy.
             max_children (int): Maximum number of allowed direct children per agent.
+            grouping (str): How children are grouped into branches, see `enforce_max_fanout`.
 
         Returns:
             dict: A modified agent hierarchy with fan-out constraints fully enforced.
         """
-        # Use class default if no specific max_children value is provided
-        if max_children is None:
-            max_children = self.MAX_CHILDREN
-        # Perform an initial fan-out enforcement pass
-        updated_agents = self.enforce_max_fanout(agents, max_children)
-        # Repeat enforcement until no agent exceeds max_children
-        has_overflow = True
-        while has_overflow:
-            has_overflow = False
-            # Check each agent to see if fan-out exceeds limit
-            for agent in updated_agents.values():
-                if len(agent["down_chains"]) > max_children:
-                    has_overflow = True
-                    break
-            if has_overflow:
-                # Reassign agents and run another pass of enforcement
-                agents = updated_agents
-                updated_agents = self.enforce_max_fanout(agents, max_children)
-        return updated_agents
+        return self.enforce_max_fanout(agents, max_children, grouping)
+
+    def _group_children(self, parent: str, children: List[str], max_children: int, new_agents: dict) -> List[str]:
+        """
+        Groups children into as few levels of branches as the fan-out allows.
+
+        While there are too many entries, the fewest branches that bring them down to max_children take in the
+        entries at the end, and the first ones stay direct. When even max_children full branches cannot do that,
+        all entries are split evenly into branches, which form the next level up.
+
+        Args:
+            parent (str): Name of the agent whose children are grouped.
+            children (list): Names of the children, ordered so that the ones to group together are adjacent.
+            max_children (int): Maximum number of direct children per agent.
+            new_agents (dict): The agent hierarchy, to which the branches are added.
+
+        Returns:
+            list: The direct children of the parent, at most max_children of them.
+        """
+        level = list(children)
+        while len(level) > max_children:
+            # Each branch of max_children entries takes the place of max_children - 1 of them
+            branches = -(-(len(level) - max_children) // (max_children - 1))
+            if branches <= max_children:
+                direct = max_children - branches
+                chunks = split_evenly(level[direct:], branches)
+                level = level[:direct] + self.create_intermediate_agents(parent, chunks, new_agents)
+            else:
+                chunks = split_evenly(level, -(-len(level) // max_children))
+                level = self.create_intermediate_agents(parent, chunks, new_agents)
+        return level
+
+    def _order_children(self, children: List[str], agents: dict, grouping: str) -> List[str]:
+        """
+        Args:
+            children (list): Names of the children of an agent, in the order they were discovered.
+            agents (dict): The agent hierarchy.
+            grouping (str): One of GROUPINGS.
+
+        Returns:
+            list: The children, ordered so that the ones to group together are adjacent.
+        """
+        if grouping == "order":
+            return list(children)
+        if grouping == "path":
+            return sorted(children, key=lambda child: path_key(agents.get(child, {}).get("url", "")))
+        if grouping == "similarity":
+            keys = {}
+            for child in children:
+                instructions = agents.get(child, {}).get("instructions", "")
+                keys[child] = minhash_key(instructions.replace(self.AGENT_INSTRUCTION_PREFACE, ""))
+            return sorted(children, key=keys.__getitem__)
+        raise ValueError(f"Unknown grouping '{grouping}', expected one of {', '.join(self.GROUPINGS)}.")
 
     def add_agent(self, agents, agent_name: str, instructions: str, down_chains: list, top_agent: str = "false"):
         """
@@ -213,7 +290,7 @@ class WebAgentNetworkBuilder:
             print(f" {self.agent_counter}")
         return str(agents[agent_name])
 
-    def get_clean_agent_name(self, url, html, existing_names=None):
+    def get_clean_agent_name(self, url, html, existing_names=None, title=None):
         """
         Generates a clean, URL-based agent name derived from the HTML page title or URL path.
 
@@ -224,13 +301,15 @@ class WebAgentNetworkBuilder:
             url (str): The URL of the web page.
             html (str): The raw HTML content of the web page.
             existing_names (set, optional): A set of agent names already used. Ensures the result is unique.
+            title (str, optional): The title of the page if it was already extracted, so the HTML is not parsed again.
 
         Returns:
             str: A clean, unique agent name suitable for use as an identifier.
         """
         if existing_names is None:
             existing_names = set()
-        title = _extract_title_from_html(html)
+        if title is None:
+            title = _extract_title_from_html(html)
 
         # If no title is found, fall back to using the URL path or netloc for the agent name
         if not title:
@@ -290,14 +369,17 @@ class WebAgentNetworkBuilder:
         existing_names: set,
         agents: dict,
         count: int,
-        to_visit: List[Tuple[str, Optional[str]]],
+        to_visit: CrawlFrontier,
         base_domain: str,
+        page: Optional[PageContent] = None,
     ) -> int:
-        text = clean_and_extract_text(resp.text)
+        if page is None:
+            page = extract_page(resp.text, url)
+        text = page.text
         if len(text) < self.MIN_PAGE_LEN:
             return count  # Skip light pages
 
-        name = self.get_clean_agent_name(url, resp.text, existing_names)
+        name = self.get_clean_agent_name(url, resp.text, existing_names, title=page.title)
         existing_names.add(name)
         clean_text = (
             text[: self.PAGE_LEN_MAX].replace('"', "").replace("'", "").encode("ascii", errors="ignore").decode()
@@ -310,22 +392,20 @@ class WebAgentNetworkBuilder:
         else:
             is_top = "false"
         self.add_agent(agents, name, instructions, [], is_top)
+        agents[name]["url"] = url
 
         if parent_name and parent_name in agents and name != parent_name:
             agents[parent_name].get("down_chains", []).append(name)
 
         visited.add(url)
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        for a in soup.find_all("a", href=True):
-            full_link = urljoin(url, a["href"])
-            if is_valid_url(full_link, base_domain) and full_link not in visited:
-                if not any(full_link == queued_url for queued_url, _ in to_visit):
-                    to_visit.append((full_link, name))
+        for full_link in page.links:
+            if is_valid_url(full_link, base_domain) and full_link not in visited and full_link not in to_visit:
+                to_visit.append((full_link, name))
 
         return count + 1
 
-    def crawl(self, start_url, max_agents):
+    def crawl(self, start_url, max_agents, resume=False):
         """
         Crawls a website starting from the given URL and constructs a hierarchy of content-based agents.
 
@@ -339,49 +419,196 @@ class WebAgentNetworkBuilder:
         Args:
             start_url (str): The root URL to begin crawling from.
             max_agents (int): Maximum number of agents (pages) to generate.
+            resume (bool): Carry on from the checkpoint of an unfinished crawl of start_url in the cache, if any.
 
         Returns:
             dict: A dictionary representing the agent hierarchy, where each key is an agent name and each value is
                   a dictionary with "instructions", "down_chains", and "top_agent" fields.
         """
-        agents = {}
-        visited = set()
-        to_visit: List[Tuple[str, Optional[str]]] = [(start_url, None)]
-        count = 0
+        return asyncio.run(self._crawl(start_url, max_agents, resume))
+
+    async def _crawl(self, start_url: str, max_agents: int, resume: bool = False) -> dict:
+        """
+        Fetches pages concurrently with a PoliteFetcher, processing each one as it arrives.
+
+        The start page is fetched alone, so it becomes the top agent. From then on up to max_concurrency
+        pages are in flight, taken from the frontier in the order they were discovered.
+
+        With a cache, the state of the crawl is checkpointed every CHECKPOINT_INTERVAL seconds and when the crawl
+        stops before completing, e.g. on an error or Ctrl-C, and deleted once it completes.
+        """
+        checkpoint = self.cache.load_checkpoint(start_url) if self.cache and resume else None
+        agents, visited, existing_names, count, to_visit = self._restore_checkpoint(start_url, checkpoint)
         # Use tldextract to isolate the registered domain and suffix (e.g., 'example.com') from the URL.
         # This helps in determining whether a link is internal to the site, which is important for focused crawling.
         domain_info = extract(start_url)
         base_domain = f"{domain_info.domain}.{domain_info.suffix}"
-        existing_names = set()
 
-        while to_visit and count < max_agents:
-            url, parent_name = to_visit.pop(0)
-            if url in visited:
-                continue
-            try:
-                resp = get(url, timeout=10)
-                # Skip non-HTML content types
-                if "text/html" not in resp.headers.get("Content-Type", ""):
-                    continue
-                count = self._process_page(
-                    url, parent_name, resp, visited, existing_names, agents, count, to_visit, base_domain
-                )
-            except (RequestException, ValueError, UnicodeDecodeError) as e:
-                print(f"Skipping {url} due to error: {str(e)}")
-                continue
-
-            if hasattr(self, "politeness_delay") and self.politeness_delay > 0:
-                sleep(uniform(self.politeness_delay * 0.75, self.politeness_delay * 1.25))
-
-        linked = set()
-        for agent in agents.values():
-            linked.update(agent["down_chains"])
+        fetcher = PoliteFetcher(
+            self.max_concurrency, self.per_host_concurrency, self.politeness_delay, self.respect_robots
+        )
+        parse_pool = (
+            ProcessPoolExecutor(self.parse_workers, mp_context=get_context("spawn")) if self.parse_workers else None
+        )
+        in_flight: Dict[asyncio.Task, Tuple[str, Optional[str]]] = {}
+        completed = False
+        last_checkpoint = monotonic()
+        try:
+            with parse_pool or nullcontext():
+                async with fetcher:
+                    while (to_visit or in_flight) and count < max_agents:
+                        # Only the start page is in flight until it is processed, so that it becomes the top agent
+                        slots = self.max_concurrency if count else 1
+                        while to_visit and len(in_flight) < slots:
+                            url, parent_name = to_visit.popleft()
+                            task = asyncio.ensure_future(self._fetch_page(fetcher, parse_pool, url))
+                            in_flight[task] = (url, parent_name)
+                        done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            url, parent_name = in_flight.pop(task)
+                            if count < max_agents:
+                                count = self._process_fetched(
+                                    task,
+                                    url,
+                                    parent_name,
+                                    visited,
+                                    existing_names,
+                                    agents,
+                                    count,
+                                    to_visit,
+                                    base_domain,
+                                )
+                        if self.cache and monotonic() - last_checkpoint >= self.CHECKPOINT_INTERVAL:
+                            self._save_checkpoint(
+                                start_url, agents, visited, existing_names, count, to_visit, in_flight
+                            )
+                            last_checkpoint = monotonic()
+                    completed = True
+                    for task in in_flight:
+                        task.cancel()
+                    await asyncio.gather(*in_flight, return_exceptions=True)
+        finally:
+            if self.cache and completed:
+                self.cache.delete_checkpoint(start_url)
+            elif self.cache:
+                self._save_checkpoint(start_url, agents, visited, existing_names, count, to_visit, in_flight)
+                print(f"\nSaved a checkpoint after {count} agents, run again with --resume to carry on.")
 
         print(f"Generated {count} agents with real content.")
         return agents
 
+    def _restore_checkpoint(
+        self, start_url: str, checkpoint: Optional[dict]
+    ) -> Tuple[dict, Set[str], Set[str], int, CrawlFrontier]:
+        """
+        Returns:
+            tuple: The agents, visited urls, agent names, agent count and frontier of the crawl saved
+                in the checkpoint, or those of a new crawl of start_url if there is no checkpoint.
+        """
+        if checkpoint is None:
+            to_visit = CrawlFrontier()
+            to_visit.append((start_url, None))
+            return {}, set(), set(), 0, to_visit
+
+        self.top_agent_name = checkpoint["top_agent_name"]
+        self.agent_counter = checkpoint["agent_counter"]
+        to_visit = CrawlFrontier.from_snapshot(checkpoint["frontier"])
+        print(f"Resuming the crawl of {start_url} with {checkpoint['count']} agents and {len(to_visit)} pages queued.")
+        return (
+            checkpoint["agents"],
+            set(checkpoint["visited"]),
+            set(checkpoint["existing_names"]),
+            checkpoint["count"],
+            to_visit,
+        )
+
+    def _save_checkpoint(
+        self,
+        start_url: str,
+        agents: dict,
+        visited: Set[str],
+        existing_names: Set[str],
+        count: int,
+        to_visit: CrawlFrontier,
+        in_flight: Dict[asyncio.Task, Tuple[str, Optional[str]]],
+    ):
+        """Saves the state of the crawl in the cache. Pages in flight are queued again in the checkpoint."""
+        self.cache.save_checkpoint(
+            start_url,
+            {
+                "agents": agents,
+                "visited": list(visited),
+                "existing_names": list(existing_names),
+                "count": count,
+                "frontier": to_visit.snapshot(in_flight.values()),
+                "top_agent_name": self.top_agent_name,
+                "agent_counter": self.agent_counter,
+            },
+        )
+
+    async def _fetch_page(
+        self, fetcher: PoliteFetcher, parse_pool: Optional[Executor], url: str
+    ) -> Tuple[FetchResult, Optional[PageContent]]:
+        """
+        Fetches a page and extracts its content in the parse pool, so parsing runs while other pages are fetched.
+
+        A cached copy of the page is used as is while it is younger than cache_max_age seconds. Otherwise it is
+        revalidated with a conditional request, and used if the server answers that it has not changed.
+        """
+        cached = self.cache.get(url) if self.cache else None
+        if cached and time() - cached.fetched < self.cache_max_age:
+            return cached.to_fetch_result(), PageContent(cached.text, cached.title, cached.links)
+        resp = await fetcher.fetch(url, cached.etag if cached else None, cached.last_modified if cached else None)
+        if cached and resp.not_modified:
+            self.cache.touch(url)
+            return cached.to_fetch_result(), PageContent(cached.text, cached.title, cached.links)
+        if not resp.text:
+            return resp, None
+        if parse_pool is None:
+            page = extract_page(resp.text, url)
+        else:
+            page = await asyncio.get_running_loop().run_in_executor(parse_pool, extract_page, resp.text, url)
+        if self.cache:
+            self.cache.put(resp, page.text, page.title, page.links)
+        return resp, page
+
+    def _process_fetched(
+        self,
+        task: asyncio.Task,
+        url: str,
+        parent_name: Optional[str],
+        visited: set,
+        existing_names: set,
+        agents: dict,
+        count: int,
+        to_visit: CrawlFrontier,
+        base_domain: str,
+    ) -> int:
+        """Processes a fetched page, skipping it if fetching failed or it is not an html page."""
+        try:
+            resp, page = task.result()
+            if resp.status == 0:
+                print(f"Skipping {url} as robots.txt disallows it")
+                return count
+            if resp.status >= 400:
+                print(f"Skipping {url} due to HTTP status {resp.status}")
+                return count
+            # Skip non-HTML content types
+            if "text/html" not in resp.content_type:
+                return count
+            return self._process_page(
+                url, parent_name, resp, visited, existing_names, agents, count, to_visit, base_domain, page
+            )
+        except (ClientError, asyncio.TimeoutError, ValueError, UnicodeDecodeError) as e:
+            print(f"Skipping {url} due to error: {str(e)}")
+            return count
+
     @classmethod
-    def main(cls):
+    def _parse_args(cls):
+        """
+        Returns:
+            Namespace: The command-line arguments.
+        """
         parser = ArgumentParser(description="Generate a hierarchy of web agents.")
         parser.add_argument(
             "--total_agents",
@@ -404,6 +631,13 @@ class WebAgentNetworkBuilder:
             default=cls.MAX_CHILDREN,
             help=f"Maximum number of direct children per agent (default: {cls.MAX_CHILDREN})",
         )
+        parser.add_argument(
+            "--grouping",
+            choices=cls.GROUPINGS,
+            default=cls.GROUPING,
+            help="How the children of an agent with too many are grouped into intermediate agents: in the order "
+            f"they were found, by URL path or by similar content (default: {cls.GROUPING})",
+        )
         parser.add_argument(
             "--max_name_len",
             type=int,
@@ -426,10 +660,56 @@ class WebAgentNetworkBuilder:
             "--politeness_delay",
             type=float,
             default=0.0,
-            help="Average delay (in seconds) between page requests to be polite to servers (default: 0.0)",
+            help="Average delay (in seconds) between page requests to the same host (default: 0.0)",
         )
+        parser.add_argument(
+            "--max_concurrency",
+            type=int,
+            default=16,
+            help="Maximum number of page requests in flight (default: 16)",
+        )
+        parser.add_argument(
+            "--per_host_concurrency",
+            type=int,
+            default=4,
+            help="Maximum number of page requests in flight to the same host (default: 4)",
+        )
+        parser.add_argument(
+            "--parse_workers",
+            type=int,
+            default=None,
+            help="Number of processes parsing pages while others are fetched, 0 to parse in the crawling process "
+            "(default: one less than the number of CPUs)",
+        )
+        parser.add_argument(
+            "--cache_file",
+            type=str,
+            default=cls.CACHE_FILE,
+            help=f"SQLite file caching fetched pages and checkpoints of unfinished crawls (default: {cls.CACHE_FILE})",
+        )
+        parser.add_argument("--no_cache", action="store_true", help="Crawl without reading or writing the cache")
+        parser.add_argument(
+            "--cache_max_age",
+            type=float,
+            default=0.0,
+            help="Seconds a cached page is used without asking the server whether it changed (default: 0.0)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Carry on from the checkpoint of an unfinished crawl of the start URL",
+        )
+        parser.add_argument(
+            "--ignore_robots",
+            action="store_true",
+            help="Fetch pages even if the robots.txt of their site disallows it",
+        )
+
+        return parser.parse_args()
 
-        args = parser.parse_args()
+    @classmethod
+    def main(cls):
+        args = cls._parse_args()
 
         # Dynamically set class attributes based on command-line arguments
         cls.MAX_CHILDREN = args.max_children
@@ -443,8 +723,21 @@ class WebAgentNetworkBuilder:
 
         builder = cls()
         builder.politeness_delay = args.politeness_delay
-        the_agents = builder.crawl(the_start_url, the_total_agents)
-        the_agents = builder.enforce_fanout_recursive(the_agents, max_children=cls.MAX_CHILDREN)
+        builder.max_concurrency = args.max_concurrency
+        builder.per_host_concurrency = args.per_host_concurrency
+        builder.respect_robots = not args.ignore_robots
+        if args.parse_workers is not None:
+            builder.parse_workers = args.parse_workers
+        builder.cache = None if args.no_cache else CrawlCache(args.cache_file)
+        builder.cache_max_age = args.cache_max_age
+        try:
+            the_agents = builder.crawl(the_start_url, the_total_agents, resume=args.resume)
+        finally:
+            if builder.cache:
+                builder.cache.close()
+        the_agents = builder.enforce_fanout_recursive(
+            the_agents, max_children=cls.MAX_CHILDREN, grouping=args.grouping
+        )
         the_linked = set()
         for an_agnt in the_agents.values():
             the_linked.update(an_agnt.get("down_chains", []))
@@ -506,11 +799,32 @@ def is_valid_url(link, base_domain):
     return parsed.scheme in ("http", "https") and base_domain in parsed.netloc
 
 
+def extract_page(html: str, url: str) -> PageContent:
+    """
+    Parses HTML once and extracts everything the crawl needs from it.
+
+    The crawl runs this in a process pool, so it has to remain a top-level function.
+
+    Args:
+        html (str): Raw HTML content of a web page.
+        url (str): The URL of the web page, to resolve relative links against.
+
+    Returns:
+        PageContent: The cleaned text as returned by clean_and_extract_text, the title and the absolute URLs
+        of all links, in document order.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    title = _title_of(soup)
+    # Links are collected before the text is cleaned, as cleaning removes elements from the tree
+    links = [urljoin(url, a["href"]) for a in soup.find_all("a", href=True)]
+    return PageContent(_clean_text_of(soup), title, links)
+
+
 def clean_and_extract_text(html):
     """
     Cleans and extracts readable text content from HTML.
 
-    Removes non-content elements (e.g., scripts, styles, images), strips unnecessary attributes,
+    Removes non-content elements (e.g., scripts, styles, images),
     extracts visible text from paragraph-level tags, and sanitizes the text by removing URLs,
     special characters, and non-ASCII content.
 
@@ -520,18 +834,23 @@ def clean_and_extract_text(html):
     Returns:
         str: Cleaned and normalized text extracted from the HTML.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return _clean_text_of(BeautifulSoup(html, HTML_PARSER))
+
 
+def _clean_text_of(soup: BeautifulSoup) -> str:
+    """
+    Extracts the cleaned text of a parsed page. Removes the non-content elements from the tree.
+
+    Args:
+        soup (BeautifulSoup): The parsed page.
+
+    Returns:
+        str: Cleaned and normalized text extracted from the page.
+    """
     # Remove unwanted tags entirely
     for tag in soup(["script", "style", "noscript", "img", "source", "picture", "svg"]):
         tag.decompose()
 
-    # Remove image srcset and media nonsense in attributes
-    for tag in soup.find_all(True):
-        for attr in ["src", "srcset", "data-src", "data-srcset", "alt", "title"]:
-            if attr in tag.attrs:
-                del tag.attrs[attr]
-
     # Extract visible paragraph-level content
     paragraphs = soup.find_all(["p", "h1", "h2", "h3", "li"])
     raw_text = " ".join(p.get_text(separator=" ", strip=True) for p in paragraphs)
@@ -562,7 +881,17 @@ def _extract_title_from_html(html: str) -> str:
     Returns:
         str: The cleaned title string if found, otherwise an empty string.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    return _title_of(BeautifulSoup(html, HTML_PARSER))
+
+
+def _title_of(soup: BeautifulSoup) -> str:
+    """
+    Args:
+        soup (BeautifulSoup): The parsed page.
+
+    Returns:
+        str: The cleaned title string if found, otherwise an empty string.
+    """
     return soup.title.string.strip() if soup.title and soup.title.string else ""
 
 
@@ -0,0 +1,189 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+from crawler import FetchResult
+
+
+@dataclass
+class CachedPage:
+    """A page as fetched by an earlier crawl, with what was extracted from it."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    url: str
+    fetched: float
+    content_type: str
+    html: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # PageContent fields, stored as extracted so a cached page is not parsed again
+    text: str
+    title: str
+    links: list
+
+    def to_fetch_result(self) -> FetchResult:
+        """
+        Returns:
+            FetchResult: The page as if it had just been fetched.
+        """
+        return FetchResult(self.url, 200, self.content_type, self.html, self.etag, self.last_modified)
+
+
+class CrawlCache:
+    """
+    SQLite file keeping the pages fetched by wwaw crawls, and a checkpoint of an unfinished crawl per start url.
+
+    Pages are stored with their ETag and Last-Modified headers, so a later crawl of the same site can revalidate
+    them with conditional requests, and with their extracted text, title and links, so unchanged pages are
+    neither downloaded nor parsed again. The HTML itself is stored compressed.
+    """
+
+    def __init__(self, db_file: str):
+        """
+        Args:
+            db_file (str): SQLite database file, created if missing.
+        """
+        self.db_file = db_file
+        os.makedirs(os.path.dirname(os.path.abspath(db_file)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(db_file, timeout=30.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    fetched REAL NOT NULL,
+                    content_type TEXT,
+                    html BLOB,
+                    etag TEXT,
+                    last_modified TEXT,
+                    text TEXT,
+                    title TEXT,
+                    links TEXT
+                );
+                CREATE TABLE IF NOT EXISTS checkpoints (start_url TEXT PRIMARY KEY, saved REAL, state TEXT);
+                """
+            )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Args:
+            url (str): The url of the page.
+
+        Returns:
+            CachedPage: The cached page, None if the url was never cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, fetched, content_type, html, etag, last_modified, text, title, links "
+                "FROM pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, fetched, content_type, html, etag, last_modified, text, title, links = row
+        return CachedPage(
+            url,
+            fetched,
+            content_type,
+            zlib.decompress(html).decode(),
+            etag,
+            last_modified,
+            text,
+            title,
+            json.loads(links),
+        )
+
+    def put(self, result: FetchResult, text: str, title: str, links: list):
+        """
+        Stores a freshly fetched html page.
+
+        Args:
+            result (FetchResult): The page as fetched.
+            text (str): Cleaned text extracted from the page.
+            title (str): Title of the page.
+            links (list): Absolute urls of the links of the page.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pages (url, fetched, content_type, html, etag, last_modified, text, title, "
+                "links) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result.url,
+                    time.time(),
+                    result.content_type,
+                    zlib.compress(result.text.encode()),
+                    result.etag,
+                    result.last_modified,
+                    text,
+                    title,
+                    json.dumps(links),
+                ),
+            )
+
+    def touch(self, url: str):
+        """Records that a cached page was confirmed to be current."""
+        with self._lock:
+            self._connection.execute("UPDATE pages SET fetched = ? WHERE url = ?", (time.time(), url))
+
+    def load_checkpoint(self, start_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Args:
+            start_url (str): The start url of the crawl.
+
+        Returns:
+            dict: The state saved by save_checkpoint, None if there is none.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM checkpoints WHERE start_url = ?", (start_url,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_checkpoint(self, start_url: str, state: Dict[str, Any]):
+        """
+        Args:
+            start_url (str): The start url of the crawl.
+            state (dict): JSON serializable state of the crawl.
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (start_url, saved, state) VALUES (?, ?, ?)",
+                (start_url, time.time(), json.dumps(state)),
+            )
+
+    def delete_checkpoint(self, start_url: str):
+        """Forgets the checkpoint of a crawl that completed."""
+        with self._lock:
+            self._connection.execute("DELETE FROM checkpoints WHERE start_url = ?", (start_url,))
+
+    def close(self):
+        """Closes the database connection."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,263 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from random import uniform
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from urllib.parse import urldefrag
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from aiohttp import ClientError
+from aiohttp import ClientSession
+from aiohttp import ClientTimeout
+from aiohttp import TCPConnector
+
+USER_AGENT = "wwaw-network-builder"
+REQUEST_TIMEOUT = 10
+
+
+class CrawlFrontier:
+    """
+    Queue of (url, parent agent name) pairs still to crawl, in discovery order.
+
+    Every url ever queued is remembered in a set, so queueing a link, checking whether it was seen
+    and taking the next url to crawl all take constant time, whatever the size of the site.
+    """
+
+    def __init__(self):
+        self._queue: Deque[Tuple[str, Optional[str]]] = deque()
+        self._seen: Set[str] = set()
+
+    def append(self, item: Tuple[str, Optional[str]]) -> bool:
+        """
+        Queues a url, unless it was queued before.
+
+        Args:
+            item (tuple): The url, without its fragment, and the name of the agent that links to it.
+
+        Returns:
+            bool: True if the url was queued.
+        """
+        url, parent_name = item
+        url = urldefrag(url)[0]
+        if url in self._seen:
+            return False
+        self._seen.add(url)
+        self._queue.append((url, parent_name))
+        return True
+
+    def popleft(self) -> Tuple[str, Optional[str]]:
+        """
+        Returns:
+            tuple: The url queued first and the name of the agent that links to it.
+        """
+        return self._queue.popleft()
+
+    def snapshot(self, pending: Iterable[Tuple[str, Optional[str]]] = ()) -> Dict[str, list]:
+        """
+        Args:
+            pending (iterable): Urls taken from the frontier but not crawled yet, with the names of their parents.
+                They are put back at the front.
+
+        Returns:
+            dict: JSON serializable state of the frontier, to restore with from_snapshot().
+        """
+        return {
+            "queue": [list(item) for item in pending] + [list(item) for item in self._queue],
+            "seen": list(self._seen),
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, list]) -> "CrawlFrontier":
+        """
+        Args:
+            snapshot (dict): State returned by snapshot().
+
+        Returns:
+            CrawlFrontier: A frontier in that state.
+        """
+        frontier = cls()
+        frontier._queue.extend((url, parent_name) for url, parent_name in snapshot["queue"])
+        frontier._seen.update(snapshot["seen"])
+        return frontier
+
+    def __contains__(self, url: str) -> bool:
+        return urldefrag(url)[0] in self._seen
+
+    def __iter__(self) -> Iterator[Tuple[str, Optional[str]]]:
+        return iter(self._queue)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one page."""
+
+    url: str
+    status: int
+    content_type: str = ""
+    text: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        """True if the server confirmed that the cached copy of the page is still current."""
+        return self.status == 304
+
+
+@dataclass
+class _HostState:
+    """Concurrency limit, politeness schedule and robots.txt rules of one host."""
+
+    semaphore: asyncio.Semaphore
+    next_request: float = 0.0
+    robots: Optional[asyncio.Future] = None
+
+
+class PoliteFetcher:
+    """
+    Fetches pages concurrently over pooled connections, while keeping to the limits of each host.
+
+    Each host gets at most per_host_concurrency requests at a time, and consecutive requests to it start
+    about politeness_delay seconds apart, or the Crawl-delay of its robots.txt if that is longer.
+    Pages that robots.txt disallows are not fetched. Passing the ETag and Last-Modified of a cached copy
+    makes the request conditional, so an unchanged page costs a 304 response instead of a download.
+    """
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        per_host_concurrency: int = 4,
+        politeness_delay: float = 0.0,
+        respect_robots: bool = True,
+        user_agent: str = USER_AGENT,
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.politeness_delay = politeness_delay
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self._hosts: Dict[str, _HostState] = {}
+        self._session: Optional[ClientSession] = None
+
+    async def __aenter__(self):
+        self._session = ClientSession(
+            connector=TCPConnector(limit=self.max_concurrency, limit_per_host=self.per_host_concurrency),
+            timeout=ClientTimeout(total=REQUEST_TIMEOUT),
+            headers={"User-Agent": self.user_agent},
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+        self._session = None
+
+    async def fetch(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchResult:
+        """
+        Fetches a page, only reading the body of html pages.
+
+        Args:
+            url (str): The url of the page.
+            etag (str, optional): ETag of a cached copy of the page.
+            last_modified (str, optional): Last-Modified of a cached copy of the page.
+
+        Returns:
+            FetchResult: The response. Its status is 0 if robots.txt disallows the page.
+
+        Raises:
+            aiohttp.ClientError, asyncio.TimeoutError: If the request fails.
+        """
+        host = self._host(url)
+        robots = await self._robots(url, host)
+        if robots is not None and not robots.can_fetch(self.user_agent, url):
+            return FetchResult(url, 0)
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        async with host.semaphore:
+            await self._wait_turn(host, robots)
+            async with self._session.get(url, headers=headers) as response:
+                result = FetchResult(
+                    url,
+                    response.status,
+                    response.headers.get("Content-Type", ""),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+                if response.status == 200 and "text/html" in result.content_type:
+                    result.text = await response.text(errors="replace")
+        return result
+
+    def _host(self, url: str) -> _HostState:
+        netloc = urlparse(url).netloc
+        if netloc not in self._hosts:
+            self._hosts[netloc] = _HostState(asyncio.Semaphore(self.per_host_concurrency))
+        return self._hosts[netloc]
+
+    async def _robots(self, url: str, host: _HostState) -> Optional[RobotFileParser]:
+        """
+        Returns:
+            RobotFileParser: The rules of the host, read once and shared by all its pages, None if not respected.
+        """
+        if not self.respect_robots:
+            return None
+        if host.robots is None:
+            host.robots = asyncio.ensure_future(self._read_robots(url))
+        return await asyncio.shield(host.robots)
+
+    async def _read_robots(self, url: str) -> RobotFileParser:
+        parsed = urlparse(url)
+        robots = RobotFileParser(f"{parsed.scheme}://{parsed.netloc}/robots.txt")
+        try:
+            async with self._session.get(robots.url) as response:
+                if response.status in (401, 403):
+                    robots.disallow_all = True
+                elif response.status == 200:
+                    robots.parse((await response.text(errors="replace")).splitlines())
+                else:
+                    robots.allow_all = True
+        except (ClientError, asyncio.TimeoutError):
+            robots.allow_all = True
+        return robots
+
+    async def _wait_turn(self, host: _HostState, robots: Optional[RobotFileParser]):
+        """Sleeps until the host may get its next request, and books the slot after it."""
+        delay = self.politeness_delay
+        crawl_delay = robots.crawl_delay(self.user_agent) if robots is not None else None
+        if crawl_delay:
+            delay = max(delay, float(crawl_delay))
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, host.next_request)
+        host.next_request = start + (uniform(delay * 0.75, delay * 1.25) if delay > 0 else 0.0)
+        if start > now:
+            await asyncio.sleep(start - now)
@@ -0,0 +1,77 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Ordering and splitting of the children of an agent into the intermediate agents that bound its fan-out"""
+
+from re import findall
+from typing import List
+from typing import Tuple
+from urllib.parse import urlparse
+from zlib import crc32
+
+# Words compared when grouping agents by content similarity, and seeds of the MinHash signature computed over them
+MINHASH_WORD_REGEX = r"[a-z0-9]{4,}"
+MINHASH_SEEDS = (0, 0x9E3779B9)
+
+
+def split_evenly(items: List[str], parts: int) -> List[List[str]]:
+    """
+    Splits a list into consecutive chunks whose sizes differ by at most one.
+
+    Args:
+        items (list): The items to split.
+        parts (int): Number of chunks.
+
+    Returns:
+        list: The chunks, in order.
+    """
+    size, larger = divmod(len(items), parts)
+    chunks = []
+    start = 0
+    for index in range(parts):
+        end = start + size + (1 if index < larger else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def path_key(url: str) -> Tuple[str, ...]:
+    """
+    Args:
+        url (str): The URL of a page, empty for intermediate agents.
+
+    Returns:
+        tuple: The segments of the URL path, so that sorting by it puts the pages under the same path together.
+    """
+    return tuple(segment for segment in urlparse(url).path.split("/") if segment)
+
+
+def minhash_key(text: str) -> Tuple[int, ...]:
+    """
+    Computes a MinHash signature of the words of a text. Two texts share each value of their signatures
+    with a probability equal to the Jaccard similarity of their sets of words, so sorting by the signature
+    tends to put pages with similar content next to each other.
+
+    Args:
+        text (str): The content of a page.
+
+    Returns:
+        tuple: MINHASH_SEEDS minimum word hashes, the largest possible ones for a text without words.
+    """
+    words = {word.encode() for word in findall(MINHASH_WORD_REGEX, text.lower())}
+    if not words:
+        return (0xFFFFFFFF,) * len(MINHASH_SEEDS)
+    return tuple(min(crc32(word, seed) for word in words) for seed in MINHASH_SEEDS)
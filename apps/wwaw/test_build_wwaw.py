@@ -17,6 +17,8 @@
 from unittest.mock import Mock
 
 from build_wwaw import WebAgentNetworkBuilder
+from build_wwaw import clean_and_extract_text
+from build_wwaw import extract_page
 
 
 def test_create_intermediate_agents_single_pass():
@@ -80,3 +82,80 @@ def test_process_page_single_pass():
     assert agents[name]["down_chains"] == []
     assert len(to_visit) == 2  # /about and /contact; external should be ignored
     assert all("example.com" in link for link, _ in to_visit)
+
+
+def test_extract_page_single_pass():
+    html = """
+    <html><head><title> Test Page </title><script>var x = "<p>not text</p>";</script></head>
+    <body>
+        <h1>Heading</h1>
+        <p>Some text, see https://example.com/ref for more @(scene7 junk).</p>
+        <noscript><a href="/noscript">Fallback</a></noscript>
+        <a href="/about#team">About</a>
+        <ul><li><a href="http://example.com/contact">Contact</a></li></ul>
+    </body></html>
+    """
+
+    page = extract_page(html, "http://example.com/index.html")
+
+    assert page.title == "Test Page"
+    assert page.text == clean_and_extract_text(html)
+    assert "not text" not in page.text
+    assert "https://" not in page.text and "scene7" not in page.text
+    assert page.links == [
+        "http://example.com/noscript",
+        "http://example.com/about#team",
+        "http://example.com/contact",
+    ]
+
+
+def _leaf_depths(agents, name, depth=0):
+    """Returns the depth of every leaf under name, checking the fan-out on the way."""
+    children = agents[name]["down_chains"]
+    assert len(children) <= WebAgentNetworkBuilder.MAX_CHILDREN
+    if not children:
+        return [depth]
+    return [leaf for child in children for leaf in _leaf_depths(agents, child, depth + 1)]
+
+
+def test_enforce_max_fanout_bounds_fanout_and_depth():
+    builder = WebAgentNetworkBuilder()
+    for count in (11, 12, 95, 101, 1000):
+        pages = [f"page{index}" for index in range(count)]
+        agents = {"top": {"instructions": "", "down_chains": pages, "top_agent": "true"}}
+        agents.update({page: {"instructions": "", "down_chains": [], "top_agent": "false"} for page in pages})
+
+        balanced = builder.enforce_fanout_recursive(agents)
+
+        depths = _leaf_depths(balanced, "top")
+        assert len(depths) == count
+        # As shallow as the fan-out allows: ceil(log10(count)) levels
+        assert max(depths) == len(str(count - 1))
+        # The input is left untouched
+        assert agents["top"]["down_chains"] == pages
+
+    # Just over the limit, only the overflow is moved into a single branch
+    balanced = builder.enforce_max_fanout(
+        {
+            "top": {"instructions": "", "down_chains": [f"page{index}" for index in range(12)], "top_agent": "true"},
+            **{f"page{index}": {"instructions": "", "down_chains": [], "top_agent": "false"} for index in range(12)},
+        }
+    )
+    assert len(balanced) == 14
+    assert balanced["top"]["down_chains"][:9] == [f"page{index}" for index in range(9)]
+
+
+def test_enforce_max_fanout_groups_by_path():
+    builder = WebAgentNetworkBuilder()
+    urls = [f"https://example.com/{section}/{index}" for index in range(3) for section in ("blog", "docs", "shop")]
+    agents = {"top": {"instructions": "", "down_chains": [], "top_agent": "true"}}
+    for index, url in enumerate(urls):
+        agents["top"]["down_chains"].append(f"page{index}")
+        agents[f"page{index}"] = {"instructions": "", "down_chains": [], "top_agent": "false", "url": url}
+
+    balanced = builder.enforce_max_fanout(agents, max_children=3, grouping="path")
+
+    assert len(balanced["top"]["down_chains"]) == 3
+    for branch in balanced["top"]["down_chains"]:
+        sections = {balanced[page]["url"].split("/")[3] for page in balanced[branch]["down_chains"]}
+        assert len(sections) == 1
@@ -0,0 +1,98 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+
+from build_wwaw import WebAgentNetworkBuilder
+from crawl_cache import CrawlCache
+from crawler import CrawlFrontier
+from crawler import FetchResult
+
+HTML = "<html><head><title>Cached</title></head><body><p>Cached page text</p><a href='/next'>Next</a></body></html>"
+
+
+class FakeFetcher:
+    """Answers every request with the same status, recording the validators it was given."""
+
+    def __init__(self, status: int, text: str = ""):
+        self.status = status
+        self.text = text
+        self.requests = []
+
+    async def fetch(self, url, etag=None, last_modified=None):
+        self.requests.append((url, etag, last_modified))
+        return FetchResult(url, self.status, "text/html", self.text, etag='"v2"')
+
+
+def test_cache_round_trip(tmp_path):
+    cache = CrawlCache(str(tmp_path / "cache.sqlite"))
+    cache.put(FetchResult("http://example.com/", 200, "text/html", HTML, '"v1"', "Mon"), "text", "Cached", ["l"])
+
+    cached = cache.get("http://example.com/")
+
+    assert cached.html == HTML
+    assert (cached.etag, cached.last_modified) == ('"v1"', "Mon")
+    assert (cached.text, cached.title, cached.links) == ("text", "Cached", ["l"])
+    assert cache.get("http://example.com/other") is None
+    cache.close()
+
+
+def test_unchanged_page_is_revalidated_not_parsed(tmp_path):
+    builder = WebAgentNetworkBuilder()
+    builder.cache = CrawlCache(str(tmp_path / "cache.sqlite"))
+    url = "http://example.com/"
+    builder.cache.put(FetchResult(url, 200, "text/html", HTML, '"v1"'), "Cached page text", "Cached", [url + "next"])
+    fetcher = FakeFetcher(304)
+
+    resp, page = asyncio.run(builder._fetch_page(fetcher, None, url))
+
+    assert fetcher.requests == [(url, '"v1"', None)]
+    assert resp.status == 200 and resp.text == HTML
+    assert page.title == "Cached" and page.links == [url + "next"]
+
+    # A changed page is downloaded, parsed and cached again
+    fetcher = FakeFetcher(200, HTML.replace("Cached", "Changed"))
+    resp, page = asyncio.run(builder._fetch_page(fetcher, None, url))
+    assert page.title == "Changed"
+    assert builder.cache.get(url).etag == '"v2"'
+
+    # A fresh enough page is not requested at all
+    builder.cache_max_age = 60
+    asyncio.run(builder._fetch_page(fetcher, None, url))
+    assert len(fetcher.requests) == 1
+    builder.cache.close()
+
+
+def test_checkpoint_round_trip(tmp_path):
+    cache = CrawlCache(str(tmp_path / "cache.sqlite"))
+    frontier = CrawlFrontier()
+    frontier.append(("http://example.com/a", "home"))
+    frontier.append(("http://example.com/b#section", "home"))
+    cache.save_checkpoint("http://example.com/", {"frontier": frontier.snapshot([("http://example.com/c", "a")])})
+
+    restored = CrawlFrontier.from_snapshot(cache.load_checkpoint("http://example.com/")["frontier"])
+
+    assert list(restored) == [
+        ("http://example.com/c", "a"),
+        ("http://example.com/a", "home"),
+        ("http://example.com/b", "home"),
+    ]
+    assert "http://example.com/b" in restored
+    assert not restored.append(("http://example.com/a", "other"))
+
+    cache.delete_checkpoint("http://example.com/")
+    assert cache.load_checkpoint("http://example.com/") is None
+    cache.close()
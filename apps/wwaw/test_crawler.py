@@ -0,0 +1,159 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+from crawler import CrawlFrontier
+from crawler import PoliteFetcher
+
+PAGE = "<html><body><a href='/next'>Next</a></body></html>"
+
+
+class LocalSite:
+    """Local web site recording the requests it receives, with their arrival times and concurrency."""
+
+    def __init__(self, robots: str = None, page_delay: float = 0.0):
+        self.robots = robots
+        self.page_delay = page_delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, request):
+        if request.path == "/robots.txt":
+            if self.robots is None:
+                raise web.HTTPNotFound()
+            return web.Response(text=self.robots)
+
+        self.requests.append((request.path, asyncio.get_running_loop().time(), dict(request.headers)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.page_delay)
+        finally:
+            self.in_flight -= 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        headers = {"ETag": '"v1"', "Last-Modified": "Mon, 02 Jun 2025 12:00:00 GMT"}
+        return web.Response(text=PAGE, content_type="text/html", headers=headers)
+
+    @asynccontextmanager
+    async def serve(self):
+        """Serve the site on a free local port, yielding its base url."""
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        try:
+            yield f"http://127.0.0.1:{runner.addresses[0][1]}"
+        finally:
+            await runner.cleanup()
+
+    def paths(self):
+        return [path for path, _, _ in self.requests]
+
+    def gaps(self):
+        times = sorted(time for _, time, _ in self.requests)
+        return [later - earlier for earlier, later in zip(times, times[1:])]
+
+
+def test_frontier_dedups_urls_without_fragments():
+    frontier = CrawlFrontier()
+
+    assert frontier.append(("http://example.com/a#intro", None))
+    assert not frontier.append(("http://example.com/a", "home"))
+    assert not frontier.append(("http://example.com/a#usage", "home"))
+    assert frontier.append(("http://example.com/b", "home"))
+
+    assert "http://example.com/a#anything" in frontier
+    assert len(frontier) == 2
+    assert frontier.popleft() == ("http://example.com/a", None)
+    # A crawled url is still remembered, so it is never queued again
+    assert not frontier.append(("http://example.com/a", "b"))
+    assert list(frontier) == [("http://example.com/b", "home")]
+
+
+def test_per_host_concurrency_is_capped():
+    site = LocalSite(page_delay=0.05)
+
+    async def crawl():
+        async with site.serve() as base_url:
+            async with PoliteFetcher(max_concurrency=16, per_host_concurrency=2) as fetcher:
+                return await asyncio.gather(*(fetcher.fetch(f"{base_url}/page{i}") for i in range(6)))
+
+    results = asyncio.run(crawl())
+
+    assert [result.status for result in results] == [200] * 6
+    assert results[0].text == PAGE
+    assert site.max_in_flight == 2
+
+
+def test_requests_to_a_host_are_spaced_by_the_politeness_delay():
+    site = LocalSite()
+
+    async def crawl():
+        async with site.serve() as base_url:
+            async with PoliteFetcher(per_host_concurrency=4, politeness_delay=0.1) as fetcher:
+                await asyncio.gather(*(fetcher.fetch(f"{base_url}/page{i}") for i in range(3)))
+
+    asyncio.run(crawl())
+
+    # The delay is jittered by up to a quarter either way
+    assert len(site.gaps()) == 2
+    assert all(gap >= 0.07 for gap in site.gaps())
+
+
+def test_robots_disallow_and_crawl_delay_are_respected():
+    site = LocalSite(robots="User-agent: *\nDisallow: /private\nCrawl-delay: 1\n")
+
+    async def crawl():
+        async with site.serve() as base_url:
+            async with PoliteFetcher(politeness_delay=0.0) as fetcher:
+                return await asyncio.gather(
+                    fetcher.fetch(f"{base_url}/private/page"),
+                    fetcher.fetch(f"{base_url}/public1"),
+                    fetcher.fetch(f"{base_url}/public2"),
+                )
+
+    private, public1, public2 = asyncio.run(crawl())
+
+    assert private.status == 0
+    assert (public1.status, public2.status) == (200, 200)
+    assert sorted(site.paths()) == ["/public1", "/public2"]
+    assert site.gaps()[0] >= 0.7
+
+
+def test_cached_validators_make_conditional_requests():
+    site = LocalSite()
+
+    async def crawl():
+        async with site.serve() as base_url:
+            async with PoliteFetcher(respect_robots=False) as fetcher:
+                first = await fetcher.fetch(f"{base_url}/page")
+                second = await fetcher.fetch(f"{base_url}/page", first.etag, first.last_modified)
+                return first, second
+
+    first, second = asyncio.run(crawl())
+
+    assert (first.status, first.etag, first.last_modified) == (200, '"v1"', "Mon, 02 Jun 2025 12:00:00 GMT")
+    assert "If-None-Match" not in site.requests[0][2]
+    assert second.not_modified and second.text == ""
+    assert site.requests[1][2]["If-None-Match"] == '"v1"'
+    assert site.requests[1][2]["If-Modified-Since"] == "Mon, 02 Jun 2025 12:00:00 GMT"
@@ -15,15 +15,18 @@
 # END COPYRIGHT
 
 import logging
-import os
 from typing import Any
 from typing import Dict
 from typing import Union
 
-from neuro_san.client.agent_session_factory import AgentSessionFactory
 from neuro_san.client.streaming_input_processor import StreamingInputProcessor
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.tools.agent_session_pool import SessionKey
+from coded_tools.tools.agent_session_pool import get_shared_agent_session_pool
+from coded_tools.tools.call_agent import create_agent_session
+from coded_tools.tools.call_agent import new_agent_state_info
+
 logger = logging.getLogger(__name__)
 
 CONNECTION_TYPE = "direct"
@@ -89,42 +92,18 @@ class CallAgent(CodedTool):
         logger.info("mode: %s", str(mode))
         logger.info("agent_name: %s", str(self.agent_name))
 
-        agent_session = sly_data.get("agent_session", None)
-        self.agent_state_info = sly_data.get("agent_state_info", None)
-        if not self.agent_state_info or not agent_session:
-            agent_session, self.agent_state_info = self.set_up_agent()
-        response, self.agent_state_info = self.call_agent(agent_session, inquiry + mode)
-        sly_data["agent_session"] = agent_session
+        # The conversation continues from sly_data, while the session comes from the shared pool
+        self.agent_state_info = sly_data.get("agent_state_info", None) or new_agent_state_info()
+        key = SessionKey(self.agent_name, CONNECTION_TYPE, HOST, PORT)
+        # The downstream agent runs synchronously, so the pool runs it off the event loop
+        response, self.agent_state_info = await get_shared_agent_session_pool(create_agent_session).call(
+            key, self.call_agent, inquiry + mode
+        )
         sly_data["agent_state_info"] = self.agent_state_info
 
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return response
 
-    def set_up_agent(self):
-        """Configure these as needed."""
-        connection = CONNECTION_TYPE
-        host = HOST
-        port = PORT
-        local_externals_direct = False
-        metadata = {"user_id": os.environ.get("USER")}
-
-        # Create session factory and agent session
-        factory = AgentSessionFactory()
-        agent_session = factory.create_session(
-            connection, self.agent_name, host, port, local_externals_direct, metadata
-        )
-        # Initialize any conversation state here
-        agent_state_info = {
-            "last_chat_response": None,
-            "prompt": "Please enter your response ('quit' to terminate):\n",
-            "timeout": 5000.0,
-            "num_input": 0,
-            "user_input": None,
-            "sly_data": None,
-            "chat_filter": {"chat_filter_type": "MAXIMAL"},
-        }
-        return agent_session, agent_state_info
-
     def call_agent(self, agent_session, user_input):
         """
         Processes a single turn of user input within the selected agent's session.
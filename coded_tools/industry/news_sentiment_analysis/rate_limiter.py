@@ -0,0 +1,133 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Token-bucket rate limiting of the news sources, driven by the rate limit headers the servers send back"""
+
+import threading
+import time
+from typing import Callable
+from typing import Mapping
+from typing import Optional
+
+# Values of a reset header above this are epoch seconds, below it seconds from now
+EPOCH_THRESHOLD = 1_000_000_000
+# Names the news APIs give their rate limit headers. Header lookups of requests are case-insensitive.
+REMAINING_HEADERS = ("X-Rate-Limit-Remaining", "X-RateLimit-Remaining", "X-RateLimit-Remaining-Minute")
+RESET_HEADERS = ("X-Rate-Limit-Reset", "X-RateLimit-Reset")
+LIMIT_PER_MINUTE_HEADERS = ("X-RateLimit-Limit-Minute",)
+
+
+class TokenBucket:
+    """
+    Allows up to `capacity` requests at once, refilled at `rate` requests per second.
+
+    acquire() blocks until a request is allowed, so callers wait exactly as long as the limit requires instead of
+    sleeping a fixed time. update() tightens or relaxes the bucket from the rate limit headers of a response: no more
+    tokens than the server says remain, a per-minute limit the server announces, and a pause until the reset time
+    once the server's quota is used up.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        :param rate: Requests per second in the long run
+        :param capacity: Requests allowed in a burst
+        :param clock: Monotonic clock, replaceable in tests
+        :param sleep: Sleep function, replaceable in tests
+        """
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._clock: Callable[[], float] = clock
+        self._sleep: Callable[[float], None] = sleep
+        self._lock = threading.Lock()
+        self._tokens: float = capacity
+        self._updated: float = clock()
+        self._paused_until: float = 0.0
+
+    def acquire(self) -> float:
+        """
+        Wait until a request is allowed and take its token.
+
+        :return: Seconds waited
+        """
+        waited: float = 0.0
+        while True:
+            with self._lock:
+                now: float = self._clock()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                delay: float = max(self._paused_until - now, (1.0 - self._tokens) / self.rate)
+            self._sleep(delay)
+            waited += delay
+
+    def update(self, headers: Mapping[str, str]):
+        """
+        Adjust the bucket to the rate limit headers of a response.
+
+        :param headers: Headers of the response
+        """
+        remaining: Optional[float] = _header_number(headers, REMAINING_HEADERS)
+        reset: Optional[float] = _header_number(headers, RESET_HEADERS)
+        per_minute: Optional[float] = _header_number(headers, LIMIT_PER_MINUTE_HEADERS)
+        with self._lock:
+            now: float = self._clock()
+            self._refill(now)
+            if per_minute:
+                self.rate = per_minute / 60.0
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    wait: float = reset - time.time() if reset > EPOCH_THRESHOLD else reset
+                    self._paused_until = max(self._paused_until, now + max(wait, 0.0))
+
+    def pause(self, seconds: float):
+        """
+        Allow no request for a while, e.g. for the Retry-After of a 429 response.
+
+        :param seconds: Seconds to wait before the next request
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def _refill(self, now: float):
+        """Add the tokens earned since the last refill. Caller holds the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+def _header_number(headers: Mapping[str, str], names: tuple) -> Optional[float]:
+    """
+    :param headers: Headers of a response
+    :param names: Names the header may have
+    :return: The value of the first of the headers present, if it is a number
+    """
+    for name in names:
+        value: Optional[str] = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
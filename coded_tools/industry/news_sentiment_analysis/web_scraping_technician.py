@@ -14,11 +14,19 @@
 #
 # END COPYRIGHT
 
+import asyncio
 import logging
 import os
-import time
+import threading
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Optional
+from urllib.parse import urldefrag
+from urllib.parse import urlparse
 
 # pylint: disable=import-error
 import backoff
@@ -28,22 +36,64 @@ from bs4 import BeautifulSoup
 from neuro_san.interfaces.coded_tool import CodedTool
 from newspaper import Article
 
+from coded_tools.industry.news_sentiment_analysis.rate_limiter import TokenBucket
+
 # pylint: enable=import-error
 
 # Setup logger
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+SOURCES = ("nyt", "guardian", "aljazeera")
+# Articles scraped at the same time, across all sources
+DEFAULT_ARTICLE_WORKERS = 8
+# Article pages requested per second from each news site, and in a burst
+ARTICLE_RATE_PER_HOST = 2.0
+ARTICLE_BURST_PER_HOST = 2
+# The NYT APIs allow 5 calls per minute, so one every 12 seconds without a burst
+NYT_RATE = 5 / 60
+NYT_BURST = 1
+
+# Submits the scraping of an article unless another source already did: (url, source, keywords) -> future or None
+ArticleSubmitter = Callable[[str, str, Optional[List[str]]], Optional[Future]]
+
+# Shared by every WebScrapingTechnician in the process, since a CodedTool instance does not outlive its invocation.
+# The Guardian developer keys allow one call per second. The rate limit headers of the responses adjust both limiters,
+# e.g. a higher per-minute limit announced by the NYT relaxes its rate.
+NYT_LIMITER = TokenBucket(rate=NYT_RATE, capacity=NYT_BURST)
+GUARDIAN_LIMITER = TokenBucket(rate=1.0, capacity=1)
+_HOST_LIMITERS: Dict[str, TokenBucket] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+
+def host_limiter(url: str) -> TokenBucket:
+    """
+    :param url: URL of an article
+    :return: The process-wide rate limiter of the site serving it
+    """
+    host: str = urlparse(url).netloc.lower()
+    with _HOST_LIMITERS_LOCK:
+        if host not in _HOST_LIMITERS:
+            _HOST_LIMITERS[host] = TokenBucket(ARTICLE_RATE_PER_HOST, ARTICLE_BURST_PER_HOST)
+        return _HOST_LIMITERS[host]
+
 
 class WebScrapingTechnician(CodedTool):
     """
     CodedTool implementation for collecting news articles from The New York Times, The Guardian, and Al Jazeera.
     Supports keyword-based filtering and saves results to text files for downstream analysis.
+
+    Sources are listed concurrently, each paced by a token bucket that follows the rate limit headers of its API,
+    and the articles they find are scraped by a shared pool of workers, at most once per URL across sources.
     """
 
-    def __init__(self):
+    def __init__(self, article_workers: int = DEFAULT_ARTICLE_WORKERS):
+        """
+        :param article_workers: Number of articles scraped at the same time
+        """
         self.nyt_api_key = os.getenv("NYT_API_KEY")
         self.guardian_api_key = os.getenv("GUARDIAN_API_KEY")
+        self.article_workers = article_workers
         self.nyt_sections = [
             "arts",
             "business",
@@ -61,6 +111,11 @@ class WebScrapingTechnician(CodedTool):
             "world",
         ]
         self.aljazeera_feeds = {"world": "https://www.aljazeera.com/xml/rss/all.xml"}
+        # Keeps connections to the APIs and news sites open between requests
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=article_workers + len(SOURCES))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         logger.info("WebScrapingTechnician initialized")
 
     def scrape_with_bs4(self, url: str, source: str = "generic") -> str:
@@ -73,7 +128,8 @@ class WebScrapingTechnician(CodedTool):
         :return: Extracted article text, or an empty string if scraping fails.
         """
         try:
-            response = requests.get(url, timeout=15)
+            host_limiter(url).acquire()
+            response = self.session.get(url, timeout=15)
             soup = BeautifulSoup(response.content, "html.parser")
             if source == "nyt":
                 article_body = soup.find_all("section", {"name": "articleBody"})
@@ -101,20 +157,43 @@ class WebScrapingTechnician(CodedTool):
 
         :return: Parsed JSON response containing articles.
         """
-        response = requests.get(url, timeout=15)
+        NYT_LIMITER.acquire()
+        response = self.session.get(url, timeout=15)
+        # A 429 with exhausted quota pauses the limiter until the reset time, which the retry then waits for
+        NYT_LIMITER.update(response.headers)
         if response.status_code == 429:
             remaining = response.headers.get("X-Rate-Limit-Remaining")
             reset_time = response.headers.get("X-Rate-Limit-Reset")
-            if remaining == "0" and reset_time:
-                wait = max(0, int(reset_time) - int(time.time())) + 2
-                logger.warning("Rate limit hit. Waiting %s seconds for reset.", wait)
-                time.sleep(wait)
-                response = requests.get(url, timeout=15)
-            elif remaining == "0":
+            retry_after = response.headers.get("Retry-After", "")
+            if remaining == "0" and not reset_time:
                 raise requests.exceptions.HTTPError("Daily quota exhausted", response=response)
+            if retry_after.isdigit():
+                NYT_LIMITER.pause(float(retry_after))
+            logger.warning("NYT rate limit hit, retrying %s", url)
         response.raise_for_status()
         return response.json()
 
+    def _fetch_guardian_results(self, keyword: str, page_size: int) -> List[Dict]:
+        """
+        Search the Guardian API for articles about a keyword, within its rate limit.
+
+        :param keyword: The keyword to search for.
+        :param page_size: Number of articles to fetch.
+
+        :return: The search results.
+        """
+        url = "https://content.guardianapis.com/search"
+        params = {
+            "q": keyword,
+            "api-key": self.guardian_api_key,
+            "page-size": page_size,
+            "show-fields": "bodyText",
+        }
+        GUARDIAN_LIMITER.acquire()
+        response = self.session.get(url, params=params, timeout=15)
+        GUARDIAN_LIMITER.update(response.headers)
+        return response.json().get("response", {}).get("results", [])
+
     @backoff.on_exception(backoff.expo, requests.exceptions.RequestException, max_tries=3, max_time=30)
     def _fetch_aljazeera_feed(self, feed_url: str) -> Any:
         """
@@ -136,6 +215,7 @@ class WebScrapingTechnician(CodedTool):
         :return: Extracted article text, or an empty string if scraping fails.
         """
         try:
+            host_limiter(url).acquire()
             article = Article(url)
             article.download()
             article.parse()
@@ -148,22 +228,31 @@ class WebScrapingTechnician(CodedTool):
             logger.debug("Newspaper3k failed for %s: %s", url, e)
             return self.scrape_with_bs4(url, source)
 
-    def scrape_nyt(self, keywords: list, save_dir: str = "nyt_articles_output") -> Dict[str, Any]:
+    def _scrape_matching(self, url: str, source: str, keywords: Optional[List[str]] = None) -> str:
         """
-        Scrape NYT articles matching given keywords and save them to a text file.
+        Scrape an article, keeping it only if it mentions one of the keywords when keywords are given.
 
-        :param keywords: List of keywords to filter articles.
-        :param save_dir: Directory to save the output file.
+        :param url: The article URL.
+        :param source: The news source name for custom parsing.
+        :param keywords: Lower case keywords the content must contain, None to keep any content.
 
-        :return: Dictionary with the number of saved articles, file path, and status.
+        :return: The article text on a single line, or an empty string.
         """
-        logger.info("NYT scraping started")
-        keywords = [kw.lower() for kw in keywords]
+        content = self._scrape_article(url, source)
+        if keywords is not None and not any(kw in content.lower() for kw in keywords):
+            return ""
+        return content.replace("\n", " ")
 
-        os.makedirs(save_dir, exist_ok=True)
+    def _list_nyt(self, keywords: List[str], submit: ArticleSubmitter) -> List[Future]:
+        """
+        Find the NYT top stories matching the keywords, submitting each one for scraping as soon as it is found.
 
-        all_articles = []
+        :param keywords: Lower case keywords to filter articles.
+        :param submit: Submits the scraping of an article.
 
+        :return: The futures of the submitted articles.
+        """
+        futures = []
         for section in self.nyt_sections:
             url = f"https://api.nytimes.com/svc/topstories/v2/{section}.json?api-key={self.nyt_api_key}"
             try:
@@ -171,145 +260,184 @@ class WebScrapingTechnician(CodedTool):
                 for article in data.get("results", []):
                     text_check = (article.get("title", "") + " " + article.get("abstract", "")).lower()
                     if any(kw in text_check for kw in keywords):
-                        content = self._scrape_article(article.get("url"), "nyt")
-                        if content:
-                            all_articles.append(content.replace("\n", " "))
-                        time.sleep(0.5)
-                time.sleep(6)
+                        futures.append(submit(article.get("url"), "nyt", None))
             except requests.exceptions.RequestException as e:
                 logger.error("Error in NYT section '%s': %s", section, e)
+        return futures
 
-        filename = os.path.join(save_dir, "nyt_articles.txt")
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(all_articles) + "\n")
-
-        return {
-            "saved_articles": len(all_articles),
-            "file": filename,
-            "status": "success" if all_articles else "failed",
-        }
-
-    def scrape_guardian(
-        self, keywords: list, save_dir: str = "guardian_articles_output", page_size: int = 50
-    ) -> Dict[str, Any]:
+    def _list_guardian(self, keywords: List[str], submit: ArticleSubmitter, page_size: int = 50) -> List[Future]:
         """
-        Scrape Guardian articles matching given keywords and save them to a text file.
+        Search the Guardian for each keyword, submitting the articles found for scraping.
 
-        :param keywords: List of keywords to filter articles.
-        :param save_dir: Directory to save the output file.
+        :param keywords: Lower case keywords to search for.
+        :param submit: Submits the scraping of an article.
         :param page_size: Number of articles to fetch per keyword.
 
-        :return: Dictionary with the number of saved articles, file path, and status.
+        :return: The futures of the submitted articles.
         """
-        logger.info("Guardian scraping started")
-        keywords = [kw.lower() for kw in keywords]
+        futures = []
+        for keyword in keywords:
+            try:
+                for article in self._fetch_guardian_results(keyword, page_size):
+                    futures.append(submit(article.get("webUrl"), "guardian", None))
+            except requests.exceptions.RequestException as e:
+                logger.error("Guardian error for keyword '%s': %s", keyword, e)
+        return futures
 
-        os.makedirs(save_dir, exist_ok=True)
+    def _list_aljazeera(self, keywords: List[str], submit: ArticleSubmitter) -> List[Future]:
+        """
+        Read the Al Jazeera feeds, submitting every entry for scraping. Entries whose title and summary do not
+        mention a keyword are only kept if their content does.
 
-        all_articles = []
+        :param keywords: Lower case keywords to filter articles.
+        :param submit: Submits the scraping of an article.
 
-        for keyword in keywords:
-            url = "https://content.guardianapis.com/search"
-            params = {
-                "q": keyword,
-                "api-key": self.guardian_api_key,
-                "page-size": page_size,
-                "show-fields": "bodyText",
-            }
+        :return: The futures of the submitted articles.
+        """
+        futures = []
+        for feed_name, feed_url in self.aljazeera_feeds.items():
             try:
-                response = requests.get(url, params=params, timeout=15)
-                results = response.json().get("response", {}).get("results", [])
-                for article in results:
-                    content = self._scrape_article(article.get("webUrl"), "guardian")
-                    if content:
-                        all_articles.append(content.replace("\n", " "))
-                    time.sleep(0.5)
+                feed = self._fetch_aljazeera_feed(feed_url)
+                for entry in feed.entries:
+                    text_check = (entry.get("title", "") + " " + entry.get("summary", "")).lower()
+                    matches_initial = any(kw in text_check for kw in keywords)
+                    futures.append(submit(entry.link, "aljazeera", None if matches_initial else keywords))
             except requests.exceptions.RequestException as e:
-                logger.error("Guardian error for keyword '%s': %s", keyword, e)
+                logger.error("Al Jazeera feed '%s' error: %s", feed_name, e)
+        return futures
+
+    def collect(self, sources: List[str], keywords: List[str], guardian_page_size: int = 50) -> Dict[str, List[str]]:
+        """
+        Collect the articles of several sources concurrently.
+
+        Each source is listed on its own thread, paced by the rate limiter of its API, and every article found
+        is scraped by a pool of article_workers threads while the listing goes on. An article found by several
+        sources is scraped once, for the first source that found it.
+
+        :param sources: Names of the sources, from SOURCES.
+        :param keywords: List of keywords to filter articles.
+        :param guardian_page_size: Number of Guardian articles to fetch per keyword.
+
+        :return: The text of the articles collected from each source, one line per article.
+        """
+        keywords = [kw.lower() for kw in keywords]
+        seen = set()
+        seen_lock = threading.Lock()
+        listers = {
+            "nyt": lambda submit: self._list_nyt(keywords, submit),
+            "guardian": lambda submit: self._list_guardian(keywords, submit, guardian_page_size),
+            "aljazeera": lambda submit: self._list_aljazeera(keywords, submit),
+        }
+
+        with ThreadPoolExecutor(self.article_workers, thread_name_prefix="news-article") as article_pool:
+
+            def submit(url: str, source: str, article_keywords: Optional[List[str]]) -> Optional[Future]:
+                if not url:
+                    return None
+                key = urldefrag(url)[0].rstrip("/")
+                with seen_lock:
+                    if key in seen:
+                        return None
+                    seen.add(key)
+                return article_pool.submit(self._scrape_matching, url, source, article_keywords)
+
+            logger.info("Scraping %s", ", ".join(sources))
+            with ThreadPoolExecutor(len(sources), thread_name_prefix="news-source") as source_pool:
+                listings = {source: source_pool.submit(listers[source], submit) for source in sources}
+                collected = {}
+                for source, listing in listings.items():
+                    futures = [future for future in listing.result() if future is not None]
+                    collected[source] = [content for content in (future.result() for future in futures) if content]
+                    logger.info("%s scraping done: %d articles", source, len(collected[source]))
+        return collected
+
+    @staticmethod
+    def _save_articles(articles: List[str], save_dir: str, file_name: str) -> Dict[str, Any]:
+        """
+        Save articles to a text file, one per line.
 
-        filename = os.path.join(save_dir, "guardian_articles.txt")
+        :param articles: The articles.
+        :param save_dir: Directory to save the output file.
+        :param file_name: Name of the output file.
+
+        :return: Dictionary with the number of saved articles, file path, and status.
+        """
+        os.makedirs(save_dir, exist_ok=True)
+        filename = os.path.join(save_dir, file_name)
         with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(all_articles) + "\n")
+            f.write("\n".join(articles) + "\n")
 
         return {
-            "saved_articles": len(all_articles),
+            "saved_articles": len(articles),
             "file": filename,
-            "status": "success" if all_articles else "failed",
+            "status": "success" if articles else "failed",
         }
 
-    def scrape_aljazeera(self, keywords: list, save_dir: str = "aljazeera_articles_output") -> Dict[str, Any]:
+    def scrape_nyt(self, keywords: list, save_dir: str = "nyt_articles_output") -> Dict[str, Any]:
         """
-        Scrape Al Jazeera articles matching given keywords and save them to a text file.
+        Scrape NYT articles matching given keywords and save them to a text file.
 
         :param keywords: List of keywords to filter articles.
         :param save_dir: Directory to save the output file.
 
         :return: Dictionary with the number of saved articles, file path, and status.
         """
-        logger.info("Al Jazeera scraping started")
-        keywords = [kw.lower() for kw in keywords]
+        articles = self.collect(["nyt"], keywords)["nyt"]
+        return self._save_articles(articles, save_dir, "nyt_articles.txt")
 
-        os.makedirs(save_dir, exist_ok=True)
+    def scrape_guardian(
+        self, keywords: list, save_dir: str = "guardian_articles_output", page_size: int = 50
+    ) -> Dict[str, Any]:
+        """
+        Scrape Guardian articles matching given keywords and save them to a text file.
 
-        all_articles = []
+        :param keywords: List of keywords to filter articles.
+        :param save_dir: Directory to save the output file.
+        :param page_size: Number of articles to fetch per keyword.
 
-        for feed_name, feed_url in self.aljazeera_feeds.items():
-            try:
-                feed = self._fetch_aljazeera_feed(feed_url)
-                for entry in feed.entries:
-                    text_check = (entry.get("title", "") + " " + entry.get("summary", "")).lower()
-                    matches_initial = any(kw in text_check for kw in keywords)
-                    content = self._scrape_article(entry.link, "aljazeera")
-                    if content and (matches_initial or any(kw in content.lower() for kw in keywords)):
-                        all_articles.append(content.replace("\n", " "))
-                    time.sleep(0.5)
-            except requests.exceptions.RequestException as e:
-                logger.error("Al Jazeera feed '%s' error: %s", feed_name, e)
+        :return: Dictionary with the number of saved articles, file path, and status.
+        """
+        articles = self.collect(["guardian"], keywords, page_size)["guardian"]
+        return self._save_articles(articles, save_dir, "guardian_articles.txt")
 
-        filename = os.path.join(save_dir, "aljazeera_articles.txt")
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(all_articles) + "\n")
+    def scrape_aljazeera(self, keywords: list, save_dir: str = "aljazeera_articles_output") -> Dict[str, Any]:
+        """
+        Scrape Al Jazeera articles matching given keywords and save them to a text file.
 
-        return {
-            "saved_articles": len(all_articles),
-            "file": filename,
-            "status": "success" if all_articles else "failed",
-        }
+        :param keywords: List of keywords to filter articles.
+        :param save_dir: Directory to save the output file.
+
+        :return: Dictionary with the number of saved articles, file path, and status.
+        """
+        articles = self.collect(["aljazeera"], keywords)["aljazeera"]
+        return self._save_articles(articles, save_dir, "aljazeera_articles.txt")
 
     def scrape_all(self, keywords: list, save_dir: str = "all_articles_output") -> Dict[str, Any]:
         """
         Scrape articles from all supported sources for given keywords and combine results.
+        The sources are scraped concurrently, and an article found by several of them is saved once.
 
         :param keywords: List of keywords to filter articles.
         :param save_dir: Directory to save the combined output file.
 
         :return: Dictionary with the number of saved articles, individual file paths, combined file path, and status.
         """
-        os.makedirs(save_dir, exist_ok=True)
-
-        nyt_result = self.scrape_nyt(keywords, save_dir)
-        guardian_result = self.scrape_guardian(keywords, save_dir)
-        aljazeera_result = self.scrape_aljazeera(keywords, save_dir)
+        collected = self.collect(list(SOURCES), keywords)
+        results = {
+            source: self._save_articles(collected[source], save_dir, f"{source}_articles.txt") for source in SOURCES
+        }
 
         # Combine all articles into a single file
-        all_articles = []
-        for result in [nyt_result, guardian_result, aljazeera_result]:
-            file_path = result.get("file")
-            if file_path and os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    all_articles.extend(line.strip() for line in f if line.strip())
-
-        combined_filename = os.path.join(save_dir, "all_news_articles.txt")
-        with open(combined_filename, "w", encoding="utf-8") as f:
-            f.write("\n".join(all_articles) + "\n")
+        all_articles = [article for source in SOURCES for article in collected[source]]
+        combined = self._save_articles(all_articles, save_dir, "all_news_articles.txt")
 
         return {
-            "saved_articles": len(all_articles),
-            "nyt_file": nyt_result.get("file"),
-            "guardian_file": guardian_result.get("file"),
-            "aljazeera_file": aljazeera_result.get("file"),
-            "combined_file": combined_filename,
-            "status": "success" if all_articles else "failed",
+            "saved_articles": combined["saved_articles"],
+            "nyt_file": results["nyt"]["file"],
+            "guardian_file": results["guardian"]["file"],
+            "aljazeera_file": results["aljazeera"]["file"],
+            "combined_file": combined["file"],
+            "status": combined["status"],
         }
 
     def invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -356,6 +484,6 @@ class WebScrapingTechnician(CodedTool):
 
     async def async_invoke(self, args: Dict[str, Any], sly_data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Delegates to the synchronous invoke method.
+        Runs the synchronous invoke method on a worker thread, so the collection does not block the event loop.
         """
-        return self.invoke(args, sly_data)
+        return await asyncio.to_thread(self.invoke, args, sly_data)
@@ -14,9 +14,7 @@
 #
 # END COPYRIGHT
 
-import json
 import logging
-import os
 from datetime import datetime
 from typing import Any
 from typing import Dict
@@ -25,7 +23,10 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.kwik_agents.list_topics import LONG_TERM_MEMORY_FILE
 from coded_tools.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
-from coded_tools.kwik_agents.list_topics import MEMORY_FILE_PATH
+from coded_tools.kwik_agents.list_topics import SEMANTIC_RECALL
+from coded_tools.kwik_agents.list_topics import get_long_term_memory
+from coded_tools.kwik_agents.semantic_memory_index import get_semantic_memory_index
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
 
 
 class CommitToMemory(CodedTool):
@@ -58,6 +59,8 @@ class CommitToMemory(CodedTool):
 
                 Keys expected for this implementation are:
                     "TopicMemory" a dictionary containing topics as keys and strings of facts as values.
+                    With LONG_TERM_MEMORY_FILE it only holds the topics used in this session,
+                    the long-term memory itself is in the memory store.
 
         :return:
             In case of successful execution:
@@ -66,12 +69,7 @@ class CommitToMemory(CodedTool):
                 a text string an error message in the format:
                 "Error: <error message>"
         """
-        self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
-        if not self.topic_memory:
-            if LONG_TERM_MEMORY_FILE:
-                self.read_memory_from_file()
-            else:
-                self.topic_memory = {}
+        self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None) or {}
         the_new_fact: str = args.get("new_fact", "")
         if the_new_fact == "":
             return "Error: No new_fact provided."
@@ -95,39 +93,25 @@ class CommitToMemory(CodedTool):
         """
         return self.invoke(args, sly_data)
 
-    def write_memory_to_file(self):
-        """
-        Writes the topic memory dictionary to a JSON file.
-        """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as file:
-            file.write(json.dumps(self.topic_memory, indent=2))
-
-    def read_memory_from_file(self):
-        """
-        Reads the topic memory dictionary from a JSON file if it exists.
-        Otherwise initializes an empty dictionary.
-        """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
-
     def add_memory(self, topic: str, new_fact: str) -> str:
         """
-        Adds a new fact to memory and saves the memory dictionary to a JSON file.
+        Adds a new fact to memory, and to the memory store with LONG_TERM_MEMORY_FILE.
 
         Parameters:
         - topic (str): A topic to store the memory under.
         - new_fact (str): The new fact to remember.
 
         Returns:
-        - str: The updated memory string for the given topic.
+        - str: The updated memory string for the given topic,
+          limited to its most recent facts with LONG_TERM_MEMORY_FILE.
         """
+        if LONG_TERM_MEMORY_FILE:
+            store = get_long_term_memory()
+            fact_id = store.add_fact(topic, new_fact)
+            if SEMANTIC_RECALL:
+                self.index_fact(store, fact_id, topic, new_fact)
+            self.topic_memory[topic] = TopicMemoryStore.format_facts(store.facts(topic))
+            return self.topic_memory[topic]
 
         time_stamp = f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] "
 
@@ -136,7 +120,20 @@ class CommitToMemory(CodedTool):
         else:
             self.topic_memory[topic] = self.topic_memory[topic] + "\n" + time_stamp + new_fact
 
-        if LONG_TERM_MEMORY_FILE:
-            self.write_memory_to_file()
-
         return self.topic_memory[topic]
+
+    def index_fact(self, store: TopicMemoryStore, fact_id: int, topic: str, new_fact: str):
+        """
+        Embeds a newly stored fact for semantic recall. A fact that could not be embedded
+        is still stored, and embedded by the next semantic recall instead.
+
+        Parameters:
+        - store (TopicMemoryStore): The memory store holding the fact.
+        - fact_id (int): The id of the fact in the store.
+        - topic (str): The topic the fact is stored under.
+        - new_fact (str): The fact.
+        """
+        try:
+            get_semantic_memory_index(store).add(fact_id, topic, new_fact)
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            logging.getLogger(self.__class__.__name__).warning("Could not embed the new fact: %s", exception)
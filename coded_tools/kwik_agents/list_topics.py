@@ -14,17 +14,28 @@
 #
 # END COPYRIGHT
 
-import json
 import logging
-import os
 from typing import Any
 from typing import Dict
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
+from coded_tools.kwik_agents.topic_memory_store import get_topic_memory_store
+
 LONG_TERM_MEMORY_FILE = True  # Store and read memory from file
 MEMORY_FILE_PATH = "./"
 MEMORY_DATA_STRUCTURE = "TopicMemory"
+SEMANTIC_RECALL = True  # Embed facts as they are committed and recall them by meaning. Needs LONG_TERM_MEMORY_FILE.
+
+
+def get_long_term_memory() -> TopicMemoryStore:
+    """
+    :return: The store behind the long-term memory file, which imports the TopicMemory.json file
+        of earlier versions when it is first created
+    """
+    file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE
+    return get_topic_memory_store(file_path + ".sqlite", legacy_json_file=file_path + ".json")
 
 
 class ListTopics(CodedTool):
@@ -40,21 +51,22 @@ class ListTopics(CodedTool):
         :param args: None
 
         :param sly_data: "TopicMemory" a dictionary containing topics as keys and strings of facts as values.
+                Only used without LONG_TERM_MEMORY_FILE, when the memory lives in sly_data alone.
 
         :return: The list of topics in the memory
         """
-        self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
-        if not self.topic_memory:
-            if LONG_TERM_MEMORY_FILE:
-                self.read_memory_from_file()
-            else:
+        if LONG_TERM_MEMORY_FILE:
+            # Only the topics are read, not the facts under them
+            self.topic_memory = dict.fromkeys(get_long_term_memory().topics())
+        else:
+            self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
+            if not self.topic_memory:
                 return "NO TOPICS YET!"
 
         logger = logging.getLogger(self.__class__.__name__)
         logger.info(">>>>>>>>>>>>>>>>>>>ListTopics>>>>>>>>>>>>>>>>>>")
         topics_str = self.get_memory_topics()
         logger.info("The resulting list of topics: \n %s", str(topics_str))
-        sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return topics_str
 
@@ -64,19 +76,6 @@ class ListTopics(CodedTool):
         """
         return self.invoke(args, sly_data)
 
-    def read_memory_from_file(self):
-        """
-        Reads the topic memory dictionary from a JSON file if it exists.
-        Otherwise initializes an empty dictionary.
-        """
-        file_path = MEMORY_FILE_PATH + MEMORY_DATA_STRUCTURE + ".json"
-        if os.path.exists(file_path):
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-                self.topic_memory = json.loads(content) if content else {}
-        else:
-            self.topic_memory = {}
-
     def get_memory_topics(self) -> str:
         """
         Retrieves the full list of memory topics.
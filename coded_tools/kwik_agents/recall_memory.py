@@ -15,17 +15,29 @@
 # END COPYRIGHT
 
 import logging
+from datetime import datetime
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
 
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.kwik_agents.list_topics import LONG_TERM_MEMORY_FILE
 from coded_tools.kwik_agents.list_topics import MEMORY_DATA_STRUCTURE
+from coded_tools.kwik_agents.list_topics import SEMANTIC_RECALL
+from coded_tools.kwik_agents.list_topics import get_long_term_memory
+from coded_tools.kwik_agents.semantic_memory_index import DEFAULT_TOP_K
+from coded_tools.kwik_agents.semantic_memory_index import RecalledFact
+from coded_tools.kwik_agents.semantic_memory_index import SemanticMemoryIndex
+from coded_tools.kwik_agents.semantic_memory_index import get_semantic_memory_index
+from coded_tools.kwik_agents.topic_memory_store import DEFAULT_FACT_LIMIT
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
 
 
 class RecallMemory(CodedTool):
     """
-    A CodedTool that retrieves facts related to a topic from memory.
+    A CodedTool that retrieves facts related to a topic, or relevant to a query, from memory.
     """
 
     def __init__(self):
@@ -40,6 +52,17 @@ class RecallMemory(CodedTool):
                 The argument dictionary expects the following keys:
                     "topic" A topic for which to retrieve relevant facts.
 
+                With LONG_TERM_MEMORY_FILE, "query" can be given instead of "topic":
+                    "query" what to recall, in natural language. Retrieves the most relevant facts across all
+                        topics, by meaning with SEMANTIC_RECALL, otherwise from the topics named in the query.
+                    "top_k" the maximum number of facts to retrieve for a query, 10 by default.
+                A topic without facts is also recalled as a query with SEMANTIC_RECALL.
+
+                With LONG_TERM_MEMORY_FILE, these optional keys narrow down the facts of a topic:
+                    "limit" the maximum number of most recent facts to retrieve, 100 by default.
+                    "since" only facts from this ISO date or time on, e.g. "2025-06-01".
+                    "until" only facts before this ISO date or time.
+
         :param sly_data: A dictionary whose keys are defined by the agent hierarchy,
                 but whose values are meant to be kept out of the chat stream.
 
@@ -61,16 +84,21 @@ class RecallMemory(CodedTool):
                 "Error: <error message>"
         """
         self.topic_memory = sly_data.get(MEMORY_DATA_STRUCTURE, None)
-        if not self.topic_memory:
+        if not self.topic_memory and not LONG_TERM_MEMORY_FILE:
             return "NO TOPICS YET!"
+        self.topic_memory = self.topic_memory or {}
         the_topic: str = args.get("topic", "")
-        if the_topic == "":
+        the_query: str = args.get("query", "") if LONG_TERM_MEMORY_FILE else ""
+        if the_topic == "" and the_query == "":
             return "Error: No topic provided."
 
         logger = logging.getLogger(self.__class__.__name__)
         logger.info(">>>>>>>>>>>>>>>>>>>RecallMemory>>>>>>>>>>>>>>>>>>")
         logger.info("Topic: %s", str(the_topic))
-        the_memory_str = self.recall_memory(the_topic)
+        if LONG_TERM_MEMORY_FILE:
+            the_memory_str = self.recall_from_store(args)
+        else:
+            the_memory_str = self.recall_memory(the_topic)
         logger.info("Memories on this topic: \n %s", str(the_memory_str))
         sly_data[MEMORY_DATA_STRUCTURE] = self.topic_memory
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
@@ -95,3 +123,122 @@ class RecallMemory(CodedTool):
         if topic in self.topic_memory:
             return self.topic_memory[topic]
         return "NO RELATED MEMORIES!"
+
+    def recall_from_store(self, args: Dict[str, Any]) -> str:
+        """
+        Recall from the memory store, by topic or by query.
+
+        Parameters:
+        - args (dict): The arguments of the tool.
+
+        Returns:
+        - str: The list of memories, or an error message.
+        """
+        try:
+            limit = int(args.get("limit") or DEFAULT_FACT_LIMIT)
+            top_k = int(args.get("top_k") or DEFAULT_TOP_K)
+            since = self.parse_time(args.get("since"))
+            until = self.parse_time(args.get("until"))
+        except ValueError as exception:
+            return f"Error: {exception}"
+
+        topic: str = args.get("topic", "")
+        if topic:
+            the_memory_str = self.recall_long_term_memory(topic, limit, since, until)
+            if the_memory_str != "NO RELATED MEMORIES!" or not SEMANTIC_RECALL:
+                return the_memory_str
+        # A topic without facts is likely a near miss, so look for facts about it anywhere
+        return self.recall_relevant_memory(args.get("query") or topic, top_k)
+
+    def recall_relevant_memory(self, query: str, top_k: int) -> str:
+        """
+        Recall the facts most relevant to a query across all topics.
+
+        Parameters:
+        - query (str): What to recall, in natural language.
+        - top_k (int): The maximum number of facts to retrieve.
+
+        Returns:
+        - str: The relevant memories with their topics, or "NO RELATED MEMORIES!" if there are none.
+        """
+        store = get_long_term_memory()
+        facts: Optional[List[RecalledFact]] = None
+        if SEMANTIC_RECALL:
+            try:
+                facts = get_semantic_memory_index(store).search(query, k=top_k)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                logging.getLogger(self.__class__.__name__).warning(
+                    "Semantic recall failed, recalling topics named in the query instead: %s", exception
+                )
+        if facts is None:
+            facts = self.recall_named_topics(store, query, top_k)
+        if not facts:
+            return "NO RELATED MEMORIES!"
+        return SemanticMemoryIndex.format_facts(facts)
+
+    @staticmethod
+    def recall_named_topics(store: TopicMemoryStore, query: str, top_k: int) -> List[RecalledFact]:
+        """
+        Recall the most recent facts of the topics sharing a word with the query, without embeddings.
+
+        Parameters:
+        - store (TopicMemoryStore): The memory store.
+        - query (str): What to recall.
+        - top_k (int): The maximum number of facts to retrieve.
+
+        Returns:
+        - list: The facts, those of the topics sharing the most words with the query first.
+        """
+        query_words = set(query.lower().split())
+        matches = []
+        for topic in store.topics():
+            shared = len(query_words & set(topic.lower().split()))
+            if shared or topic.lower() in query.lower():
+                matches.append((shared, topic))
+
+        facts: List[RecalledFact] = []
+        for shared, topic in sorted(matches, reverse=True):
+            remaining = top_k - len(facts)
+            if remaining <= 0:
+                break
+            facts.extend(
+                RecalledFact(float(shared), topic, created, fact) for created, fact in store.facts(topic, remaining)
+            )
+        return facts
+
+    def recall_long_term_memory(
+        self, topic: str, limit: int, since: Optional[datetime], until: Optional[datetime]
+    ) -> str:
+        """
+        Recall the most recent facts related to this topic from the memory store.
+
+        Parameters:
+        - topic (str): A topic to retrieve memories for.
+        - limit (int): The maximum number of facts to retrieve.
+        - since (datetime): Only facts from this time on, if given.
+        - until (datetime): Only facts before this time, if given.
+
+        Returns:
+        - str: The list of memories related to the topic, or "NO RELATED MEMORIES!" if there are none.
+        """
+        facts = get_long_term_memory().facts(topic, limit=limit, since=since, until=until)
+        if not facts:
+            return "NO RELATED MEMORIES!"
+        self.topic_memory[topic] = TopicMemoryStore.format_facts(facts)
+        return self.topic_memory[topic]
+
+    @staticmethod
+    def parse_time(value: Any) -> Optional[datetime]:
+        """
+        Parameters:
+        - value: An ISO date or date and time, or nothing.
+
+        Returns:
+        - datetime: The parsed time, None if no value was given.
+        """
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(str(value))
+        except ValueError as exception:
+            raise ValueError(f"Invalid date or time: {value}") from exception
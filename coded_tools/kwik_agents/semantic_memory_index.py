@@ -0,0 +1,220 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Embedding index over the topics and facts of the kwik_agents memory, for recall by meaning"""
+
+import logging
+import os
+import threading
+from datetime import datetime
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.kwik_agents.topic_memory_store import TIME_STAMP_FORMAT
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
+from coded_tools.tools.vector_search import normalize_rows
+
+EMBEDDINGS_MODEL = "text-embedding-3-small"
+DEFAULT_TOP_K = 10
+# Maximum number of characters of facts returned by one recall
+DEFAULT_MAX_RECALL_CHARS = 4000
+# Maximum number of facts embedded in one request when catching up on facts stored without a vector
+BACKFILL_BATCH_SIZE = 256
+
+logger = logging.getLogger(__name__)
+
+
+class RecalledFact(NamedTuple):
+    """A fact found by a semantic recall."""
+
+    score: float
+    topic: str
+    created: datetime
+    fact: str
+
+
+class SemanticMemoryIndex:
+    """
+    Cosine similarity search over the facts of a TopicMemoryStore.
+
+    Vectors of facts and topics are computed once, when a fact is committed, and kept in the store next to the
+    facts, so every session and process shares them. Each process holds a normalized float32 matrix of them,
+    which only reads the facts stored since its last search. A fact scores the better of its own similarity
+    to the query and that of its topic, so a query naming a topic recalls the facts under it.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, store: TopicMemoryStore, embeddings: Embeddings, model: str = EMBEDDINGS_MODEL):
+        """
+        :param store: Store holding the facts and their vectors
+        :param embeddings: Embeddings service computing the vectors
+        :param model: Name of the embedding model, stored with the vectors so a new model does not mix with them
+        """
+        self.store: TopicMemoryStore = store
+        self.embeddings: Embeddings = embeddings
+        self.model: str = model
+        self._lock = threading.Lock()
+        self._last_id: int = 0
+        self._facts: List[RecalledFact] = []
+        self._fact_topics: List[int] = []
+        self._fact_matrix: Optional[np.ndarray] = None
+        self._topics: Dict[str, int] = {}
+        self._topic_matrix: Optional[np.ndarray] = None
+
+    def add(self, fact_id: int, topic: str, fact: str):
+        """
+        Compute and store the vectors of a newly committed fact, and of its topic if it is new,
+        in a single embeddings request.
+
+        :param fact_id: Id of the fact in the store
+        :param topic: Topic of the fact
+        :param fact: The fact
+        """
+        known_topic: bool = self.store.has_topic_vector(self.model, topic)
+        texts: List[str] = [fact] if known_topic else [fact, topic]
+        vectors: np.ndarray = normalize_rows(self.embeddings.embed_documents(texts))
+        self.store.put_fact_vectors(self.model, {fact_id: vectors[0].tobytes()})
+        if not known_topic:
+            self.store.put_topic_vectors(self.model, {topic: vectors[1].tobytes()})
+
+    def search(self, query: str, k: int = DEFAULT_TOP_K) -> List[RecalledFact]:
+        """
+        :param query: What to recall, in natural language
+        :param k: Maximum number of facts
+        :return: The k facts most relevant to the query across all topics, most relevant first
+        """
+        query_vector: np.ndarray = normalize_rows(self.embeddings.embed_query(query))[0]
+        with self._lock:
+            self._refresh()
+            if not self._facts:
+                return []
+            scores: np.ndarray = self._fact_matrix @ query_vector
+            topic_scores: np.ndarray = self._topic_matrix @ query_vector
+            scores = np.maximum(scores, topic_scores[np.asarray(self._fact_topics)])
+
+            k = min(k, len(self._facts))
+            best: np.ndarray = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [self._facts[row]._replace(score=float(scores[row])) for row in best]
+
+    @staticmethod
+    def format_facts(facts: List[RecalledFact], max_chars: int = DEFAULT_MAX_RECALL_CHARS) -> str:
+        """
+        :param facts: Recalled facts, most relevant first
+        :param max_chars: Maximum length of the result, less relevant facts are left out beyond it
+        :return: One time stamped fact per line, with its topic
+        """
+        lines: List[str] = []
+        length: int = 0
+        for recalled in facts:
+            line = f"[{recalled.created.strftime(TIME_STAMP_FORMAT)}] ({recalled.topic}) {recalled.fact}"
+            if lines and length + len(line) + 1 > max_chars:
+                break
+            lines.append(line[:max_chars])
+            length += len(line) + 1
+        return "\n".join(lines)
+
+    def _refresh(self):
+        """
+        Add the facts stored since the last search to the matrices, embedding those stored without a vector,
+        such as facts imported from a legacy memory file. Caller holds the lock.
+        """
+        new_facts = self.store.facts_after(self._last_id)
+        if not new_facts:
+            return
+        vectors: Dict[int, bytes] = self.store.fact_vectors(self.model, self._last_id)
+        missing = [(fact_id, fact) for fact_id, _, _, fact in new_facts if fact_id not in vectors]
+        for start in range(0, len(missing), BACKFILL_BATCH_SIZE):
+            end = start + BACKFILL_BATCH_SIZE
+            batch = missing[start:end]
+            embedded = normalize_rows(self.embeddings.embed_documents([fact for _, fact in batch]))
+            computed = {fact_id: vector.tobytes() for (fact_id, _), vector in zip(batch, embedded)}
+            self.store.put_fact_vectors(self.model, computed)
+            vectors.update(computed)
+        self._refresh_topics({topic for _, topic, _, _ in new_facts})
+
+        rows: List[np.ndarray] = []
+        for fact_id, topic, created, fact in new_facts:
+            self._facts.append(RecalledFact(0.0, topic, created, fact))
+            self._fact_topics.append(self._topics[topic])
+            rows.append(np.frombuffer(vectors[fact_id], dtype=np.float32))
+        self._fact_matrix = self._append_rows(self._fact_matrix, rows)
+        self._last_id = new_facts[-1][0]
+
+    def _refresh_topics(self, topics: set):
+        """Add the vectors of topics not in the topic matrix yet, embedding those without one."""
+        new_topics: List[str] = sorted(topic for topic in topics if topic not in self._topics)
+        if not new_topics:
+            return
+        vectors: Dict[str, bytes] = self.store.topic_vectors(self.model)
+        missing: List[str] = [topic for topic in new_topics if topic not in vectors]
+        if missing:
+            embedded = normalize_rows(self.embeddings.embed_documents(missing))
+            computed = {topic: vector.tobytes() for topic, vector in zip(missing, embedded)}
+            self.store.put_topic_vectors(self.model, computed)
+            vectors.update(computed)
+
+        rows: List[np.ndarray] = []
+        for topic in new_topics:
+            self._topics[topic] = len(self._topics)
+            rows.append(np.frombuffer(vectors[topic], dtype=np.float32))
+        self._topic_matrix = self._append_rows(self._topic_matrix, rows)
+
+    @staticmethod
+    def _append_rows(matrix: Optional[np.ndarray], rows: List[np.ndarray]) -> np.ndarray:
+        """:return: matrix with rows appended below it"""
+        added: np.ndarray = np.vstack(rows)
+        return added if matrix is None else np.vstack([matrix, added])
+
+
+def create_memory_embeddings() -> Embeddings:
+    """
+    :return: OpenAI embeddings for the memory, served from the shared on-disk embedding cache
+        unless EMBEDDING_CACHE_ENABLED is false
+    """
+    # pylint: disable=import-outside-toplevel
+    from langchain_openai import OpenAIEmbeddings
+
+    from coded_tools.tools.embedding_cache import CachedEmbeddings
+    from coded_tools.tools.embedding_cache import get_shared_embedding_cache
+
+    embeddings: Embeddings = OpenAIEmbeddings(model=EMBEDDINGS_MODEL)
+    if os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() != "false":
+        embeddings = CachedEmbeddings(embeddings, cache=get_shared_embedding_cache(), model=EMBEDDINGS_MODEL)
+    return embeddings
+
+
+# Shared by every kwik_agents tool in the process, since a CodedTool instance does not outlive its invocation
+_INDEXES: Dict[str, SemanticMemoryIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_semantic_memory_index(store: TopicMemoryStore) -> SemanticMemoryIndex:
+    """
+    :param store: Store holding the facts
+    :return: The process-wide SemanticMemoryIndex for the store, created with OpenAI embeddings on first use
+    """
+    with _INDEXES_LOCK:
+        if store.db_file not in _INDEXES:
+            _INDEXES[store.db_file] = SemanticMemoryIndex(store, create_memory_embeddings())
+        return _INDEXES[store.db_file]
@@ -0,0 +1,295 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""SQLite backed long-term memory shared by the kwik_agents coded tools"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# Number of most recent facts returned for a topic unless a limit is given
+DEFAULT_FACT_LIMIT = 100
+
+TIME_STAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+# A fact line of the legacy JSON memory file: "[2025-01-31 12:00:00] fact"
+LEGACY_FACT_PATTERN = re.compile(r"^\[(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\] (.*)$")
+
+logger = logging.getLogger(__name__)
+
+
+class TopicMemoryStore:
+    """
+    Facts stored one row each, indexed by topic and time.
+
+    Committing a fact is a single insert, whatever the size of the memory, and recalling a topic reads only
+    that topic's most recent facts. The database runs in WAL mode with a busy timeout, so sessions in
+    several threads or server processes can write at the same time while others read.
+    """
+
+    def __init__(self, db_file: str, legacy_json_file: Optional[str] = None):
+        """
+        :param db_file: SQLite database file, created if missing
+        :param legacy_json_file: TopicMemory JSON file written by earlier versions,
+            imported once when the database is first created
+        """
+        self.db_file: str = db_file
+        directory: str = os.path.dirname(os.path.abspath(db_file))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: every statement is its own transaction unless BEGIN is issued
+        self._connection = sqlite3.connect(db_file, timeout=30.0, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS facts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    topic TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    fact TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS facts_by_topic ON facts (topic, created);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS fact_vectors (
+                    fact_id INTEGER NOT NULL,
+                    model TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (fact_id, model)
+                );
+                CREATE TABLE IF NOT EXISTS topic_vectors (
+                    topic TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    PRIMARY KEY (topic, model)
+                );
+                """
+            )
+        if legacy_json_file:
+            self._import_legacy_json(legacy_json_file)
+
+    def add_fact(self, topic: str, fact: str, created: Optional[datetime] = None) -> int:
+        """
+        :param topic: Topic to store the fact under
+        :param fact: The fact
+        :param created: Time of the fact, now by default
+        :return: Id of the stored fact
+        """
+        created = created or datetime.now()
+        with self._lock:
+            cursor = self._connection.execute(
+                "INSERT INTO facts (topic, created, fact) VALUES (?, ?, ?)", (topic, created.timestamp(), fact)
+            )
+        return cursor.lastrowid
+
+    def facts_after(self, fact_id: int) -> List[Tuple[int, str, datetime, str]]:
+        """
+        :param fact_id: Id of the last fact already known, 0 for all facts
+        :return: (id, topic, time, fact) of every fact stored after that one, in id order
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, topic, created, fact FROM facts WHERE id > ? ORDER BY id", (fact_id,)
+            ).fetchall()
+        return [(row_id, topic, datetime.fromtimestamp(created), fact) for row_id, topic, created, fact in rows]
+
+    def fact_vectors(self, model: str, after_id: int = 0) -> Dict[int, bytes]:
+        """
+        :param model: Embedding model the vectors were computed with
+        :param after_id: Only vectors of facts stored after this id
+        :return: Stored vectors per fact id
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT fact_id, vector FROM fact_vectors WHERE model = ? AND fact_id > ?", (model, after_id)
+            ).fetchall()
+        return dict(rows)
+
+    def put_fact_vectors(self, model: str, vectors: Dict[int, bytes]):
+        """
+        :param model: Embedding model the vectors were computed with
+        :param vectors: Vectors per fact id
+        """
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO fact_vectors (fact_id, model, vector) VALUES (?, ?, ?)",
+                [(fact_id, model, vector) for fact_id, vector in vectors.items()],
+            )
+
+    def topic_vectors(self, model: str) -> Dict[str, bytes]:
+        """
+        :param model: Embedding model the vectors were computed with
+        :return: Stored vectors per topic
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT topic, vector FROM topic_vectors WHERE model = ?", (model,)
+            ).fetchall()
+        return dict(rows)
+
+    def has_topic_vector(self, model: str, topic: str) -> bool:
+        """
+        :param model: Embedding model the vector was computed with
+        :param topic: Topic of facts
+        :return: True if a vector of the topic is stored for the model
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT 1 FROM topic_vectors WHERE topic = ? AND model = ?", (topic, model)
+            ).fetchone()
+        return row is not None
+
+    def put_topic_vectors(self, model: str, vectors: Dict[str, bytes]):
+        """
+        :param model: Embedding model the vectors were computed with
+        :param vectors: Vectors per topic
+        """
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO topic_vectors (topic, model, vector) VALUES (?, ?, ?)",
+                [(topic, model, vector) for topic, vector in vectors.items()],
+            )
+
+    def topics(self) -> List[str]:
+        """
+        :return: Sorted list of every topic with at least one fact
+        """
+        with self._lock:
+            rows = self._connection.execute("SELECT DISTINCT topic FROM facts ORDER BY topic").fetchall()
+        return [row[0] for row in rows]
+
+    def facts(
+        self,
+        topic: str,
+        limit: Optional[int] = DEFAULT_FACT_LIMIT,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Tuple[datetime, str]]:
+        """
+        :param topic: Topic to recall
+        :param limit: Maximum number of facts, the most recent ones are kept. None for all of them.
+        :param since: Only facts stored at or after this time
+        :param until: Only facts stored before this time
+        :return: (time, fact) of the matching facts, oldest first
+        """
+        query = "SELECT created, fact FROM facts WHERE topic = ?"
+        params: List = [topic]
+        if since is not None:
+            query += " AND created >= ?"
+            params.append(since.timestamp())
+        if until is not None:
+            query += " AND created < ?"
+            params.append(until.timestamp())
+        query += " ORDER BY created DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+        return [(datetime.fromtimestamp(created), fact) for created, fact in reversed(rows)]
+
+    @staticmethod
+    def format_facts(facts: List[Tuple[datetime, str]]) -> str:
+        """
+        :param facts: (time, fact) pairs as returned by facts()
+        :return: One time stamped fact per line, the format the agents have always been given
+        """
+        return "\n".join(f"[{created.strftime(TIME_STAMP_FORMAT)}] {fact}" for created, fact in facts)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _import_legacy_json(self, json_file: str):
+        """
+        Copy the facts of a legacy JSON memory file into the database, once.
+        The JSON file is left in place untouched.
+        """
+        if not os.path.exists(json_file):
+            return
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock, so concurrent processes cannot both import
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                imported = self._connection.execute("SELECT value FROM meta WHERE key = 'legacy_json_imported'")
+                if imported.fetchone() is None:
+                    rows = self._read_legacy_json(json_file)
+                    self._connection.executemany("INSERT INTO facts (topic, created, fact) VALUES (?, ?, ?)", rows)
+                    self._connection.execute(
+                        "INSERT INTO meta (key, value) VALUES ('legacy_json_imported', ?)", (json_file,)
+                    )
+                    logger.info("Imported %d facts from %s into %s", len(rows), json_file, self.db_file)
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _read_legacy_json(json_file: str) -> List[Tuple[str, float, str]]:
+        """
+        :return: (topic, created, fact) rows of a legacy JSON memory file, where every topic maps
+            to newline separated, time stamped facts. Lines without a time stamp continue the previous fact.
+        """
+        try:
+            with open(json_file, "r", encoding="utf-8") as file:
+                content: str = file.read()
+            memory: Dict[str, str] = json.loads(content) if content else {}
+        except (OSError, ValueError) as exception:
+            logger.warning("Could not import the memory file %s: %s", json_file, exception)
+            return []
+
+        rows: List[Tuple[str, float, str]] = []
+        fallback: float = os.path.getmtime(json_file)
+        for topic, facts in memory.items():
+            topic_rows: List[List] = []
+            for line in str(facts or "").split("\n"):
+                match = LEGACY_FACT_PATTERN.match(line)
+                if match:
+                    created = datetime.strptime(match.group(1), TIME_STAMP_FORMAT).timestamp()
+                    topic_rows.append([topic, created, match.group(2)])
+                elif topic_rows:
+                    topic_rows[-1][2] += "\n" + line
+                elif line:
+                    topic_rows.append([topic, fallback, line])
+            rows.extend(tuple(row) for row in topic_rows)
+        return rows
+
+
+# Shared by every kwik_agents tool in the process, since a CodedTool instance does not outlive its invocation
+_STORES: Dict[str, TopicMemoryStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_topic_memory_store(db_file: str, legacy_json_file: Optional[str] = None) -> TopicMemoryStore:
+    """
+    :param db_file: SQLite database file
+    :param legacy_json_file: TopicMemory JSON file written by earlier versions, imported on first use
+    :return: The process-wide TopicMemoryStore for db_file
+    """
+    key: str = os.path.abspath(db_file)
+    with _STORES_LOCK:
+        if key not in _STORES:
+            _STORES[key] = TopicMemoryStore(db_file, legacy_json_file)
+        return _STORES[key]
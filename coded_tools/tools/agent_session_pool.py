@@ -0,0 +1,231 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Pool of agent sessions reused across CallAgent invocations"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from neuro_san.interfaces.agent_session import AgentSession
+
+DEFAULT_MAX_SIZE = 16
+DEFAULT_IDLE_SECONDS = 300.0
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class SessionKey(NamedTuple):
+    """Everything that determines which agent a session talks to and how."""
+
+    agent_name: str
+    connection_type: str
+    host: str
+    port: int
+    local_externals_direct: bool = False
+
+
+class AgentSessionPool:
+    """
+    Keeps idle agent sessions per SessionKey so later calls to the same agent skip session setup.
+
+    A session is used by one call at a time: acquire() hands out an idle session or creates one,
+    and release() returns it. Sessions idle for longer than idle_seconds are closed, and at most
+    max_size idle sessions are kept across all keys, closing the least recently used first.
+    Conversation state is not part of a session, so any session for a key can continue any conversation.
+    """
+
+    def __init__(
+        self,
+        create_session: Callable[[SessionKey], AgentSession],
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+    ):
+        """
+        :param create_session: Blocking function creating a new session for a key
+        :param max_size: Maximum number of idle sessions kept across all keys
+        :param idle_seconds: Seconds after which an unused session is closed
+        """
+        self.create_session: Callable[[SessionKey], AgentSession] = create_session
+        self.max_size: int = max_size
+        self.idle_seconds: float = idle_seconds
+        self.created: int = 0
+        self.reused: int = 0
+        # Idle sessions per key with the time they were released, most recently released last
+        self._idle: Dict[SessionKey, List[Tuple[AgentSession, float]]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: SessionKey) -> AgentSession:
+        """
+        :param key: Which agent to talk to and how
+        :return: An idle session for key, or a new one. Blocks while a new session is set up.
+        """
+        session: Optional[AgentSession] = None
+        with self._lock:
+            doomed: List[AgentSession] = self._evict_expired(time.monotonic())
+            idle: List[Tuple[AgentSession, float]] = self._idle.get(key, [])
+            if idle:
+                session, _ = idle.pop()
+                if not idle:
+                    del self._idle[key]
+                self.reused += 1
+            else:
+                self.created += 1
+        self._close_all(doomed)
+
+        if session is not None:
+            return session
+        logger.info("Creating agent session for %s", key.agent_name)
+        return self.create_session(key)
+
+    def release(self, key: SessionKey, session: AgentSession):
+        """
+        Return a session acquired for key so other calls can reuse it.
+
+        :param key: Key the session was acquired for
+        :param session: The session
+        """
+        with self._lock:
+            self._idle.setdefault(key, []).append((session, time.monotonic()))
+            doomed: List[AgentSession] = self._evict_over_size()
+        self._close_all(doomed)
+
+    def discard(self, session: AgentSession):
+        """
+        Close a session that failed instead of returning it to the pool.
+
+        :param session: The session
+        """
+        self._close_all([session])
+
+    async def call(self, key: SessionKey, function: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking function with a session for key on a worker thread, without blocking the event loop.
+
+        The worker thread acquires the session, runs the function and then returns the session to the pool,
+        or closes it if the function raised. Cancelling the awaiting task leaves the thread to finish,
+        so a session is never returned or closed while it is still in use.
+
+        :param key: Which agent to talk to and how
+        :param function: Blocking function called with the session followed by args
+        :param args: Further arguments of the function
+        :return: What the function returned
+        """
+        return await asyncio.to_thread(self._call, key, function, *args)
+
+    def _call(self, key: SessionKey, function: Callable[..., T], *args: Any) -> T:
+        """Acquire a session, run the function with it and release it. Runs on a worker thread."""
+        session: AgentSession = self.acquire(key)
+        try:
+            result: T = function(session, *args)
+        except BaseException:
+            self.discard(session)
+            raise
+        self.release(key, session)
+        return result
+
+    def close(self):
+        """Close every idle session."""
+        with self._lock:
+            doomed: List[AgentSession] = [session for idle in self._idle.values() for session, _ in idle]
+            self._idle.clear()
+        self._close_all(doomed)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary with counters of created and reused sessions and the number of idle sessions
+        """
+        with self._lock:
+            return {
+                "created": self.created,
+                "reused": self.reused,
+                "idle": sum(len(idle) for idle in self._idle.values()),
+            }
+
+    def _evict_expired(self, now: float) -> List[AgentSession]:
+        """Remove sessions idle for longer than idle_seconds. Caller holds the lock."""
+        doomed: List[AgentSession] = []
+        for key in list(self._idle):
+            fresh = [
+                (session, released) for session, released in self._idle[key] if now - released <= self.idle_seconds
+            ]
+            doomed.extend(session for session, released in self._idle[key] if now - released > self.idle_seconds)
+            if fresh:
+                self._idle[key] = fresh
+            else:
+                del self._idle[key]
+        return doomed
+
+    def _evict_over_size(self) -> List[AgentSession]:
+        """Remove the least recently released sessions beyond max_size. Caller holds the lock."""
+        entries = [(released, key, session) for key, idle in self._idle.items() for session, released in idle]
+        if len(entries) <= self.max_size:
+            return []
+
+        entries.sort(key=lambda entry: entry[0])
+        doomed: List[AgentSession] = []
+        for _, key, session in entries[: len(entries) - self.max_size]:
+            self._idle[key] = [(kept, released) for kept, released in self._idle[key] if kept is not session]
+            if not self._idle[key]:
+                del self._idle[key]
+            doomed.append(session)
+        return doomed
+
+    @staticmethod
+    def _close_all(sessions: List[AgentSession]):
+        """Close sessions that support it, such as direct sessions holding an agent network."""
+        for session in sessions:
+            close: Optional[Callable] = getattr(session, "close", None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                logger.warning("Failed to close agent session: %s", exception)
+
+
+# Shared by every CallAgent in the process, since a CodedTool instance does not outlive its invocation
+_SHARED_POOL: Optional[AgentSessionPool] = None
+_SHARED_POOL_LOCK = threading.Lock()
+
+
+def get_shared_agent_session_pool(create_session: Callable[[SessionKey], AgentSession]) -> AgentSessionPool:
+    """
+    :param create_session: Blocking function creating a new session for a key, used when the pool is first created
+    :return: The process-wide AgentSessionPool, configured from the AGENT_SESSION_POOL_MAX_SIZE
+        and AGENT_SESSION_POOL_IDLE_SECONDS environment variables on first use
+    """
+    global _SHARED_POOL  # pylint: disable=global-statement
+    with _SHARED_POOL_LOCK:
+        if _SHARED_POOL is None:
+            _SHARED_POOL = AgentSessionPool(
+                create_session,
+                max_size=int(os.getenv("AGENT_SESSION_POOL_MAX_SIZE") or DEFAULT_MAX_SIZE),
+                idle_seconds=float(os.getenv("AGENT_SESSION_POOL_IDLE_SECONDS") or DEFAULT_IDLE_SECONDS),
+            )
+        return _SHARED_POOL
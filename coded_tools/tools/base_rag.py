@@ -22,9 +22,11 @@ from abc import ABC
 from abc import abstractmethod
 from dataclasses import dataclass
 from typing import Any
+from typing import AsyncIterator
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import Tuple
 
 # pylint: disable=import-error
 from asyncpg import InvalidCatalogNameError
@@ -37,14 +39,36 @@ from langchain_core.vectorstores.base import VectorStoreRetriever
 from langchain_openai import OpenAIEmbeddings
 from langchain_postgres import PGEngine
 from langchain_postgres import PGVectorStore
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from sqlalchemy.exc import ProgrammingError
+from langchain_text_splitters import TextSplitter
+
+from coded_tools.tools.document_loading import DEFAULT_MAX_CONCURRENT_LOADS
+from coded_tools.tools.embedding_cache import CachedEmbeddings
+from coded_tools.tools.embedding_cache import get_shared_embedding_cache
+from coded_tools.tools.embedding_pipeline import aadd_in_batches
+from coded_tools.tools.embedding_pipeline import asplit_documents
+from coded_tools.tools.incremental_index import IndexChanges
+from coded_tools.tools.incremental_index import IndexManifest
+from coded_tools.tools.incremental_index import chunk_id
+from coded_tools.tools.incremental_index import document_fingerprint
+from coded_tools.tools.numpy_vector_store import NUMPY_EXTENSION
+from coded_tools.tools.numpy_vector_store import NumpyVectorStore
+from coded_tools.tools.pg_engine_pool import PGEnginePool
+from coded_tools.tools.pg_engine_pool import get_shared_pg_engine_pool
+from coded_tools.tools.text_splitting import SPLITTER_TYPES
+from coded_tools.tools.text_splitting import get_text_splitter
+from coded_tools.tools.vector_search import DEFAULT_TOP_K
+from coded_tools.tools.vector_search import VectorSearchIndex
+from coded_tools.tools.vector_store_registry import VectorStoreRegistry
+from coded_tools.tools.vector_store_registry import get_shared_vector_store_registry
 
 # Invalid file path character pattern
 INVALID_PATH_PATTERN = r"[<>:\"|?*\x00-\x1F]"
 DEFAULT_TABLE_NAME = "vectorstore"
 EMBEDDINGS_MODEL = "text-embedding-3-small"
 VECTOR_SIZE = 1536
+CHUNK_SIZE = 100
+CHUNK_OVERLAP = 50
+SPLITTER_TYPE = "recursive"
 
 logger = logging.getLogger(__name__)
 
@@ -68,16 +92,39 @@ class PostgresConfig:
 
 
 class BaseRag(ABC):
+    # pylint: disable=too-many-instance-attributes
     """
     Abstract Base Class for different types of RAG implementations.
     """
 
     def __init__(self):
-        # Save the generated vector store as a JSON file if True
+        # Save the generated vector store to vector_store_path if True
         self.save_vector_store: bool = False
         self.abs_vector_store_path: Optional[str] = None
+        # Only re-split and re-embed source documents that changed since the last build if True
+        self.incremental_indexing: bool = False
+        self.abs_index_manifest_path: Optional[str] = None
+        # Seconds between checks of the sources for changes, defaulting to the vector store registry's TTL
+        self.reindex_interval: Optional[float] = None
+        # Chunking of loaded documents, in tokens
+        self.chunk_size: int = CHUNK_SIZE
+        self.chunk_overlap: int = CHUNK_OVERLAP
+        self.splitter_type: str = SPLITTER_TYPE
+        # Maximum number of sources loaded at the same time by loaders that support it
+        self.max_concurrent_loads: int = DEFAULT_MAX_CONCURRENT_LOADS
+        # Reuse vector stores built by earlier invocations with the same sources and settings
+        self.use_vector_store_registry: bool = os.getenv("VECTOR_STORE_REGISTRY_ENABLED", "true").lower() != "false"
         self.embeddings: Embeddings = OpenAIEmbeddings(model=EMBEDDINGS_MODEL, dimensions=VECTOR_SIZE)
 
+        # Serve chunk embeddings that were already computed (by any tool, in any session) from the on-disk cache
+        if os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() != "false":
+            self.embeddings = CachedEmbeddings(
+                embeddings=self.embeddings,
+                cache=get_shared_embedding_cache(),
+                model=EMBEDDINGS_MODEL,
+                dimensions=VECTOR_SIZE,
+            )
+
     @abstractmethod
     async def load_documents(self, loader_args: Any) -> List[Document]:
         """
@@ -85,11 +132,23 @@ class BaseRag(ABC):
         """
         raise NotImplementedError
 
+    async def alazy_load_documents(self, loader_args: Any) -> AsyncIterator[Document]:
+        """
+        Load documents from a specific data source, yielding them as they become available.
+        Loaders that fetch several sources override this so documents can be split while others still load.
+
+        :param loader_args: Arguments specific to the document loader
+        :return: Async iterator of loaded documents
+        """
+        for doc in await self.load_documents(loader_args):
+            yield doc
+
     def configure_vector_store_path(self, vector_store_path: Optional[str]):
         """
         Validate the vector store file path and set it as an absolute path.
 
-        :param vector_store_path: Relative or absolute path to the vector store JSON file.
+        :param vector_store_path: Relative or absolute path to the vector store file, either a ".json" dump
+            of an InMemoryVectorStore or a ".npy" matrix of a NumpyVectorStore.
         :raises ValueError: If the path contains invalid characters or has an incorrect file extension.
         """
         if not vector_store_path:
@@ -101,9 +160,9 @@ class BaseRag(ABC):
             raise ValueError(f"Invalid vector_store_path: '{vector_store_path}'")
 
         # Check file extension
-        if not vector_store_path.endswith(".json"):
-            logger.error("vector_store_path must be a .json file, got: '%s'\n", vector_store_path)
-            raise ValueError(f"vector_store_path must be a .json file, got: '{vector_store_path}'")
+        if not vector_store_path.endswith((".json", NUMPY_EXTENSION)):
+            logger.error("vector_store_path must be a .json or .npy file, got: '%s'\n", vector_store_path)
+            raise ValueError(f"vector_store_path must be a .json or .npy file, got: '{vector_store_path}'")
 
         if os.path.isabs(vector_store_path):
             # It's already an absolute path — use it directly
@@ -113,6 +172,68 @@ class BaseRag(ABC):
             base_path: str = os.path.dirname(__file__)
             self.abs_vector_store_path = os.path.abspath(os.path.join(base_path, vector_store_path))
 
+    def configure_incremental_indexing(
+        self,
+        incremental_indexing: bool,
+        index_manifest_path: Optional[str] = None,
+        reindex_interval: Optional[float] = None,
+    ):
+        """
+        Enable incremental indexing and set where the fingerprints of indexed documents are kept.
+
+        :param incremental_indexing: Only re-split and re-embed documents that changed since the last build if True
+        :param index_manifest_path: Relative or absolute path to the ".json" manifest of indexed documents.
+            Defaults to "<vector store path stem>.manifest.json" for in-memory vector stores
+            and "<table name>.manifest.json" for postgres vector stores.
+        :param reindex_interval: Seconds for which an updated vector store is reused before the sources
+            are checked again. Defaults to the TTL of the vector store registry.
+        :raises ValueError: If the path contains invalid characters or has an incorrect file extension.
+        """
+        self.incremental_indexing = bool(incremental_indexing)
+        self.reindex_interval = None if reindex_interval is None else float(reindex_interval)
+        if not index_manifest_path:
+            return
+
+        if re.search(INVALID_PATH_PATTERN, index_manifest_path) or not index_manifest_path.endswith(".json"):
+            logger.error("index_manifest_path must be a valid .json file path, got: '%s'\n", index_manifest_path)
+            raise ValueError(f"index_manifest_path must be a valid .json file path, got: '{index_manifest_path}'")
+
+        base_path: str = os.path.dirname(__file__)
+        self.abs_index_manifest_path = os.path.abspath(os.path.join(base_path, index_manifest_path))
+
+    def configure_text_splitter(
+        self,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        splitter_type: Optional[str] = None,
+    ):
+        """
+        Set how loaded documents are split into chunks. Unset arguments keep their defaults.
+
+        :param chunk_size: Maximum number of tokens per chunk
+        :param chunk_overlap: Number of tokens shared by consecutive chunks
+        :param splitter_type: "recursive" to split on paragraphs, lines and words,
+            or "token" for the faster single-pass split at sentence or word boundaries
+        :raises ValueError: If the sizes are not positive, the overlap is not smaller than the chunk size,
+            or the splitter type is unknown.
+        """
+        chunk_size = int(chunk_size) if chunk_size is not None else self.chunk_size
+        chunk_overlap = int(chunk_overlap) if chunk_overlap is not None else self.chunk_overlap
+        splitter_type = splitter_type or self.splitter_type
+
+        if chunk_size <= 0 or chunk_overlap < 0 or chunk_overlap >= chunk_size:
+            logger.error("Invalid chunk_size %s and chunk_overlap %s\n", chunk_size, chunk_overlap)
+            raise ValueError(
+                f"chunk_size must be positive and larger than chunk_overlap, got {chunk_size} and {chunk_overlap}"
+            )
+        if splitter_type not in SPLITTER_TYPES:
+            logger.error("splitter must be one of %s, got: '%s'\n", SPLITTER_TYPES, splitter_type)
+            raise ValueError(f"splitter must be one of {SPLITTER_TYPES}, got: '{splitter_type}'")
+
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.splitter_type = splitter_type
+
     async def generate_vector_store(
         self,
         loader_args: Any,
@@ -122,6 +243,9 @@ class BaseRag(ABC):
         """
         Asynchronously loads documents from a given data source, splits them into
         chunks, and builds a vector store using OpenAI embeddings.
+        Vector stores built by earlier invocations with the same arguments are
+        reused from the process-wide VectorStoreRegistry. With incremental indexing, the source documents
+        are checked against the index manifest again once the registered store is reindex_interval seconds old.
 
         :param loader_args: Arguments specific to the document loader
         :param postgres_config: PostgreSQL configuration (required for postgres vector store)
@@ -141,6 +265,47 @@ class BaseRag(ABC):
         if vector_store_type == "postgres" and postgres_config is None:
             raise ValueError("postgres_config is required when vector_store_type is 'postgres'\n")
 
+        if not self.use_vector_store_registry:
+            return await self._build_vector_store(loader_args, postgres_config, vector_store_type)
+
+        manifest_path: Optional[str] = (
+            self._index_manifest_path(postgres_config, vector_store_type) if self.incremental_indexing else None
+        )
+
+        key: str = VectorStoreRegistry.make_key(
+            loader_type=type(self).__name__,
+            loader_args=loader_args,
+            vector_store_type=vector_store_type,
+            postgres=(postgres_config.connection_string, postgres_config.table_name) if postgres_config else None,
+            vector_store_path=self.abs_vector_store_path,
+            chunk_size=self.chunk_size,
+            chunk_overlap=self.chunk_overlap,
+            splitter_type=self.splitter_type,
+            embeddings_model=EMBEDDINGS_MODEL,
+            vector_size=VECTOR_SIZE,
+            index_manifest_path=manifest_path,
+        )
+        # An incrementally indexed store is reused until the sources are due to be checked for edits again
+        return await get_shared_vector_store_registry().get_or_build(
+            key,
+            lambda: self._build_vector_store(loader_args, postgres_config, vector_store_type),
+            ttl_seconds=self.reindex_interval if manifest_path else None,
+        )
+
+    async def _build_vector_store(
+        self,
+        loader_args: Any,
+        postgres_config: Optional[PostgresConfig],
+        vector_store_type: Literal["in_memory", "postgres"],
+    ) -> Optional[VectorStore]:
+        """Load an existing vector store or create a new one, bypassing the registry."""
+
+        if self.incremental_indexing:
+            manifest_path: Optional[str] = self._index_manifest_path(postgres_config, vector_store_type)
+            if manifest_path:
+                return await self._update_vector_store(loader_args, postgres_config, vector_store_type, manifest_path)
+            logger.warning("Incremental indexing of an in-memory vector store needs a vector_store_path.\n")
+
         # Try to load existing vector store for in-memory vector store
         if vector_store_type == "in_memory":
             existing_store = await self._load_existing_vector_store()
@@ -162,7 +327,7 @@ class BaseRag(ABC):
             return None
 
         try:
-            vector_store: VectorStore = InMemoryVectorStore.load(
+            vector_store: VectorStore = self._in_memory_store_class().load(
                 path=self.abs_vector_store_path, embedding=self.embeddings
             )
             logger.info("Loaded vector store from: %s\n", self.abs_vector_store_path)
@@ -184,93 +349,229 @@ class BaseRag(ABC):
 
         return await self._create_postgres_vector_store(loader_args, postgres_config)
 
-    async def _process_documents(self, loader_args: Any) -> List[Document]:
-        """Load and split documents"""
-        # Load documents and build the vector store
-        docs: List[Document] = await self.load_documents(loader_args)
-
-        # Split documents into smaller chunks for better embedding and retrieval
-        text_splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(chunk_size=100, chunk_overlap=50)
+    def _stream_chunks(self, loader_args: Any) -> AsyncIterator[Document]:
+        """Load and split documents, yielding chunks as soon as each document is loaded and split"""
+        text_splitter: TextSplitter = self._text_splitter()
+        return asplit_documents(self.alazy_load_documents(loader_args), text_splitter.split_documents)
 
-        doc_chunks: List[Document] = text_splitter.split_documents(docs)
-        logger.info("Processed %d document chunks\n", len(doc_chunks))
+    def _text_splitter(self) -> TextSplitter:
+        """Get the shared splitter used to chunk documents for embedding and retrieval"""
+        return get_text_splitter(self.chunk_size, self.chunk_overlap, self.splitter_type)
 
-        return doc_chunks
+    def _in_memory_store_class(self) -> type:
+        """
+        :return: NumpyVectorStore when the vector store is persisted as a ".npy" matrix, InMemoryVectorStore otherwise
+        """
+        if self.abs_vector_store_path and self.abs_vector_store_path.endswith(NUMPY_EXTENSION):
+            return NumpyVectorStore
+        return InMemoryVectorStore
 
     async def _create_in_memory_vector_store(self, loader_args) -> VectorStore:
         """Create an in-memory vector store."""
-        doc_chunks: List[Document] = await self._process_documents(loader_args)
         logger.info("Creating in-memory vector store.")
-        return await InMemoryVectorStore.afrom_documents(
-            documents=doc_chunks,
-            embedding=self.embeddings,
-        )
+        vectorstore: VectorStore = self._in_memory_store_class()(embedding=self.embeddings)
+        # Chunks are embedded in batches while later documents are still being loaded and split
+        await aadd_in_batches(vectorstore, self._stream_chunks(loader_args))
+        return vectorstore
 
     async def _create_postgres_vector_store(
         self, loader_args: Any, postgres_config: PostgresConfig
     ) -> Optional[VectorStore]:
         """Create a PostgreSQL vector store."""
 
-        # Create engine and table
-        pg_engine = PGEngine.from_connection_string(url=postgres_config.connection_string)
+        # Reuse the pooled engine for this database
+        engine_pool: PGEnginePool = get_shared_pg_engine_pool()
+        pg_engine: PGEngine = engine_pool.get(postgres_config.connection_string)
         table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
-
-        logger.info(
-            "PostgreSQL connection details:\n"
-            + "  Host: %s\n"
-            + "  Port: %s\n"
-            + "  Database: %s\n"
-            + "  Table: %s\n",
-            postgres_config.host,
-            postgres_config.port,
-            postgres_config.database,
-            table_name,
-        )
+        self._log_postgres_connection(postgres_config, table_name)
 
         try:
+            if await engine_pool.table_exists(postgres_config.connection_string, table_name):
+                # Table already exists. Create vector store from it.
+                logger.info("Table %s already exists.\n", table_name)
+                logger.info("Creating postgres vector store from existing table.\n")
+                return await PGVectorStore.create(
+                    engine=pg_engine,
+                    table_name=table_name,
+                    embedding_service=self.embeddings,
+                )
+
             # Initiaize vector store table
             await pg_engine.ainit_vectorstore_table(
                 table_name=table_name,
                 vector_size=VECTOR_SIZE,
             )
 
-            doc_chunks: List[Document] = await self._process_documents(loader_args)
-
             logger.info("Creating postgres vector store from documents.")
-            # Create vector store and load documents
-            return await PGVectorStore.afrom_documents(
-                documents=doc_chunks,
-                embedding=self.embeddings,
+            # Create vector store and insert chunks batch by batch as they are embedded
+            vectorstore: VectorStore = await PGVectorStore.create(
                 engine=pg_engine,
                 table_name=table_name,
+                embedding_service=self.embeddings,
             )
+            await aadd_in_batches(vectorstore, self._stream_chunks(loader_args))
+            return vectorstore
+
+        except (OSError, InvalidPasswordError, InvalidCatalogNameError) as error:
+            self._log_postgres_error(error)
+            engine_pool.invalidate(postgres_config.connection_string, pg_engine)
+            return None
+
+    async def _open_postgres_vector_store(self, postgres_config: PostgresConfig) -> Optional[VectorStore]:
+        """Open a PostgreSQL vector store, creating its table if it does not exist yet."""
+
+        engine_pool: PGEnginePool = get_shared_pg_engine_pool()
+        pg_engine: PGEngine = engine_pool.get(postgres_config.connection_string)
+        table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+        self._log_postgres_connection(postgres_config, table_name)
+
+        try:
+            if await engine_pool.table_exists(postgres_config.connection_string, table_name):
+                logger.info("Table %s already exists.\n", table_name)
+            else:
+                await pg_engine.ainit_vectorstore_table(table_name=table_name, vector_size=VECTOR_SIZE)
 
-        except ProgrammingError:
-            # Table already exists. Create vector store from it.
-            logger.info("Table %s already exists.\n", table_name)
-            logger.info("Creating postgres vector store from existing table.\n")
             return await PGVectorStore.create(
                 engine=pg_engine,
                 table_name=table_name,
                 embedding_service=self.embeddings,
             )
 
-        except OSError as os_error:
-            # Fail to create vector store due to connection error
-            logger.error("Fail to create vector store due to connection error. %s\n", os_error)
+        except (OSError, InvalidPasswordError, InvalidCatalogNameError) as error:
+            self._log_postgres_error(error)
+            engine_pool.invalidate(postgres_config.connection_string, pg_engine)
             return None
 
-        except InvalidPasswordError as invalid_password_error:
-            # Fail to create vector store due to invalid username or password
-            logger.error(
-                "Fail to create vector store due to invalid username or password. %s\n", invalid_password_error
-            )
-            return None
+    @staticmethod
+    def _log_postgres_connection(postgres_config: PostgresConfig, table_name: str):
+        """Log where the PostgreSQL vector store lives."""
+        logger.info(
+            "PostgreSQL connection details:\n"
+            + "  Host: %s\n"
+            + "  Port: %s\n"
+            + "  Database: %s\n"
+            + "  Table: %s\n",
+            postgres_config.host,
+            postgres_config.port,
+            postgres_config.database,
+            table_name,
+        )
 
-        except InvalidCatalogNameError as invalid_catalog_error:
+    @staticmethod
+    def _log_postgres_error(error: Exception):
+        """Log why a PostgreSQL vector store could not be created."""
+        if isinstance(error, InvalidPasswordError):
+            # Fail to create vector store due to invalid username or password
+            logger.error("Fail to create vector store due to invalid username or password. %s\n", error)
+        elif isinstance(error, InvalidCatalogNameError):
             # Fail to create vector store due to invalid DB name
-            logger.error("Fail to create vector store due to invalid DB name. %s\n", invalid_catalog_error)
-            return None
+            logger.error("Fail to create vector store due to invalid DB name. %s\n", error)
+        else:
+            # Fail to create vector store due to connection error
+            logger.error("Fail to create vector store due to connection error. %s\n", error)
+
+    def _index_manifest_path(
+        self, postgres_config: Optional[PostgresConfig], vector_store_type: Literal["in_memory", "postgres"]
+    ) -> Optional[str]:
+        """
+        :return: Path of the manifest of indexed documents, or None if an in-memory vector store is not persisted
+        """
+        if self.abs_index_manifest_path:
+            return self.abs_index_manifest_path
+
+        if vector_store_type == "postgres":
+            table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+            return os.path.join(os.path.dirname(__file__), f"{table_name}.manifest.json")
+
+        if self.abs_vector_store_path:
+            return os.path.splitext(self.abs_vector_store_path)[0] + ".manifest.json"
+
+        return None
+
+    async def _update_vector_store(
+        self,
+        loader_args: Any,
+        postgres_config: Optional[PostgresConfig],
+        vector_store_type: Literal["in_memory", "postgres"],
+        manifest_path: str,
+    ) -> Optional[VectorStore]:
+        """
+        Bring an existing vector store up to date with its source, re-splitting and re-embedding
+        only the documents whose fingerprint changed and deleting chunks of changed or removed documents.
+
+        :raises ValueError: If a postgres table already holds chunks but there is no manifest tracking them
+        """
+        # Chunks indexed without a manifest are not tracked, so every document would look new and be indexed twice
+        has_manifest: bool = os.path.exists(manifest_path)
+        if vector_store_type == "in_memory":
+            vectorstore: Optional[VectorStore] = await self._load_existing_vector_store()
+            if vectorstore is not None and not has_manifest:
+                logger.warning("No index manifest at %s. Rebuilding the vector store from source.\n", manifest_path)
+                vectorstore = None
+            # A manifest without the vector store it describes is meaningless
+            manifest: IndexManifest = IndexManifest.load(manifest_path) if vectorstore else IndexManifest()
+            if vectorstore is None:
+                vectorstore = self._in_memory_store_class()(embedding=self.embeddings)
+        else:
+            vectorstore = await self._open_postgres_vector_store(postgres_config)
+            if vectorstore is None:
+                return None
+            table_name: str = postgres_config.table_name or DEFAULT_TABLE_NAME
+            if not has_manifest and await get_shared_pg_engine_pool().table_has_rows(
+                postgres_config.connection_string, table_name
+            ):
+                logger.error("Table %s has no index manifest at %s\n", table_name, manifest_path)
+                raise ValueError(
+                    f"Table '{table_name}' was not indexed incrementally, since there is no index manifest at "
+                    f"'{manifest_path}'. Use a new table_name or drop the table to rebuild it incrementally."
+                )
+            manifest = IndexManifest.load(manifest_path)
+
+        docs: List[Document] = await self.load_documents(loader_args)
+        if not docs:
+            # Most likely a loading failure rather than a source that was emptied on purpose
+            logger.warning("No documents loaded. Keeping the existing vector store unchanged.\n")
+            return vectorstore
+
+        changes = manifest.diff(docs)
+        logger.info(
+            "Incremental indexing: %d changed, %d unchanged and %d removed documents\n",
+            len(changes.changed),
+            changes.unchanged_count,
+            len(changes.removed_keys),
+        )
+
+        if changes.stale_chunk_ids:
+            await vectorstore.adelete(ids=changes.stale_chunk_ids)
+        manifest.forget(changes.removed_keys)
+
+        await aadd_in_batches(vectorstore, self._stream_changed_chunks(changes, manifest))
+        VectorSearchIndex.invalidate(vectorstore)
+
+        # The manifest describes the saved vector store, so in-memory stores are always saved alongside it
+        if vector_store_type == "in_memory":
+            self._dump_vector_store(vectorstore)
+        try:
+            manifest.save(manifest_path)
+        except OSError as os_error:
+            logger.error("Failed to save index manifest to %s: %s\n", manifest_path, os_error)
+
+        return vectorstore
+
+    async def _stream_changed_chunks(self, changes: IndexChanges, manifest: IndexManifest) -> AsyncIterator[Document]:
+        """
+        Split changed documents group by group, giving each chunk its deterministic id
+        and recording the ids in the manifest.
+        """
+        text_splitter: TextSplitter = self._text_splitter()
+        for key, group in changes.changed.items():
+            fingerprint: str = document_fingerprint(group)
+            group_chunks: List[Document] = await asyncio.to_thread(text_splitter.split_documents, group)
+            for index, chunk in enumerate(group_chunks):
+                chunk.id = chunk_id(key, fingerprint, index)
+            manifest.record(key, fingerprint, [chunk.id for chunk in group_chunks])
+            for chunk in group_chunks:
+                yield chunk
 
     async def _save_vector_store(self, vectorstore: VectorStore, vector_store_type: Literal["in_memory", "postgres"]):
         """Save vector store to file if configured."""
@@ -279,6 +580,10 @@ class BaseRag(ABC):
         if not should_save:
             return None
 
+        self._dump_vector_store(vectorstore)
+
+    def _dump_vector_store(self, vectorstore: VectorStore):
+        """Write an in-memory vector store to its configured path."""
         try:
             os.makedirs(os.path.dirname(self.abs_vector_store_path), exist_ok=True)
             vectorstore.dump(path=self.abs_vector_store_path)
@@ -295,14 +600,37 @@ class BaseRag(ABC):
         :param query: The user query to search for relevant documents
         :return: Concatenated text content of the retrieved documents
         """
+        results: List[str] = await self.query_vectorstore_batch(vectorstore, [query])
+        return results[0]
+
+    async def query_vectorstore_batch(
+        self, vectorstore: VectorStore, queries: List[str], k: int = DEFAULT_TOP_K
+    ) -> List[str]:
+        """
+        Query the given vector store with several query strings at once.
+        In-memory vector stores answer all queries with a single matrix product;
+        other vector stores are queried through their retriever one query at a time.
+
+        :param vectorstore: The vector store to query
+        :param queries: The user queries to search for relevant documents
+        :param k: Number of documents to retrieve per query
+        :return: Concatenated text content of the retrieved documents, one string per query
+        """
+        if vectorstore is None:
+            return ["Failed to create vector store. Please check the log for more information.\n"] * len(queries)
+
+        index: Optional[VectorSearchIndex] = VectorSearchIndex.for_vector_store(vectorstore)
+        if index is not None:
+            return await self._query_index(index, vectorstore.embeddings, queries, k)
+
         try:
             # Create a retriever interface from the vector store
-            retriever: VectorStoreRetriever = vectorstore.as_retriever()
+            retriever: VectorStoreRetriever = vectorstore.as_retriever(search_kwargs={"k": k})
 
-            return await self.query_retriever(retriever, query)
+            return [await self.query_retriever(retriever, query) for query in queries]
 
         except AttributeError:
-            return "Failed to create vector store. Please check the log for more information.\n"
+            return ["Failed to create vector store. Please check the log for more information.\n"] * len(queries)
 
     @staticmethod
     async def query_retriever(retriever: Any, query: str) -> str:
@@ -313,6 +641,17 @@ class BaseRag(ABC):
         :param query: The user query to search for relevant documents
         :return: Concatenated text content of the retrieved documents
         """
+        # Plain similarity retrievers over in-memory vector stores use the vectorized search
+        if isinstance(retriever, VectorStoreRetriever) and retriever.search_type == "similarity":
+            search_kwargs: dict = retriever.search_kwargs or {}
+            index: Optional[VectorSearchIndex] = None
+            if set(search_kwargs) <= {"k"}:
+                index = VectorSearchIndex.for_vector_store(retriever.vectorstore)
+            if index is not None:
+                k: int = search_kwargs.get("k", DEFAULT_TOP_K)
+                results: List[str] = await BaseRag._query_index(index, retriever.vectorstore.embeddings, [query], k)
+                return results[0]
+
         try:
             # Perform an asynchronous similarity search
             results: List[Document] = await retriever.ainvoke(query)
@@ -325,3 +664,28 @@ class BaseRag(ABC):
 
         except asyncio.TimeoutError as e:
             return f"Timed out while querying retriever: {e}"
+
+    @staticmethod
+    async def _query_index(index: VectorSearchIndex, embeddings: Embeddings, queries: List[str], k: int) -> List[str]:
+        """
+        Embed the queries concurrently, then find the top k chunks for all of them in one pass.
+
+        :param index: Index over the vectors of an in-memory vector store
+        :param embeddings: Embeddings the vector store was built with
+        :param queries: The user queries to search for relevant documents
+        :param k: Number of documents to retrieve per query
+        :return: Concatenated text content of the retrieved documents, one string per query
+        """
+        try:
+            query_vectors: List[List[float]] = await asyncio.gather(
+                *(embeddings.aembed_query(query) for query in queries)
+            )
+        except asyncio.TimeoutError as e:
+            return [f"Timed out while querying retriever: {e}"] * len(queries)
+
+        hits: List[List[Tuple[Document, float]]] = index.search(query_vectors, k)
+        if any(hits):
+            logger.info("Retrieval completed!\n")
+
+        # Concatenate the content of the retrieved documents of each query
+        return ["\n\n".join(doc.page_content for doc, _ in query_hits) for query_hits in hits]
@@ -26,6 +26,9 @@ from neuro_san.client.streaming_input_processor import StreamingInputProcessor
 from neuro_san.interfaces.agent_session import AgentSession
 from neuro_san.interfaces.coded_tool import CodedTool
 
+from coded_tools.tools.agent_session_pool import SessionKey
+from coded_tools.tools.agent_session_pool import get_shared_agent_session_pool
+
 logger = logging.getLogger(__name__)
 
 CONNECTION_TYPE = "direct"
@@ -91,32 +94,39 @@ class CallAgent(CodedTool):
         logger.info("inquiry: %s", str(inquiry))
         logger.info("agent_name: %s", str(agent_name))
 
-        agent_session = sly_data.get("agent_session", None)
-        agent_state_info = sly_data.get("agent_state_info", None)
-        if not agent_state_info or not agent_session:
-            agent_session, agent_state_info = set_up_agent(
-                agent_name, connection_type, host, port, local_externals_direct
-            )
-        response, agent_state_info = call_agent(agent_session, agent_state_info, inquiry, agent_thinking_path)
-        sly_data["agent_session"] = agent_session
+        # The conversation continues from sly_data, while the session comes from the shared pool
+        agent_state_info = sly_data.get("agent_state_info", None) or new_agent_state_info()
+        key = SessionKey(agent_name, connection_type, host, port, local_externals_direct)
+        # The downstream agent runs synchronously, so the pool runs it off the event loop
+        response, agent_state_info = await get_shared_agent_session_pool(create_agent_session).call(
+            key, call_agent, agent_state_info, inquiry, agent_thinking_path
+        )
         sly_data["agent_state_info"] = agent_state_info
 
         logger.info(">>>>>>>>>>>>>>>>>>>DONE !!!>>>>>>>>>>>>>>>>>>")
         return response
 
 
-def set_up_agent(
-    agent_name: str, connection_type: str, host: int, port: int, local_externals_direct: bool
-) -> Tuple[AgentSession, Dict[str, Any]]:
-    """Configure these as needed."""
-
+def create_agent_session(key: SessionKey) -> AgentSession:
+    """
+    :param key: Which agent to talk to and how
+    :return: A new session for the agent
+    """
     metadata = {"user_id": os.environ.get("USER")}
 
     # Create session factory and agent session
     factory = AgentSessionFactory()
-    agent_session = factory.create_session(connection_type, agent_name, host, port, local_externals_direct, metadata)
+    return factory.create_session(
+        key.connection_type, key.agent_name, key.host, key.port, key.local_externals_direct, metadata
+    )
+
+
+def new_agent_state_info() -> Dict[str, Any]:
+    """
+    :return: Conversation state for a new conversation with an agent
+    """
     # Initialize any conversation state here
-    agent_state_info = {
+    return {
         "last_chat_response": None,
         "prompt": "Please enter your response ('quit' to terminate):\n",
         "timeout": 5000.0,
@@ -125,7 +135,6 @@ def set_up_agent(
         "sly_data": None,
         "chat_filter": {"chat_filter_type": "MAXIMAL"},
     }
-    return agent_session, agent_state_info
 
 
 def call_agent(
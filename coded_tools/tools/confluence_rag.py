@@ -102,12 +102,20 @@ class ConfluenceRag(CodedTool, BaseRag):
                 "https://your-domain.atlassian.net/wiki/spaces/<space_key>/pages/<page_id>/<title>"
             )
 
-        # Save the generated vector store as a JSON file if True
+        # Save the generated vector store to vector_store_path if True
         self.save_vector_store = args.get("save_vector_store", False)
 
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Only re-index source documents that changed since the last build if True
+        self.configure_incremental_indexing(
+            args.get("incremental_indexing", False), args.get("index_manifest_path"), args.get("reindex_interval")
+        )
+
+        # Chunking of loaded documents
+        self.configure_text_splitter(args.get("chunk_size"), args.get("chunk_overlap"), args.get("splitter"))
+
         # Prepare the vector store
         vectorstore = await self.generate_vector_store(loader_args=loader_args)
 
@@ -17,21 +17,29 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
+from typing import Optional
 
+# pylint: disable=import-error
+from docling.document_converter import DocumentConverter
 from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStore
-
-# pylint: disable=import-error
 from langchain_docling import DoclingLoader
 from neuro_san.interfaces.coded_tool import CodedTool
 from requests.exceptions import HTTPError
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.document_loading import DEFAULT_MAX_CONCURRENT_LOADS
+from coded_tools.tools.document_loading import get_shared_process_pool
+from coded_tools.tools.document_loading import iter_loaded_documents
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Converter of the worker process, created once since it loads the layout models
+_CONVERTER: Optional[DocumentConverter] = None
+
 
 class DoclingRag(CodedTool, BaseRag):
     """
@@ -47,8 +55,15 @@ class DoclingRag(CodedTool, BaseRag):
         :param args: Dictionary containing:
           "query": search string
           "urls": list of pdf files
-          "save_vector_store": save to JSON file if True
+          "save_vector_store": save to vector_store_path if True
           "vector_store_path": relative path to this file
+          "incremental_indexing": only re-index changed source documents if True
+          "index_manifest_path": where fingerprints of indexed documents are kept
+          "reindex_interval": seconds between checks of the sources for changes
+          "chunk_size": maximum number of tokens per chunk
+          "chunk_overlap": number of tokens shared by consecutive chunks
+          "splitter": "recursive" or the faster "token" splitter
+          "max_concurrent_loads": maximum number of urls loaded at the same time
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -79,12 +94,23 @@ class DoclingRag(CodedTool, BaseRag):
         # Vector store type
         vector_store_type: str = args.get("vector_store_type", "in_memory")
 
-        # Save the generated vector store as a JSON file if True
+        # Save the generated vector store to vector_store_path if True
         self.save_vector_store = args.get("save_vector_store", False)
 
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Only re-index source documents that changed since the last build if True
+        self.configure_incremental_indexing(
+            args.get("incremental_indexing", False), args.get("index_manifest_path"), args.get("reindex_interval")
+        )
+
+        # Chunking of loaded documents
+        self.configure_text_splitter(args.get("chunk_size"), args.get("chunk_overlap"), args.get("splitter"))
+
+        # Load up to this many urls at the same time
+        self.max_concurrent_loads = int(args.get("max_concurrent_loads", DEFAULT_MAX_CONCURRENT_LOADS))
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -113,19 +139,35 @@ class DoclingRag(CodedTool, BaseRag):
         :param loader_args: Dictionary containing 'urls' (list of file URLs)
         :return: List of loaded documents
         """
-        docs: list[Document] = []
+        return [doc async for doc in self.alazy_load_documents(loader_args)]
+
+    async def alazy_load_documents(self, loader_args: dict[str, Any]) -> AsyncIterator[Document]:
+        """
+        Load documents from URLs concurrently, converting them in the shared process pool.
+
+        :param loader_args: Dictionary containing 'urls' (list of file URLs)
+        :return: Async iterator of loaded documents, in the order the files finish loading
+        """
         urls: list[str] = loader_args.get("urls", [])
+        async for _, docs in iter_loaded_documents(
+            urls,
+            load_with_docling,
+            max_concurrency=self.max_concurrent_loads,
+            executor=get_shared_process_pool(),
+            handled_errors=(HTTPError, FileNotFoundError, ValueError),
+        ):
+            for doc in docs:
+                yield doc
+
+
+def load_with_docling(url: str) -> list[Document]:
+    """
+    Download and convert one file. Runs in a worker process, so it must stay a module-level function.
 
-        loader = DoclingLoader(file_path=urls)
-        async for doc in loader.alazy_load():
-            try:
-                docs.append(doc)
-                logger.info("Successfully loaded PDF file from %s", doc.metadata.get("source", "unknown source"))
-            except HTTPError as http_e:
-                logger.error("HTTP error occurred: %s", http_e)
-            except FileNotFoundError as fnf_e:
-                logger.error("File not found: %s", fnf_e)
-            except ValueError as val_e:
-                logger.error("Value error: %s", val_e)
-
-        return docs
+    :param url: URL or path of the file
+    :return: Documents of the converted file
+    """
+    global _CONVERTER  # pylint: disable=global-statement
+    if _CONVERTER is None:
+        _CONVERTER = DocumentConverter()
+    return DoclingLoader(file_path=url, converter=_CONVERTER).load()
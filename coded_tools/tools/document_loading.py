@@ -0,0 +1,105 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Concurrent loading of RAG sources with parsing offloaded to a shared process pool"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+
+DEFAULT_MAX_CONCURRENT_LOADS = 4
+
+logger = logging.getLogger(__name__)
+
+
+async def iter_loaded_documents(
+    sources: List[str],
+    load: Callable[[str], List[Document]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENT_LOADS,
+    executor: Optional[Executor] = None,
+    handled_errors: Tuple[Type[BaseException], ...] = (FileNotFoundError, ValueError),
+) -> AsyncIterator[Tuple[str, List[Document]]]:
+    """
+    Load sources concurrently, yielding the documents of each source as soon as it is loaded.
+
+    :param sources: URLs or paths to load
+    :param load: Blocking function loading the documents of one source. Must be picklable,
+        i.e. a module-level function, when executor is a process pool.
+    :param max_concurrency: Maximum number of sources being loaded at the same time
+    :param executor: Executor that runs load, or None for the event loop's default thread pool
+    :param handled_errors: Errors that are logged and skip the failing source. Other errors are raised.
+    :return: Async iterator of (source, documents) in completion order
+    """
+    loop = asyncio.get_running_loop()
+    pending_sources: List[str] = list(sources)
+    in_flight: Dict[asyncio.Future, str] = {}
+    max_concurrency = max(1, max_concurrency)
+
+    try:
+        while pending_sources or in_flight:
+            while pending_sources and len(in_flight) < max_concurrency:
+                source: str = pending_sources.pop(0)
+                in_flight[loop.run_in_executor(executor, load, source)] = source
+
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                source = in_flight.pop(future)
+                try:
+                    documents: List[Document] = future.result()
+                except handled_errors as error:
+                    logger.error("Failed to load %s: %s", source, error)
+                    continue
+                logger.info("Successfully loaded %d documents from %s", len(documents), source)
+                yield source, documents
+    finally:
+        # Abandoned or failed iteration: do not start what has not started yet
+        for future in in_flight:
+            future.cancel()
+
+
+# Shared by every RAG tool in the process, since a CodedTool instance does not outlive its invocation
+_SHARED_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_SHARED_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def get_shared_process_pool() -> ProcessPoolExecutor:
+    """
+    :return: The process-wide pool used for CPU-bound document parsing, sized by the
+        RAG_LOADER_PROCESSES environment variable or the number of CPUs on first use
+    """
+    global _SHARED_PROCESS_POOL  # pylint: disable=global-statement
+    with _SHARED_PROCESS_POOL_LOCK:
+        if _SHARED_PROCESS_POOL is None:
+            max_workers: int = int(os.getenv("RAG_LOADER_PROCESSES") or os.cpu_count() or 1)
+            # Forking a server that runs threads can deadlock the children, so start workers fresh
+            _SHARED_PROCESS_POOL = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _SHARED_PROCESS_POOL
@@ -0,0 +1,262 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Content-addressed, on-disk cache for chunk embeddings used by the RAG tools"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Dict
+from typing import List
+from typing import Optional
+
+# pylint: disable=import-error
+from langchain_core.embeddings import Embeddings
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "neuro-san-studio", "embedding_cache.sqlite")
+DEFAULT_MAX_CACHE_BYTES = 512 * 1024 * 1024
+# Stay well under SQLite's limit on the number of bound parameters per statement
+SQL_BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Persistent key/vector store backed by SQLite.
+
+    Entries are keyed on a SHA-256 digest of the embedding model name, the vector dimensions
+    and the chunk text, so identical chunks indexed by different tools or sessions share one entry.
+    When the total size of the stored vectors exceeds max_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_CACHE_BYTES):
+        """
+        :param path: Path to the SQLite file, or ":memory:" for a non-persistent cache
+        :param max_bytes: Upper bound on the total size of the cached vectors
+        """
+        self.path: str = path
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS embeddings_last_access ON embeddings (last_access)")
+        self._connection.commit()
+        self._total_bytes: int = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[
+            0
+        ]
+
+    @staticmethod
+    def make_key(model: str, dimensions: Optional[int], text: str) -> str:
+        """
+        :param model: Name of the embedding model
+        :param dimensions: Size of the vectors produced by the model
+        :param text: Text of the chunk being embedded
+        :return: Hex digest identifying the embedding of text under the given model
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{model}\x00{dimensions}\x00".encode("utf-8"))
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        """
+        Look up several keys at once, refreshing their recency.
+
+        :param keys: Keys to look up
+        :return: Dictionary of the keys that were found mapped to their vectors
+        """
+        found: Dict[str, List[float]] = {}
+        unique_keys: List[str] = list(dict.fromkeys(keys))
+        with self._lock:
+            for start in range(0, len(unique_keys), SQL_BATCH_SIZE):
+                batch: List[str] = unique_keys[start : start + SQL_BATCH_SIZE]
+                placeholders: str = ",".join("?" * len(batch))
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = array("f", blob).tolist()
+
+            if found:
+                now: float = time.time()
+                self._connection.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                self._connection.commit()
+
+            hit_count: int = sum(1 for key in keys if key in found)
+            self.hits += hit_count
+            self.misses += len(keys) - hit_count
+
+        return found
+
+    def put_many(self, items: Dict[str, List[float]]):
+        """
+        Store several vectors, then evict least recently used entries if the cache is over budget.
+
+        :param items: Dictionary of keys mapped to their vectors
+        """
+        if not items:
+            return
+
+        now: float = time.time()
+        rows = []
+        for key, vector in items.items():
+            blob: bytes = array("f", vector).tobytes()
+            rows.append((key, blob, len(blob), now))
+
+        with self._lock:
+            replaced: int = 0
+            keys: List[str] = list(items)
+            for start in range(0, len(keys), SQL_BATCH_SIZE):
+                batch: List[str] = keys[start : start + SQL_BATCH_SIZE]
+                placeholders: str = ",".join("?" * len(batch))
+                replaced += self._connection.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchone()[0]
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector, size, last_access) VALUES (?, ?, ?, ?)", rows
+            )
+            self._total_bytes += sum(row[2] for row in rows) - replaced
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes. Caller holds the lock."""
+        while self._total_bytes > self.max_bytes:
+            victims = self._connection.execute(
+                "SELECT key, size FROM embeddings ORDER BY last_access LIMIT 256"
+            ).fetchall()
+            if not victims:
+                self._total_bytes = 0
+                return
+            for key, size in victims:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._connection.execute("DELETE FROM embeddings WHERE key = ?", (key,))
+                self._total_bytes -= size
+            logger.debug("Evicted embeddings down to %d bytes", self._total_bytes)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of the cached vectors in bytes"""
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary with hit/miss counters and the current cache size
+        """
+        with self._lock:
+            entries: int = self._connection.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+            return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": self._total_bytes}
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that serves chunk embeddings from an EmbeddingCache
+    and only sends cache misses to the wrapped embeddings service.
+    Query embeddings are passed straight through since queries rarely repeat.
+    """
+
+    def __init__(self, embeddings: Embeddings, cache: EmbeddingCache, model: str, dimensions: Optional[int] = None):
+        """
+        :param embeddings: The embeddings service that computes vectors on a cache miss
+        :param cache: The cache to read from and write to
+        :param model: Name of the embedding model, part of the cache key
+        :param dimensions: Size of the vectors, part of the cache key
+        """
+        self.embeddings: Embeddings = embeddings
+        self.cache: EmbeddingCache = cache
+        self.model: str = model
+        self.dimensions: Optional[int] = dimensions
+
+    def _lookup(self, texts: List[str]):
+        """
+        :param texts: Texts to look up
+        :return: Tuple of the per-text keys, the cached vectors found, and the distinct texts that missed
+        """
+        keys: List[str] = [EmbeddingCache.make_key(self.model, self.dimensions, text) for text in texts]
+        cached: Dict[str, List[float]] = self.cache.get_many(keys)
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached:
+                missing.setdefault(key, text)
+        return keys, cached, missing
+
+    def _store(self, cached: Dict[str, List[float]], missing: Dict[str, str], vectors: List[List[float]]):
+        """Record newly computed vectors in both the cache and the lookup result."""
+        computed: Dict[str, List[float]] = dict(zip(missing, vectors))
+        self.cache.put_many(computed)
+        cached.update(computed)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, cached, missing = self._lookup(texts)
+        if missing:
+            self._store(cached, missing, self.embeddings.embed_documents(list(missing.values())))
+        return [cached[key] for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        # SQLite calls block, so they run off the event loop
+        keys, cached, missing = await asyncio.to_thread(self._lookup, texts)
+        if missing:
+            vectors: List[List[float]] = await self.embeddings.aembed_documents(list(missing.values()))
+            await asyncio.to_thread(self._store, cached, missing, vectors)
+        return [cached[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await self.embeddings.aembed_query(text)
+
+
+# Shared by every RAG tool in the process so hit/miss counters aggregate
+_SHARED_CACHE: Optional[EmbeddingCache] = None
+_SHARED_CACHE_LOCK = threading.Lock()
+
+
+def get_shared_embedding_cache() -> EmbeddingCache:
+    """
+    :return: The process-wide EmbeddingCache, configured from the EMBEDDING_CACHE_PATH
+        and EMBEDDING_CACHE_MAX_BYTES environment variables on first use
+    """
+    global _SHARED_CACHE  # pylint: disable=global-statement
+    with _SHARED_CACHE_LOCK:
+        if _SHARED_CACHE is None:
+            path: str = os.path.expanduser(os.getenv("EMBEDDING_CACHE_PATH") or DEFAULT_CACHE_PATH)
+            max_bytes: int = int(os.getenv("EMBEDDING_CACHE_MAX_BYTES") or DEFAULT_MAX_CACHE_BYTES)
+            _SHARED_CACHE = EmbeddingCache(path=path, max_bytes=max_bytes)
+            logger.info("Using embedding cache at %s (max %d bytes)", path, max_bytes)
+        return _SHARED_CACHE
@@ -0,0 +1,122 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Streaming pipeline that splits documents, embeds the chunks in batches and adds them to a vector store"""
+
+import asyncio
+import logging
+from typing import AsyncIterable
+from typing import AsyncIterator
+from typing import Callable
+from typing import List
+from typing import Set
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+from langchain_core.vectorstores import VectorStore
+
+# Chunks per embedding request. OpenAI accepts up to 2048 inputs per request.
+DEFAULT_EMBEDDING_BATCH_SIZE = 256
+# Characters per embedding request, keeping a request well below the ~300k token limit
+DEFAULT_EMBEDDING_BATCH_CHARS = 400_000
+DEFAULT_MAX_BATCHES_IN_FLIGHT = 4
+
+logger = logging.getLogger(__name__)
+
+
+async def asplit_documents(
+    documents: AsyncIterable[Document], split: Callable[[List[Document]], List[Document]]
+) -> AsyncIterator[Document]:
+    """
+    Split documents as they arrive. Splitting runs on a worker thread so the event loop
+    keeps serving embedding requests that are in flight.
+
+    :param documents: Async iterable of loaded documents
+    :param split: Blocking function splitting a list of documents into chunks
+    :return: Async iterator of chunks
+    """
+    async for document in documents:
+        for chunk in await asyncio.to_thread(split, [document]):
+            yield chunk
+
+
+async def abatch_chunks(
+    chunks: AsyncIterable[Document],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    batch_chars: int = DEFAULT_EMBEDDING_BATCH_CHARS,
+) -> AsyncIterator[List[Document]]:
+    """
+    Group chunks into embedding batches bounded by number of chunks and number of characters.
+
+    :param chunks: Async iterable of chunks
+    :param batch_size: Maximum number of chunks per batch
+    :param batch_chars: Maximum number of characters per batch. A single larger chunk still forms its own batch.
+    :return: Async iterator of non-empty batches
+    """
+    batch: List[Document] = []
+    chars: int = 0
+    async for chunk in chunks:
+        length: int = len(chunk.page_content)
+        if batch and (len(batch) >= batch_size or chars + length > batch_chars):
+            yield batch
+            batch, chars = [], 0
+        batch.append(chunk)
+        chars += length
+    if batch:
+        yield batch
+
+
+async def aadd_in_batches(
+    vectorstore: VectorStore,
+    chunks: AsyncIterable[Document],
+    batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+    batch_chars: int = DEFAULT_EMBEDDING_BATCH_CHARS,
+    max_in_flight: int = DEFAULT_MAX_BATCHES_IN_FLIGHT,
+) -> int:
+    """
+    Embed chunks and add them to a vector store batch by batch, with several batches in flight.
+    No new batch is formed while max_in_flight batches are pending, so memory stays bounded
+    no matter how large the corpus is.
+
+    :param vectorstore: Vector store to add the chunks to. Chunks that have an id are stored under it.
+    :param chunks: Async iterable of chunks
+    :param batch_size: Maximum number of chunks per embedding request
+    :param batch_chars: Maximum number of characters per embedding request
+    :param max_in_flight: Maximum number of batches being embedded at the same time
+    :return: Number of chunks added
+    """
+    in_flight: Set[asyncio.Task] = set()
+    added: int = 0
+    max_in_flight = max(1, max_in_flight)
+
+    try:
+        async for batch in abatch_chunks(chunks, batch_size, batch_chars):
+            while len(in_flight) >= max_in_flight:
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                added += sum(len(task.result()) for task in done)
+
+            in_flight.add(asyncio.create_task(vectorstore.aadd_documents(batch)))
+
+        if in_flight:
+            done, in_flight = await asyncio.wait(in_flight)
+            added += sum(len(task.result()) for task in done)
+    finally:
+        # A failed batch or cancellation must not leave other batches writing in the background
+        for task in in_flight:
+            task.cancel()
+
+    logger.info("Embedded and added %d document chunks\n", added)
+    return added
@@ -0,0 +1,182 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Change detection for incrementally re-indexing RAG sources"""
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Dict
+from typing import List
+
+# pylint: disable=import-error
+from langchain_core.documents import Document
+
+MANIFEST_VERSION = 1
+# Metadata set by loaders that changes whenever the source changes, e.g. Confluence "when" or PDF "modDate"
+VALIDATOR_METADATA_KEYS = ("etag", "last_modified", "Last-Modified", "when", "modDate", "moddate")
+# Namespace for deterministic chunk ids, so a chunk of unchanged content always gets the same id
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c1c2e-1f4e-4c55-9b3a-5f0d6b7f2a10")
+
+logger = logging.getLogger(__name__)
+
+
+def document_key(document: Document) -> str:
+    """
+    :param document: A document produced by a loader
+    :return: Identity of the source document, stable across loads, e.g. the Confluence page id
+        or the source URL plus page number for PDFs
+    """
+    metadata: dict = document.metadata or {}
+    key: str = str(metadata.get("id") or metadata.get("source") or metadata.get("file_path") or "")
+    if "page" in metadata:
+        key += f"#page={metadata['page']}"
+    return key
+
+
+def document_fingerprint(documents: List[Document]) -> str:
+    """
+    :param documents: All documents a loader produced for one document_key(), in load order
+    :return: Digest of their content and of any validator metadata the loader provides
+    """
+    digest = hashlib.sha256()
+    for document in documents:
+        digest.update(hashlib.sha256(document.page_content.encode("utf-8")).digest())
+        metadata: dict = document.metadata or {}
+        for validator in VALIDATOR_METADATA_KEYS:
+            if metadata.get(validator) is not None:
+                digest.update(f"\x00{validator}={metadata[validator]}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def group_documents(documents: List[Document]) -> Dict[str, List[Document]]:
+    """
+    :param documents: Documents produced by a loader
+    :return: The documents grouped by document_key(), since some loaders emit several documents per source
+    """
+    groups: Dict[str, List[Document]] = {}
+    for document in documents:
+        groups.setdefault(document_key(document), []).append(document)
+    return groups
+
+
+def chunk_id(key: str, fingerprint: str, index: int) -> str:
+    """
+    :param key: document_key() of the documents the chunk was split from
+    :param fingerprint: document_fingerprint() of those documents
+    :param index: Position of the chunk among all chunks of those documents
+    :return: UUID string usable as an id by both InMemoryVectorStore and PGVectorStore
+    """
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, f"{key}\x00{fingerprint}\x00{index}"))
+
+
+@dataclass
+class IndexChanges:
+    """Outcome of comparing freshly loaded documents with an IndexManifest."""
+
+    # Documents that are new or whose fingerprint changed grouped by key, to be split and embedded
+    changed: Dict[str, List[Document]] = field(default_factory=dict)
+    # Ids of chunks belonging to changed or removed documents
+    stale_chunk_ids: List[str] = field(default_factory=list)
+    # Keys of documents that are no longer produced by the loader
+    removed_keys: List[str] = field(default_factory=list)
+    unchanged_count: int = 0
+
+
+class IndexManifest:
+    """
+    Records, per source document, the fingerprint that was indexed and the ids of its chunks.
+    Stored as a JSON file next to the vector store it describes.
+    """
+
+    def __init__(self, documents: Dict[str, dict] = None):
+        """
+        :param documents: Dictionary of document key -> {"fingerprint": str, "chunk_ids": [str]}
+        """
+        self.documents: Dict[str, dict] = documents or {}
+
+    @classmethod
+    def load(cls, path: str) -> "IndexManifest":
+        """
+        :param path: Path of the manifest file
+        :return: The manifest stored at path, or an empty manifest if there is none
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as manifest_file:
+                content: dict = json.load(manifest_file)
+        except FileNotFoundError:
+            return cls()
+
+        if content.get("version") != MANIFEST_VERSION:
+            logger.warning("Ignoring index manifest %s with unsupported version %s", path, content.get("version"))
+            return cls()
+        return cls(content.get("documents", {}))
+
+    def save(self, path: str):
+        """
+        Atomically write the manifest.
+
+        :param path: Path of the manifest file
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path: str = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as manifest_file:
+            json.dump({"version": MANIFEST_VERSION, "documents": self.documents}, manifest_file)
+        os.replace(temp_path, path)
+
+    def diff(self, documents: List[Document]) -> IndexChanges:
+        """
+        :param documents: Every document currently produced by the loader
+        :return: Which documents need re-indexing and which chunks are stale
+        """
+        changes = IndexChanges()
+        groups: Dict[str, List[Document]] = group_documents(documents)
+        for key, group in groups.items():
+            entry: dict = self.documents.get(key)
+            if entry is not None and entry["fingerprint"] == document_fingerprint(group):
+                changes.unchanged_count += 1
+                continue
+            changes.changed[key] = group
+            if entry is not None:
+                changes.stale_chunk_ids.extend(entry["chunk_ids"])
+
+        for key, entry in self.documents.items():
+            if key not in groups:
+                changes.removed_keys.append(key)
+                changes.stale_chunk_ids.extend(entry["chunk_ids"])
+
+        return changes
+
+    def record(self, key: str, fingerprint: str, chunk_ids: List[str]):
+        """
+        Remember that the documents under a key were indexed as the given chunks.
+
+        :param key: document_key() of the documents
+        :param fingerprint: document_fingerprint() of the documents
+        :param chunk_ids: Ids of their chunks in the vector store
+        """
+        self.documents[key] = {"fingerprint": fingerprint, "chunk_ids": chunk_ids}
+
+    def forget(self, keys: List[str]):
+        """
+        :param keys: Keys of documents that were removed from the source
+        """
+        for key in keys:
+            self.documents.pop(key, None)
@@ -0,0 +1,283 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Vector store that persists vectors as a NumPy matrix and searches it memory-mapped"""
+
+import json
+import os
+import uuid
+from typing import Callable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import VectorStore
+
+from coded_tools.tools.vector_search import normalize_rows
+from coded_tools.tools.vector_search import top_k_similar
+
+NUMPY_EXTENSION = ".npy"
+DOCS_EXTENSION = ".docs.jsonl"
+
+
+class NumpyVectorStore(VectorStore):
+    """
+    In-memory vector store holding its vectors in one contiguous, L2-normalized float32 matrix.
+
+    Persisted as two files sharing a stem: "<stem>.npy" with the matrix and "<stem>.docs.jsonl"
+    with one line of id, text and metadata per row. load() maps the matrix read-only instead of parsing it,
+    so cold start costs one pass over the text side file and searches run directly against the mapped pages.
+    """
+
+    def __init__(self, embedding: Embeddings):
+        """
+        :param embedding: Embeddings used to embed added texts and queries
+        """
+        self.embedding: Embeddings = embedding
+        self.ids: List[str] = []
+        self.texts: List[str] = []
+        self.metadatas: List[dict] = []
+        self.vectors: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        # Rows added so far, with spare capacity. vectors is a view of its first len(ids) rows while set.
+        self._buffer: Optional[np.ndarray] = None
+
+    @property
+    def embeddings(self) -> Embeddings:
+        return self.embedding
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add_vectors(
+        self,
+        vectors: List[List[float]],
+        texts: List[str],
+        metadatas: Optional[List[dict]] = None,
+        ids: Optional[List[str]] = None,
+    ) -> List[str]:
+        """
+        Add already embedded texts.
+
+        :param vectors: One embedding per text
+        :param texts: Texts of the chunks
+        :param metadatas: Optional metadata per text
+        :param ids: Optional ids per text. Missing ids are generated.
+        :return: Ids of the added texts
+        """
+        if not texts:
+            return []
+
+        ids = [doc_id or str(uuid.uuid4()) for doc_id in (ids or [None] * len(texts))]
+        rows: np.ndarray = normalize_rows(vectors)
+        self._append_rows(rows)
+        self.ids.extend(ids)
+        self.texts.extend(texts)
+        self.metadatas.extend(metadatas or [{} for _ in texts])
+        return ids
+
+    def _append_rows(self, rows: np.ndarray):
+        """
+        Append normalized rows to the matrix. The buffer grows geometrically, so a store built from many
+        batches copies each row a constant number of times on average instead of once per later batch.
+        A memory-mapped matrix is read-only, so the first append after load() copies it into a new buffer.
+
+        :param rows: Normalized rows to append
+        """
+        count: int = len(self.ids)
+        needed: int = count + rows.shape[0]
+        if self._buffer is None or needed > self._buffer.shape[0]:
+            capacity: int = max(needed, 2 * count)
+            buffer: np.ndarray = np.empty((capacity, rows.shape[1]), dtype=np.float32)
+            if count:
+                buffer[:count] = self.vectors[:count]
+            self._buffer = buffer
+        self._buffer[count:needed] = rows
+        self.vectors = self._buffer[:needed]
+
+    def add_texts(
+        self, texts: Iterable[str], metadatas: Optional[List[dict]] = None, ids: Optional[List[str]] = None, **kwargs
+    ) -> List[str]:
+        texts = list(texts)
+        return self.add_vectors(self.embedding.embed_documents(texts), texts, metadatas, ids)
+
+    async def aadd_texts(
+        self, texts: Iterable[str], metadatas: Optional[List[dict]] = None, ids: Optional[List[str]] = None, **kwargs
+    ) -> List[str]:
+        texts = list(texts)
+        return self.add_vectors(await self.embedding.aembed_documents(texts), texts, metadatas, ids)
+
+    def add_documents(self, documents: List[Document], **kwargs) -> List[str]:
+        ids: List[Optional[str]] = kwargs.pop("ids", None) or [doc.id for doc in documents]
+        return self.add_texts(
+            [doc.page_content for doc in documents], [doc.metadata for doc in documents], ids=ids, **kwargs
+        )
+
+    async def aadd_documents(self, documents: List[Document], **kwargs) -> List[str]:
+        ids: List[Optional[str]] = kwargs.pop("ids", None) or [doc.id for doc in documents]
+        return await self.aadd_texts(
+            [doc.page_content for doc in documents], [doc.metadata for doc in documents], ids=ids, **kwargs
+        )
+
+    def delete(self, ids: Optional[List[str]] = None, **kwargs) -> Optional[bool]:
+        if not ids:
+            return False
+        doomed = set(ids)
+        keep: List[int] = [row for row, doc_id in enumerate(self.ids) if doc_id not in doomed]
+        if len(keep) == len(self.ids):
+            return False
+        self.vectors = np.ascontiguousarray(self.vectors[keep])
+        self._buffer = None
+        self.ids = [self.ids[row] for row in keep]
+        self.texts = [self.texts[row] for row in keep]
+        self.metadatas = [self.metadatas[row] for row in keep]
+        return True
+
+    async def adelete(self, ids: Optional[List[str]] = None, **kwargs) -> Optional[bool]:
+        return self.delete(ids, **kwargs)
+
+    def get_by_ids(self, ids: Sequence[str], /) -> List[Document]:
+        rows = {doc_id: row for row, doc_id in enumerate(self.ids)}
+        return [self._document(rows[doc_id]) for doc_id in ids if doc_id in rows]
+
+    def _document(self, row: int) -> Document:
+        return Document(id=self.ids[row], page_content=self.texts[row], metadata=self.metadatas[row])
+
+    # pylint: disable=redefined-builtin,unused-argument
+    def similarity_search_with_score_by_vector(
+        self, embedding: List[float], k: int = 4, filter: Optional[Callable[[Document], bool]] = None, **kwargs
+    ) -> List[Tuple[Document, float]]:
+        """
+        :param embedding: Embedding of the query
+        :param k: Number of results
+        :param filter: Optional predicate that results must satisfy
+        :return: The k most similar chunks with their cosine similarity, best first
+        """
+        if len(self.ids) == 0:
+            return []
+
+        query: np.ndarray = normalize_rows(embedding)
+        if filter is None:
+            rows, scores = top_k_similar(self.vectors, query, k)
+            return [(self._document(int(row)), float(score)) for row, score in zip(rows[0], scores[0])]
+
+        # A filter can reject any number of the best rows, so walk the full ranking
+        all_scores: np.ndarray = self.vectors @ query[0]
+        results: List[Tuple[Document, float]] = []
+        for row in np.argsort(-all_scores):
+            document: Document = self._document(int(row))
+            if filter(document):
+                results.append((document, float(all_scores[row])))
+                if len(results) == k:
+                    break
+        return results
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4, **kwargs) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score_by_vector(embedding, k, **kwargs)]
+
+    # pylint: disable=arguments-differ
+    def similarity_search_with_score(self, query: str, k: int = 4, **kwargs) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(self.embedding.embed_query(query), k, **kwargs)
+
+    # pylint: disable=arguments-differ
+    async def asimilarity_search_with_score(self, query: str, k: int = 4, **kwargs) -> List[Tuple[Document, float]]:
+        return self.similarity_search_with_score_by_vector(await self.embedding.aembed_query(query), k, **kwargs)
+
+    def similarity_search(self, query: str, k: int = 4, **kwargs) -> List[Document]:
+        return [doc for doc, _ in self.similarity_search_with_score(query, k, **kwargs)]
+
+    async def asimilarity_search(self, query: str, k: int = 4, **kwargs) -> List[Document]:
+        return [doc for doc, _ in await self.asimilarity_search_with_score(query, k, **kwargs)]
+
+    def _select_relevance_score_fn(self) -> Callable[[float], float]:
+        return self._cosine_relevance_score_fn
+
+    @classmethod
+    def from_texts(
+        cls, texts: List[str], embedding: Embeddings, metadatas: Optional[List[dict]] = None, **kwargs
+    ) -> "NumpyVectorStore":
+        store = cls(embedding=embedding)
+        store.add_texts(texts, metadatas, ids=kwargs.get("ids"))
+        return store
+
+    @classmethod
+    async def afrom_texts(
+        cls, texts: List[str], embedding: Embeddings, metadatas: Optional[List[dict]] = None, **kwargs
+    ) -> "NumpyVectorStore":
+        store = cls(embedding=embedding)
+        await store.aadd_texts(texts, metadatas, ids=kwargs.get("ids"))
+        return store
+
+    @staticmethod
+    def _paths(path: str) -> Tuple[str, str]:
+        """
+        :param path: Path of the ".npy" file
+        :return: Paths of the matrix file and of the text side file
+        """
+        stem: str = path[: -len(NUMPY_EXTENSION)] if path.endswith(NUMPY_EXTENSION) else path
+        return stem + NUMPY_EXTENSION, stem + DOCS_EXTENSION
+
+    def dump(self, path: str):
+        """
+        Write the store to disk. Both files are replaced atomically.
+
+        :param path: Path of the ".npy" file
+        """
+        matrix_path, docs_path = self._paths(path)
+
+        # np.save appends ".npy" to names that lack it, so keep the extension on the temporary file
+        temp_matrix_path: str = matrix_path[: -len(NUMPY_EXTENSION)] + ".tmp" + NUMPY_EXTENSION
+        np.save(temp_matrix_path, np.asarray(self.vectors, dtype=np.float32))
+
+        temp_docs_path: str = docs_path + ".tmp"
+        with open(temp_docs_path, "w", encoding="utf-8") as docs_file:
+            for doc_id, text, metadata in zip(self.ids, self.texts, self.metadatas):
+                line: str = json.dumps({"id": doc_id, "text": text, "metadata": metadata}, ensure_ascii=False)
+                docs_file.write(line + "\n")
+
+        os.replace(temp_docs_path, docs_path)
+        os.replace(temp_matrix_path, matrix_path)
+
+    # pylint: disable=unused-argument
+    @classmethod
+    def load(cls, path: str, embedding: Embeddings, **kwargs) -> "NumpyVectorStore":
+        """
+        Map a store written by dump().
+
+        :param path: Path of the ".npy" file
+        :param embedding: Embeddings used for queries and added texts
+        :return: The loaded store
+        :raises FileNotFoundError: If either file is missing
+        """
+        matrix_path, docs_path = cls._paths(path)
+        store = cls(embedding=embedding)
+        store.vectors = np.load(matrix_path, mmap_mode="r")
+
+        with open(docs_path, "r", encoding="utf-8") as docs_file:
+            for line in docs_file:
+                record: dict = json.loads(line)
+                store.ids.append(record["id"])
+                store.texts.append(record["text"])
+                store.metadatas.append(record["metadata"])
+
+        if store.vectors.shape[0] != len(store.ids):
+            raise ValueError(f"{matrix_path} has {store.vectors.shape[0]} rows but {docs_path} has {len(store.ids)}")
+        return store
@@ -19,6 +19,7 @@
 import logging
 import os
 from typing import Any
+from typing import AsyncIterator
 from typing import Dict
 from typing import List
 
@@ -29,6 +30,9 @@ from neuro_san.interfaces.coded_tool import CodedTool
 
 from coded_tools.tools.base_rag import BaseRag
 from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.document_loading import DEFAULT_MAX_CONCURRENT_LOADS
+from coded_tools.tools.document_loading import get_shared_process_pool
+from coded_tools.tools.document_loading import iter_loaded_documents
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -46,8 +50,15 @@ class PdfRag(CodedTool, BaseRag):
         :param args: Dictionary containing:
           "query": search string
           "urls": list of pdf files
-          "save_vector_store": save to JSON file if True
+          "save_vector_store": save to vector_store_path if True
           "vector_store_path": relative path to this file
+          "incremental_indexing": only re-index changed source documents if True
+          "index_manifest_path": where fingerprints of indexed documents are kept
+          "reindex_interval": seconds between checks of the sources for changes
+          "chunk_size": maximum number of tokens per chunk
+          "chunk_overlap": number of tokens shared by consecutive chunks
+          "splitter": "recursive" or the faster "token" splitter
+          "max_concurrent_loads": maximum number of urls loaded at the same time
 
         :param sly_data: A dictionary whose keys are defined by the agent
             hierarchy, but whose values are meant to be kept out of the
@@ -78,12 +89,23 @@ class PdfRag(CodedTool, BaseRag):
         # Vector store type
         vector_store_type: str = args.get("vector_store_type", "in_memory")
 
-        # Save the generated vector store as a JSON file if True
+        # Save the generated vector store to vector_store_path if True
         self.save_vector_store = args.get("save_vector_store", False)
 
         # Configure the vector store path
         self.configure_vector_store_path(args.get("vector_store_path"))
 
+        # Only re-index source documents that changed since the last build if True
+        self.configure_incremental_indexing(
+            args.get("incremental_indexing", False), args.get("index_manifest_path"), args.get("reindex_interval")
+        )
+
+        # Chunking of loaded documents
+        self.configure_text_splitter(args.get("chunk_size"), args.get("chunk_overlap"), args.get("splitter"))
+
+        # Load up to this many urls at the same time
+        self.max_concurrent_loads = int(args.get("max_concurrent_loads", DEFAULT_MAX_CONCURRENT_LOADS))
+
         # For PostgreSQL vector store
         if vector_store_type == "postgres":
             postgres_config = PostgresConfig(
@@ -112,18 +134,28 @@ class PdfRag(CodedTool, BaseRag):
         :param loader_args: Dictionary containing 'urls' (list of PDF file URLs)
         :return: List of loaded PDF documents
         """
-        docs: List[Document] = []
+        return [doc async for doc in self.alazy_load_documents(loader_args)]
+
+    async def alazy_load_documents(self, loader_args: Dict[str, Any]) -> AsyncIterator[Document]:
+        """
+        Load PDF documents from URLs concurrently, parsing them in the shared process pool.
+
+        :param loader_args: Dictionary containing 'urls' (list of PDF file URLs)
+        :return: Async iterator of loaded PDF documents, in the order the files finish loading
+        """
         urls: List[str] = loader_args.get("urls", [])
+        async for _, docs in iter_loaded_documents(
+            urls, load_pdf, max_concurrency=self.max_concurrent_loads, executor=get_shared_process_pool()
+        ):
+            for doc in docs:
+                yield doc
+
 
-        for url in urls:
-            try:
-                loader = PyMuPDFLoader(file_path=url)
-                doc: List[Document] = await loader.aload()
-                docs.extend(doc)
-                logger.info("Successfully loaded PDF file from %s", url)
-            except FileNotFoundError:
-                logger.error("File not found: %s", url)
-            except ValueError as e:
-                logger.error("Invalid file path or unsupported input: %s – %s", url, e)
-
-        return docs
+def load_pdf(url: str) -> List[Document]:
+    """
+    Download and parse one PDF. Runs in a worker process, so it must stay a module-level function.
+
+    :param url: URL or path of the PDF file
+    :return: One document per page
+    """
+    return PyMuPDFLoader(file_path=url).load()
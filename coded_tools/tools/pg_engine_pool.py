@@ -0,0 +1,217 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Long-lived, pooled PGEngines shared by every Postgres-backed RAG tool in the process"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+import weakref
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+# pylint: disable=import-error
+from langchain_postgres import PGEngine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+# Connections older than this are replaced, so server-side idle timeouts never hand out a dead connection
+DEFAULT_POOL_RECYCLE_SECONDS = 1800
+DEFAULT_SCHEMA_NAME = "public"
+CLOSE_TIMEOUT_SECONDS = 10.0
+
+TABLE_EXISTS_QUERY = text(
+    "SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_schema = :schema AND table_name = :table)"
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PooledEngine(NamedTuple):
+    """A PGEngine together with the SQLAlchemy engine it runs its queries on."""
+
+    engine: PGEngine
+    async_engine: AsyncEngine
+
+
+class PGEnginePool:
+    """
+    Keeps one PGEngine, and so one SQLAlchemy connection pool, per connection string.
+
+    Every engine runs its queries on the pool's background event loop, so a single engine can serve
+    tool invocations running on any event loop.
+    Connections are pinged before use, so connections dropped by the server are replaced transparently.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_overflow: int = DEFAULT_MAX_OVERFLOW,
+        pool_recycle: int = DEFAULT_POOL_RECYCLE_SECONDS,
+    ):
+        """
+        :param pool_size: Number of connections kept open per connection string
+        :param max_overflow: Number of extra connections opened under load and closed when returned
+        :param pool_recycle: Seconds after which a connection is replaced
+        """
+        self.pool_size: int = pool_size
+        self.max_overflow: int = max_overflow
+        self.pool_recycle: int = pool_recycle
+        self._engines: Dict[str, PooledEngine] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self, connection_string: str) -> PGEngine:
+        """
+        :param connection_string: SQLAlchemy URL of the database
+        :return: The engine for connection_string, created on first use
+        """
+        return self._get(connection_string).engine
+
+    def _get(self, connection_string: str) -> PooledEngine:
+        """
+        :param connection_string: SQLAlchemy URL of the database
+        :return: The engine for connection_string with its SQLAlchemy engine, created on first use
+        """
+        with self._lock:
+            pooled: Optional[PooledEngine] = self._engines.get(connection_string)
+            if pooled is None:
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                    threading.Thread(target=self._loop.run_forever, name="pg-engine-pool", daemon=True).start()
+                async_engine: AsyncEngine = create_async_engine(
+                    connection_string,
+                    pool_size=self.pool_size,
+                    max_overflow=self.max_overflow,
+                    pool_recycle=self.pool_recycle,
+                    pool_pre_ping=True,
+                )
+                pooled = PooledEngine(PGEngine.from_engine(async_engine, loop=self._loop), async_engine)
+                # An engine forgotten by invalidate() closes its connections once nothing uses it anymore
+                weakref.finalize(pooled.engine, self._dispose_soon, async_engine, self._loop)
+                self._engines[connection_string] = pooled
+            return pooled
+
+    async def _run(self, coroutine):
+        """Run a coroutine on the background loop of the engines and wait for it from any loop."""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine, self._loop))
+
+    async def table_exists(
+        self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME
+    ) -> bool:
+        """
+        :param connection_string: SQLAlchemy URL of the database
+        :param table_name: Name of the table
+        :param schema_name: Schema of the table
+        :return: True if the table exists
+        """
+        async_engine: AsyncEngine = self._get(connection_string).async_engine
+
+        async def query() -> bool:
+            async with async_engine.connect() as connection:
+                result = await connection.execute(TABLE_EXISTS_QUERY, {"schema": schema_name, "table": table_name})
+                return bool(result.scalar())
+
+        return await self._run(query())
+
+    async def table_has_rows(
+        self, connection_string: str, table_name: str, schema_name: str = DEFAULT_SCHEMA_NAME
+    ) -> bool:
+        """
+        :param connection_string: SQLAlchemy URL of the database
+        :param table_name: Name of an existing table
+        :param schema_name: Schema of the table
+        :return: True if the table holds at least one row
+        """
+        async_engine: AsyncEngine = self._get(connection_string).async_engine
+        quote = async_engine.dialect.identifier_preparer.quote
+        statement = text(f"SELECT EXISTS (SELECT 1 FROM {quote(schema_name)}.{quote(table_name)})")
+
+        async def query() -> bool:
+            async with async_engine.connect() as connection:
+                result = await connection.execute(statement)
+                return bool(result.scalar())
+
+        return await self._run(query())
+
+    def invalidate(self, connection_string: str, engine: Optional[PGEngine] = None):
+        """
+        Forget the engine for connection_string, e.g. after it failed to connect, so the next request
+        starts with a fresh engine. The engine is not closed here, since concurrent calls and vector stores
+        may still use it; its connections are closed once it is no longer referenced.
+
+        :param connection_string: SQLAlchemy URL of the database
+        :param engine: The engine that failed. If given, a newer engine that replaced it is kept.
+        """
+        with self._lock:
+            pooled: Optional[PooledEngine] = self._engines.get(connection_string)
+            if pooled is not None and (engine is None or pooled.engine is engine):
+                del self._engines[connection_string]
+
+    async def close(self):
+        """Close every engine and its connections."""
+        with self._lock:
+            engines: List[PooledEngine] = list(self._engines.values())
+            self._engines.clear()
+        for pooled in engines:
+            try:
+                await self._run(pooled.async_engine.dispose())
+            except OSError as error:
+                logger.warning("Failed to close PostgreSQL engine: %s", error)
+
+    def close_sync(self):
+        """Close every engine from code that is not running an event loop, such as an atexit handler."""
+        if not self._engines:
+            return
+        try:
+            asyncio.run(asyncio.wait_for(self.close(), CLOSE_TIMEOUT_SECONDS))
+        except (asyncio.TimeoutError, RuntimeError) as error:
+            logger.warning("Failed to close PostgreSQL engines: %s", error)
+
+    @staticmethod
+    def _dispose_soon(async_engine: AsyncEngine, loop: asyncio.AbstractEventLoop):
+        """Close the connections of an engine that is no longer used, from whichever thread released it."""
+        if not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(async_engine.dispose(), loop)
+
+
+# Shared by every RAG tool in the process, since a CodedTool instance does not outlive its invocation
+_SHARED_ENGINE_POOL: Optional[PGEnginePool] = None
+_SHARED_ENGINE_POOL_LOCK = threading.Lock()
+
+
+def get_shared_pg_engine_pool() -> PGEnginePool:
+    """
+    :return: The process-wide PGEnginePool, configured from the POSTGRES_POOL_SIZE, POSTGRES_MAX_OVERFLOW
+        and POSTGRES_POOL_RECYCLE_SECONDS environment variables on first use and closed at interpreter exit
+    """
+    global _SHARED_ENGINE_POOL  # pylint: disable=global-statement
+    with _SHARED_ENGINE_POOL_LOCK:
+        if _SHARED_ENGINE_POOL is None:
+            _SHARED_ENGINE_POOL = PGEnginePool(
+                pool_size=int(os.getenv("POSTGRES_POOL_SIZE") or DEFAULT_POOL_SIZE),
+                max_overflow=int(os.getenv("POSTGRES_MAX_OVERFLOW") or DEFAULT_MAX_OVERFLOW),
+                pool_recycle=int(os.getenv("POSTGRES_POOL_RECYCLE_SECONDS") or DEFAULT_POOL_RECYCLE_SECONDS),
+            )
+            atexit.register(_SHARED_ENGINE_POOL.close_sync)
+        return _SHARED_ENGINE_POOL
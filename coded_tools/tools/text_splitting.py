@@ -0,0 +1,121 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Token-based text splitters sharing one tokenizer per process"""
+
+import functools
+from typing import Any
+from typing import List
+
+# pylint: disable=import-error
+import tiktoken
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import TextSplitter
+
+# Tokenizer of the OpenAI embedding models, so chunk sizes are measured the way the embeddings API counts them
+ENCODING_NAME = "cl100k_base"
+SPLITTER_TYPES = ("recursive", "token")
+SENTENCE_ENDINGS = ".!?\n"
+
+
+@functools.lru_cache(maxsize=None)
+def get_shared_encoding(encoding_name: str = ENCODING_NAME) -> tiktoken.Encoding:
+    """
+    :param encoding_name: Name of the tiktoken encoding
+    :return: The encoding, loaded once per process
+    """
+    return tiktoken.get_encoding(encoding_name)
+
+
+class TokenBoundaryTextSplitter(TextSplitter):
+    """
+    Splits text into windows of chunk_size tokens with a single tokenizer pass.
+
+    The whole text is encoded once and the character offset of every token is precomputed,
+    so each chunk is a slice of the original text. A window ends at the last sentence end in its back half,
+    else at the last word boundary there, else at exactly chunk_size tokens.
+    The next window starts chunk_overlap tokens before that end, or half the window before it if that is less.
+    """
+
+    def __init__(self, encoding: Any, **kwargs):
+        """
+        :param encoding: tiktoken Encoding, or anything with the same encode_ordinary() and decode_with_offsets()
+        :param kwargs: TextSplitter arguments such as chunk_size and chunk_overlap
+        """
+        super().__init__(length_function=lambda text: len(encoding.encode_ordinary(text)), **kwargs)
+        self._encoding = encoding
+
+    def split_text(self, text: str) -> List[str]:
+        tokens: List[int] = self._encoding.encode_ordinary(text)
+        if not tokens:
+            return []
+
+        # starts[i] is the character offset where token i begins; starts[len(tokens)] is the end of the text
+        decoded, starts = self._encoding.decode_with_offsets(tokens)
+        starts = list(starts) + [len(decoded)]
+
+        chunks: List[str] = []
+        start: int = 0
+        while start < len(tokens):
+            end: int = min(start + self._chunk_size, len(tokens))
+            if end < len(tokens):
+                end = self._boundary(decoded, starts, start, end)
+
+            chunk: str = decoded[starts[start] : starts[end]]
+            if self._strip_whitespace:
+                chunk = chunk.strip()
+            if chunk:
+                chunks.append(chunk)
+
+            if end == len(tokens):
+                break
+            # A window shortened to a boundary keeps at most half of itself as overlap, so the next one moves on
+            start = max(end - min(self._chunk_overlap, (end - start) // 2), start + 1)
+        return chunks
+
+    def _boundary(self, text: str, starts: List[int], start: int, end: int) -> int:
+        """
+        :return: Token index at which the window [start, end) should end
+        """
+        earliest: int = start + max(1, (end - start) // 2)
+        for candidate in range(end, earliest - 1, -1):
+            if text[starts[candidate] - 1] in SENTENCE_ENDINGS:
+                return candidate
+        for candidate in range(end, earliest - 1, -1):
+            if text[starts[candidate]].isspace():
+                return candidate
+        return end
+
+
+@functools.lru_cache(maxsize=32)
+def get_text_splitter(chunk_size: int, chunk_overlap: int, splitter_type: str = "recursive") -> TextSplitter:
+    """
+    Splitters are stateless, so one instance per configuration is shared by every tool in the process.
+
+    :param chunk_size: Maximum number of tokens per chunk
+    :param chunk_overlap: Number of tokens shared by consecutive chunks
+    :param splitter_type: "recursive" splits on paragraphs, lines and words, measuring candidates with the tokenizer.
+        "token" encodes each text once and cuts token windows at sentence or word boundaries, which is much faster.
+    :return: The splitter
+    """
+    encoding: tiktoken.Encoding = get_shared_encoding()
+    if splitter_type == "token":
+        return TokenBoundaryTextSplitter(encoding, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+    return RecursiveCharacterTextSplitter(
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        length_function=lambda text: len(encoding.encode_ordinary(text)),
+    )
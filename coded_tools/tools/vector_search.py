@@ -0,0 +1,163 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Vectorized, batched top-k cosine similarity search over in-memory vector stores"""
+
+import threading
+import weakref
+from typing import Any
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+# pylint: disable=import-error
+import numpy as np
+from langchain_core.documents import Document
+
+DEFAULT_TOP_K = 4
+
+
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """
+    :param vectors: Vectors as a list of lists, a single vector, or a 2D array
+    :return: Contiguous float32 matrix with each non-zero row scaled to unit length,
+        so dot products between rows are cosine similarities
+    """
+    matrix: np.ndarray = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms: np.ndarray = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return np.ascontiguousarray(matrix / norms)
+
+
+def top_k_similar(matrix: np.ndarray, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of matrix most similar to each query with one matrix product.
+
+    :param matrix: N x D matrix of normalized vectors
+    :param queries: Q x D matrix of normalized query vectors
+    :param k: Number of results per query
+    :return: Tuple of Q x k row indices and Q x k scores, best first
+    """
+    k = min(k, matrix.shape[0])
+    if k <= 0:
+        empty = np.empty((queries.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(np.float32)
+
+    scores: np.ndarray = queries @ matrix.T
+    if k < matrix.shape[0]:
+        # Partial selection is linear in N; only the k survivors get sorted
+        candidates: np.ndarray = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(matrix.shape[0]), (queries.shape[0], k))
+    candidate_scores: np.ndarray = np.take_along_axis(scores, candidates, axis=1)
+    order: np.ndarray = np.argsort(-candidate_scores, axis=1)
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+
+class VectorSearchIndex:
+    """
+    Chunk texts and metadata alongside one contiguous, normalized float32 matrix of their vectors.
+    """
+
+    # Indexes built from InMemoryVectorStores, reused while the store is alive and unchanged
+    _cache: "weakref.WeakKeyDictionary[Any, Tuple[int, VectorSearchIndex]]" = weakref.WeakKeyDictionary()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, ids: List[str], texts: List[str], metadatas: List[dict], matrix: np.ndarray):
+        """
+        :param ids: Chunk ids, one per row
+        :param texts: Chunk texts, one per row
+        :param metadatas: Chunk metadata, one per row
+        :param matrix: Normalized vectors, one row per chunk. Used as is, so memory-mapped matrices stay mapped.
+        """
+        self.ids: List[str] = ids
+        self.texts: List[str] = texts
+        self.metadatas: List[dict] = metadatas
+        self.matrix: np.ndarray = matrix
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def for_vector_store(cls, vectorstore: Any) -> Optional["VectorSearchIndex"]:
+        """
+        :param vectorstore: A vector store
+        :return: An index over the vectors of an InMemoryVectorStore or NumpyVectorStore,
+            or None for stores that search elsewhere, such as PGVectorStore
+        """
+        # NumpyVectorStore already holds a normalized matrix
+        if isinstance(getattr(vectorstore, "vectors", None), np.ndarray):
+            return cls(vectorstore.ids, vectorstore.texts, vectorstore.metadatas, vectorstore.vectors)
+
+        # InMemoryVectorStore keeps a dict of id -> {"id", "vector", "text", "metadata"}
+        documents = getattr(vectorstore, "store", None)
+        if not isinstance(documents, dict):
+            return None
+
+        with cls._cache_lock:
+            cached = cls._cache.get(vectorstore)
+            if cached is not None and cached[0] == len(documents):
+                return cached[1]
+
+        records = list(documents.values())
+        index = cls(
+            ids=[record["id"] for record in records],
+            texts=[record["text"] for record in records],
+            metadatas=[record["metadata"] for record in records],
+            matrix=normalize_rows([record["vector"] for record in records]) if records else np.empty((0, 0)),
+        )
+        with cls._cache_lock:
+            cls._cache[vectorstore] = (len(documents), index)
+        return index
+
+    @classmethod
+    def invalidate(cls, vectorstore: Any):
+        """
+        Drop the cached index of a vector store whose contents changed in place.
+
+        :param vectorstore: The vector store
+        """
+        with cls._cache_lock:
+            cls._cache.pop(vectorstore, None)
+
+    def document(self, row: int) -> Document:
+        """
+        :param row: Row of the matrix
+        :return: The chunk stored at that row
+        """
+        return Document(id=self.ids[row], page_content=self.texts[row], metadata=self.metadatas[row])
+
+    def search(
+        self, query_vectors: Sequence[Sequence[float]], k: int = DEFAULT_TOP_K
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        Answer a batch of queries with a single matrix product.
+
+        :param query_vectors: Embeddings of the queries
+        :param k: Number of results per query
+        :return: For each query, the k most similar chunks with their cosine similarity, best first
+        """
+        if len(self.ids) == 0:
+            return [[] for _ in query_vectors]
+
+        rows, scores = top_k_similar(self.matrix, normalize_rows(query_vectors), k)
+        return [
+            [(self.document(int(row)), float(score)) for row, score in zip(query_rows, query_scores)]
+            for query_rows, query_scores in zip(rows, scores)
+        ]
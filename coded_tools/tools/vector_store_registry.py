@@ -0,0 +1,234 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Process-wide registry that keeps built vector stores alive across RAG tool invocations"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Rough per-float cost of a vector held as a Python list
+BYTES_PER_FLOAT = 8
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RegistryEntry:
+    """A built vector store together with its bookkeeping."""
+
+    store: Any
+    size_bytes: int
+    created: float
+    last_access: float
+    # Overrides the registry's ttl_seconds for this entry if set
+    ttl_seconds: Optional[float] = None
+
+
+class VectorStoreRegistry:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Keeps built vector stores keyed on everything that determines their content.
+
+    Entries expire ttl_seconds after they were built, or after their own TTL, and the least recently used entries are
+    evicted when the estimated memory of all entries exceeds max_bytes.
+    Concurrent requests for the same key share a single build, even across event loops.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        :param ttl_seconds: Seconds a built vector store stays usable
+        :param max_bytes: Upper bound on the estimated memory of all registered vector stores
+        """
+        self.ttl_seconds: float = ttl_seconds
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self._entries: OrderedDict[str, RegistryEntry] = OrderedDict()
+        self._building: Dict[str, Future] = {}
+        self._total_bytes: int = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        :param parts: Everything that determines the content of a vector store,
+            e.g. loader type, loader arguments, splitter config and embedding model
+        :return: Digest of the parts. Hashing keeps credentials in loader arguments out of the registry.
+        """
+        serialized: str = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def estimate_size(store: Any) -> int:
+        """
+        :param store: A vector store
+        :return: Approximate number of bytes the store holds in process memory.
+            Stores backed by an external database count as zero.
+        """
+        # NumpyVectorStore keeps its vectors in one matrix, next to lists of ids, texts and metadata
+        matrix = getattr(store, "vectors", None)
+        if hasattr(matrix, "nbytes"):
+            size: int = int(matrix.nbytes) + sum(len(text) for text in getattr(store, "texts", ()))
+            return size + len(json.dumps(getattr(store, "metadatas", []), default=str))
+
+        # InMemoryVectorStore keeps its documents in a dict of id -> {"vector", "text", "metadata"}
+        documents = getattr(store, "store", None)
+        if not isinstance(documents, dict):
+            return 0
+
+        size = 0
+        for document in documents.values():
+            size += len(document.get("vector", ())) * BYTES_PER_FLOAT + len(document.get("text", ""))
+        return size
+
+    async def get_or_build(
+        self, key: str, build: Callable[[], Awaitable[Any]], ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        Return the vector store registered under key, building it with build() if necessary.
+
+        :param key: Key from make_key()
+        :param build: Coroutine function that builds the vector store. A None result is returned but not registered.
+        :param ttl_seconds: Seconds the built vector store stays usable. Defaults to the registry's ttl_seconds.
+        :return: The registered or newly built vector store
+        """
+        with self._lock:
+            self._expire(time.time())
+            entry: Optional[RegistryEntry] = self._entries.get(key)
+            if entry is not None:
+                entry.last_access = time.time()
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.store
+
+            self.misses += 1
+            future: Optional[Future] = self._building.get(key)
+            is_builder: bool = future is None
+            if is_builder:
+                future = Future()
+                self._building[key] = future
+
+        if not is_builder:
+            logger.info("Waiting for an in-progress build of the same vector store")
+            return await asyncio.wrap_future(future)
+
+        try:
+            store = await build()
+        except BaseException as exception:
+            with self._lock:
+                self._building.pop(key, None)
+            future.set_exception(exception)
+            raise
+
+        with self._lock:
+            self._building.pop(key, None)
+            if store is not None:
+                self._register(key, store, ttl_seconds)
+        future.set_result(store)
+        return store
+
+    def _register(self, key: str, store: Any, ttl_seconds: Optional[float] = None):
+        """Add a newly built store and evict others if over budget. Caller holds the lock."""
+        now: float = time.time()
+        size: int = self.estimate_size(store)
+        self._discard(key)
+        self._entries[key] = RegistryEntry(
+            store=store, size_bytes=size, created=now, last_access=now, ttl_seconds=ttl_seconds
+        )
+        self._total_bytes += size
+
+        # Never evict the store that was just built, even if it alone is over budget
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            oldest_key: str = next(iter(self._entries))
+            logger.info("Evicting vector store to stay within %d bytes", self.max_bytes)
+            self._discard(oldest_key)
+
+    def _expire(self, now: float):
+        """Drop entries older than the TTL. Caller holds the lock."""
+        expired = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.created >= (self.ttl_seconds if entry.ttl_seconds is None else entry.ttl_seconds)
+        ]
+        for key in expired:
+            self._discard(key)
+
+    def _discard(self, key: str):
+        """Remove an entry if present. Caller holds the lock."""
+        entry: Optional[RegistryEntry] = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size_bytes
+
+    def invalidate(self, key: str):
+        """
+        Forget the vector store registered under key so the next request rebuilds it.
+
+        :param key: Key from make_key()
+        """
+        with self._lock:
+            self._discard(key)
+
+    def clear(self):
+        """Forget all registered vector stores."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        :return: Dictionary with hit/miss counters and the current registry size
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+
+# Shared by every RAG tool in the process, since a CodedTool instance does not outlive its invocation
+_SHARED_REGISTRY: Optional[VectorStoreRegistry] = None
+_SHARED_REGISTRY_LOCK = threading.Lock()
+
+
+def get_shared_vector_store_registry() -> VectorStoreRegistry:
+    """
+    :return: The process-wide VectorStoreRegistry, configured from the VECTOR_STORE_REGISTRY_TTL_SECONDS
+        and VECTOR_STORE_REGISTRY_MAX_BYTES environment variables on first use
+    """
+    global _SHARED_REGISTRY  # pylint: disable=global-statement
+    with _SHARED_REGISTRY_LOCK:
+        if _SHARED_REGISTRY is None:
+            ttl_seconds: float = float(os.getenv("VECTOR_STORE_REGISTRY_TTL_SECONDS") or DEFAULT_TTL_SECONDS)
+            max_bytes: int = int(os.getenv("VECTOR_STORE_REGISTRY_MAX_BYTES") or DEFAULT_MAX_BYTES)
+            _SHARED_REGISTRY = VectorStoreRegistry(ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+        return _SHARED_REGISTRY
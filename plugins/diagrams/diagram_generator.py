@@ -0,0 +1,223 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Parallel, cached generation of the HTML agent network diagrams served by the flask web client"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from importlib import metadata
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+BUILDER_PACKAGE = "neuro_san_web_client"
+BUILDER_MODULE = f"{BUILDER_PACKAGE}.agents_diagram_builder"
+BUILDER_DISTRIBUTION = "neuro-san-web-client"
+
+# include "file.hocon", include file("file.hocon") and include required(file("file.hocon"))
+INCLUDE_PATTERN = re.compile(r'^\s*include\s+(?:required\(\s*)?(?:file\(\s*)?"([^"]+)"', re.MULTILINE)
+
+
+class DiagramGenerator:
+    """
+    Builds one HTML diagram per registry file, running up to max_workers builder processes at once.
+
+    A JSON manifest remembers a fingerprint of every file built successfully: its content plus the content
+    of every file it includes, transitively, and the version of the diagram builder.
+    Files whose fingerprint is unchanged and whose .html file still exists are skipped,
+    so a restart only rebuilds the networks that changed or whose diagram was removed.
+    """
+
+    def __init__(self, root_dir: str, manifest_file: str, max_workers: Optional[int] = None):
+        """
+        :param root_dir: Directory include paths are resolved against, besides the including file's directory
+        :param manifest_file: JSON file recording the fingerprints of the diagrams already built
+        :param max_workers: Maximum number of concurrent builder processes, by default the number of CPUs
+        """
+        self.root_dir: str = root_dir
+        self.manifest_file: str = manifest_file
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self._lock = threading.Lock()
+
+    def generate(self, files: List[str]):
+        """
+        Build the diagrams of the files that changed since their last successful build, or whose diagram is missing.
+
+        :param files: Registry files, or directories of registry files, to build diagrams for
+        :raises subprocess.CalledProcessError: The first failed build, after all other builds have finished.
+            Failed files are not recorded in the manifest, so they are retried next time.
+        """
+        manifest: Dict[str, str] = self._load_manifest()
+        fingerprints: Dict[str, str] = {file: self.fingerprint(file) for file in files}
+        stale: List[str] = [
+            file for file in files if manifest.get(file) != fingerprints[file] or self._output_missing(file)
+        ]
+        print(f"Generating .html files: {len(stale)} changed, {len(files) - len(stale)} unchanged")
+        if not stale:
+            return
+
+        errors: List[subprocess.CalledProcessError] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="html-diagram") as executor:
+            futures = {executor.submit(self._build, file): file for file in stale}
+            for future in as_completed(futures):
+                file: str = futures[future]
+                try:
+                    future.result()
+                except subprocess.CalledProcessError as error:
+                    print(f"Failed to generate .html file for {file}: {error.stderr}", file=sys.stderr)
+                    errors.append(error)
+                    continue
+                manifest[file] = fingerprints[file]
+                self._save_manifest(manifest)
+
+        if errors:
+            raise errors[0]
+
+    def generate_in_background(self, files: List[str]) -> threading.Thread:
+        """
+        Build the diagrams on a daemon thread, reporting failures instead of raising them.
+
+        :param files: Registry files, or directories of registry files, to build diagrams for
+        :return: The thread
+        """
+
+        def generate():
+            try:
+                self.generate(files)
+            except subprocess.CalledProcessError:
+                print("Some .html files could not be generated; they will be retried on the next start.")
+
+        thread = threading.Thread(target=generate, name="html-diagrams", daemon=True)
+        thread.start()
+        return thread
+
+    def fingerprint(self, path: str) -> str:
+        """
+        :param path: A registry file or directory
+        :return: Hex digest over the builder version and the content of path and everything it includes
+        """
+        digest = hashlib.sha256(self._builder_version().encode())
+        for name, content in self._contents(path, set()):
+            digest.update(name.encode() + b"\0" + content + b"\0")
+        return digest.hexdigest()
+
+    def _contents(self, path: str, seen: Set[str]) -> List[Tuple[str, bytes]]:
+        """
+        :return: (name, content) of path, of every file below it if it is a directory,
+            and of the files they include, each file once
+        """
+        real: str = os.path.realpath(path)
+        if real in seen:
+            return []
+        seen.add(real)
+
+        if os.path.isdir(path):
+            contents: List[Tuple[str, bytes]] = []
+            for directory, _, names in sorted(os.walk(path)):
+                for name in sorted(names):
+                    contents.extend(self._contents(os.path.join(directory, name), seen))
+            return contents
+
+        try:
+            with open(path, "rb") as file:
+                content: bytes = file.read()
+        except OSError:
+            return [(path, b"<missing>")]
+
+        contents = [(path, content)]
+        for include in INCLUDE_PATTERN.findall(content.decode("utf-8", errors="replace")):
+            candidates = [os.path.join(self.root_dir, include), os.path.join(os.path.dirname(path), include)]
+            resolved: str = next((candidate for candidate in candidates if os.path.exists(candidate)), include)
+            contents.extend(self._contents(resolved, seen))
+        return contents
+
+    @staticmethod
+    def _build(file: str):
+        """Run the diagram builder for one file in its own process, printing its output."""
+        result = subprocess.run(
+            [sys.executable, "-m", BUILDER_MODULE, "--input_file", file],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        print(f"Generated .html file for: {file}")
+        if result.stdout.strip():
+            print(result.stdout)
+        if result.stderr:
+            print(result.stderr, file=sys.stderr)
+
+    def _output_missing(self, file: str) -> bool:
+        """
+        :param file: A registry file or directory
+        :return: True if the builder is installed but the .html file it writes for file does not exist,
+            for instance after the builder package was reinstalled
+        """
+        output_file: Optional[str] = self._output_file(file)
+        return output_file is not None and not os.path.exists(output_file)
+
+    @staticmethod
+    def _output_file(file: str) -> Optional[str]:
+        """
+        :param file: A registry file or directory
+        :return: The .html file the builder writes for file, named after it in the builder package's static
+            directory, or None if the builder is not installed
+        """
+        spec = importlib.util.find_spec(BUILDER_PACKAGE)
+        if spec is None or not spec.submodule_search_locations:
+            return None
+        name: str = os.path.splitext(os.path.basename(os.path.normpath(file)))[0]
+        return os.path.join(list(spec.submodule_search_locations)[0], "static", f"{name}.html")
+
+    @staticmethod
+    def _builder_version() -> str:
+        """
+        :return: Installed version of the diagram builder, so an upgrade rebuilds every diagram
+        """
+        try:
+            return metadata.version(BUILDER_DISTRIBUTION)
+        except metadata.PackageNotFoundError:
+            return "unknown"
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """
+        :return: Fingerprints per file of the last successful builds, empty if there is no readable manifest
+        """
+        try:
+            with open(self.manifest_file, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self, manifest: Dict[str, str]):
+        """Atomically replace the manifest file, so an interrupted start never leaves it half written."""
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.manifest_file)), exist_ok=True)
+            temp_file: str = f"{self.manifest_file}.tmp"
+            with open(temp_file, "w", encoding="utf-8") as file:
+                json.dump(manifest, file, indent=2, sort_keys=True)
+            os.replace(temp_file, self.manifest_file)
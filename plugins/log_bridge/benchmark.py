@@ -0,0 +1,148 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# imitations under the License.
+#
+# END COPYRIGHT
+"""
+Measure how many lines per second ProcessLogBridge classifies, parses and renders.
+
+Usage:
+    python -m plugins.log_bridge.benchmark logs/server.log [more.log ...]
+    python -m plugins.log_bridge.benchmark --synthetic 200000 --render 5000
+
+The per-process files the bridge writes to `logs/` are raw captures of the server output,
+so they can be replayed here directly. Without files, a synthetic mix of neuro-san style lines is used.
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import json
+import logging
+import random
+import time
+from typing import Callable, Dict, List
+
+from plugins.log_bridge import process_log_bridge
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+
+def synthetic_lines(count: int, seed: int = 0) -> List[str]:
+    """
+    Build a mix resembling neuro-san server output: mostly structured JSON lines,
+    plus plain text, multi-line JSON blocks and tracebacks.
+    :param count (int): Approximate number of lines.
+    :param seed (int): Random seed, so runs are comparable.
+    :return list[str]: The lines.
+    """
+    rnd = random.Random(seed)
+    lines: List[str] = []
+    while len(lines) < count:
+        roll = rnd.random()
+        request_id = f"{rnd.getrandbits(64):016x}"
+        if roll < 0.7:
+            record = {
+                "message": f"Chat request for agent hello_world took {rnd.random():.3f} seconds",
+                "user_id": "anonymous",
+                "Timestamp": "2025-06-01T12:00:00.000000+00:00",
+                "source": "HttpServer",
+                "message_type": rnd.choice(["Other", "Info", "Debug", "Warning"]),
+                "request_id": request_id,
+            }
+            lines.append(json.dumps(record))
+        elif roll < 0.9:
+            lines.append(f"2025-06-01 12:00:00,000 DEBUG neuro_san.service - dispatching request {request_id}")
+        elif roll < 0.95:
+            lines.extend(
+                json.dumps(
+                    {"request_id": request_id, "metadata": {"tokens": rnd.randint(1, 999)}}, indent=2
+                ).splitlines()
+            )
+        else:
+            lines.extend(
+                [
+                    "Traceback (most recent call last):",
+                    '  File "/app/neuro_san/service.py", line 42, in handle',
+                    "    raise ValueError(request_id)",
+                    f"ValueError: {request_id}",
+                ]
+            )
+    return lines
+
+
+def measure(name: str, lines: List[str], handle: Callable[[str], None]) -> Dict[str, float]:
+    """
+    Run every line through a handler once and report the throughput.
+    :param name (str): Label of the measured stage.
+    :param lines (list[str]): Lines to handle.
+    :param handle (Callable): Function called with each line.
+    :return dict: Stage name, seconds taken and lines per second.
+    """
+    start = time.perf_counter()
+    for line in lines:
+        handle(line)
+    seconds = time.perf_counter() - start
+    return {"stage": name, "seconds": seconds, "lines_per_second": len(lines) / seconds if seconds else 0.0}
+
+
+def run(lines: List[str], render_lines: int) -> List[Dict[str, float]]:
+    """
+    Measure the classifier alone, line handling without console output, and full Rich rendering.
+    :param lines (list[str]): Lines to handle.
+    :param render_lines (int): Number of lines to render with Rich, which is far slower than the other stages.
+    :return list[dict]: One result per stage.
+    """
+    bridge = ProcessLogBridge(level="DEBUG")
+    # render into memory, so terminal speed does not skew the numbers
+    bridge.console.file = io.StringIO()
+
+    silent = bridge._make_stream_state("bench", io.StringIO())  # pylint: disable=protected-access
+    silent["logger"] = logging.getLogger("bench.silent")
+    silent["logger"].propagate = False
+    silent["logger"].addHandler(logging.NullHandler())
+    rendered = bridge._make_stream_state("bench", io.StringIO())  # pylint: disable=protected-access
+
+    # pylint: disable=protected-access
+    return [
+        measure("classify", lines, bridge._classify_line),
+        measure("parse", lines, lambda line: bridge._handle_line(silent, line)),
+        measure("render", lines[:render_lines], lambda line: bridge._handle_line(rendered, line)),
+    ]
+
+
+def main():
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark ProcessLogBridge line handling")
+    parser.add_argument("logs", nargs="*", help="Captured log files to replay, e.g. logs/server.log")
+    parser.add_argument("--synthetic", type=int, default=100000, help="Number of synthetic lines without log files")
+    parser.add_argument("--render", type=int, default=2000, help="Number of lines to render on a Rich console")
+    args = parser.parse_args()
+
+    lines: List[str] = []
+    for path in args.logs:
+        with open(path, encoding="utf-8", errors="replace") as log:
+            lines.extend(line.rstrip("\r\n") for line in log)
+    if not lines:
+        lines = synthetic_lines(args.synthetic)
+
+    results = run(lines, args.render)
+    backend = "orjson" if process_log_bridge.orjson is not None else "json"
+    print(f"\n{len(lines)} lines ({min(args.render, len(lines))} rendered), JSON backend: {backend}")
+    for result in results:
+        print(f"{result['stage']:>10}: {result['lines_per_second']:>12,.0f} lines/s ({result['seconds']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,16 +15,20 @@
 # END COPYRIGHT
 from __future__ import annotations
 
+import codecs
 import copy
 import json
 import logging
 import os
+import queue
 import re
+import selectors
 import threading
+import time
 from datetime import datetime
 from logging.handlers import TimedRotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict, Optional, TextIO, Tuple
+from typing import Any, Dict, Iterable, List, Optional, TextIO, Tuple
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -32,6 +36,15 @@ from rich.syntax import Syntax
 from rich.text import Text
 from rich.theme import Theme
 
+from plugins.log_bridge.record_store import LogRecordStore, open_record_store
+from plugins.log_bridge.request_metrics import MetricsServer, RequestMetrics
+
+try:
+    # Optional: parses the server's structured lines several times faster than the json module
+    import orjson
+except ImportError:
+    orjson = None
+
 
 log_cfg = {
     # Refer rich guidelines for more options:
@@ -54,9 +67,59 @@ log_cfg = {
         "backupCount": 10,
         "fmt": "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s",
     },
+    "drain": {
+        # bytes read from a child pipe per system call
+        "read_chunk_size": 65536,
+        # batches of lines waiting to be rendered on the console
+        "render_queue_size": 1024,
+        # what to do when the console falls behind and the render queue is full:
+        # "drop"  - skip console rendering of new lines and later print how many were skipped
+        #           (the per-process log file still receives every line)
+        # "block" - stop reading the pipes until the console catches up, which eventually blocks the child
+        "overflow": "drop",
+        # seconds between summaries of skipped lines
+        "summary_interval": 5.0,
+    },
+    "store": {
+        # also keep every parsed record, even those skipped on the console, in a compressed store
+        # indexed by request_id and time, queried with:
+        # python -m plugins.log_bridge.record_cli query|replay --dir logs/records --request-id <id>
+        "enabled": False,
+        "directory": "logs/records",
+        # size at which a new segment file is started
+        "segment_bytes": 64 * 1024 * 1024,
+        # records compressed together in one block
+        "block_records": 512,
+        # longest time a record waits in memory before its block is written
+        "flush_seconds": 2.0,
+        # number of segments kept, 0 keeps all
+        "max_segments": 0,
+    },
+    "metrics": {
+        # aggregate request wall times and token counts from the server's request logs
+        "enabled": False,
+        # Prometheus text endpoint at http://<host>:<port>/metrics, no endpoint when port is None
+        "host": "127.0.0.1",
+        "port": 9464,
+        # window of the quantiles, rates and summary line
+        "window_seconds": 300.0,
+        # seconds between summary lines on the console, 0 for none
+        "summary_interval": 60.0,
+    },
 }
 
 
+def _json_loads(text: str) -> Any:
+    """
+    Parse JSON text with orjson when it is installed, else with the json module.
+    :param text (str): JSON text.
+    :return Any: The parsed value. Raises ValueError if the text is not JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(text)  # pylint: disable=no-member
+    return json.loads(text)
+
+
 class ProcessLogBridge:
     """
     ProcessLogBridge: single-class logging bridge
@@ -66,10 +129,20 @@ class ProcessLogBridge:
     - Traceback text reflow + syntax-highlight (via Rich)
     - Tee raw lines to per-process log files
     - Multi-line JSON reassembly (brace-balanced)
+    - One drain thread multiplexes every child pipe with a selector, and one render thread
+      formats lines for the console from a bounded queue
+    - Optional structured tee of parsed records into an indexed LogRecordStore, written before console overflow
+    - Optional per-request latency and token metrics, served for Prometheus and summarized periodically
     """
 
     # ---------- constants ----------
-    _LEVEL_WORD = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b", re.IGNORECASE)
+    # matched against the upper-cased line, which is much faster than a case-insensitive search
+    _LEVEL_WORD = re.compile(r"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL|FATAL)\b")
+    # backslash escapes and double-quoted strings (possibly unterminated), whose braces do not count
+    _QUOTED_OR_ESCAPED = re.compile(r'\\.|"(?:[^"\\]|\\.)*"?')
+    # first characters of a JSON object, array or string; numbers and literals must be the whole line
+    _JSON_STARTS = frozenset('{["')
+    _JSON_SCALAR = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
     _MESSAGE_TYPE_TO_LEVEL: Dict[str, int] = {
         "trace": logging.DEBUG,
         "debug": logging.DEBUG,
@@ -86,6 +159,8 @@ class ProcessLogBridge:
     _TB_START = "Traceback (most recent call last):"
     _TB_CHAIN_1 = "During handling of the above exception, another exception occurred:"
     _TB_CHAIN_2 = "The above exception was the direct cause of the following exception:"
+    # an indented frame line of a traceback, recognized even when the traceback began before the bridge attached
+    _TB_FRAME = re.compile(r'\s+File ".*", line \d+')
     _REQUEST_REPORTING_INNER = re.compile(r'Request reporting:\s*\{(?P<inner>.*?)\}\s*",', re.IGNORECASE | re.DOTALL)
     _META_FIELDS = ["user_id", "Timestamp", "source", "message_type", "request_id"]
     _META_REGEXES = {f: re.compile(rf'"{f}"\s*:\s*"(?P<val>[^"]*)"', re.IGNORECASE) for f in _META_FIELDS}
@@ -114,6 +189,7 @@ class ProcessLogBridge:
             - Creates a Rich console.
             - Reconfigures the root logger with rich + optional file handlers.
             - Initializes per-stream state storage for subprocess drains.
+            - Drain and render threads are started by the first `attach_process_logger()` call.
         """
         self.level_name = level.upper()
         self.runner_log_file = runner_log_file
@@ -179,24 +255,52 @@ class ProcessLogBridge:
         self._logger.info("Runner logging initialized (rich console enabled)")
 
         # Per-stream state: (process_name, stream_tag) -> state
-        # state keys: tee(TextIO), buffer(list[str]), balance(int), collecting(bool), logger(logging.Logger)
+        # state keys: tee(TextIO), buffer(list[str]), balance(int), collecting(bool), traceback(bool),
+        #             logger(logging.Logger), decoder(codecs.IncrementalDecoder), partial(str), dropped(int)
         self._streams: Dict[Tuple[str, str], Dict[str, Any]] = {}
 
+        # drain engine: one selector thread reads every pipe, one render thread owns the console
+        drain_cfg = cfg.get("drain", {})
+        self._read_chunk_size = int(drain_cfg.get("read_chunk_size", 65536))
+        self._overflow = str(drain_cfg.get("overflow", "drop")).lower()
+        self._summary_interval = float(drain_cfg.get("summary_interval", 5.0))
+        self._render_queue: queue.Queue = queue.Queue(maxsize=int(drain_cfg.get("render_queue_size", 1024)))
+        self._engine_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._wakeup: Optional[Tuple[int, int]] = None
+        self._pending: List[Tuple[Any, Dict[str, Any]]] = []
+        self._render_thread: Optional[threading.Thread] = None
+
+        # optional structured tee, written by the drain thread
+        store_cfg = cfg.get("store", {})
+        self._record_store: Optional[LogRecordStore] = (
+            open_record_store(store_cfg) if store_cfg.get("enabled") else None
+        )
+
+        # optional request metrics, observed by the drain thread
+        metrics_cfg = cfg.get("metrics", {})
+        self._metrics: Optional[RequestMetrics] = None
+        self._metrics_server: Optional[MetricsServer] = None
+        self._metrics_summary_interval = float(metrics_cfg.get("summary_interval", 60.0))
+        if metrics_cfg.get("enabled"):
+            self._start_metrics(metrics_cfg)
+
     # ---------- public API ----------
     def attach_process_logger(self, process, process_name: str, log_file: str) -> None:
         """
-        Drain stdout/stderr in background threads, pretty-print to terminal, mirror raw to file.
-        Spawns background threads that:
-        - Continuously read from `process.stdout` and `process.stderr`.
-        - Pretty-print parsed output to the console.
-        - Mirror raw lines to the specified log file.
-        :param process: A running subprocess object with `.stdout` and `.stderr`
-            file-like streams opened in text mode.
+        Drain stdout/stderr in the background, pretty-print to terminal, mirror raw to file.
+        - Registers `process.stdout` and `process.stderr` with the shared drain engine,
+          which reads them in large chunks and mirrors raw lines to the specified log file.
+        - Complete lines are queued for the render thread, which pretty-prints them to the console.
+        :param process: A running subprocess object with `.stdout` and `.stderr` pipes.
+            The pipes are read at the file descriptor level, so text or binary mode does not matter.
         :param process_name (str): Logical label for this process. Used as logger name prefix.
         :param log_file (str): File to write raw mirror logs to. Created if missing.
         Notes:
-            - Two threads are spawned: one for stdout, one for stderr.
-            - Per-stream state (buffer, JSON reassembly, tee handle) is created.
+            - No threads are spawned per process: all pipes share one drain thread and one render thread.
+              On Windows, where pipes cannot be selected, each pipe gets a reader thread instead.
+            - Per-stream state (buffer, JSON reassembly, tee handle, line splitting) is created.
         """
         Path(log_file).parent.mkdir(parents=True, exist_ok=True)
         tee_out = open(log_file, "a", encoding="utf-8")
@@ -204,10 +308,35 @@ class ProcessLogBridge:
         self._streams[(process_name, "STDOUT")] = self._make_stream_state(process_name, tee_out)
         self._streams[(process_name, "STDERR")] = self._make_stream_state(process_name, tee_err)
 
-        t_out = threading.Thread(target=self._drain_pipe, args=(process.stdout, process_name, "STDOUT"), daemon=True)
-        t_err = threading.Thread(target=self._drain_pipe, args=(process.stderr, process_name, "STDERR"), daemon=True)
-        t_out.start()
-        t_err.start()
+        self._ensure_engine()
+        self._register_pipe(process.stdout, self._streams[(process_name, "STDOUT")])
+        self._register_pipe(process.stderr, self._streams[(process_name, "STDERR")])
+
+    def replay(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Render stored records on the console the way they were rendered live, stamped with their original time.
+        :param records: Records from `LogRecordStore.query()`.
+        """
+        current: Dict[str, float] = {"ts": time.time()}
+
+        def stamp(log_record: logging.LogRecord) -> bool:
+            log_record.created = current["ts"]
+            return True
+
+        self.rich_handler.addFilter(stamp)
+        states: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            current["ts"] = record["ts"]
+            state = states.setdefault(record["process"], self._make_stream_state(record["process"], None))
+            level = logging.getLevelName(record.get("level", "INFO"))
+            if record.get("fields") is None:
+                self._emit_text_line(state, str(record.get("message", "")), level)
+                continue
+            original: Dict[str, Any] = {"message": record.get("message"), **record["fields"]}
+            for key in ("source", "request_id"):
+                if record.get(key) is not None:
+                    original[key] = record[key]
+            self._emit_json_block(state, original, level)
 
     # ---------- helpers: logging/time ----------
     @classmethod
@@ -219,13 +348,13 @@ class ProcessLogBridge:
 
     def _rich_time_text(self, record=None, date=None):
         """
-        :param record: Unused, but required for compatibility with RichHandler's
-                `log_time_format` signature.
+        :param record: The time of the log record, which RichHandler passes as a datetime.
+                Used when given, so replayed records keep their original time.
         :param date: Unused. Rich passes this parameter but it is not needed.
         :return: Text: A Rich `Text` object containing a formatted timestamp using
                 the configured `self._time_style_key`.
         """
-        now = self._now_local()
+        now = record.astimezone() if isinstance(record, datetime) else self._now_local()
         return Text(f"[{now.strftime('%Y-%m-%d %H:%M:%S')} {now.tzname()}]", style=self._time_style_key)
 
     class _TZFormatter(logging.Formatter):
@@ -233,6 +362,7 @@ class ProcessLogBridge:
         File-handler formatter that emits timezone-aware timestamps.
         :extend: logging.Formatter
         """
+
         def formatTime(self, record, datefmt=None):
             """
             :param: record: A log record.
@@ -253,6 +383,7 @@ class ProcessLogBridge:
                     - "buffer": list used for multiline JSON reassembly.
                     - "balance": brace balance counter.
                     - "collecting": whether multi-line JSON parsing is active.
+                    - "traceback": whether the last line belonged to a plain text traceback.
                     - "logger": Python logger for this process's output.
         """
         return {
@@ -260,19 +391,24 @@ class ProcessLogBridge:
             "buffer": [],
             "balance": 0,
             "collecting": False,
+            "traceback": False,
             "logger": logging.getLogger(process_name),
+            "decoder": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+            "partial": "",
+            "dropped": 0,
         }
 
     @staticmethod
-    def _write_tee(state: Dict[str, Any], raw: str) -> None:
+    def _write_tee(state: Dict[str, Any], lines: List[str]) -> None:
         """
-        Write a raw log line to the tee file handle.
+        Write a batch of raw log lines to the tee file handle with a single write.
         :param state (dict): A per-stream state dictionary.
-        :param raw (str): The raw line to mirror.
+        :param lines (list[str]): The raw lines to mirror, without line endings.
         Notes: Exceptions are silently ignored so logging never causes crashes.
         """
         try:
-            state["tee"].write(f"{raw}\n")
+            state["tee"].write("\n".join(lines) + "\n")
+            state["tee"].flush()
         except Exception:
             pass
 
@@ -289,101 +425,430 @@ class ProcessLogBridge:
         except Exception:
             pass
 
-    # ---------- pipe draining ----------
-    def _drain_pipe(self, pipe, process_name: str, stream_tag: str) -> None:
+    # ---------- drain engine ----------
+    def _ensure_engine(self) -> None:
+        """
+        Start the render thread and, where pipes can be selected, the drain thread, once per bridge.
+        The drain thread also watches a wakeup pipe so pipes attached later are registered promptly.
+        """
+        with self._engine_lock:
+            if self._render_thread is not None:
+                return
+            self._render_thread = threading.Thread(target=self._render_loop, name="log-bridge-render", daemon=True)
+            self._render_thread.start()
+            if os.name == "nt":
+                return
+            self._selector = selectors.DefaultSelector()
+            self._wakeup = os.pipe()
+            for fd in self._wakeup:
+                os.set_blocking(fd, False)
+            self._selector.register(self._wakeup[0], selectors.EVENT_READ, None)
+            threading.Thread(target=self._drain_loop, name="log-bridge-drain", daemon=True).start()
+
+    def _register_pipe(self, pipe, state: Dict[str, Any]) -> None:
+        """
+        Hand a pipe to the drain thread, or to a reader thread where pipes cannot be selected.
+        :param pipe: A file-like object (stdout or stderr from a subprocess).
+        :param state (dict): The per-stream state for the pipe.
+        """
+        if self._selector is None:
+            threading.Thread(target=self._drain_pipe, args=(pipe, state), daemon=True).start()
+            return
+        os.set_blocking(pipe.fileno(), False)
+        with self._engine_lock:
+            self._pending.append((pipe, state))
+        try:
+            os.write(self._wakeup[1], b"\0")
+        except BlockingIOError:
+            # a wakeup is already pending
+            pass
+
+    def _drain_loop(self) -> None:
+        """
+        Drain every registered pipe from one thread.
+        Each ready pipe is read with a single non-blocking `os.read()` of up to `read_chunk_size` bytes,
+        so a chatty child costs one system call per chunk rather than per line.
         """
-        Continuously read from a subprocess pipe and process each line.
-        This method:
-        - Retrieves the per-stream state.
-        - Reads lines until EOF.
-        - Passes each line to `_handle_line()`.
-        - Cleans up the pipe and tee file when finished.
+        while True:
+            for key, _ in self._selector.select():
+                if key.data is None:
+                    self._accept_pending()
+                    continue
+                pipe, state = key.data
+                try:
+                    data = os.read(key.fd, self._read_chunk_size)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    data = b""
+                if data:
+                    self._feed(state, data)
+                else:
+                    self._selector.unregister(key.fd)
+                    self._finish_stream(pipe, state)
+
+    def _accept_pending(self) -> None:
+        """
+        Register pipes attached since the last wakeup with the selector.
+        """
+        try:
+            while os.read(self._wakeup[0], 4096):
+                pass
+        except BlockingIOError:
+            pass
+        with self._engine_lock:
+            pending, self._pending = self._pending, []
+        for pipe, state in pending:
+            self._selector.register(pipe.fileno(), selectors.EVENT_READ, (pipe, state))
+
+    def _drain_pipe(self, pipe, state: Dict[str, Any]) -> None:
+        """
+        Fallback for platforms without selectable pipes: read one pipe in chunks until EOF.
         :param pipe: A file-like object (stdout or stderr from a subprocess).
-        :param process_name (str): Label for the process.
-        :param stream_tag (str): `"STDOUT"` or `"STDERR"`—used as part of the state key.
+        :param state (dict): The per-stream state for the pipe.
         """
-        key = (process_name, stream_tag)
-        state = self._streams[key]
         try:
-            for line in iter(pipe.readline, ""):
-                self._handle_line(state, line.rstrip("\n"))
+            while True:
+                data = os.read(pipe.fileno(), self._read_chunk_size)
+                if not data:
+                    break
+                self._feed(state, data)
+        except OSError:
+            pass
         finally:
+            self._finish_stream(pipe, state)
+
+    def _feed(self, state: Dict[str, Any], data: bytes) -> None:
+        """
+        Split a chunk of pipe output into lines and dispatch the complete ones.
+        A line cut by the chunk boundary is carried over to the next chunk, as is a cut UTF-8 sequence.
+        :param state (dict): The per-stream state.
+        :param data (bytes): Bytes read from the pipe.
+        """
+        lines = (state["partial"] + state["decoder"].decode(data)).split("\n")
+        state["partial"] = lines.pop()
+        if lines:
+            self._dispatch(state, [line[:-1] if line.endswith("\r") else line for line in lines])
+
+    def _finish_stream(self, pipe, state: Dict[str, Any]) -> None:
+        """
+        Dispatch any unterminated last line, then close the pipe and the tee file.
+        :param pipe: The pipe that reached EOF.
+        :param state (dict): The per-stream state.
+        """
+        tail = state["partial"] + state["decoder"].decode(b"", final=True)
+        state["partial"] = ""
+        if tail:
+            self._dispatch(state, [tail.rstrip("\r")])
+        try:
+            pipe.close()
+        except Exception:
+            pass
+        self._close_stream(state)
+
+    def _dispatch(self, state: Dict[str, Any], lines: List[str]) -> None:
+        """
+        Mirror lines to the tee file, parse them into entries for the record store and the request metrics,
+        then queue the entries for the console.
+        Lines are stored and observed before the overflow policy applies, so only console rendering is ever skipped.
+        When the render queue is full, the "drop" policy counts the lines as skipped instead,
+        and the "block" policy waits, so the pipes are not read until the console catches up.
+        :param state (dict): The per-stream state.
+        :param lines (list[str]): Complete lines without line endings.
+        """
+        self._write_tee(state, lines)
+        entries = self._parse_lines(state, lines, time.time())
+        if not entries:
+            return
+        if self._overflow == "block":
+            self._render_queue.put((state, entries))
+            return
+        try:
+            self._render_queue.put_nowait((state, entries))
+        except queue.Full:
+            with self._dropped_lock:
+                state["dropped"] += len(lines)
+
+    # ---------- rendering ----------
+    def _render_loop(self) -> None:
+        """
+        Render queued entries on the console, the only thread that formats and logs child output.
+        Skipped lines are summarized per stream at most every `summary_interval` seconds,
+        and request metrics every `metrics.summary_interval` seconds.
+        """
+        next_summary = time.monotonic() + self._summary_interval
+        next_metrics_summary = time.monotonic() + self._metrics_summary_interval
+        while True:
+            if time.monotonic() >= next_summary:
+                self._report_dropped()
+                next_summary = time.monotonic() + self._summary_interval
+            if self._metrics_summary_interval > 0 and time.monotonic() >= next_metrics_summary:
+                self._log_metrics_summary()
+                next_metrics_summary = time.monotonic() + self._metrics_summary_interval
             try:
-                pipe.close()
-            except Exception:
-                pass
-            self._close_stream(state)
+                state, entries = self._render_queue.get(timeout=self._summary_interval)
+            except queue.Empty:
+                self._flush_record_store()
+                continue
+            for entry in entries:
+                try:
+                    self._render_entry(state, entry)
+                except Exception:
+                    pass
+
+    def _report_dropped(self) -> None:
+        """
+        Log how many lines each stream skipped on the console since the last summary.
+        """
+        for state in list(self._streams.values()):
+            with self._dropped_lock:
+                dropped, state["dropped"] = state["dropped"], 0
+            if dropped:
+                self._log(
+                    state,
+                    logging.WARNING,
+                    f"{state['logger'].name} - console fell behind, {dropped} lines not shown here "
+                    "(see the process log file)",
+                )
+
+    # ---------- structured tee ----------
+    def _store_record(self, state: Dict[str, Any], ts: float, entry: Tuple[int, Any, Any]) -> None:
+        """
+        Add a parsed record to the record store, if one is configured.
+        :param state (dict): Per-stream state.
+        :param ts (float): UNIX time at which the line was read from the pipe.
+        :param entry (tuple): The `(level, message, record)` entry, where message is the text line or the `message`
+            of the JSON record, whose other fields are kept under `fields`.
+        Notes: Errors are ignored so the store never breaks console logging.
+        """
+        if self._record_store is None:
+            return
+        level, message, record = entry
+        source = request_id = fields = None
+        if record is not None:
+            source = record.get("source")
+            request_id = record.get("request_id")
+            fields = {k: v for k, v in record.items() if k not in ("message", "source", "request_id")}
+        try:
+            self._record_store.append(
+                {
+                    "ts": ts,
+                    "level": logging.getLevelName(level),
+                    "process": state["logger"].name,
+                    "request_id": None if request_id is None else str(request_id),
+                    "source": source,
+                    "message": message,
+                    "fields": fields,
+                }
+            )
+        except Exception:
+            pass
+
+    def _flush_record_store(self) -> None:
+        """
+        Write records buffered by the record store while the console is idle.
+        """
+        if self._record_store is None:
+            return
+        try:
+            self._record_store.flush()
+        except Exception:
+            pass
+
+    # ---------- request metrics ----------
+    def _observe_metrics(self, message: Any, request_id: Any, ts: float) -> None:
+        """
+        Feed a parsed message to the request metrics, if enabled.
+        :param message (Any): The text line, or the `message` of a JSON record.
+        :param request_id (Any): The request_id of a JSON record, or None.
+        :param ts (float): UNIX time at which the line was read from the pipe.
+        Notes: Errors are ignored so metrics never break console logging.
+        """
+        if self._metrics is None:
+            return
+        try:
+            self._metrics.observe(message, None if request_id is None else str(request_id), now=ts)
+        except Exception:
+            pass
+
+    def _start_metrics(self, metrics_cfg: Dict[str, Any]) -> None:
+        """
+        Create the request metrics and, unless the port is None, serve them over HTTP.
+        :param metrics_cfg (dict): The "metrics" configuration section.
+        Notes: A port that is already taken only skips the endpoint; metrics are still aggregated and summarized.
+        """
+        self._metrics = RequestMetrics(window_seconds=float(metrics_cfg.get("window_seconds", 300.0)))
+        if metrics_cfg.get("port") is None:
+            return
+        host = metrics_cfg.get("host", "127.0.0.1")
+        try:
+            self._metrics_server = MetricsServer(self._metrics, host, int(metrics_cfg["port"]))
+        except OSError as exc:
+            self._logger.warning("Request metrics endpoint not started: %s", exc)
+            return
+        self._logger.info("Request metrics served at http://%s:%d/metrics", host, self._metrics_server.port)
+
+    def _log_metrics_summary(self) -> None:
+        """
+        Log throughput, latency quantiles and tokens of the recent requests, if any.
+        """
+        if self._metrics is None:
+            return
+        summary = self._metrics.summary()
+        if summary:
+            self._logger.info("Request metrics: %s", summary)
 
     # ---------- line handling ----------
+    def _parse_lines(self, state: Dict[str, Any], lines: List[str], ts: float) -> List[Tuple[int, Any, Any]]:
+        """
+        Parse lines into entries, add them to the record store and feed them to the request metrics.
+        :param state (dict): The per-stream state dict.
+        :param lines (list[str]): Raw lines, already mirrored to the tee file.
+        :param ts (float): UNIX time at which the lines were read.
+        :return list: The `(level, message, record)` entries completed by these lines.
+        """
+        entries = []
+        for line in lines:
+            try:
+                entry = self._parse_line(state, line)
+            except Exception:
+                continue
+            if entry is not None:
+                self._store_record(state, ts, entry)
+                self._observe_metrics(entry[1], None if entry[2] is None else entry[2].get("request_id"), ts)
+                entries.append(entry)
+        return entries
+
     def _handle_line(self, state: Dict[str, Any], line: str) -> None:
         """
-        Handle a single log line from a process.
+        Parse, store and render a single line in the calling thread.
+        :param state (dict): The per-stream state dict.
+        :param line (str): The raw line to process.
+        """
+        for entry in self._parse_lines(state, [line], time.time()):
+            self._render_entry(state, entry)
+
+    # pylint: disable=too-many-return-statements
+    def _parse_line(self, state: Dict[str, Any], line: str) -> Optional[Tuple[int, Any, Any]]:
+        """
+        Parse a single log line from a process. The raw line was already mirrored to the tee file.
         Steps:
-            1. Mirror raw line to tee file.
+            1. Classify the line, so plain text skips all JSON handling.
             2. Attempt strict or fragmentary JSON parsing.
             3. Otherwise apply multiline JSON reassembly logic.
-            4. If none apply, log as plain text.
+            4. If none apply, keep it as plain text.
         :param state (dict): The per-stream state dict.
         :param line (str): The raw line to process.
+        :return tuple | None: A `(level, message, record)` entry, where record is the JSON record or None for text,
+            or None while a multi-line block is being collected.
         """
         if line == "":
-            self._write_tee(state, line)
-            return
+            return None
 
-        # Mirror raw first
-        self._write_tee(state, line)
+        kind = self._classify_line(line, state["traceback"])
+        state["traceback"] = kind == "traceback" and (line[:1] in " \t" or line.lstrip().startswith(self._TB_START))
+        if kind == "traceback" and not state["collecting"]:
+            # traceback lines quote source code, whose braces must not start JSON reassembly
+            return self._text_entry(line, logging.ERROR)
+        if kind == "text" and not state["collecting"]:
+            return self._text_entry(line)
 
         # Single-line JSON?
-        obj = self._try_parse_json_fragment(line)
+        obj = None if kind in ("text", "traceback") else self._try_parse_json_fragment(line, strict=kind == "json")
         if obj is not None:
-            self._emit_json_block(state, obj)
-            return
+            return self._json_entry(obj)
 
         # Multi-line accumulation
         if not state["collecting"]:
             if self._reasm_start_if_jsonish(state, line):
                 if state["balance"] <= 0:  # closed on same line
-                    block = self._reasm_flush(state)
-                    self._emit_collected(state, block)
-                return
+                    return self._parse_collected(self._reasm_flush(state))
+                return None
             # Plain text fallback
-            self._emit_text_line(state, line)
-            return
+            return self._text_entry(line)
 
         # we are collecting
         self._reasm_add(state, line)
         if self._reasm_should_flush(state, line):
-            block = self._reasm_flush(state)
-            self._emit_collected(state, block)
+            return self._parse_collected(self._reasm_flush(state))
+        return None
+
+    def _text_entry(self, line: str, level: Optional[int] = None) -> Tuple[int, Any, Any]:
+        """
+        :param line (str): A plain text line.
+        :param level (int | None): Level of the line, inferred from its text when None.
+        :return tuple: The `(level, message, record)` entry of the line.
+        """
+        return (self._infer_level_from_text(line, logging.INFO) if level is None else level), line, None
+
+    def _json_entry(self, record: Dict[str, Any]) -> Tuple[int, Any, Any]:
+        """
+        :param record (dict): A parsed JSON record.
+        :return tuple: The `(level, message, record)` entry of the record.
+        """
+        return self._infer_level_from_message_type(record), record.get("message"), record
+
+    def _parse_collected(self, block: str) -> Tuple[int, Any, Any]:
+        """
+        Parse a reconstructed multiline block.
+        Decision logic:
+            - If block parses as JSON → JSON entry.
+            - If it matches NeuroSan request-reporting → rebuild into a JSON entry.
+            - Otherwise → treat as text (flatten whitespace).
+        :param block (str): Reassembled multiline block.
+        :return tuple: The `(level, message, record)` entry of the block.
+        """
+        obj = self._try_parse_json_fragment(block)
+        if obj is not None:
+            return self._json_entry(obj)
+
+        rebuilt = self._rebuild_neurosan_request_reporting(block)
+        if rebuilt is not None:
+            return self._json_entry(rebuilt)
+
+        return self._text_entry(" ".join(p.strip() for p in block.splitlines() if p.strip()))
+
+    # ---------- classifier ----------
+    @classmethod
+    def _classify_line(cls, line: str, in_traceback: bool = False) -> str:
+        """
+        Decide in a single pass over the first character and a substring check how a line can be parsed.
+        :param line (str): A non-empty raw line.
+        :param in_traceback (bool): True when the previous line was the start or a frame of a traceback.
+        :return str:
+            - "traceback" if the line starts a traceback, is an indented frame or source line of one,
+              or is the exception line that ends one.
+            - "json" if a strict JSON parse of the whole line could succeed.
+            - "fragment" if only a `{...}` fragment inside the line could be JSON.
+            - "text" if the line contains no JSON at all, which is the common case.
+        """
+        if line[:1] in " \t" and (in_traceback or cls._TB_FRAME.match(line)):
+            return "traceback"
+        stripped = line.strip()
+        if stripped.startswith(cls._TB_START):
+            return "traceback"
+        if stripped[:1] in cls._JSON_STARTS or cls._JSON_SCALAR.fullmatch(stripped):
+            return "json"
+        if in_traceback:
+            return "traceback"
+        if "{" in line:
+            return "fragment"
+        return "text"
 
     # ---------- reassembler (stateful, no extra classes) ----------
-    @staticmethod
-    def _count_braces_outside_quotes(s: str) -> int:
+    @classmethod
+    def _count_braces_outside_quotes(cls, s: str) -> int:
         """
         Count net brace balance `{` minus `}` ignoring quoted strings.
         :param s (str): A text line.
         :return int: Net count (`+1` for `{`, `-1` for `}`), ignoring content inside double quotes.
+        Notes: Strings and escapes are removed with one regex substitution instead of a per-character loop.
         """
-        depth = 0
-        in_str = False
-        esc = False
-        for ch in s:
-            if esc:
-                esc = False
-                continue
-            if ch == "\\":
-                esc = True
-                continue
-            if ch == '"':
-                in_str = not in_str
-                continue
-            if in_str:
-                continue
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-        return depth
+        if "{" not in s and "}" not in s:
+            return 0
+        if '"' in s or "\\" in s:
+            s = cls._QUOTED_OR_ESCAPED.sub("", s)
+        return s.count("{") - s.count("}")
 
     def _reasm_start_if_jsonish(self, state: Dict[str, Any], line: str) -> bool:
         """
@@ -462,7 +927,7 @@ class ProcessLogBridge:
         """
         if not line:
             return default
-        m = self._LEVEL_WORD.search(line)
+        m = self._LEVEL_WORD.search(line.upper())
         if not m:
             if "traceback" in line.lower():
                 return logging.ERROR
@@ -478,36 +943,43 @@ class ProcessLogBridge:
         :param obj (Any): Any JSON-serializable object.
         :return str: Indented JSON, or `str(obj)` on failure.
         """
+        if orjson is not None:
+            try:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")  # pylint: disable=no-member
+            except Exception:
+                pass
         try:
             return json.dumps(obj, indent=2, ensure_ascii=False)
         except Exception:
             return str(obj)
 
     @staticmethod
-    def _try_parse_json_fragment(text: str) -> Optional[Dict[str, Any]]:
+    def _try_parse_json_fragment(text: str, strict: bool = True) -> Optional[Dict[str, Any]]:
         """
         Try to parse a JSON dictionary from a text line.
         Attempts:
-            1. Full strict `json.loads(text)`
+            1. Full strict parse of the text, unless `strict` is False.
             2. Extract fragment between first `{` and last `}` and parse that.
         :param text (str): Input line.
+        :param strict (bool): False when the classifier ruled out that the whole text is JSON.
         :return dict | None: Parsed JSON as a dictionary, or None if not parseable.
         """
         if not text:
             return None
         # strict
-        try:
-            obj = json.loads(text)
-            return obj if isinstance(obj, dict) else {"message": obj}
-        except Exception:
-            pass
+        if strict:
+            try:
+                obj = _json_loads(text)
+                return obj if isinstance(obj, dict) else {"message": obj}
+            except Exception:
+                pass
         # first {...}
         s = text.find("{")
         e = text.rfind("}")
         if s != -1 and e != -1 and e > s:
             frag = text[s : e + 1]
             try:
-                obj = json.loads(frag)
+                obj = _json_loads(frag)
                 return obj if isinstance(obj, dict) else {"message": obj}
             except Exception:
                 return None
@@ -520,7 +992,7 @@ class ProcessLogBridge:
         Strategy:
             - If value is not a string, return None.
             - If it doesn't begin with `{` or `[`, return None.
-            - Try strict `json.loads()`.
+            - Try a strict parse.
             - Otherwise, clean escape sequences and attempt again.
         :param val (Any): Possibly nested JSON-like string.
         :return Any | None: Parsed JSON object, or None if not parseable.
@@ -534,7 +1006,7 @@ class ProcessLogBridge:
             return None
         # strict
         try:
-            return json.loads(s)
+            return _json_loads(s)
         except Exception:
             pass
         # mild cleanup: unescape \n \t \r and drop trailing commas
@@ -542,7 +1014,7 @@ class ProcessLogBridge:
         s2 = re.sub(r",\s*(?=[}\]])", "", s2)
         s2 = re.sub(r"\n{3,}", "\n\n", s2)
         try:
-            return json.loads(s2)
+            return _json_loads(s2)
         except Exception:
             return None
 
@@ -563,7 +1035,7 @@ class ProcessLogBridge:
             return None
         inner_src = "{" + m.group("inner").strip() + "}"
         try:
-            inner = json.loads(inner_src)
+            inner = _json_loads(inner_src)
         except Exception:
             inner = inner_src
         out: Dict[str, Any] = {"message": inner}
@@ -626,19 +1098,33 @@ class ProcessLogBridge:
         """
         return f"{process_name}:{source}" if source else process_name
 
-    def _emit_json_block(self, state: Dict[str, Any], record: Dict[str, Any]) -> None:
+    def _render_entry(self, state: Dict[str, Any], entry: Tuple[int, Any, Any]) -> None:
+        """
+        Render a parsed entry on the console.
+        :param state (dict): Per-stream logging state.
+        :param entry (tuple): A `(level, message, record)` entry from `_parse_line()`.
+        """
+        level, message, record = entry
+        if record is None:
+            self._emit_text_line(state, message, level)
+        else:
+            self._emit_json_block(state, record, level)
+
+    def _emit_json_block(self, state: Dict[str, Any], record: Dict[str, Any], level: Optional[int] = None) -> None:
         """
         Emit a fully parsed JSON record to the logger.
         Steps:
-            1. Infer log level from `message_type`.
+            1. Infer log level from `message_type`, unless given.
             2. Build header including process name and optional source.
             3. Parse nested JSON inside the `"message"` field (if present).
             4. Pretty-print JSON.
             5. If the message looks like traceback text, print a Rich-formatted traceback.
         :param state (dict): Per-stream logging state.
         :param record (dict): Parsed JSON dictionary representing the log event.
+        :param level (int | None): Level of the record, inferred from it when None.
         """
-        level = self._infer_level_from_message_type(record)
+        if level is None:
+            level = self._infer_level_from_message_type(record)
         src = str(record.get("source") or "").strip() or None
         header = self._src_header(state["logger"].name, src)
 
@@ -652,47 +1138,26 @@ class ProcessLogBridge:
         self._log(state, level, header + "\n" + body)
 
         # If message was traceback-like text, pretty print after
+        # (normalizing only inserts line breaks, so messages without either marker are never tracebacks)
         msg = record.get("message")
-        if isinstance(msg, str):
+        if isinstance(msg, str) and (self._TB_START in msg or "File " in msg):
             tb_text = self._normalize_traceback_str(msg)
             if self._looks_like_traceback(tb_text):
                 self._log(state, level, header + " (traceback)")
                 self.console.print(Syntax(tb_text, "pytb", word_wrap=False))
 
-    def _emit_text_line(self, state: Dict[str, Any], line: str) -> None:
+    def _emit_text_line(self, state: Dict[str, Any], line: str, level: Optional[int] = None) -> None:
         """
         Emit a plain text line to the logger.
         :param state (dict): Per-stream logging state.
         :param line (str): Raw log line.
-        Notes: Severity is inferred automatically via `_infer_level_from_text()`.
+        :param level (int | None): Level of the line, inferred via `_infer_level_from_text()` when None.
         """
-        level = self._infer_level_from_text(line, logging.INFO)
+        if level is None:
+            level = self._infer_level_from_text(line, logging.INFO)
         header = self._src_header(state["logger"].name, None)
         self._log(state, level, header + " - " + line)
 
-    def _emit_collected(self, state: Dict[str, Any], block: str) -> None:
-        """
-        Emit a reconstructed multiline block.
-        Decision logic:
-            - If block parses as JSON → emit as JSON.
-            - If it matches NeuroSan request-reporting → rebuild + emit.
-            - Otherwise → treat as text (flatten whitespace).
-        :param state (dict): Per-stream state.
-        :param block (str): Reassembled multiline block.
-        """
-        obj = self._try_parse_json_fragment(block)
-        if obj is not None:
-            self._emit_json_block(state, obj)
-            return
-
-        rebuilt = self._rebuild_neurosan_request_reporting(block)
-        if rebuilt is not None:
-            self._emit_json_block(state, rebuilt)
-            return
-
-        flat = " ".join(p.strip() for p in block.splitlines() if p.strip())
-        self._emit_text_line(state, flat)
-
     # ---------- logging wrapper ----------
     @staticmethod
     def _log(state: Dict[str, Any], level: int, msg: str) -> None:
@@ -0,0 +1,75 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+"""
+Query or replay the records kept by the log bridge's LogRecordStore:
+    python -m plugins.log_bridge.record_cli query --request-id <id>
+    python -m plugins.log_bridge.record_cli replay --since 2025-06-01T12:00 --until 2025-06-01T12:05
+"""
+import argparse
+import json
+import logging
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+from plugins.log_bridge.record_store import LogRecordStore
+
+
+def _parse_time(value: str) -> float:
+    """
+    :param value (str): UNIX time, or an ISO 8601 date/time in local time unless it has an offset.
+    :return float: UNIX time.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).astimezone().timestamp()
+
+
+def main():
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description="Query or replay records stored by the log bridge")
+    parser.add_argument("command", choices=["query", "replay"], help="query prints JSON lines, replay renders them")
+    parser.add_argument("--dir", default="logs/records", help="Store directory")
+    parser.add_argument("--request-id", help="Only records of this request")
+    parser.add_argument("--since", type=_parse_time, help="UNIX time or ISO 8601 date/time")
+    parser.add_argument("--until", type=_parse_time, help="UNIX time or ISO 8601 date/time")
+    parser.add_argument("--process", help="Only records of this process, e.g. NeuroSanServer")
+    parser.add_argument("--level", default="NOTSET", help="Minimum level, e.g. WARNING")
+    args = parser.parse_args()
+
+    if not (Path(args.dir) / "index.sqlite").exists():
+        parser.error(f"no record store in {args.dir}")
+    store = LogRecordStore(args.dir)
+    records = store.query(
+        request_id=args.request_id,
+        since=args.since,
+        until=args.until,
+        process=args.process,
+        min_level=logging.getLevelName(args.level.upper()),
+    )
+    if args.command == "replay":
+        ProcessLogBridge(level="DEBUG").replay(records)
+        return
+    for record in records:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# imitations under the License.
+#
+# END COPYRIGHT
+"""
+Append-only, compressed store of the records parsed by ProcessLogBridge, indexed by request_id and time.
+
+Layout of the store directory:
+    - `NNNNNN.seg`: segment files made of blocks, each a 4-byte big-endian length followed by
+      zlib-compressed JSON lines, one record per line. A new segment starts once one reaches `segment_bytes`.
+    - `index.sqlite`: one row per block with its location and time range, plus the request_ids it contains.
+
+Query or replay records from the command line with `plugins.log_bridge.record_cli`.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import sqlite3
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+_BLOCK_HEADER = struct.Struct(">I")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blocks (
+    id INTEGER PRIMARY KEY,
+    segment INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    records INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_time ON blocks (end_ts, start_ts);
+CREATE TABLE IF NOT EXISTS requests (
+    request_id TEXT NOT NULL,
+    block_id INTEGER NOT NULL,
+    PRIMARY KEY (request_id, block_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS requests_block ON requests (block_id);
+"""
+
+
+class LogRecordStore:
+    """
+    Segment-based record store with a SQLite sidecar index.
+    - Records are buffered and written as one compressed block once `block_records` are buffered
+      or the oldest buffered record is `flush_seconds` old.
+    - A block is written to its segment before it is indexed, so the index never points at missing data.
+    - With `max_segments`, the oldest segments and their index rows are deleted as new ones start.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        directory: str,
+        segment_bytes: int = 64 * 1024 * 1024,
+        block_records: int = 512,
+        flush_seconds: float = 2.0,
+        max_segments: int = 0,
+    ):
+        """
+        :param directory (str): Directory holding the segments and the index. Created if missing.
+        :param segment_bytes (int): Size at which a new segment is started.
+        :param block_records (int): Number of records compressed together; larger blocks compress better,
+            smaller blocks make lookups decompress less.
+        :param flush_seconds (float): Maximum time a record stays buffered in memory.
+        :param max_segments (int): Number of segments to keep, or 0 to keep every segment.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.block_records = block_records
+        self.flush_seconds = flush_seconds
+        self.max_segments = max_segments
+
+        self._lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_since = 0.0
+        self._db = sqlite3.connect(str(self.directory / "index.sqlite"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self._segment = max(self._segments(), default=1)
+        self._segment_file = None
+
+    # ---------- writing ----------
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Buffer a record, writing a block when the buffer is full or old enough.
+        :param record (dict): Record with at least a float `ts`; `request_id` is indexed when present.
+        """
+        with self._lock:
+            if not self._buffer:
+                self._buffer_since = time.monotonic()
+            self._buffer.append(record)
+            if len(self._buffer) >= self.block_records or time.monotonic() - self._buffer_since >= self.flush_seconds:
+                self._write_block()
+
+    def flush(self) -> None:
+        """
+        Write any buffered records as a block.
+        """
+        with self._lock:
+            self._write_block()
+
+    def close(self) -> None:
+        """
+        Flush buffered records and close the segment and the index.
+        """
+        with self._lock:
+            self._write_block()
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+            self._db.close()
+
+    def _write_block(self) -> None:
+        """
+        Compress the buffered records into one block and index it. Caller holds the lock.
+        """
+        if not self._buffer:
+            return
+        records, self._buffer = self._buffer, []
+        payload = zlib.compress("\n".join(json.dumps(r, ensure_ascii=False, default=str) for r in records).encode())
+
+        segment_file = self._open_segment(len(payload) + _BLOCK_HEADER.size)
+        offset = segment_file.tell()
+        segment_file.write(_BLOCK_HEADER.pack(len(payload)) + payload)
+        segment_file.flush()
+
+        timestamps = [r["ts"] for r in records]
+        with self._db:
+            block_id = self._db.execute(
+                "INSERT INTO blocks (segment, offset, length, start_ts, end_ts, records) VALUES (?, ?, ?, ?, ?, ?)",
+                (self._segment, offset, len(payload), min(timestamps), max(timestamps), len(records)),
+            ).lastrowid
+            self._db.executemany(
+                "INSERT OR IGNORE INTO requests (request_id, block_id) VALUES (?, ?)",
+                [(rid, block_id) for rid in {r.get("request_id") for r in records} if rid],
+            )
+
+    def _open_segment(self, block_bytes: int):
+        """
+        :param block_bytes (int): Size of the block about to be written.
+        :return: The segment file to append the block to, rolling over to a new segment when it is full.
+        """
+        # the segment stays open across blocks and is closed when it is full or the store is closed
+        # pylint: disable=consider-using-with
+        if self._segment_file is None:
+            self._segment_file = open(self._segment_path(self._segment), "ab")
+        if self._segment_file.tell() and self._segment_file.tell() + block_bytes > self.segment_bytes:
+            self._segment_file.close()
+            self._segment += 1
+            self._segment_file = open(self._segment_path(self._segment), "ab")
+            self._enforce_retention()
+        return self._segment_file
+
+    def _enforce_retention(self) -> None:
+        """
+        Delete the oldest segments, and their index rows, beyond `max_segments`.
+        """
+        if not self.max_segments:
+            return
+        for segment in sorted(self._segments())[: -self.max_segments]:
+            with self._db:
+                self._db.execute(
+                    "DELETE FROM requests WHERE block_id IN (SELECT id FROM blocks WHERE segment = ?)", (segment,)
+                )
+                self._db.execute("DELETE FROM blocks WHERE segment = ?", (segment,))
+            self._segment_path(segment).unlink(missing_ok=True)
+
+    # ---------- reading ----------
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def query(
+        self,
+        request_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        process: Optional[str] = None,
+        min_level: int = logging.NOTSET,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream matching records in the order they were written.
+        Only blocks whose index rows match `request_id` and the time range are read and decompressed.
+        :param request_id (str | None): Only records of this request.
+        :param since (float | None): Only records at or after this UNIX time.
+        :param until (float | None): Only records at or before this UNIX time.
+        :param process (str | None): Only records of this process.
+        :param min_level (int): Only records at or above this logging level.
+        :return: Iterator over the records.
+        """
+        self.flush()
+        clauses, params = [], []
+        if request_id is not None:
+            clauses.append("id IN (SELECT block_id FROM requests WHERE request_id = ?)")
+            params.append(request_id)
+        if since is not None:
+            clauses.append("end_ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("start_ts <= ?")
+            params.append(until)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            blocks = self._db.execute(
+                f"SELECT segment, offset, length FROM blocks {where} ORDER BY id", params
+            ).fetchall()
+
+        for segment, offset, length in blocks:
+            for record in self._read_block(segment, offset, length):
+                if request_id is not None and record.get("request_id") != request_id:
+                    continue
+                if (since is not None and record["ts"] < since) or (until is not None and record["ts"] > until):
+                    continue
+                if process is not None and record.get("process") != process:
+                    continue
+                if logging.getLevelName(record.get("level", "INFO")) < min_level:
+                    continue
+                yield record
+
+    def _read_block(self, segment: int, offset: int, length: int) -> List[Dict[str, Any]]:
+        """
+        :return list[dict]: The records of one block, or none if its segment was deleted meanwhile.
+        """
+        try:
+            with open(self._segment_path(segment), "rb") as segment_file:
+                segment_file.seek(offset + _BLOCK_HEADER.size)
+                payload = segment_file.read(length)
+        except FileNotFoundError:
+            return []
+        return [json.loads(line) for line in zlib.decompress(payload).decode().split("\n")]
+
+    # ---------- helpers ----------
+    def _segment_path(self, segment: int) -> Path:
+        """
+        :return Path: File of a segment.
+        """
+        return self.directory / f"{segment:06d}.seg"
+
+    def _segments(self) -> List[int]:
+        """
+        :return list[int]: Numbers of the segments on disk.
+        """
+        return [int(path.stem) for path in self.directory.glob("*.seg") if path.stem.isdigit()]
+
+
+def open_record_store(cfg: Dict[str, Any]) -> LogRecordStore:
+    """
+    Open the store described by the "store" section of the bridge configuration,
+    flushing it when the interpreter exits.
+    :param cfg (dict): The "store" configuration section.
+    :return LogRecordStore: The store.
+    """
+    store = LogRecordStore(
+        cfg.get("directory", "logs/records"),
+        segment_bytes=int(cfg.get("segment_bytes", 64 * 1024 * 1024)),
+        block_records=int(cfg.get("block_records", 512)),
+        flush_seconds=float(cfg.get("flush_seconds", 2.0)),
+        max_segments=int(cfg.get("max_segments", 0)),
+    )
+    atexit.register(store.close)
+    return store
@@ -0,0 +1,380 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# imitations under the License.
+#
+# END COPYRIGHT
+"""
+Per-request latency and token metrics derived from the neuro-san server log lines seen by ProcessLogBridge.
+
+The server logs, with the request_id of each request:
+    - "Received a <agent>.<method> request for <marker>" when a request starts
+    - "Request reporting: {"token_accounting": {...}}" when a streaming chat finishes
+    - "Done with <agent>.<method> request for <marker>" when a request ends
+From these, request wall times per agent and method and prompt/completion/total token counts per agent
+are aggregated into histograms, served in the Prometheus text format by MetricsServer.
+"""
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+DURATION_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+TOKEN_BUCKETS = (100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000)
+QUANTILES = (0.5, 0.95, 0.99)
+TOKEN_KINDS = ("prompt_tokens", "completion_tokens", "total_tokens")
+REPORTING_PREFIX = "Request reporting:"
+
+
+class RollingHistogram:
+    """
+    Prometheus-style cumulative histogram that also keeps the observations of the last `window_seconds`,
+    so quantiles and rates reflect recent traffic rather than everything since startup.
+    """
+
+    def __init__(self, buckets: Sequence[float], window_seconds: float):
+        """
+        :param buckets (Sequence[float]): Upper bounds of the histogram buckets.
+        :param window_seconds (float): Length of the rolling window.
+        """
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.window_seconds = window_seconds
+        self.bucket_counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._window: Deque[Tuple[float, float]] = deque()
+
+    def observe(self, value: float, now: float) -> None:
+        """
+        :param value (float): The observed value.
+        :param now (float): UNIX time of the observation.
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self._window.append((now, value))
+        self._expire(now)
+
+    def window_values(self, now: float) -> List[float]:
+        """
+        :param now (float): Current UNIX time.
+        :return list[float]: Sorted values observed within the window.
+        """
+        self._expire(now)
+        return sorted(value for _, value in self._window)
+
+    def cumulative_buckets(self) -> List[Tuple[str, int]]:
+        """
+        :return list[tuple]: (`le` label, count of values at or below it) per bucket, ending with "+Inf".
+        """
+        result: List[Tuple[str, int]] = []
+        running = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            running += count
+            result.append((_format_number(bound), running))
+        result.append(("+Inf", self.count))
+        return result
+
+    def _expire(self, now: float) -> None:
+        """
+        Forget observations older than the window.
+        """
+        while self._window and self._window[0][0] < now - self.window_seconds:
+            self._window.popleft()
+
+
+def quantile(sorted_values: List[float], q: float) -> float:
+    """
+    :param sorted_values (list[float]): Non-empty, sorted values.
+    :param q (float): Quantile between 0 and 1.
+    :return float: Nearest-rank quantile.
+    """
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+def _format_number(value: float) -> str:
+    """
+    :return str: The value in the Prometheus text format, without a trailing ".0" for integers.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _labels(**labels: str) -> str:
+    """
+    :return str: Prometheus label set, with backslashes, quotes and line breaks in values escaped.
+    """
+    escaped = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        escaped.append(f'{name}="{value}"')
+    return "{" + ",".join(escaped) + "}"
+
+
+class RequestMetrics:
+    """
+    Aggregates request wall times and token counts from server log messages.
+    Thread-safe: the bridge drain thread observes while the metrics endpoint renders.
+    """
+
+    _LIFECYCLE = re.compile(r"(Received a|Done with) (\S+)\.(\w+) request for (.*)")
+
+    def __init__(self, window_seconds: float = 300.0, pending_seconds: float = 3600.0):
+        """
+        :param window_seconds (float): Window for quantiles, rates and the summary line.
+        :param pending_seconds (float): Requests not done after this long are forgotten.
+        """
+        self.window_seconds = window_seconds
+        self.pending_seconds = pending_seconds
+        self._lock = threading.Lock()
+        self._durations: Dict[Tuple[str, str], RollingHistogram] = {}
+        self._tokens: Dict[Tuple[str, str], RollingHistogram] = {}
+        # request key -> agent, method, start time and token accounting of a request in flight
+        self._pending: Dict[str, Dict[str, Any]] = {}
+
+    def observe(self, message: Any, request_id: Optional[str], now: Optional[float] = None) -> None:
+        """
+        Update the metrics from one log message. Messages unrelated to request lifecycles are ignored cheaply.
+        :param message (Any): The `message` of a JSON log record, or a plain text line.
+        :param request_id (str | None): The request_id of the record, if any.
+        :param now (float | None): UNIX time of the message, defaulting to the current time.
+        """
+        if isinstance(message, dict):
+            if "token_accounting" in message:
+                self._observe_reporting(message, request_id, now or time.time())
+            return
+        if not isinstance(message, str):
+            return
+        if message.startswith(REPORTING_PREFIX):
+            try:
+                reporting = json.loads(message[len(REPORTING_PREFIX) :])
+            except ValueError:
+                return
+            if isinstance(reporting, dict):
+                self._observe_reporting(reporting, request_id, now or time.time())
+            return
+        if " request for " in message:
+            match = self._LIFECYCLE.search(message)
+            if match is not None:
+                self._observe_lifecycle(*match.groups(), request_id=request_id, now=now or time.time())
+
+    # pylint: disable=too-many-arguments
+    def _observe_lifecycle(
+        self, event: str, agent: str, method: str, marker: str, *, request_id: Optional[str], now: float
+    ) -> None:
+        """
+        Start timing a request, or finish it and record its wall time and tokens.
+        Requests are matched by request_id, else by the marker at the end of the message.
+        """
+        key = request_id or marker.strip()
+        with self._lock:
+            if event == "Received a":
+                self._expire_pending(now)
+                self._pending[key] = {"agent": agent, "method": method, "start": now, "tokens": None}
+                return
+            pending = self._pending.pop(key, None) or {}
+            tokens: Optional[Dict[str, Any]] = pending.get("tokens")
+            if pending.get("start") is not None:
+                duration: Optional[float] = now - pending["start"]
+            else:
+                # the bridge started after the request did; fall back to the server's own timing
+                duration = (tokens or {}).get("time_taken_in_seconds")
+            if duration is not None:
+                self._histogram(self._durations, (agent, method), DURATION_BUCKETS).observe(float(duration), now)
+            if tokens:
+                self._observe_tokens(agent, tokens, now)
+
+    def _observe_reporting(self, reporting: Dict[str, Any], request_id: Optional[str], now: float) -> None:
+        """
+        Keep the token accounting of a request until it is done, or record it right away without a request_id.
+        """
+        tokens = reporting.get("token_accounting")
+        if not isinstance(tokens, dict):
+            return
+        with self._lock:
+            if request_id and request_id in self._pending:
+                self._pending[request_id]["tokens"] = tokens
+            else:
+                self._observe_tokens("unknown", tokens, now)
+
+    def _observe_tokens(self, agent: str, tokens: Dict[str, Any], now: float) -> None:
+        """
+        Record the token counts of one request. Caller holds the lock.
+        """
+        for kind in TOKEN_KINDS:
+            value = tokens.get(kind)
+            if isinstance(value, (int, float)):
+                self._histogram(self._tokens, (agent, kind.replace("_tokens", "")), TOKEN_BUCKETS).observe(value, now)
+
+    def _histogram(
+        self, histograms: Dict[Tuple[str, str], RollingHistogram], key: Tuple[str, str], buckets: Sequence[float]
+    ) -> RollingHistogram:
+        """
+        :return RollingHistogram: The histogram for a label pair, created on first use. Caller holds the lock.
+        """
+        if key not in histograms:
+            histograms[key] = RollingHistogram(buckets, self.window_seconds)
+        return histograms[key]
+
+    def _expire_pending(self, now: float) -> None:
+        """
+        Forget requests that never reported being done. Caller holds the lock.
+        """
+        stale = [key for key, pending in self._pending.items() if now - pending["start"] > self.pending_seconds]
+        for key in stale:
+            del self._pending[key]
+
+    # ---------- output ----------
+    def render_prometheus(self, now: Optional[float] = None) -> str:
+        """
+        :param now (float | None): Current UNIX time, used for the rolling window.
+        :return str: All metrics in the Prometheus text exposition format.
+        """
+        now = now or time.time()
+        lines: List[str] = []
+        with self._lock:
+            self._render_family(
+                lines,
+                "neuro_san_request_duration_seconds",
+                "Wall time of agent requests",
+                "method",
+                self._durations,
+                now,
+            )
+            lines.append(
+                f"# HELP neuro_san_requests_per_second Requests completed per second over the last "
+                f"{_format_number(self.window_seconds)} seconds"
+            )
+            lines.append("# TYPE neuro_san_requests_per_second gauge")
+            for (agent, method), histogram in sorted(self._durations.items()):
+                rate = len(histogram.window_values(now)) / self.window_seconds
+                lines.append(f"neuro_san_requests_per_second{_labels(agent=agent, method=method)} {rate!r}")
+            self._render_family(
+                lines, "neuro_san_request_tokens", "LLM tokens used per request", "kind", self._tokens, now
+            )
+        return "\n".join(lines) + "\n"
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+    def _render_family(
+        self,
+        lines: List[str],
+        name: str,
+        description: str,
+        second_label: str,
+        histograms: Dict[Tuple[str, str], RollingHistogram],
+        now: float,
+    ) -> None:
+        """
+        Append a histogram family and its rolling-window quantiles. Caller holds the lock.
+        The histograms are keyed by agent and the value of `second_label`.
+        """
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} histogram")
+        for (agent, other), histogram in sorted(histograms.items()):
+            labels = {"agent": agent, second_label: other}
+            for bound, count in histogram.cumulative_buckets():
+                lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {count}")
+            lines.append(f"{name}_sum{_labels(**labels)} {_format_number(histogram.sum)}")
+            lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+        window_name = f"{name}_window"
+        lines.append(
+            f"# HELP {window_name} Quantiles of {name} over the last {_format_number(self.window_seconds)} seconds"
+        )
+        lines.append(f"# TYPE {window_name} gauge")
+        for (agent, other), histogram in sorted(histograms.items()):
+            values = histogram.window_values(now)
+            if not values:
+                continue
+            for q in QUANTILES:
+                labels = _labels(agent=agent, **{second_label: other}, quantile=str(q))
+                lines.append(f"{window_name}{labels} {_format_number(quantile(values, q))}")
+
+    def summary(self, now: Optional[float] = None) -> Optional[str]:
+        """
+        :param now (float | None): Current UNIX time, used for the rolling window.
+        :return str | None: One line on throughput, latency quantiles and tokens over the window,
+            or None when no request completed within it.
+        """
+        now = now or time.time()
+        with self._lock:
+            durations = sorted(v for h in self._durations.values() for v in h.window_values(now))
+            total_tokens = sum(sum(h.window_values(now)) for (_, kind), h in self._tokens.items() if kind == "total")
+        if not durations:
+            return None
+        window = _format_number(self.window_seconds)
+        return (
+            f"{len(durations)} requests in the last {window}s ({len(durations) / self.window_seconds:.2f}/s), "
+            f"latency p50 {quantile(durations, 0.5):.2f}s p95 {quantile(durations, 0.95):.2f}s "
+            f"p99 {quantile(durations, 0.99):.2f}s, {int(total_tokens)} tokens"
+        )
+
+
+class MetricsServer:  # pylint: disable=too-few-public-methods
+    """
+    Serves RequestMetrics in the Prometheus text format at http://<host>:<port>/metrics from a daemon thread.
+    """
+
+    def __init__(self, metrics: RequestMetrics, host: str = "127.0.0.1", port: int = 9464):
+        """
+        :param metrics (RequestMetrics): The metrics to serve.
+        :param host (str): Interface to listen on; the default only accepts local connections.
+        :param port (int): Port to listen on, or 0 for any free port.
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Answers GET /metrics.
+            """
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """
+                Send the metrics, or 404 for other paths.
+                """
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                """
+                Keep scrapes out of the console.
+                """
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self.port: int = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="log-bridge-metrics", daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Stop serving and release the port.
+        """
+        self._server.shutdown()
+        self._server.server_close()
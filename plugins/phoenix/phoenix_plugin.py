@@ -42,6 +42,8 @@ class PhoenixPlugin:
         self._logger = logging.getLogger(__name__)
         self.config = config or {}
         self.phoenix_process = None
+        # set once Phoenix was started, so a supervised restart appends to its log instead of truncating it
+        self.phoenix_started = False
         self.is_windows = os.name == "nt"
 
     @staticmethod
@@ -309,9 +311,14 @@ class PhoenixPlugin:
         Returns:
             subprocess.Popen object
         """
-        # Initialize/clear the log file before starting
-        with open(log_file, "w", encoding="utf-8") as log:
-            log.write("Starting Phoenix...\n")
+        # Initialize/clear the log file before starting, but keep the output of a crashed Phoenix being restarted
+        if self.phoenix_started:
+            with open(log_file, "a", encoding="utf-8") as log:
+                log.write("Restarting Phoenix...\n")
+        else:
+            with open(log_file, "w", encoding="utf-8") as log:
+                log.write("Starting Phoenix...\n")
+        self.phoenix_started = True
 
         # pylint: disable=consider-using-with
         if self.is_windows:
@@ -339,11 +346,25 @@ class PhoenixPlugin:
         print(f"Started Phoenix with PID {process.pid}")
         return process
 
-    def start_phoenix_server(self) -> None:
-        """Start Phoenix server (UI + OTLP HTTP collector) if enabled."""
-        if str(self.config.get("phoenix_autostart", "false")).lower() not in ("true", "1", "yes", "on"):
-            return
-        if str(self.config.get("phoenix_enabled", "false")).lower() not in ("true", "1", "yes", "on"):
+    def autostart_enabled(self) -> bool:
+        """Check whether start_phoenix_server() launches Phoenix.
+
+        Returns:
+            True if Phoenix is both enabled and set to autostart
+        """
+        truthy = ("true", "1", "yes", "on")
+        return (
+            str(self.config.get("phoenix_autostart", "false")).lower() in truthy
+            and str(self.config.get("phoenix_enabled", "false")).lower() in truthy
+        )
+
+    def start_phoenix_server(self, wait: bool = True) -> None:
+        """Start Phoenix server (UI + OTLP HTTP collector) if enabled.
+
+        Args:
+            wait: Wait up to 10 seconds for Phoenix to listen on its port, instead of leaving that to the caller
+        """
+        if not self.autostart_enabled():
             return
 
         print("Starting Phoenix (AI observability)...")
@@ -364,18 +385,19 @@ class PhoenixPlugin:
                     [sys.executable, "-m", "phoenix.server.main", "serve"], "logs/phoenix.log"
                 )
 
-                # Wait for Phoenix to bind to port (with retry)
-                phoenix_ready = False
-                for _ in range(10):  # Try for up to 10 seconds
-                    time.sleep(1)
-                    if self.is_port_open(phoenix_host, phoenix_port):
-                        phoenix_ready = True
-                        break
-
-                if phoenix_ready:
-                    print("Phoenix started successfully.")
-                else:
-                    print("Failed to start Phoenix automatically. Check logs/phoenix.log")
+                # Wait for Phoenix to bind to port (with retry), unless the caller probes it
+                if wait:
+                    phoenix_ready = False
+                    for _ in range(10):  # Try for up to 10 seconds
+                        time.sleep(1)
+                        if self.is_port_open(phoenix_host, phoenix_port):
+                            phoenix_ready = True
+                            break
+
+                    if phoenix_ready:
+                        print("Phoenix started successfully.")
+                    else:
+                        print("Failed to start Phoenix automatically. Check logs/phoenix.log")
             except Exception as exc:  # pylint: disable=broad-exception-caught
                 print(f"Failed to start Phoenix automatically: {exc}")
 
@@ -393,4 +415,3 @@ class PhoenixPlugin:
                 self.phoenix_process.terminate()
             else:
                 os.killpg(os.getpgid(self.phoenix_process.pid), signal.SIGKILL)
-
@@ -0,0 +1,288 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+"""Concurrent start-up, readiness probing and restarting of the services launched by run.py"""
+
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+
+DEFAULT_STARTUP_TIMEOUT = 120.0
+DEFAULT_MAX_RESTARTS = 3
+DEFAULT_RESTART_WINDOW = 300.0
+
+
+def http_probe(url: str, timeout: float = 2.0) -> Callable[[], bool]:
+    """
+    :param url: Health endpoint of the service, e.g. http://localhost:8080/healthz
+    :param timeout: Seconds to wait for a response
+    :return: Probe that is True once the endpoint answers with a status below 500
+    """
+
+    def probe() -> bool:
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:  # nosec B310 - local service url
+                return response.status < 500
+        except urllib.error.HTTPError as error:
+            return error.code < 500
+        except (urllib.error.URLError, OSError, ValueError):
+            return False
+
+    return probe
+
+
+def grpc_probe(host: str, port: int, timeout: float = 2.0) -> Callable[[], bool]:
+    """
+    :param host: Host of the gRPC server
+    :param port: Port of the gRPC server
+    :param timeout: Seconds to wait for the channel to connect
+    :return: Probe that is True once a channel completes the HTTP/2 handshake with the server
+    """
+
+    def probe() -> bool:
+        # grpc comes with neuro-san, but is only needed when a gRPC service is supervised
+        import grpc  # pylint: disable=import-outside-toplevel
+
+        with grpc.insecure_channel(f"{host}:{port}") as channel:
+            try:
+                grpc.channel_ready_future(channel).result(timeout=timeout)
+                return True
+            except grpc.FutureTimeoutError:
+                return False
+
+    return probe
+
+
+@dataclass
+class ServiceSpec:
+    """How to start one service and how to tell that it is ready."""
+
+    name: str
+    # Starts the service and returns its process. Called again to restart it.
+    start: Callable[[], object]
+    # Probes that must all succeed before the service counts as ready
+    probes: Sequence[Callable[[], bool]] = ()
+    startup_timeout: float = DEFAULT_STARTUP_TIMEOUT
+
+
+@dataclass
+class ServiceState:
+    """What the supervisor knows about one service."""
+
+    # pylint: disable=too-many-instance-attributes
+
+    spec: ServiceSpec
+    process: Optional[object] = None
+    started_at: float = 0.0
+    spawn_seconds: float = 0.0
+    ready_seconds: Optional[float] = None
+    probe_attempts: int = 0
+    restarts: Deque[float] = field(default_factory=deque)
+    restarting: bool = False
+    failed: bool = False
+
+
+class ServiceSupervisor:
+    """
+    Starts services concurrently, waits for each one with its readiness probes, and restarts crashed services.
+
+    Readiness probes are retried with exponential backoff, from initial_backoff up to max_backoff seconds,
+    until they all succeed, the process exits or startup_timeout passes.
+    A service exiting while the supervisor is running is restarted after the same kind of backoff,
+    at most max_restarts times within restart_window seconds, after which it is given up on.
+    """
+
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(
+        self,
+        *,
+        max_restarts: int = DEFAULT_MAX_RESTARTS,
+        restart_window: float = DEFAULT_RESTART_WINDOW,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 2.0,
+        poll_interval: float = 0.5,
+    ):
+        """
+        :param max_restarts: Maximum number of restarts per service within restart_window
+        :param restart_window: Seconds over which restarts are counted
+        :param initial_backoff: Seconds before the first probe retry or restart
+        :param max_backoff: Maximum seconds between probe retries or before a restart
+        :param poll_interval: Seconds between checks whether the services are still running
+        """
+        self.max_restarts: int = max_restarts
+        self.restart_window: float = restart_window
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.poll_interval: float = poll_interval
+        self.services: Dict[str, ServiceState] = {}
+        self._stopping = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+    def start_all(self, specs: List[ServiceSpec]) -> bool:
+        """
+        Spawn the services in order, wait for their readiness concurrently, print their start-up timings
+        and begin restarting services that exit.
+
+        Spawning only launches a process, so it is quick, and services spawned earlier can still hand
+        environment variables to later ones. Readiness is what takes time, and no service waits for another's.
+
+        :param specs: The services to start
+        :return: True if every service became ready
+        """
+        start = time.monotonic()
+        states = [ServiceState(spec) for spec in specs]
+        self.services.update((state.spec.name, state) for state in states)
+        spawned = [state for state in states if self._spawn(state)]
+        threads = [
+            threading.Thread(target=self._await_ready, args=(state,), name=f"ready-{state.spec.name}", daemon=True)
+            for state in spawned
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.report(time.monotonic() - start)
+        if self._monitor is None:
+            self._monitor = threading.Thread(target=self._monitor_loop, name="service-supervisor", daemon=True)
+            self._monitor.start()
+        return all(state.ready_seconds is not None for state in states)
+
+    def report(self, total_seconds: float):
+        """
+        Print how long each service took to spawn and to become ready.
+
+        :param total_seconds: Seconds start_all took, the cold-start time
+        """
+        print("\nService start-up:")
+        for name, state in self.services.items():
+            if state.ready_seconds is None:
+                outcome = "NOT READY"
+            else:
+                outcome = f"ready in {state.ready_seconds:6.2f}s"
+            print(
+                f"  {name:<16} {outcome} (spawned in {state.spawn_seconds:.2f}s, "
+                f"{state.probe_attempts} readiness probes)"
+            )
+        print(f"  {'total':<16} {total_seconds:.2f}s\n")
+
+    def stop(self):
+        """Stop restarting services, so they can be shut down."""
+        self._stopping.set()
+
+    def wait(self):
+        """Block until stop() is called or every service has been given up on."""
+        while not self._stopping.wait(self.poll_interval):
+            if self.services and all(state.failed for state in self.services.values()):
+                return
+
+    def _spawn(self, state: ServiceState) -> bool:
+        """
+        Launch the process of a service.
+
+        :return: True if the service was launched
+        """
+        spec: ServiceSpec = state.spec
+        state.started_at = time.monotonic()
+        state.ready_seconds = None
+        state.probe_attempts = 0
+        try:
+            state.process = spec.start()
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            print(f"Failed to start {spec.name}: {exception}")
+            return False
+        state.spawn_seconds = time.monotonic() - state.started_at
+        return True
+
+    def _await_ready(self, state: ServiceState) -> bool:
+        """
+        Retry the readiness probes of a spawned service with exponential backoff.
+
+        :return: True if the service became ready
+        """
+        spec: ServiceSpec = state.spec
+        deadline: float = state.started_at + spec.startup_timeout
+        backoff: float = self.initial_backoff
+        while not self._stopping.is_set():
+            state.probe_attempts += 1
+            if all(probe() for probe in spec.probes):
+                state.ready_seconds = time.monotonic() - state.started_at
+                return True
+            if self._exited(state):
+                print(f"{spec.name} exited with code {state.process.poll()} before it was ready.")
+                return False
+            if time.monotonic() + backoff > deadline:
+                print(f"{spec.name} was not ready within {spec.startup_timeout:.0f}s.")
+                return False
+            self._stopping.wait(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+        return False
+
+    def _monitor_loop(self):
+        """Restart services whose process exited, each on its own thread, until stopped."""
+        while not self._stopping.wait(self.poll_interval):
+            for state in list(self.services.values()):
+                if state.failed or state.restarting or not self._exited(state):
+                    continue
+                state.restarting = True
+                threading.Thread(
+                    target=self._restart, args=(state,), name=f"restart-{state.spec.name}", daemon=True
+                ).start()
+
+    def _restart(self, state: ServiceState):
+        """Restart an exited service, unless it already restarted max_restarts times within restart_window."""
+        try:
+            self._restart_once(state)
+        finally:
+            state.restarting = False
+
+    def _restart_once(self, state: ServiceState):
+        """Give up on the service or start it again after a backoff."""
+        name: str = state.spec.name
+        now: float = time.monotonic()
+        while state.restarts and now - state.restarts[0] > self.restart_window:
+            state.restarts.popleft()
+        if len(state.restarts) >= self.max_restarts:
+            print(
+                f"{name} exited with code {state.process.poll()} and restarted {len(state.restarts)} times "
+                f"within {self.restart_window:.0f}s; giving up on it."
+            )
+            state.failed = True
+            return
+
+        delay: float = min(self.initial_backoff * 2 ** len(state.restarts), self.max_backoff)
+        state.restarts.append(now)
+        print(f"{name} exited with code {state.process.poll()}; restarting in {delay:.1f}s...")
+        if self._stopping.wait(delay):
+            return
+        if self._spawn(state) and self._await_ready(state):
+            print(f"{name} restarted and ready in {state.ready_seconds:.2f}s.")
+
+    @staticmethod
+    def _exited(state: ServiceState) -> bool:
+        """:return: True if the service has a process and that process has exited"""
+        poll: Optional[Callable[[], Optional[int]]] = getattr(state.process, "poll", None)
+        return poll is not None and poll() is not None
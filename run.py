@@ -25,11 +25,20 @@ import threading
 import time
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
 from typing import Tuple
 
 from dotenv import load_dotenv
+from plugins.diagrams.diagram_generator import DiagramGenerator
 from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+from plugins.log_bridge.process_log_bridge import log_cfg
 from plugins.phoenix.phoenix_plugin import PhoenixPlugin
+from plugins.supervisor.service_supervisor import ServiceSpec
+from plugins.supervisor.service_supervisor import ServiceSupervisor
+from plugins.supervisor.service_supervisor import grpc_probe
+from plugins.supervisor.service_supervisor import http_probe
 
 
 class NeuroSanRunner:
@@ -65,6 +74,9 @@ class NeuroSanRunner:
             "thinking_file": os.getenv("THINKING_FILE", self.thinking_file),
             "thinking_dir": os.getenv("THINKING_DIR", self.thinking_dir),
             "logbridge_enabled": os.getenv("LOGBRIDGE_ENABLED", "true"),
+            "logbridge_record_store": os.getenv("LOGBRIDGE_RECORD_STORE", "false").lower() == "true",
+            "logbridge_metrics": os.getenv("LOGBRIDGE_METRICS", "false").lower() == "true",
+            "logbridge_metrics_port": int(os.getenv("LOGBRIDGE_METRICS_PORT", str(log_cfg["metrics"]["port"]))),
             # Ensure all paths are resolved relative to `self.root_dir`
             "agent_manifest_file": os.getenv(
                 "AGENT_MANIFEST_FILE", os.path.join(self.root_dir, "registries", "manifest.hocon")
@@ -74,6 +86,11 @@ class NeuroSanRunner:
                 "AGENT_TOOLBOX_INFO_FILE", os.path.join(self.root_dir, "toolbox", "toolbox_info.hocon")
             ),
             "logs_dir": self.logs_dir,
+            "html_in_background": os.getenv("HTML_DIAGRAMS_IN_BACKGROUND", "false").lower() == "true",
+            "html_workers": int(os.getenv("HTML_DIAGRAMS_WORKERS", "0")) or None,
+            "supervise": os.getenv("SUPERVISE_SERVICES", "false").lower() == "true",
+            "service_startup_timeout": float(os.getenv("SERVICE_STARTUP_TIMEOUT", "120")),
+            "service_max_restarts": int(os.getenv("SERVICE_MAX_RESTARTS", "3")),
         }
 
         # Add Phoenix configuration defaults
@@ -87,14 +104,27 @@ class NeuroSanRunner:
         self.args.update(self.parse_args())
 
         if self.args.get("logbridge_enabled"):
+            store_cfg = {
+                **log_cfg["store"],
+                "enabled": self.args.get("logbridge_record_store"),
+                "directory": os.path.join(self.args["logs_dir"], "records"),
+            }
+            metrics_cfg = {
+                **log_cfg["metrics"],
+                "enabled": self.args.get("logbridge_metrics"),
+                "port": self.args.get("logbridge_metrics_port"),
+            }
             self.log_bridge = ProcessLogBridge(
                 level=self.args.get("log_level", "info"),
                 runner_log_file=os.path.join(self.args["logs_dir"], "runner.log"),
+                config={"store": store_cfg, "metrics": metrics_cfg},
             )
         # Process references
         self.server_process = None
         self.flask_webclient_process = None
         self.nsflow_process = None
+        self.started_process_names: Set[str] = set()
+        self.supervisor: Optional[ServiceSupervisor] = None
 
         # Initialize Phoenix manager
         self.phoenix_plugin = PhoenixPlugin(self.args)
@@ -149,6 +179,18 @@ class NeuroSanRunner:
             "--thinking-file", type=str, default=self.args["thinking_file"], help="Path to the agent thinking file"
         )
         parser.add_argument("--no-html", action="store_true", help="Don't generate html for network diagrams")
+        parser.add_argument(
+            "--html-in-background",
+            action="store_true",
+            default=self.args["html_in_background"],
+            help="Generate html for network diagrams in the background once the servers are up",
+        )
+        parser.add_argument(
+            "--supervise",
+            action="store_true",
+            default=self.args["supervise"],
+            help="Start services concurrently, wait for their health checks and restart them if they crash",
+        )
         parser.add_argument(
             "--client-only", action="store_true", help="Run only the nsflow client without NeuroSan server"
         )
@@ -230,22 +272,31 @@ class NeuroSanRunner:
 
         print("\n" + "=" * 50 + "\n")
 
-    @staticmethod
-    def generate_html_files():
-        """Generate .html files for all registry files except manifest.hocon."""
-        for file in glob.glob("./registries/*"):
-            if os.path.basename(file) != "manifest.hocon":
-                print(f"Generating .html file for: {file}")
-                result = subprocess.run(
-                    [sys.executable, "-m", "neuro_san_web_client.agents_diagram_builder", "--input_file", file],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True,
-                    check=True,
-                )
-                print(result.stdout)
-                if result.stderr:
-                    print(result.stderr, file=sys.stderr)
+    def generate_html_files(self, in_background: bool = False):
+        """
+        Generate .html files for all registry files except manifest.hocon, in parallel,
+        skipping files that did not change since their last successful generation.
+        :param in_background: Generate on a background thread instead of waiting for the files
+        """
+        files = sorted(file for file in glob.glob("./registries/*") if os.path.basename(file) != "manifest.hocon")
+        generator = DiagramGenerator(
+            root_dir=self.root_dir,
+            manifest_file=os.path.join(self.args["logs_dir"], "html_diagrams_manifest.json"),
+            max_workers=self.args.get("html_workers"),
+        )
+        if in_background:
+            generator.generate_in_background(files)
+        else:
+            generator.generate(files)
+
+    def generate_html_for_flask(self, deferred: bool):
+        """
+        Generate the network diagrams served by the flask web client, unless disabled with --no-html.
+        :param deferred: True once the servers are up, when diagrams are generated with --html-in-background
+        """
+        if self.args.get("no_html", False) or self.args.get("html_in_background", False) != deferred:
+            return
+        self.generate_html_files(in_background=deferred)
 
     @staticmethod
     def stream_output(pipe, log_file, prefix):
@@ -259,9 +310,14 @@ class NeuroSanRunner:
 
     def start_process(self, command, process_name, log_file):
         """Start a subprocess and capture logs."""
-        # Initialize/clear the log file before starting
-        with open(log_file, "w", encoding="utf-8") as log:
-            log.write(f"Starting {process_name}...\n")
+        # Initialize/clear the log file before starting, but keep the output of a crashed process being restarted
+        if process_name in self.started_process_names:
+            with open(log_file, "a", encoding="utf-8") as log:
+                log.write(f"Restarting {process_name}...\n")
+        else:
+            with open(log_file, "w", encoding="utf-8") as log:
+                log.write(f"Starting {process_name}...\n")
+        self.started_process_names.add(process_name)
 
         # pylint: disable=consider-using-with
         if self.is_windows:
@@ -300,12 +356,20 @@ class NeuroSanRunner:
 
         return process
 
-    def start_phoenix(self):
-        """Start Phoenix server (UI + OTLP HTTP collector) if enabled."""
-        self.phoenix_plugin.start_phoenix_server()
+    def start_phoenix(self, wait: bool = True):
+        """
+        Start Phoenix server (UI + OTLP HTTP collector) if enabled.
+        :param wait: Wait for Phoenix to listen on its port
+        :return: The Phoenix process, None if it was not started
+        """
+        self.phoenix_plugin.start_phoenix_server(wait=wait)
+        return self.phoenix_plugin.phoenix_process
 
     def start_neuro_san(self):
-        """Start the Neuro SAN server."""
+        """
+        Start the Neuro SAN server.
+        :return: The server process
+        """
         print("Starting Neuro SAN server...")
         command = [
             sys.executable,
@@ -320,9 +384,13 @@ class NeuroSanRunner:
         self.server_process = self.start_process(command, "NeuroSan", "logs/server.log")
         print("NeuroSan server grpc started on port: ", self.args["server_grpc_port"])
         print("NeuroSan server http started on port: ", self.args["server_http_port"])
+        return self.server_process
 
     def start_nsflow(self):
-        """Start nsflow client."""
+        """
+        Start nsflow client.
+        :return: The nsflow process
+        """
         print("Starting nsflow client...")
         command = [
             sys.executable,
@@ -337,9 +405,13 @@ class NeuroSanRunner:
 
         self.nsflow_process = self.start_process(command, "nsflow", "logs/nsflow.log")
         print("nsflow client started on port: ", self.args["nsflow_port"])
+        return self.nsflow_process
 
     def start_flask_web_client(self):
-        """Start the Flask web client."""
+        """
+        Start the Flask web client.
+        :return: The web client process
+        """
         print("Starting Flask web client...")
         command = [
             sys.executable,
@@ -357,12 +429,17 @@ class NeuroSanRunner:
         ]
         self.flask_webclient_process = self.start_process(command, "FlaskWebClient", "logs/webclient.log")
         print("Flask web client started on port: ", self.args["web_client_port"])
+        return self.flask_webclient_process
 
     # pylint: disable=unused-argument
     def signal_handler(self, signum, frame):
         """Handle termination signals to cleanly exit."""
         print("\nTermination signal received. Stopping all processes...")
 
+        if self.supervisor:
+            # Keep the supervisor from restarting the processes being stopped
+            self.supervisor.stop()
+
         if self.server_process:
             print(f"\nStopping SERVER (PID {self.server_process.pid})...")
             if self.is_windows:
@@ -462,6 +539,27 @@ class NeuroSanRunner:
             except Exception as e:  # pylint: disable=broad-exception-caught
                 print(f"  Error handling port {port}: {e}")
 
+    def _resolve_port_conflicts(self):
+        """Offer to kill the processes using the ports of the services to start. Exit if the user declines."""
+        port_conflicts, conflicting_ports = self._check_port_conflicts()
+
+        # Exit early if any conflict is found
+        if port_conflicts:
+            print("\n" + "=" * 50)
+            for msg in port_conflicts:
+                print(msg)
+            print("=" * 50)
+
+            # Ask user if they want to kill the processes
+            response = input("\nDo you want to kill the processes using these ports? (yes/no): ").strip().lower()
+
+            if response in ["yes", "y"]:
+                self._kill_processes_on_ports(conflicting_ports)
+                print("\nProcesses killed. Continuing with startup...\n")
+            else:
+                print("\nExiting due to port conflicts.\n")
+                sys.exit(1)
+
     def conditional_start_servers(self):
         """
         Start neuro-san, nsflow, and flask client based on conditions while running on localhost.
@@ -470,7 +568,6 @@ class NeuroSanRunner:
         client_only = self.args["client_only"]
         server_only = self.args["server_only"]
         use_flask = self.args.get("use_flask_web_client", False)
-        no_html = self.args.get("no_html", False)
 
         if client_only and server_only:
             print("Cannot use --client-only and --server-only together.")
@@ -484,32 +581,18 @@ class NeuroSanRunner:
                 print("Flask web client is not available. Please install it with `pip install neuro-san-web-client`.")
                 sys.exit(1)
 
-        port_conflicts, conflicting_ports = self._check_port_conflicts()
-
-        # Exit early if any conflict is found
-        if port_conflicts:
-            print("\n" + "=" * 50)
-            for msg in port_conflicts:
-                print(msg)
-            print("=" * 50)
-
-            # Ask user if they want to kill the processes
-            response = input("\nDo you want to kill the processes using these ports? (yes/no): ").strip().lower()
+        self._resolve_port_conflicts()
 
-            if response in ["yes", "y"]:
-                self._kill_processes_on_ports(conflicting_ports)
-                print("\nProcesses killed. Continuing with startup...\n")
-            else:
-                print("\nExiting due to port conflicts.\n")
-                sys.exit(1)
+        if self.args.get("supervise"):
+            self.start_supervised_services()
+            return
 
         # Start services only if ports are free
         # 1) Phoenix first so other services point OTLP to it
         self.start_phoenix()
         if not server_only:
             if use_flask:
-                if not no_html:
-                    self.generate_html_files()
+                self.generate_html_for_flask(deferred=False)
                 self.start_flask_web_client()
                 print("Flask web-client is now running.")
             else:
@@ -521,6 +604,54 @@ class NeuroSanRunner:
             time.sleep(3)
             print("Neuro-San server is now running.")
 
+        if use_flask and not server_only:
+            self.generate_html_for_flask(deferred=True)
+
+    def start_supervised_services(self):
+        """
+        Start the selected services concurrently, each counted as running once its health check passes,
+        and restart them if they crash.
+        """
+        server_only = self.args["server_only"]
+        use_flask = self.args.get("use_flask_web_client", False)
+        timeout = self.args["service_startup_timeout"]
+        specs: List[ServiceSpec] = []
+
+        # Phoenix is spawned first, so the other services inherit the OTLP endpoint pointing to it
+        if self.phoenix_plugin.autostart_enabled():
+            phoenix_url = f"http://{self.args['phoenix_host']}:{self.args['phoenix_port']}/"
+            specs.append(
+                ServiceSpec("Phoenix", lambda: self.start_phoenix(wait=False), [http_probe(phoenix_url)], timeout)
+            )
+        if not self.args["client_only"]:
+            host = self.args["server_host"]
+            probes = [
+                grpc_probe(host, self.args["server_grpc_port"]),
+                http_probe(f"http://{host}:{self.args['server_http_port']}/healthz"),
+            ]
+            specs.append(ServiceSpec("NeuroSan", self.start_neuro_san, probes, timeout))
+        if not server_only and use_flask:
+            web_client_url = f"http://localhost:{self.args['web_client_port']}/"
+            specs.append(
+                ServiceSpec("FlaskWebClient", self.start_flask_web_client, [http_probe(web_client_url)], timeout)
+            )
+        elif not server_only:
+            nsflow_url = f"http://{self.args['nsflow_host']}:{self.args['nsflow_port']}/"
+            specs.append(ServiceSpec("nsflow", self.start_nsflow, [http_probe(nsflow_url)], timeout))
+
+        # Diagrams are built alongside the services instead of delaying them, or after them with --html-in-background
+        generate_html = use_flask and not server_only and not self.args.get("no_html", False)
+        html_in_background = self.args.get("html_in_background", False)
+        if generate_html and not html_in_background:
+            self.generate_html_files(in_background=True)
+
+        self.supervisor = ServiceSupervisor(max_restarts=self.args["service_max_restarts"])
+        if not self.supervisor.start_all(specs):
+            print("Some services are not ready yet. Check their logs in the logs directory.")
+
+        if generate_html and html_in_background:
+            self.generate_html_files(in_background=True)
+
     def run(self):
         """Run the Neuro SAN server and a client."""
         print("\nInitial Run Config:\n" + "\n".join(f"{key}: {value}" for key, value in self.args.items()) + "\n")
@@ -549,6 +680,10 @@ class NeuroSanRunner:
         print("\n" + "=" * 50 + "\n")
 
         # Wait on active processes to finish
+        if self.supervisor:
+            self.supervisor.wait()
+            print("Every service stopped and could not be restarted.")
+            sys.exit(1)
         if self.nsflow_process:
             self.nsflow_process.wait()
         if self.server_process:
@@ -0,0 +1,70 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import web
+
+from apps.slack.api_client import APIClient
+
+
+class TestAPIClient(IsolatedAsyncioTestCase):
+    """Tests for the streaming APIClient against a local server."""
+
+    async def asyncSetUp(self):
+        self.chunks: list[bytes] = []
+        app = web.Application()
+        app.router.add_post("/api/v1/{network}/streaming_chat", self.streaming_chat)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "localhost", 0)
+        await site.start()
+        self.client = APIClient(str(self.runner.addresses[0][1]))
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.runner.cleanup()
+
+    async def streaming_chat(self, request: web.Request) -> web.StreamResponse:
+        """Send the prepared chunks one by one, so each arrives separately."""
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for chunk in self.chunks:
+            await response.write(chunk)
+            await asyncio.sleep(0.01)
+        await response.write_eof()
+        return response
+
+    async def test_stream_splits_lines_across_chunks(self):
+        """Lines cut by chunk boundaries, several lines in one chunk and a long last line all come out whole."""
+        messages = [{"response": {"text": f"partial {i}"}} for i in range(3)]
+        final = {"response": {"chat_context": {"text": "x" * 200000}}}
+        data = b"".join(json.dumps(message).encode() + b"\n\n" for message in messages) + json.dumps(final).encode()
+        cuts = [0, 5, 30, 31, 90, 4000, len(data)]
+        self.chunks = [data[start:end] for start, end in zip(cuts, cuts[1:])]
+
+        received = [message async for message in self.client.stream("hello/streaming_chat", {})]
+
+        self.assertEqual(messages + [final], received)
+
+    async def test_connection_reads_only_the_status(self):
+        """A network answering with a success status is valid, an unknown route is not."""
+        self.chunks = [b'{"response": {"text": "never read"}}\n']
+
+        self.assertTrue(await self.client.test_connection("hello"))
+        self.assertFalse(await self.client.test_connection("hello/unknown"))
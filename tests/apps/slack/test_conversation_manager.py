@@ -0,0 +1,117 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+import tempfile
+from unittest import TestCase
+
+from apps.slack.conversation_manager import ConversationManager
+from apps.slack.conversation_store import ConversationStore
+from apps.slack.dataclass.thread_context import ThreadContext
+
+LOGGER = logging.getLogger(__name__)
+
+
+class TestConversationManager(TestCase):
+    """Tests for the bounded ConversationManager."""
+
+    def setUp(self):
+        self.now = 1000.0
+        self.clock = lambda: self.now
+
+    def test_contexts_are_kept_per_thread_and_network(self):
+        """Contexts of other networks are cleared only in the thread being answered."""
+        manager = ConversationManager(clock=self.clock)
+        manager.set_context("C1:1.0:alpha", {"turn": 1})
+        manager.set_context("C1:1.0:beta", {"turn": 2})
+        manager.set_context("C1:2.0:beta", {"turn": 3})
+
+        manager.clear_old_contexts(ThreadContext("C1", None, "1.0"), "alpha", LOGGER)
+
+        self.assertEqual({"turn": 1}, manager.get_context("C1:1.0:alpha"))
+        self.assertEqual({}, manager.get_context("C1:1.0:beta"))
+        self.assertEqual({"turn": 3}, manager.get_context("C1:2.0:beta"))
+
+    def test_idle_threads_expire(self):
+        """A thread not used for ttl_seconds is forgotten, one used since is not."""
+        manager = ConversationManager(ttl_seconds=60, clock=self.clock)
+        manager.set_network("C1:1.0", "alpha")
+        manager.set_network("C1:2.0", "beta")
+        self.now += 50
+        self.assertEqual("beta", manager.get_network("C1:2.0"))
+        self.now += 20
+
+        self.assertIsNone(manager.get_network("C1:1.0"))
+        self.assertEqual("beta", manager.get_network("C1:2.0"))
+        self.assertEqual(1, manager.stats()["evicted"])
+
+    def test_least_recently_used_threads_are_evicted_over_the_limits(self):
+        """Beyond max_threads or max_bytes the least recently used threads go first."""
+        manager = ConversationManager(max_threads=2, clock=self.clock)
+        manager.set_network("C1:1.0", "alpha")
+        manager.set_network("C1:2.0", "beta")
+        manager.get_network("C1:1.0")
+        manager.set_network("C1:3.0", "gamma")
+
+        self.assertEqual("alpha", manager.get_network("C1:1.0"))
+        self.assertIsNone(manager.get_network("C1:2.0"))
+
+        manager = ConversationManager(max_bytes=1000, clock=self.clock)
+        manager.set_context("C1:1.0:alpha", {"text": "x" * 600})
+        manager.set_context("C1:2.0:alpha", {"text": "y" * 600})
+        self.assertEqual({}, manager.get_context("C1:1.0:alpha"))
+        self.assertEqual(1, manager.stats()["threads"])
+        self.assertLessEqual(manager.stats()["bytes"], 1000)
+
+    def test_memory_accounting_follows_changes(self):
+        """The accounted size shrinks again when a large context is replaced or evicted."""
+        manager = ConversationManager(ttl_seconds=60, clock=self.clock)
+        manager.set_context("C1:1.0:alpha", {"text": "x" * 5000})
+        large = manager.stats()["bytes"]
+        manager.set_context("C1:1.0:alpha", {"text": "x"})
+        self.assertLess(manager.stats()["bytes"], large - 4000)
+
+        self.now += 61
+        self.assertEqual(0, manager.stats()["bytes"])
+
+    def test_store_restores_active_threads(self):
+        """A new manager on the same store carries on the threads that have not expired."""
+        with tempfile.TemporaryDirectory() as directory:
+            db_file = os.path.join(directory, "slack_state.sqlite")
+            store = ConversationStore(db_file)
+            manager = ConversationManager(ttl_seconds=60, store=store, clock=self.clock)
+            manager.set_network("C1:1.0", "alpha")
+            manager.set_sly_data("C1:1.0", {"x": 7})
+            manager.set_context("C1:1.0:alpha", {"turn": 1})
+            manager.set_network("C1:2.0", "beta")
+            self.now += 30
+            manager.set_network("C1:3.0", "gamma")
+            manager.set_context("C1:3.0:gamma", {"turn": 2})
+            store.close()
+
+            self.now += 40
+            store = ConversationStore(db_file)
+            restarted = ConversationManager(ttl_seconds=60, store=store, clock=self.clock)
+            self.assertIsNone(restarted.get_network("C1:1.0"))
+            self.assertEqual("gamma", restarted.get_network("C1:3.0"))
+            self.assertEqual({"turn": 2}, restarted.get_context("C1:3.0:gamma"))
+            self.assertEqual(1, restarted.stats()["threads"])
+            store.close()
+
+            store = ConversationStore(db_file)
+            self.assertEqual(["C1:3.0"], list(store.load(0)))
+            store.close()
@@ -0,0 +1,161 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import logging
+from typing import Any
+from typing import AsyncIterator
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock
+
+from slack_sdk.errors import SlackApiError
+
+from apps.slack.conversation_manager import ConversationManager
+from apps.slack.dataclass.message_context import MessageContext
+from apps.slack.dataclass.thread_context import ThreadContext
+from apps.slack.network_handler import PLACEHOLDER_TEXT
+from apps.slack.network_handler import NetworkHandler
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FakeClient:
+    """APIClient streaming a fixed list of messages."""
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, messages: list[dict[str, Any]]):
+        self.messages = messages
+        self.payloads: list[dict[str, Any]] = []
+
+    async def stream(self, endpoint: str, payload: dict[str, Any]) -> AsyncIterator[dict[str, Any]]:
+        """Yield the messages, recording the request."""
+        self.payloads.append({"endpoint": endpoint, **payload})
+        for message in self.messages:
+            yield message
+
+
+def make_context(thread_ts: str = "1.0", slack_client: Any = None) -> tuple[MessageContext, MagicMock]:
+    """Return the context of a message in a thread of channel C1, and its say(), which posts at timestamp 2.0."""
+    say = MagicMock(return_value={"ts": "2.0"})
+    return MessageContext(ThreadContext("C1", thread_ts, thread_ts), say, LOGGER, slack_client), say
+
+
+class TestNetworkHandler(IsolatedAsyncioTestCase):
+    """Tests for the streaming NetworkHandler."""
+
+    def setUp(self):
+        self.manager = ConversationManager()
+        self.handler = NetworkHandler(self.manager, FakeClient([]), runner=None, update_interval=0)
+
+    async def test_messages_of_a_thread_are_processed_in_turn(self):
+        """A thread's second message waits for its first, other threads do not, and no lock outlives its thread."""
+        events: list[str] = []
+        release_first = asyncio.Event()
+
+        # pylint: disable=unused-argument
+        async def process(msg_ctx: MessageContext, network_name: str, user_message: str):
+            events.append(f"start {user_message}")
+            if user_message == "a1":
+                await release_first.wait()
+            events.append(f"end {user_message}")
+
+        self.handler._process = process  # pylint: disable=protected-access
+        thread_a, thread_b = make_context("1.0")[0], make_context("9.0")[0]
+        # pylint: disable=protected-access
+        tasks = [
+            asyncio.create_task(self.handler._process_in_turn(thread_a, "hello", "a1")),
+            asyncio.create_task(self.handler._process_in_turn(thread_a, "hello", "a2")),
+            asyncio.create_task(self.handler._process_in_turn(thread_b, "hello", "b1")),
+        ]
+        await asyncio.sleep(0.01)
+        self.assertEqual(["start a1", "start b1", "end b1"], events)
+        self.assertEqual({"C1:1.0": 2}, self.handler._pending_messages)
+
+        release_first.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(["start a1", "start b1", "end b1", "end a1", "start a2", "end a2"], events)
+        self.assertEqual({}, self.handler._thread_locks)
+        self.assertEqual({}, self.handler._pending_messages)
+
+    async def test_lock_is_released_when_processing_fails(self):
+        """A failed message neither blocks the next one of its thread nor leaks its lock."""
+
+        async def process(msg_ctx: MessageContext, network_name: str, user_message: str):
+            raise RuntimeError(user_message)
+
+        self.handler._process = process  # pylint: disable=protected-access
+        with self.assertRaises(RuntimeError):
+            await self.handler._process_in_turn(make_context()[0], "hello", "boom")  # pylint: disable=protected-access
+
+        self.assertEqual({}, self.handler._thread_locks)  # pylint: disable=protected-access
+        self.assertEqual({}, self.handler._pending_messages)  # pylint: disable=protected-access
+
+    async def test_reply_updates_the_placeholder_or_posts(self):
+        """A reply replaces the placeholder, and is posted instead when there is none or it cannot be updated."""
+        slack_client = MagicMock()
+        msg_ctx, say = make_context(slack_client=slack_client)
+
+        await self.handler._reply(msg_ctx, "answer", "2.0")  # pylint: disable=protected-access
+        slack_client.chat_update.assert_called_once_with(channel="C1", ts="2.0", text="answer")
+        say.assert_not_called()
+
+        slack_client.chat_update.side_effect = SlackApiError("message_not_found", {"ok": False})
+        await self.handler._reply(msg_ctx, "answer", "2.0")  # pylint: disable=protected-access
+        say.assert_called_once_with(text="answer", thread_ts="1.0")
+
+        say.reset_mock()
+        await self.handler._reply(msg_ctx, "acknowledged")  # pylint: disable=protected-access
+        say.assert_called_once_with(text="acknowledged", thread_ts="1.0")
+
+    async def test_partial_answers_update_the_placeholder(self):
+        """The placeholder shows each partial answer, then the final answer, and the context is kept."""
+        final = {
+            "response": {
+                "chat_context": {"chat_histories": [{"messages": [{"text": "Hello there!"}]}]},
+            }
+        }
+        self.handler.client = FakeClient([{"response": {"text": "Hel"}}, {"response": {"text": "Hello"}}, final])
+        slack_client = MagicMock()
+        msg_ctx, say = make_context(slack_client=slack_client)
+
+        await self.handler._process(msg_ctx, "hello", "hi")  # pylint: disable=protected-access
+
+        say.assert_called_once_with(text=PLACEHOLDER_TEXT, thread_ts="1.0")
+        texts = [call.kwargs["text"] for call in slack_client.chat_update.call_args_list]
+        self.assertEqual([f"{PLACEHOLDER_TEXT}\nHel", f"{PLACEHOLDER_TEXT}\nHello", "Hello there!"], texts)
+        self.assertEqual(final["response"]["chat_context"], self.manager.get_context("C1:1.0:hello"))
+
+    async def test_partial_answer_is_kept_without_a_final_message(self):
+        """Without a final message the last partial answer is the reply, posted when there is no web client."""
+        self.handler.client = FakeClient([{"response": {"text": "Partial"}}])
+        msg_ctx, say = make_context()
+
+        await self.handler._process(msg_ctx, "hello", "hi")  # pylint: disable=protected-access
+
+        say.assert_called_once_with(text="Partial", thread_ts="1.0")
+
+    async def test_unexpected_error_replaces_the_placeholder(self):
+        """Any failure while answering replaces the placeholder with an error instead of leaving it in the thread."""
+        self.handler.client = FakeClient([{"response": {"text": "Partial"}}, {"response": []}])
+        slack_client = MagicMock()
+        msg_ctx, _ = make_context(slack_client=slack_client)
+
+        await self.handler._process(msg_ctx, "hello", "hi")  # pylint: disable=protected-access
+
+        last_text = slack_client.chat_update.call_args_list[-1].kwargs["text"]
+        self.assertTrue(last_text.startswith("Error processing message:"), last_text)
@@ -0,0 +1,85 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+from coded_tools.industry.news_sentiment_analysis.rate_limiter import TokenBucket
+from coded_tools.industry.news_sentiment_analysis.web_scraping_technician import NYT_BURST
+from coded_tools.industry.news_sentiment_analysis.web_scraping_technician import NYT_RATE
+
+
+class TestTokenBucket(TestCase):
+    """
+    Unit tests for the TokenBucket class, on a simulated clock.
+    """
+
+    def setUp(self):
+        self.now = 0.0
+        self.sleeps = []
+
+        def sleep(seconds: float):
+            self.sleeps.append(seconds)
+            self.now += seconds
+
+        self.sleep = sleep
+
+    def bucket(self, rate: float, capacity: float) -> TokenBucket:
+        """:return: A bucket on the simulated clock"""
+        return TokenBucket(rate, capacity, clock=lambda: self.now, sleep=self.sleep)
+
+    def test_burst_then_rate(self):
+        """A full bucket allows a burst, after which requests are spaced by the rate."""
+        bucket = self.bucket(rate=0.5, capacity=3)
+        waits = [bucket.acquire() for _ in range(5)]
+        self.assertEqual(waits[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(waits[3], 2.0)
+        self.assertAlmostEqual(waits[4], 2.0)
+        self.assertAlmostEqual(self.now, 4.0)
+
+    def test_remaining_header_limits_tokens(self):
+        """No more requests are made right away than the server says remain."""
+        bucket = self.bucket(rate=1.0, capacity=5)
+        bucket.update({"X-RateLimit-Remaining-Minute": "1"})
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 1.0)
+
+    def test_exhausted_quota_waits_for_reset(self):
+        """An exhausted quota pauses every request until the reset time."""
+        bucket = self.bucket(rate=10.0, capacity=10)
+        bucket.update({"X-Rate-Limit-Remaining": "0", "X-Rate-Limit-Reset": "30"})
+        self.assertAlmostEqual(bucket.acquire(), 30.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_limit_header_sets_rate(self):
+        """A per-minute limit announced by the server replaces the configured rate."""
+        bucket = self.bucket(rate=1 / 6, capacity=1)
+        bucket.update({"X-RateLimit-Limit-Minute": "30"})
+        bucket.acquire()
+        self.assertAlmostEqual(bucket.acquire(), 2.0)
+
+    def test_pause(self):
+        """A pause, e.g. from Retry-After, delays the next request even with tokens left."""
+        bucket = self.bucket(rate=1.0, capacity=2)
+        bucket.pause(5.0)
+        self.assertAlmostEqual(bucket.acquire(), 5.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+
+    def test_nyt_quota(self):
+        """The NYT limiter never makes more than the 5 calls per minute the API allows."""
+        bucket = self.bucket(rate=NYT_RATE, capacity=NYT_BURST)
+        for _ in range(6):
+            bucket.acquire()
+        self.assertAlmostEqual(self.now, 60.0)
@@ -0,0 +1,99 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import threading
+from typing import List
+from typing import Optional
+from unittest import TestCase
+
+from coded_tools.industry.news_sentiment_analysis.web_scraping_technician import WebScrapingTechnician
+
+SHARED = "https://example.com/shared"
+TIMEOUT = 5
+
+
+class TestCollect(TestCase):
+    """
+    Unit tests for WebScrapingTechnician.collect, with stubbed listers and scraper.
+    """
+
+    def setUp(self):
+        self.technician = WebScrapingTechnician(article_workers=4)
+        self.scraped = []
+        self.scraped_lock = threading.Lock()
+        self.nyt_scraped = threading.Event()
+        self.nyt_listed = threading.Event()
+        self.guardian_listing = threading.Event()
+
+        def scrape_matching(url: str, source: str, keywords: Optional[List[str]] = None) -> str:
+            with self.scraped_lock:
+                self.scraped.append(url)
+            if source == "nyt":
+                self.nyt_scraped.set()
+            if keywords is not None and "off-topic" in url:
+                return ""
+            return f"{source} article at {url}"
+
+        # pylint: disable=unused-argument
+        def list_nyt(keywords, submit):
+            futures = [submit(SHARED + "#top", "nyt", None)]
+            # listing goes on while the articles found so far are scraped, and alongside the other sources
+            self.assertTrue(self.nyt_scraped.wait(TIMEOUT))
+            self.assertTrue(self.guardian_listing.wait(TIMEOUT))
+            futures.append(submit("https://example.com/nyt-only", "nyt", None))
+            self.nyt_listed.set()
+            return futures
+
+        def list_guardian(keywords, submit, page_size=50):
+            self.guardian_listing.set()
+            self.assertTrue(self.nyt_listed.wait(TIMEOUT))
+            return [
+                submit(SHARED + "/", "guardian", None),
+                submit("https://example.com/guardian-only", "guardian", None),
+            ]
+
+        def list_aljazeera(keywords, submit):
+            return [
+                submit(SHARED, "aljazeera", keywords),
+                submit("https://example.com/off-topic", "aljazeera", keywords),
+                submit(None, "aljazeera", keywords),
+            ]
+
+        self.technician._scrape_matching = scrape_matching  # pylint: disable=protected-access
+        self.technician._list_nyt = list_nyt  # pylint: disable=protected-access
+        self.technician._list_guardian = list_guardian  # pylint: disable=protected-access
+        self.technician._list_aljazeera = list_aljazeera  # pylint: disable=protected-access
+
+    def test_each_article_is_scraped_once_for_the_first_source(self):
+        """An article found by several sources is scraped once and attributed to the source that found it first."""
+        collected = self.technician.collect(["nyt", "guardian"], ["Markets"])
+
+        self.assertEqual(
+            {
+                "nyt": [f"nyt article at {SHARED}#top", "nyt article at https://example.com/nyt-only"],
+                "guardian": ["guardian article at https://example.com/guardian-only"],
+            },
+            collected,
+        )
+        self.assertEqual(3, len(self.scraped))
+        self.assertEqual(1, len([url for url in self.scraped if url.startswith(SHARED)]))
+
+    def test_articles_without_keywords_are_dropped(self):
+        """Articles whose content misses the keywords, and entries without a url, are not collected."""
+        collected = self.technician.collect(["aljazeera"], ["Markets"])
+
+        self.assertEqual({"aljazeera": [f"aljazeera article at {SHARED}"]}, collected)
+        self.assertEqual(sorted([SHARED, "https://example.com/off-topic"]), sorted(self.scraped))
@@ -0,0 +1,162 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import os
+import tempfile
+from datetime import datetime
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.kwik_agents.commit_to_memory import CommitToMemory
+from coded_tools.kwik_agents.recall_memory import RecallMemory
+from coded_tools.kwik_agents.semantic_memory_index import RecalledFact
+from coded_tools.kwik_agents.semantic_memory_index import SemanticMemoryIndex
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
+
+VOCABULARY = ["dog", "cat", "pet", "job", "nurse", "work", "max"]
+
+
+class WordEmbeddings(Embeddings):
+    """
+    Embeds a text as the counts of the vocabulary words in it, counting the texts embedded.
+    """
+
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        words = text.lower().replace(".", " ").split()
+        return [float(words.count(word)) for word in VOCABULARY] + [0.01]
+
+
+class TestSemanticMemoryIndex(TestCase):
+    """
+    Unit tests for the SemanticMemoryIndex class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = TopicMemoryStore(os.path.join(self.temp_dir.name, "TopicMemory.sqlite"))
+        self.embeddings = WordEmbeddings()
+        self.index = SemanticMemoryIndex(self.store, self.embeddings, model="words")
+
+    def tearDown(self):
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def commit(self, topic: str, fact: str):
+        """Store and index a fact the way CommitToMemory does."""
+        self.index.add(self.store.add_fact(topic, fact), topic, fact)
+
+    def test_search_across_topics(self):
+        """
+        Tests that the most relevant facts are found whatever topic they are stored under.
+        """
+        self.commit("pets", "Bill has a dog named Max")
+        self.commit("work", "Bill is a nurse")
+        self.commit("family", "Max sleeps on the dog bed")
+
+        facts = self.index.search("what does Bill do for work", k=1)
+        self.assertEqual(["Bill is a nurse"], [recalled.fact for recalled in facts])
+        facts = self.index.search("tell me about the dog", k=2)
+        self.assertEqual({"pets", "family"}, {recalled.topic for recalled in facts})
+
+    def test_topic_similarity_recalls_its_facts(self):
+        """
+        Tests that a query matching a topic recalls facts under it that share no words with the query.
+        """
+        self.commit("pet", "Bill adopted Whiskers last spring")
+        self.commit("job", "Bill works nights")
+
+        self.assertEqual("pet", self.index.search("pet", k=1)[0].topic)
+
+    def test_refresh_is_incremental(self):
+        """
+        Tests that facts are embedded once, at commit, and facts stored without a vector only at the next search.
+        """
+        self.commit("pets", "Bill has a dog named Max")
+        self.index.search("dog")
+        self.store.add_fact("pets", "Bill has a cat")
+        self.embeddings.embedded.clear()
+
+        self.index.search("cat")
+        self.index.search("cat")
+        self.assertEqual(["Bill has a cat"], self.embeddings.embedded)
+
+    def test_format_caps_size(self):
+        """
+        Tests that less relevant facts are left out beyond the character limit.
+        """
+        created = datetime(2025, 6, 1, 12)
+        facts = [RecalledFact(1.0, "pets", created, "x" * 50), RecalledFact(0.5, "pets", created, "y" * 50)]
+
+        formatted = SemanticMemoryIndex.format_facts(facts, max_chars=100)
+        self.assertEqual("[2025-06-01 12:00:00] (pets) " + "x" * 50, formatted)
+
+
+class TestRecallMemoryByQuery(TestCase):
+    """
+    Unit tests for recalling by query with the RecallMemory tool.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = TopicMemoryStore(os.path.join(self.temp_dir.name, "TopicMemory.sqlite"))
+        self.index = SemanticMemoryIndex(self.store, WordEmbeddings(), model="words")
+        self.patchers = [
+            patch(f"coded_tools.kwik_agents.{module}.get_long_term_memory", return_value=self.store)
+            for module in ("commit_to_memory", "recall_memory")
+        ]
+        self.patchers += [
+            patch(f"coded_tools.kwik_agents.{module}.get_semantic_memory_index", return_value=self.index)
+            for module in ("commit_to_memory", "recall_memory")
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+        CommitToMemory().invoke({"topic": "pets", "new_fact": "Bill has a dog named Max"}, {})
+        CommitToMemory().invoke({"topic": "work", "new_fact": "Bill is a nurse"}, {})
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_query_and_near_miss_topic(self):
+        """
+        Tests that a query, or a topic without facts, recalls relevant facts from any topic.
+        """
+        recalled = RecallMemory().invoke({"query": "Bill's job as a nurse", "top_k": 1}, {})
+        self.assertTrue(recalled.endswith("(work) Bill is a nurse"))
+
+        recalled = RecallMemory().invoke({"topic": "dog"}, {})
+        self.assertTrue(recalled.startswith("[") and "(pets) Bill has a dog named Max" in recalled)
+
+    def test_named_topics_without_embeddings(self):
+        """
+        Tests that topics named in the query are recalled when embeddings are unavailable.
+        """
+        with patch.object(self.index, "search", side_effect=RuntimeError("no api key")):
+            recalled = RecallMemory().invoke({"query": "any news about work?"}, {})
+        self.assertTrue(recalled.endswith("(work) Bill is a nurse"))
@@ -0,0 +1,153 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from unittest import TestCase
+from unittest.mock import patch
+
+from coded_tools.kwik_agents.commit_to_memory import CommitToMemory
+from coded_tools.kwik_agents.list_topics import ListTopics
+from coded_tools.kwik_agents.recall_memory import RecallMemory
+from coded_tools.kwik_agents.topic_memory_store import TopicMemoryStore
+
+
+class TestTopicMemoryStore(TestCase):
+    """
+    Unit tests for the TopicMemoryStore class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.db_file = os.path.join(self.temp_dir.name, "TopicMemory.sqlite")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_facts_with_limit_and_time_range(self):
+        """
+        Tests that recall returns the most recent facts of one topic, oldest first, within the time range.
+        """
+        store = TopicMemoryStore(self.db_file)
+        for day in range(1, 6):
+            store.add_fact("pets", f"fact {day}", datetime(2025, 6, day, 12))
+        store.add_fact("work", "Bill is a nurse", datetime(2025, 6, 3, 12))
+
+        self.assertEqual(["pets", "work"], store.topics())
+        self.assertEqual(["fact 4", "fact 5"], [fact for _, fact in store.facts("pets", limit=2)])
+        since, until = datetime(2025, 6, 2), datetime(2025, 6, 4)
+        self.assertEqual(["fact 2", "fact 3"], [fact for _, fact in store.facts("pets", since=since, until=until)])
+        self.assertEqual(
+            "[2025-06-03 12:00:00] Bill is a nurse", TopicMemoryStore.format_facts(store.facts("work", limit=None))
+        )
+        store.close()
+
+    def test_topic_vector_lookup(self):
+        """
+        Tests that a topic vector is found for its own model only.
+        """
+        store = TopicMemoryStore(self.db_file)
+        store.put_topic_vectors("model-a", {"pets": b"\0" * 8})
+
+        self.assertTrue(store.has_topic_vector("model-a", "pets"))
+        self.assertFalse(store.has_topic_vector("model-b", "pets"))
+        self.assertFalse(store.has_topic_vector("model-a", "work"))
+        store.close()
+
+    def test_concurrent_writers(self):
+        """
+        Tests that writers on separate connections, like separate server processes, lose no facts.
+        """
+        stores = [TopicMemoryStore(self.db_file) for _ in range(4)]
+
+        def write(store: TopicMemoryStore, writer: int):
+            for index in range(50):
+                store.add_fact("shared", f"{writer}-{index}")
+
+        threads = [threading.Thread(target=write, args=(store, writer)) for writer, store in enumerate(stores)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(200, len(stores[0].facts("shared", limit=None)))
+        for store in stores:
+            store.close()
+
+    def test_legacy_json_is_imported_once(self):
+        """
+        Tests that the facts of a TopicMemory.json file are imported when the database is first created only.
+        """
+        json_file = os.path.join(self.temp_dir.name, "TopicMemory.json")
+        memory = {"pets": "[2025-06-01 10:00:00] Bill has a dog named Max\n[2025-06-02 10:00:00] Max is a beagle"}
+        with open(json_file, "w", encoding="utf-8") as file:
+            json.dump(memory, file)
+
+        TopicMemoryStore(self.db_file, json_file).close()
+        store = TopicMemoryStore(self.db_file, json_file)
+
+        self.assertEqual(memory["pets"], TopicMemoryStore.format_facts(store.facts("pets")))
+        store.close()
+
+
+class TestKwikAgentsMemoryTools(TestCase):
+    """
+    Unit tests for the kwik_agents memory tools backed by the memory store.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.store = TopicMemoryStore(os.path.join(self.temp_dir.name, "TopicMemory.sqlite"))
+        self.patchers = [
+            patch(f"coded_tools.kwik_agents.{module}.get_long_term_memory", return_value=self.store)
+            for module in ("commit_to_memory", "list_topics", "recall_memory")
+        ]
+        # Recall by topic only, without an embeddings service
+        self.patchers += [
+            patch(f"coded_tools.kwik_agents.{module}.SEMANTIC_RECALL", False)
+            for module in ("commit_to_memory", "recall_memory")
+        ]
+        for patcher in self.patchers:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in self.patchers:
+            patcher.stop()
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_commit_list_and_recall(self):
+        """
+        Tests that a committed fact is listed and recalled in a later session without any sly_data.
+        """
+        CommitToMemory().invoke({"topic": "pets", "new_fact": "Bill has a dog named Max"}, {})
+
+        self.assertEqual("['pets']", ListTopics().invoke({}, {}))
+        sly_data = {}
+        recalled = RecallMemory().invoke({"topic": "pets", "limit": 5}, sly_data)
+        self.assertTrue(recalled.endswith("] Bill has a dog named Max"))
+        self.assertEqual(recalled, sly_data["TopicMemory"]["pets"])
+        self.assertEqual("NO RELATED MEMORIES!", RecallMemory().invoke({"topic": "work"}, {}))
+
+    def test_recall_rejects_invalid_time(self):
+        """
+        Tests that an invalid time range is reported as an error.
+        """
+        self.assertTrue(RecallMemory().invoke({"topic": "pets", "since": "last week"}, {}).startswith("Error:"))
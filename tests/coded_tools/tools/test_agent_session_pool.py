@@ -0,0 +1,140 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+from coded_tools.tools.agent_session_pool import AgentSessionPool
+from coded_tools.tools.agent_session_pool import SessionKey
+
+KEY_A = SessionKey("agent_a", "direct", "localhost", 30012)
+KEY_B = SessionKey("agent_b", "direct", "localhost", 30012)
+
+
+class FakeSession:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in for an AgentSession that records whether it was closed.
+    """
+
+    def __init__(self, key: SessionKey):
+        self.key = key
+        self.closed = False
+
+    def close(self):
+        """Mark the session closed."""
+        self.closed = True
+
+
+class TestAgentSessionPool(TestCase):
+    """
+    Unit tests for the AgentSessionPool class.
+    """
+
+    def test_sessions_are_reused_per_key(self):
+        """
+        Tests that a released session is handed out again for the same key only.
+        """
+        pool = AgentSessionPool(FakeSession)
+
+        session = pool.acquire(KEY_A)
+        pool.release(KEY_A, session)
+
+        self.assertIs(session, pool.acquire(KEY_A))
+        self.assertIsNot(session, pool.acquire(KEY_B))
+        self.assertEqual({"created": 2, "reused": 1, "idle": 0}, pool.stats())
+
+    def test_concurrent_calls_get_separate_sessions(self):
+        """
+        Tests that overlapping calls never share a session and both sessions are pooled afterwards.
+        """
+        pool = AgentSessionPool(FakeSession)
+
+        def use(session: FakeSession) -> FakeSession:
+            time.sleep(0.01)
+            return session
+
+        async def main():
+            return await asyncio.gather(pool.call(KEY_A, use), pool.call(KEY_A, use))
+
+        first, second = asyncio.run(main())
+
+        self.assertIsNot(first, second)
+        self.assertEqual(2, pool.stats()["idle"])
+
+    def test_failed_call_discards_session(self):
+        """
+        Tests that a session used by a call that raised is closed rather than pooled.
+        """
+        pool = AgentSessionPool(FakeSession)
+        sessions = []
+
+        def fail(session: FakeSession):
+            sessions.append(session)
+            raise RuntimeError("downstream agent failed")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(pool.call(KEY_A, fail))
+
+        self.assertTrue(sessions[0].closed)
+        self.assertEqual(0, pool.stats()["idle"])
+
+    def test_cancelled_call_keeps_session_until_done(self):
+        """
+        Tests that cancelling a call neither closes nor pools its session while the worker thread still uses it.
+        """
+        pool = AgentSessionPool(FakeSession)
+        started = threading.Event()
+        finish = threading.Event()
+        sessions = []
+
+        def block(session: FakeSession):
+            sessions.append(session)
+            started.set()
+            finish.wait(5)
+
+        async def main():
+            task = asyncio.create_task(pool.call(KEY_A, block))
+            await asyncio.to_thread(started.wait, 5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            self.assertFalse(sessions[0].closed)
+            self.assertEqual(0, pool.stats()["idle"])
+            finish.set()
+            # asyncio.run() waits for the worker thread before returning
+
+        asyncio.run(main())
+        self.assertFalse(sessions[0].closed)
+        self.assertEqual(1, pool.stats()["idle"])
+
+    def test_idle_and_size_eviction(self):
+        """
+        Tests that idle sessions expire and that only max_size idle sessions are kept.
+        """
+        pool = AgentSessionPool(FakeSession, max_size=1, idle_seconds=0.05)
+        first, second = pool.acquire(KEY_A), pool.acquire(KEY_B)
+
+        pool.release(KEY_A, first)
+        pool.release(KEY_B, second)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
+
+        time.sleep(0.1)
+        self.assertIsNot(second, pool.acquire(KEY_B))
+        self.assertTrue(second.closed)
@@ -0,0 +1,96 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import threading
+import time
+from typing import List
+from unittest import TestCase
+
+from langchain_core.documents import Document
+
+from coded_tools.tools.document_loading import iter_loaded_documents
+
+
+class SlowLoader:
+    """
+    Blocking loader that records how many sources it loads at the same time.
+    """
+
+    def __init__(self, delays: dict):
+        self.delays = delays
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, source: str) -> List[Document]:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delays.get(source, 0.01))
+            if source == "missing":
+                raise FileNotFoundError(source)
+            if source == "broken":
+                raise RuntimeError(source)
+            return [Document(page_content=source, metadata={"source": source})]
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+async def collect(*args, **kwargs) -> List[str]:
+    """Return the sources yielded by iter_loaded_documents in order."""
+    return [source async for source, _ in iter_loaded_documents(*args, **kwargs)]
+
+
+class TestDocumentLoading(TestCase):
+    """
+    Unit tests for iter_loaded_documents.
+    """
+
+    def test_concurrency_is_bounded(self):
+        """
+        Tests that no more than max_concurrency sources load at the same time.
+        """
+        loader = SlowLoader({})
+        sources = [f"doc{index}" for index in range(8)]
+
+        loaded = asyncio.run(collect(sources, loader, max_concurrency=3))
+
+        self.assertEqual(sorted(sources), sorted(loaded))
+        self.assertLessEqual(loader.max_active, 3)
+        self.assertGreater(loader.max_active, 1)
+
+    def test_yields_in_completion_order(self):
+        """
+        Tests that a fast source is not held back by a slow one listed before it.
+        """
+        loader = SlowLoader({"slow": 0.2, "fast": 0.01})
+
+        loaded = asyncio.run(collect(["slow", "fast"], loader, max_concurrency=2))
+
+        self.assertEqual(["fast", "slow"], loaded)
+
+    def test_handled_errors_skip_source(self):
+        """
+        Tests that a source failing with a handled error is skipped and an unhandled error is raised.
+        """
+        loader = SlowLoader({})
+
+        self.assertEqual(["ok"], asyncio.run(collect(["missing", "ok"], loader, max_concurrency=1)))
+        with self.assertRaises(RuntimeError):
+            asyncio.run(collect(["broken"], loader))
@@ -0,0 +1,117 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+import threading
+from typing import List
+from unittest import TestCase
+
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.tools.embedding_cache import CachedEmbeddings
+from coded_tools.tools.embedding_cache import EmbeddingCache
+
+
+class CountingEmbeddings(Embeddings):
+    """
+    Deterministic embeddings that record every text sent for embedding.
+    """
+
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+
+class TestEmbeddingCache(TestCase):
+    """
+    Unit tests for the EmbeddingCache and CachedEmbeddings classes.
+    """
+
+    def test_only_misses_are_embedded(self):
+        """
+        Tests that chunks already in the cache are not sent to the wrapped embeddings again.
+        """
+        service = CountingEmbeddings()
+        embeddings = CachedEmbeddings(service, EmbeddingCache(path=":memory:"), model="test", dimensions=2)
+
+        first = embeddings.embed_documents(["a", "bb", "a"])
+        second = asyncio.run(embeddings.aembed_documents(["bb", "ccc"]))
+
+        self.assertEqual([[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]], first)
+        self.assertEqual([[2.0, 1.0], [3.0, 1.0]], second)
+        self.assertEqual(["a", "bb", "ccc"], service.embedded)
+        self.assertEqual(1, embeddings.cache.hits)
+        self.assertEqual(4, embeddings.cache.misses)
+
+    def test_async_cache_access_leaves_the_event_loop(self):
+        """
+        Tests that the async path reads and writes SQLite on a worker thread, not on the event loop thread.
+        """
+        cache = EmbeddingCache(path=":memory:")
+        embeddings = CachedEmbeddings(CountingEmbeddings(), cache, model="test", dimensions=2)
+        threads = []
+        for name in ["get_many", "put_many"]:
+            method = getattr(cache, name)
+            setattr(cache, name, lambda *args, method=method: threads.append(threading.get_ident()) or method(*args))
+
+        asyncio.run(embeddings.aembed_documents(["a"]))
+
+        self.assertEqual(2, len(threads))
+        self.assertNotIn(threading.get_ident(), threads)
+
+    def test_key_depends_on_model(self):
+        """
+        Tests that the same text embedded by different models gets different keys.
+        """
+        self.assertNotEqual(EmbeddingCache.make_key("a", 2, "text"), EmbeddingCache.make_key("b", 2, "text"))
+        self.assertNotEqual(EmbeddingCache.make_key("a", 2, "text"), EmbeddingCache.make_key("a", 3, "text"))
+
+    def test_lru_eviction(self):
+        """
+        Tests that the least recently used entries are evicted once the cache is over budget.
+        """
+        # Each two-float vector takes 8 bytes, so only two entries fit
+        cache = EmbeddingCache(path=":memory:", max_bytes=16)
+        cache.put_many({"one": [1.0, 1.0]})
+        cache.put_many({"two": [2.0, 2.0]})
+        cache.get_many(["one"])
+        cache.put_many({"three": [3.0, 3.0]})
+
+        self.assertEqual({"one", "three"}, set(cache.get_many(["one", "two", "three"])))
+        self.assertEqual(16, cache.total_bytes)
+
+    def test_persistence(self):
+        """
+        Tests that cached vectors survive reopening the cache file.
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "cache.sqlite")
+            cache = EmbeddingCache(path=path)
+            cache.put_many({"key": [0.5, 0.25]})
+            cache.close()
+
+            reopened = EmbeddingCache(path=path)
+            self.assertEqual({"key": [0.5, 0.25]}, reopened.get_many(["key"]))
+            self.assertEqual(8, reopened.total_bytes)
+            reopened.close()
@@ -0,0 +1,112 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from typing import AsyncIterator
+from typing import List
+from unittest import TestCase
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.embedding_pipeline import aadd_in_batches
+from coded_tools.tools.embedding_pipeline import abatch_chunks
+from coded_tools.tools.embedding_pipeline import asplit_documents
+
+
+class SlowEmbeddings(Embeddings):
+    """
+    Embeddings that take a while per request and record request sizes and concurrency.
+    """
+
+    def __init__(self):
+        self.request_sizes: List[int] = []
+        self.active = 0
+        self.max_active = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(len(text)), 1.0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.request_sizes.append(len(texts))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return self.embed_documents(texts)
+
+
+async def stream(documents: List[Document]) -> AsyncIterator[Document]:
+    """Yield documents asynchronously."""
+    for document in documents:
+        yield document
+
+
+def chunks(count: int, text: str = "chunk") -> List[Document]:
+    """Return count small documents."""
+    return [Document(page_content=f"{text}{index}") for index in range(count)]
+
+
+class TestEmbeddingPipeline(TestCase):
+    """
+    Unit tests for the streaming split-and-embed pipeline.
+    """
+
+    def test_batches_respect_size_and_chars(self):
+        """
+        Tests that batches are bounded by chunk count and character count.
+        """
+
+        async def collect(batch_size, batch_chars):
+            return [len(batch) async for batch in abatch_chunks(stream(chunks(10)), batch_size, batch_chars)]
+
+        self.assertEqual([4, 4, 2], asyncio.run(collect(4, 10_000)))
+        # Each chunk is 6 characters, so at most 2 fit in 12
+        self.assertEqual([2] * 5, asyncio.run(collect(100, 12)))
+
+    def test_split_documents_streams_chunks(self):
+        """
+        Tests that each document is split as it arrives.
+        """
+
+        def split(docs):
+            return [Document(page_content=part) for doc in docs for part in doc.page_content.split("-")]
+
+        async def collect():
+            return [chunk.page_content async for chunk in asplit_documents(stream(chunks(2, "a-")), split)]
+
+        self.assertEqual(["a", "0", "a", "1"], asyncio.run(collect()))
+
+    def test_add_in_batches(self):
+        """
+        Tests that all chunks are added with several bounded embedding requests in flight, keeping given ids.
+        """
+        embeddings = SlowEmbeddings()
+        store = InMemoryVectorStore(embedding=embeddings)
+        documents = chunks(25)
+        documents[0].id = "first"
+
+        added = asyncio.run(aadd_in_batches(store, stream(documents), batch_size=5, max_in_flight=2))
+
+        self.assertEqual(25, added)
+        self.assertEqual(25, len(store.store))
+        self.assertEqual([5] * 5, embeddings.request_sizes)
+        self.assertEqual(2, embeddings.max_active)
+        self.assertIn("first", store.store)
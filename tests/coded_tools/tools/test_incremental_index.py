@@ -0,0 +1,210 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_text_splitters import TextSplitter
+
+from coded_tools.tools.base_rag import BaseRag
+from coded_tools.tools.base_rag import PostgresConfig
+from coded_tools.tools.incremental_index import IndexManifest
+from coded_tools.tools.incremental_index import chunk_id
+from coded_tools.tools.incremental_index import document_fingerprint
+from coded_tools.tools.incremental_index import document_key
+from coded_tools.tools.incremental_index import group_documents
+from coded_tools.tools.vector_store_registry import get_shared_vector_store_registry
+
+
+def page(source: str, number: int, text: str, **metadata) -> Document:
+    """
+    :return: A document shaped like one page produced by a PDF loader
+    """
+    return Document(page_content=text, metadata={"source": source, "page": number, **metadata})
+
+
+class KeywordEmbeddings(Embeddings):
+    """
+    Embeds text as counts of a few keywords so similarity is predictable.
+    """
+
+    KEYWORDS = ["bag", "flight", "pet"]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(text.count(keyword)) + 0.1 for keyword in self.KEYWORDS]
+
+
+class ListRag(BaseRag):
+    """
+    RAG over the documents in a list that tests edit between calls.
+    """
+
+    def __init__(self, documents: List[Document]):
+        super().__init__()
+        self.documents = documents
+        self.embeddings = KeywordEmbeddings()
+
+    async def load_documents(self, loader_args) -> List[Document]:
+        return list(self.documents)
+
+    def _text_splitter(self) -> TextSplitter:
+        # Measured in characters, so the tests need no tokenizer download
+        return RecursiveCharacterTextSplitter(chunk_size=self.chunk_size, chunk_overlap=self.chunk_overlap)
+
+
+class TestIncrementalIndex(TestCase):
+    """
+    Unit tests for the change detection used by incremental indexing.
+    """
+
+    def _indexed_manifest(self, documents):
+        manifest = IndexManifest()
+        for key, group in group_documents(documents).items():
+            fingerprint = document_fingerprint(group)
+            manifest.record(key, fingerprint, [chunk_id(key, fingerprint, 0)])
+        return manifest
+
+    def test_only_changed_and_removed_documents_are_reported(self):
+        """
+        Tests that unchanged pages are skipped while chunks of changed and removed pages are stale.
+        """
+        manifest = self._indexed_manifest([page("a.pdf", 0, "one"), page("a.pdf", 1, "two"), page("b.pdf", 0, "x")])
+        old_ids = {key: entry["chunk_ids"][0] for key, entry in manifest.documents.items()}
+
+        changes = manifest.diff([page("a.pdf", 0, "one"), page("a.pdf", 1, "two, edited")])
+
+        self.assertEqual(["a.pdf#page=1"], list(changes.changed))
+        self.assertEqual(["b.pdf#page=0"], changes.removed_keys)
+        self.assertEqual({old_ids["a.pdf#page=1"], old_ids["b.pdf#page=0"]}, set(changes.stale_chunk_ids))
+        self.assertEqual(1, changes.unchanged_count)
+
+    def test_validator_metadata_changes_fingerprint(self):
+        """
+        Tests that a new modification time marks a page as changed even with identical text.
+        """
+        before = document_fingerprint([page("a.pdf", 0, "same", modDate="D:20250101")])
+        after = document_fingerprint([page("a.pdf", 0, "same", modDate="D:20250202")])
+        self.assertNotEqual(before, after)
+
+    def test_keys_prefer_ids(self):
+        """
+        Tests that Confluence page ids take precedence over the source URL.
+        """
+        document = Document(page_content="", metadata={"id": "123", "source": "https://wiki/page"})
+        self.assertEqual("123", document_key(document))
+
+    def test_manifest_round_trip(self):
+        """
+        Tests that a saved manifest reports no changes for the same documents.
+        """
+        documents = [page("a.pdf", 0, "one")]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "index.manifest.json")
+            self._indexed_manifest(documents).save(path)
+            changes = IndexManifest.load(path).diff(documents)
+
+        self.assertEqual({}, changes.changed)
+        self.assertEqual([], changes.stale_chunk_ids)
+
+    def test_registered_store_is_reused_until_reindex_interval(self):
+        """
+        Tests that an incrementally indexed store is served from the registry without reloading the sources.
+        """
+        documents = [page("a.pdf", 0, "bag rules")]
+        environment = {"OPENAI_API_KEY": "test", "EMBEDDING_CACHE_ENABLED": "false"}
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, environment):
+            get_shared_vector_store_registry().clear()
+            rag = ListRag(documents)
+            rag.use_vector_store_registry = True
+            rag.configure_incremental_indexing(True, reindex_interval=3600)
+            rag.abs_vector_store_path = os.path.join(temp_dir, "store.npy")
+
+            with patch.object(rag, "load_documents", wraps=rag.load_documents) as load_documents:
+                first = asyncio.run(rag.generate_vector_store("docs"))
+                documents.append(page("b.pdf", 0, "pet policy"))
+                second = asyncio.run(rag.generate_vector_store("docs"))
+
+            self.assertIs(first, second)
+            self.assertEqual(1, load_documents.call_count)
+
+    def test_edits_are_indexed_with_the_registry_enabled(self):
+        """
+        Tests that an edited source is re-indexed on the next call once the reindex interval has passed.
+        """
+        documents = [page("a.pdf", 0, "bag rules"), page("b.pdf", 0, "flight changes")]
+        environment = {"OPENAI_API_KEY": "test", "EMBEDDING_CACHE_ENABLED": "false"}
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, environment):
+            get_shared_vector_store_registry().clear()
+            rag = ListRag(documents)
+            rag.use_vector_store_registry = True
+            rag.configure_incremental_indexing(True, reindex_interval=0)
+            rag.abs_vector_store_path = os.path.join(temp_dir, "store.npy")
+
+            first = asyncio.run(rag.generate_vector_store("docs"))
+            self.assertEqual(2, len(first))
+
+            documents[1] = page("b.pdf", 0, "pet policy")
+            second = asyncio.run(rag.generate_vector_store("docs"))
+            self.assertEqual(["bag rules", "pet policy"], sorted(second.texts))
+            self.assertEqual("pet policy", asyncio.run(rag.query_vectorstore(second, "pet")).split("\n")[0])
+
+    def test_store_without_manifest_is_rebuilt(self):
+        """
+        Tests that enabling incremental indexing on a saved vector store rebuilds it instead of duplicating its chunks.
+        """
+        documents = [page("a.pdf", 0, "bag rules"), page("b.pdf", 0, "flight changes")]
+        environment = {"OPENAI_API_KEY": "test", "EMBEDDING_CACHE_ENABLED": "false"}
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, environment):
+            rag = ListRag(documents)
+            rag.use_vector_store_registry = False
+            rag.save_vector_store = True
+            rag.abs_vector_store_path = os.path.join(temp_dir, "store.npy")
+            self.assertEqual(2, len(asyncio.run(rag.generate_vector_store("docs"))))
+
+            rag.incremental_indexing = True
+            store = asyncio.run(rag.generate_vector_store("docs"))
+            self.assertEqual(["bag rules", "flight changes"], sorted(store.texts))
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "store.manifest.json")))
+
+    @patch("coded_tools.tools.base_rag.PGVectorStore.create", new_callable=AsyncMock)
+    @patch("coded_tools.tools.base_rag.get_shared_pg_engine_pool")
+    def test_table_without_manifest_is_refused(self, get_pool, _create):
+        """
+        Tests that incremental indexing refuses a postgres table that holds chunks no manifest tracks.
+        """
+        get_pool.return_value.table_exists = AsyncMock(return_value=True)
+        get_pool.return_value.table_has_rows = AsyncMock(return_value=True)
+        config = PostgresConfig(user="u", password="p", host="h", port="5432", database="d", table_name="chunks")
+        environment = {"OPENAI_API_KEY": "test", "EMBEDDING_CACHE_ENABLED": "false"}
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ, environment):
+            rag = ListRag([page("a.pdf", 0, "bag rules")])
+            rag.use_vector_store_registry = False
+            rag.incremental_indexing = True
+            rag.abs_index_manifest_path = os.path.join(temp_dir, "chunks.manifest.json")
+
+            with self.assertRaises(ValueError):
+                asyncio.run(rag.generate_vector_store("docs", postgres_config=config, vector_store_type="postgres"))
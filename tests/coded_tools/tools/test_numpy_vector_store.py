@@ -0,0 +1,113 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+import os
+import tempfile
+from typing import List
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from coded_tools.tools.numpy_vector_store import NumpyVectorStore
+
+
+class KeywordEmbeddings(Embeddings):
+    """
+    Embeds text as counts of a few keywords so similarity is predictable.
+    """
+
+    KEYWORDS = ["bag", "flight", "pet"]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return [float(text.count(keyword)) for keyword in self.KEYWORDS]
+
+
+DOCUMENTS = [
+    Document(page_content="bag bag rules", metadata={"source": "bags"}),
+    Document(page_content="flight changes", metadata={"source": "flights"}),
+    Document(page_content="pet in cabin with a bag", metadata={"source": "pets"}),
+]
+
+
+class TestNumpyVectorStore(TestCase):
+    """
+    Unit tests for the NumpyVectorStore class.
+    """
+
+    def test_similarity_search(self):
+        """
+        Tests that results are ordered by cosine similarity.
+        """
+        store = asyncio.run(NumpyVectorStore.afrom_documents(DOCUMENTS, KeywordEmbeddings()))
+        results = store.similarity_search_with_score("pet", k=2)
+
+        self.assertEqual(["pets", "bags"], [doc.metadata["source"] for doc, _ in results])
+        self.assertAlmostEqual(1 / np.sqrt(2), results[0][1], places=5)
+
+    def test_dump_and_memory_mapped_load(self):
+        """
+        Tests that a dumped store is memory-mapped on load and answers the same queries.
+        """
+        store = NumpyVectorStore.from_documents(DOCUMENTS, KeywordEmbeddings())
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "store.npy")
+            store.dump(path)
+            self.assertTrue(os.path.exists(os.path.join(temp_dir, "store.docs.jsonl")))
+
+            loaded = NumpyVectorStore.load(path, KeywordEmbeddings())
+            self.assertIsInstance(loaded.vectors, np.memmap)
+            self.assertEqual(store.ids, loaded.ids)
+            self.assertEqual(
+                [doc.page_content for doc in store.similarity_search("flight", k=3)],
+                [doc.page_content for doc in loaded.similarity_search("flight", k=3)],
+            )
+
+            # Appending to a mapped store must not write through to the file
+            loaded.add_texts(["pet pet"])
+            self.assertEqual(4, len(loaded))
+            self.assertEqual(3, len(NumpyVectorStore.load(path, KeywordEmbeddings())))
+
+    def test_delete(self):
+        """
+        Tests that deleted chunks are no longer returned.
+        """
+        store = NumpyVectorStore.from_documents(DOCUMENTS, KeywordEmbeddings())
+        self.assertTrue(store.delete([store.ids[0]]))
+        self.assertEqual(["flights", "pets"], [doc.metadata["source"] for doc in store.get_by_ids(store.ids)])
+        self.assertEqual("pets", store.similarity_search("bag", k=1)[0].metadata["source"])
+
+    def test_batches_share_a_growing_buffer(self):
+        """
+        Tests that appending many batches keeps every row and does not copy the matrix on every batch.
+        """
+        store = NumpyVectorStore(KeywordEmbeddings())
+        buffers = set()
+        for batch in range(100):
+            store.add_texts([f"bag {'pet ' * batch}", "flight"])
+            buffers.add(id(store.vectors.base))
+
+        self.assertEqual((200, 3), store.vectors.shape)
+        # Geometric growth reallocates about log2(200) times
+        self.assertLessEqual(len(buffers), 9)
+        self.assertEqual(store.texts[198], "bag " + "pet " * 99)
+        np.testing.assert_allclose(store.vectors[199], [0.0, 1.0, 0.0])
+        self.assertEqual("flight", store.similarity_search("flight", k=1)[0].page_content)
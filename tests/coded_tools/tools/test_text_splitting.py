@@ -0,0 +1,107 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import re
+import string
+from typing import List
+from typing import Tuple
+from unittest import TestCase
+
+from coded_tools.tools.text_splitting import TokenBoundaryTextSplitter
+
+
+class WordEncoding:
+    """
+    Stand-in for a tiktoken Encoding where every token is a word with its leading whitespace,
+    or a run of two letters for long words.
+    """
+
+    def __init__(self):
+        self.pieces: List[str] = []
+        self.encode_calls = 0
+
+    def encode_ordinary(self, text: str) -> List[int]:
+        """Return one token per piece of text."""
+        self.encode_calls += 1
+        tokens: List[int] = []
+        for piece in re.findall(r"\s*\w{1,2}|\s*[^\w\s]|\s+", text):
+            self.pieces.append(piece)
+            tokens.append(len(self.pieces) - 1)
+        return tokens
+
+    def decode_with_offsets(self, tokens: List[int]) -> Tuple[str, List[int]]:
+        """Return the text of the tokens and the offset at which each token starts."""
+        offsets: List[int] = []
+        text: str = ""
+        for token in tokens:
+            offsets.append(len(text))
+            text += self.pieces[token]
+        return text, offsets
+
+
+class TestTokenBoundaryTextSplitter(TestCase):
+    """
+    Unit tests for the TokenBoundaryTextSplitter class.
+    """
+
+    def test_chunks_respect_size_and_overlap(self):
+        """
+        Tests that chunks are at most chunk_size tokens, overlap, and cover the whole text.
+        """
+        encoding = WordEncoding()
+        splitter = TokenBoundaryTextSplitter(encoding, chunk_size=4, chunk_overlap=1)
+        text = "a b c d e f g h i j"
+
+        chunks = splitter.split_text(text)
+
+        self.assertEqual(["a b c d", "d e f g", "g h i j"], chunks)
+        # The text is encoded once, no matter how many chunks it yields
+        self.assertEqual(1, encoding.encode_calls)
+
+    def test_prefers_sentence_then_word_boundaries(self):
+        """
+        Tests that windows end after a sentence end or between words rather than inside a word.
+        """
+        splitter = TokenBoundaryTextSplitter(WordEncoding(), chunk_size=6, chunk_overlap=0)
+
+        self.assertEqual(["a b c.", "d e f g h i"], splitter.split_text("a b c. d e f g h i"))
+        # "abcdef" is three tokens, so a window of 4 would cut it; the cut moves to the preceding space
+        self.assertEqual(
+            ["x y", "abcdef z"],
+            TokenBoundaryTextSplitter(WordEncoding(), chunk_size=4, chunk_overlap=0).split_text("x y abcdef z"),
+        )
+
+    def test_short_windows_still_advance(self):
+        """
+        Tests that windows shortened to a sentence end do not repeat their overlap over and over.
+        """
+        letters = string.digits + string.ascii_lowercase
+        words = [first + second for first in letters for second in letters]
+        # 20 sentences of 60 tokens each, so every window of 100 is cut back to a sentence end
+        text = " ".join(" ".join(words[index * 59 : (index + 1) * 59]) + "." for index in range(20))
+        splitter = TokenBoundaryTextSplitter(WordEncoding(), chunk_size=100, chunk_overlap=50)
+
+        chunks = splitter.split_text(text)
+
+        self.assertEqual(29, len(chunks))
+        for previous, current in zip(chunks, chunks[1:]):
+            self.assertNotEqual(previous.split()[-1], current.split()[-1])
+
+    def test_empty_text(self):
+        """
+        Tests that empty text yields no chunks.
+        """
+        self.assertEqual([], TokenBoundaryTextSplitter(WordEncoding(), chunk_size=4, chunk_overlap=1).split_text(""))
@@ -0,0 +1,69 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+from unittest import TestCase
+
+import numpy as np
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from coded_tools.tools.vector_search import VectorSearchIndex
+from coded_tools.tools.vector_search import normalize_rows
+from coded_tools.tools.vector_search import top_k_similar
+
+
+class TestVectorSearch(TestCase):
+    """
+    Unit tests for the vectorized top-k search.
+    """
+
+    def test_top_k_matches_full_sort(self):
+        """
+        Tests that partial selection returns the same rows, in the same order, as sorting every score.
+        """
+        rng = np.random.default_rng(seed=7)
+        matrix = normalize_rows(rng.normal(size=(200, 16)))
+        queries = normalize_rows(rng.normal(size=(5, 16)))
+
+        rows, scores = top_k_similar(matrix, queries, k=10)
+
+        expected_rows = np.argsort(-(queries @ matrix.T), axis=1)[:, :10]
+        np.testing.assert_array_equal(expected_rows, rows)
+        self.assertTrue(np.all(np.diff(scores, axis=1) <= 0))
+
+    def test_k_larger_than_store(self):
+        """
+        Tests that asking for more results than there are rows returns every row.
+        """
+        matrix = normalize_rows([[1.0, 0.0], [0.0, 1.0]])
+        rows, _ = top_k_similar(matrix, normalize_rows([[0.0, 1.0]]), k=4)
+        self.assertEqual([[1, 0]], rows.tolist())
+
+    def test_index_matches_in_memory_vector_store(self):
+        """
+        Tests that a batch search over an InMemoryVectorStore returns what the store returns per query.
+        """
+        embeddings = DeterministicFakeEmbedding(size=32)
+        store = InMemoryVectorStore.from_texts([f"chunk {i}" for i in range(50)], embeddings)
+        queries = ["first question", "second question", "third question"]
+
+        index = VectorSearchIndex.for_vector_store(store)
+        batch = index.search([embeddings.embed_query(query) for query in queries], k=4)
+
+        for query, hits in zip(queries, batch):
+            expected = [doc.page_content for doc in store.similarity_search(query, k=4)]
+            self.assertEqual(expected, [doc.page_content for doc, _ in hits])
+        self.assertIs(index, VectorSearchIndex.for_vector_store(store))
@@ -0,0 +1,108 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import asyncio
+from unittest import TestCase
+
+from coded_tools.tools.vector_store_registry import VectorStoreRegistry
+
+
+class FakeStore:
+    """
+    Stand-in for an InMemoryVectorStore holding a single two-float vector.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.store = {"id": {"vector": [0.0, 0.0], "text": "", "metadata": {}}}
+
+
+class TestVectorStoreRegistry(TestCase):
+    """
+    Unit tests for the VectorStoreRegistry class.
+    """
+
+    def test_concurrent_builds_are_shared(self):
+        """
+        Tests that simultaneous requests for the same key await a single build.
+        """
+        registry = VectorStoreRegistry()
+        builds = []
+
+        async def build():
+            builds.append(1)
+            await asyncio.sleep(0.01)
+            return FakeStore("shared")
+
+        async def request_many():
+            key = VectorStoreRegistry.make_key(urls=["a.pdf"])
+            return await asyncio.gather(*(registry.get_or_build(key, build) for _ in range(5)))
+
+        stores = asyncio.run(request_many())
+
+        self.assertEqual(1, len(builds))
+        self.assertTrue(all(store is stores[0] for store in stores))
+
+    def test_key_ignores_argument_order(self):
+        """
+        Tests that keys only depend on the content of the parts.
+        """
+        self.assertEqual(
+            VectorStoreRegistry.make_key(loader_args={"a": 1, "b": 2}, chunk_size=100),
+            VectorStoreRegistry.make_key(chunk_size=100, loader_args={"b": 2, "a": 1}),
+        )
+
+    def test_ttl_and_memory_eviction(self):
+        """
+        Tests that expired and least recently used entries are rebuilt.
+        """
+        # Each fake store is estimated at 16 bytes, so two fit
+        registry = VectorStoreRegistry(max_bytes=32)
+
+        async def build_all():
+            for name in ["one", "two", "one", "three", "two"]:
+                await registry.get_or_build(name, lambda name=name: asyncio.sleep(0, FakeStore(name)))
+
+        asyncio.run(build_all())
+        # "two" was evicted when "three" arrived, because "one" had been used more recently
+        self.assertEqual({"hits": 1, "misses": 4, "entries": 2, "bytes": 32}, registry.stats())
+
+        registry.ttl_seconds = -1
+        asyncio.run(registry.get_or_build("one", lambda: asyncio.sleep(0, FakeStore("one"))))
+        self.assertEqual(1, registry.stats()["entries"])
+
+    def test_none_is_not_registered(self):
+        """
+        Tests that failed builds returning None are retried on the next request.
+        """
+        registry = VectorStoreRegistry()
+        asyncio.run(registry.get_or_build("key", lambda: asyncio.sleep(0, None)))
+        self.assertEqual(0, registry.stats()["entries"])
+
+    def test_numpy_store_size(self):
+        """
+        Tests that a NumpyVectorStore is sized by its matrix and texts, so the memory budget applies to it.
+        """
+        # pylint: disable=import-outside-toplevel
+        import numpy as np
+        from langchain_core.embeddings import FakeEmbeddings
+
+        from coded_tools.tools.numpy_vector_store import NumpyVectorStore
+
+        store = NumpyVectorStore(FakeEmbeddings(size=256))
+        store.add_texts(["a" * 100] * 10)
+        size = VectorStoreRegistry.estimate_size(store)
+        self.assertGreaterEqual(size, 10 * 256 * np.dtype(np.float32).itemsize + 1000)
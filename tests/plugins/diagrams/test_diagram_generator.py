@@ -0,0 +1,121 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import os
+import subprocess
+import tempfile
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+from plugins.diagrams.diagram_generator import DiagramGenerator
+
+
+class TestDiagramGenerator(TestCase):
+    """
+    Unit tests for the DiagramGenerator class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.root: str = self.temp_dir.name
+        os.makedirs(os.path.join(self.root, "registries"))
+        os.makedirs(os.path.join(self.root, "static"))
+        self.common: str = self.write("registries/common.hocon", '{"llm_config": {"model_name": "gpt-4o"}}')
+        self.network: str = self.write("registries/network.hocon", 'include "registries/common.hocon"\n{"tools": []}')
+        self.other: str = self.write("registries/other.hocon", '{"tools": []}')
+        self.built: List[str] = []
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, content: str) -> str:
+        """Write a file below the temporary root and return its path."""
+        path = os.path.join(self.root, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(content)
+        return path
+
+    def output_file(self, file: str) -> str:
+        """Return where the fake builder writes the diagram of a file."""
+        return os.path.join(self.root, "static", os.path.basename(file) + ".html")
+
+    def build(self, file: str):
+        """Record a built file and write its diagram instead of running the builder."""
+        self.built.append(file)
+        self.write(os.path.join("static", os.path.basename(file) + ".html"), "<html></html>")
+
+    def generate(self, files: List[str]):
+        """Run a generator sharing one manifest, recording the files it built instead of running the builder."""
+        generator = DiagramGenerator(self.root, os.path.join(self.root, "logs", "manifest.json"), max_workers=2)
+        with patch.object(DiagramGenerator, "_build", side_effect=self.build):
+            with patch.object(DiagramGenerator, "_output_file", side_effect=self.output_file):
+                generator.generate(files)
+
+    def test_unchanged_files_are_skipped(self):
+        """
+        Tests that a second run builds nothing when no file changed.
+        """
+        self.generate([self.network, self.other])
+        self.assertEqual(sorted([self.network, self.other]), sorted(self.built))
+
+        self.built.clear()
+        self.generate([self.network, self.other])
+        self.assertEqual([], self.built)
+
+    def test_changed_include_rebuilds_including_file(self):
+        """
+        Tests that changing an included file rebuilds only the networks including it.
+        """
+        self.generate([self.network, self.other])
+        self.built.clear()
+
+        self.write("registries/common.hocon", '{"llm_config": {"model_name": "gpt-4.1"}}')
+        self.generate([self.network, self.other])
+        self.assertEqual([self.network], self.built)
+
+    def test_missing_diagram_is_rebuilt(self):
+        """
+        Tests that an unchanged file is rebuilt when its .html file was removed.
+        """
+        self.generate([self.network, self.other])
+        self.built.clear()
+
+        os.remove(self.output_file(self.other))
+        self.generate([self.network, self.other])
+        self.assertEqual([self.other], self.built)
+
+    def test_failed_build_is_retried(self):
+        """
+        Tests that a failed build is reported after the others finish and is not recorded as built.
+        """
+
+        def build(file: str):
+            if file == self.network:
+                raise subprocess.CalledProcessError(1, "builder", stderr="bad hocon")
+            self.build(file)
+
+        generator = DiagramGenerator(self.root, os.path.join(self.root, "logs", "manifest.json"))
+        with patch.object(DiagramGenerator, "_build", side_effect=build):
+            with patch.object(DiagramGenerator, "_output_file", side_effect=self.output_file):
+                with self.assertRaises(subprocess.CalledProcessError):
+                    generator.generate([self.network, self.other])
+        self.assertEqual([self.other], self.built)
+
+        self.built.clear()
+        self.generate([self.network, self.other])
+        self.assertEqual([self.network], self.built)
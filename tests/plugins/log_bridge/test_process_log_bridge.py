@@ -0,0 +1,185 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import List
+from typing import Tuple
+from unittest import TestCase
+from unittest.mock import patch
+
+from plugins.log_bridge import process_log_bridge
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+
+# Writes 2000 lines to stdout in uneven chunks, so lines and a multi-byte character straddle chunk boundaries,
+# plus an error line and an unterminated last line on stderr
+CHILD = r"""
+import os, sys
+data = "".join(f"line {i} é\n" for i in range(2000)).encode()
+for start in range(0, len(data), 997):
+    os.write(1, data[start:start + 997])
+os.write(2, b"ERROR something broke\r\nno newline at the end")
+"""
+
+
+class TestProcessLogBridge(TestCase):
+    """
+    Unit tests for the ProcessLogBridge drain engine.
+    """
+
+    def setUp(self):
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.log_file = os.path.join(self.temp_dir.name, "child.log")
+
+    def tearDown(self):
+        logging.getLogger().handlers[:] = self.root_handlers
+        self.temp_dir.cleanup()
+
+    def run_child(self, bridge: ProcessLogBridge):
+        """Run the child process through the bridge and wait until both of its pipes are closed."""
+        # pylint: disable=consider-using-with
+        process = subprocess.Popen([sys.executable, "-c", CHILD], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        bridge.attach_process_logger(process, "child", self.log_file)
+        process.wait(timeout=30)
+        deadline = time.monotonic() + 10
+        while not (process.stdout.closed and process.stderr.closed) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_every_line_is_teed_and_rendered(self):
+        """
+        Tests that chunked reads yield the same lines as the child wrote, both in the log file and on the console.
+        """
+        bridge = ProcessLogBridge(level="DEBUG")
+        rendered: List[str] = []
+        bridge._render_entry = lambda state, entry: rendered.append(entry[1])  # pylint: disable=protected-access
+
+        self.run_child(bridge)
+        deadline = time.monotonic() + 10
+        while len(rendered) < 2002 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        with open(self.log_file, encoding="utf-8") as log:
+            teed = log.read().splitlines()
+        expected = [f"line {i} é" for i in range(2000)]
+        self.assertEqual(expected, [line for line in teed if line.startswith("line")])
+        self.assertIn("ERROR something broke", teed)
+        self.assertIn("no newline at the end", teed)
+        self.assertEqual(sorted(teed), sorted(rendered))
+
+    def test_full_render_queue_drops_and_summarizes(self):
+        """
+        Tests that with the "drop" policy a stalled console skips lines, and that the skipped lines are counted.
+        """
+        bridge = ProcessLogBridge(config={"drain": {"render_queue_size": 1, "summary_interval": 0.05}})
+        release = threading.Event()
+        summaries: List[str] = []
+        bridge._render_entry = lambda state, entry: release.wait()  # pylint: disable=protected-access
+        bridge._log = lambda state, level, msg: summaries.append(msg)  # pylint: disable=protected-access
+
+        self.run_child(bridge)
+        release.set()
+        deadline = time.monotonic() + 10
+        while not summaries and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        self.assertTrue(summaries)
+        self.assertIn("lines not shown here", summaries[0])
+        with open(self.log_file, encoding="utf-8") as log:
+            self.assertEqual(2002, len(log.read().splitlines()))
+
+
+class TestLineClassifier(TestCase):
+    """
+    Unit tests for the ProcessLogBridge fast paths.
+    """
+
+    def setUp(self):
+        self.root_handlers = logging.getLogger().handlers[:]
+        self.bridge = ProcessLogBridge()
+        self.logged: List[Tuple[int, str]] = []
+        # pylint: disable=protected-access
+        self.state = self.bridge._make_stream_state("child", None)
+        self.bridge._log = lambda state, level, msg: self.logged.append((level, msg))
+
+    def tearDown(self):
+        logging.getLogger().handlers[:] = self.root_handlers
+
+    def test_classify_line(self):
+        """
+        Tests that only lines which can hold JSON are sent to the JSON parser.
+        """
+        # pylint: disable=protected-access
+        self.assertEqual("json", ProcessLogBridge._classify_line('  {"message": "hi"}'))
+        self.assertEqual("json", ProcessLogBridge._classify_line("-1.5e3"))
+        self.assertEqual("fragment", ProcessLogBridge._classify_line('Request reporting: {"a": 1}'))
+        self.assertEqual("text", ProcessLogBridge._classify_line("2025-06-01 12:00:00 INFO server started"))
+        self.assertEqual("text", ProcessLogBridge._classify_line("nothing to see"))
+        self.assertEqual("traceback", ProcessLogBridge._classify_line("Traceback (most recent call last):"))
+        self.assertEqual("traceback", ProcessLogBridge._classify_line('  File "x.py", line 3, in f'))
+        self.assertEqual("traceback", ProcessLogBridge._classify_line('    f({"a": 1})', in_traceback=True))
+        self.assertEqual("traceback", ProcessLogBridge._classify_line("KeyError: {'a'}", in_traceback=True))
+        self.assertEqual("fragment", ProcessLogBridge._classify_line('    f({"a": 1})'))
+
+    def test_brace_count_ignores_quoted_and_escaped_braces(self):
+        """
+        Tests brace counting against lines with braces in strings, escaped quotes and escaped braces.
+        """
+        # pylint: disable=protected-access
+        self.assertEqual(0, ProcessLogBridge._count_braces_outside_quotes("no braces"))
+        self.assertEqual(1, ProcessLogBridge._count_braces_outside_quotes('{"a": "}}", "b": "\\"{"'))
+        self.assertEqual(-1, ProcessLogBridge._count_braces_outside_quotes("\\{ }"))
+        self.assertEqual(1, ProcessLogBridge._count_braces_outside_quotes('{ "unterminated }'))
+
+    def test_lines_are_handled_the_same_with_either_json_backend(self):
+        """
+        Tests JSON, multi-line JSON and text handling with orjson, when installed, and with the json module.
+        """
+        lines = ['{"message": "hi", "message_type": "Error"}', "{", '  "a": 1', "}", "WARNING low disk"]
+        results = []
+        for backend in (process_log_bridge.orjson, None):
+            self.logged.clear()
+            with patch.object(process_log_bridge, "orjson", backend):
+                for line in lines:
+                    self.bridge._handle_line(self.state, line)  # pylint: disable=protected-access
+            results.append(list(self.logged))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual([logging.ERROR, logging.INFO, logging.WARNING], [level for level, _ in results[1]])
+        self.assertIn('"a": 1', results[1][1][1])
+
+    def test_traceback_lines_skip_json_reassembly(self):
+        """
+        Tests that a traceback quoting code with braces is logged line by line as errors, not collected as JSON.
+        """
+        lines = [
+            "Traceback (most recent call last):",
+            '  File "agent.py", line 12, in run',
+            '    payload = {"args": args}',
+            "KeyError: {'args'}",
+            "INFO still running",
+        ]
+        for line in lines:
+            self.bridge._handle_line(self.state, line)  # pylint: disable=protected-access
+
+        self.assertFalse(self.state["collecting"])
+        self.assertEqual([logging.ERROR] * 4 + [logging.INFO], [level for level, _ in self.logged])
+        self.assertEqual([f"child - {line}" for line in lines], [msg for _, msg in self.logged])
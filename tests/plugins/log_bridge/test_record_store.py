@@ -0,0 +1,143 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+from plugins.log_bridge.record_store import LogRecordStore
+
+
+def make_record(i: int) -> dict:
+    """Return record i of a server that handles one request per ten records."""
+    return {
+        "ts": 1000.0 + i,
+        "level": "ERROR" if i % 7 == 0 else "INFO",
+        "process": "NeuroSanServer",
+        "request_id": f"req-{i // 10}",
+        "source": "HttpServer",
+        "message": f"record {i}",
+        "fields": {},
+    }
+
+
+class TestLogRecordStore(TestCase):
+    """
+    Unit tests for the LogRecordStore class.
+    """
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.directory = self.temp_dir.name
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_query_by_request_time_and_level(self):
+        """
+        Tests that queries return exactly the matching records, in order, including records still buffered.
+        """
+        store = LogRecordStore(self.directory, block_records=8)
+        for i in range(100):
+            store.append(make_record(i))
+
+        self.assertEqual([f"record {i}" for i in range(30, 40)], [r["message"] for r in store.query("req-3")])
+        self.assertEqual([1095.0, 1096.0], [r["ts"] for r in store.query(since=1095, until=1096)])
+        self.assertEqual(
+            [91, 98], [int(r["message"].split()[1]) for r in store.query(since=1090, min_level=logging.ERROR)]
+        )
+        self.assertEqual([], list(store.query("req-404")))
+        store.close()
+
+        # Records survive reopening the store
+        self.assertEqual(100, len(list(LogRecordStore(self.directory).query())))
+
+    def test_segments_roll_over_and_are_retained(self):
+        """
+        Tests that full segments roll over and only max_segments segments and their index rows are kept.
+        """
+        store = LogRecordStore(self.directory, segment_bytes=200, block_records=4, max_segments=2)
+        for i in range(100):
+            store.append(make_record(i))
+        store.flush()
+
+        self.assertEqual(2, len(list(Path(self.directory).glob("*.seg"))))
+        messages = [r["message"] for r in store.query()]
+        self.assertEqual(f"record {99}", messages[-1])
+        self.assertLess(len(messages), 100)
+        self.assertEqual([], list(store.query("req-0")))
+        store.close()
+
+    def test_bridge_stores_rendered_records(self):
+        """
+        Tests that the bridge tees JSON and text records into the store, keeping the other JSON fields.
+        """
+        root_handlers = logging.getLogger().handlers[:]
+        try:
+            bridge = ProcessLogBridge(config={"store": {"enabled": True, "directory": self.directory}})
+            state = bridge._make_stream_state("server", None)  # pylint: disable=protected-access
+            # pylint: disable=protected-access
+            bridge._handle_line(
+                state, '{"message": "hi", "request_id": "abc", "user_id": "u1", "message_type": "Error"}'
+            )
+            bridge._handle_line(state, "WARNING plain text")
+            bridge._record_store.flush()
+        finally:
+            logging.getLogger().handlers[:] = root_handlers
+
+        store = LogRecordStore(self.directory)
+        (json_record,) = store.query("abc")
+        self.assertEqual(
+            ("ERROR", "server", "hi"), (json_record["level"], json_record["process"], json_record["message"])
+        )
+        self.assertEqual({"user_id": "u1", "message_type": "Error"}, json_record["fields"])
+        text_record = list(store.query())[-1]
+        self.assertEqual(
+            ("WARNING", None, None), (text_record["level"], text_record["request_id"], text_record["fields"])
+        )
+
+    def test_lines_skipped_on_the_console_are_stored(self):
+        """
+        Tests that lines the "drop" policy skips on the console still reach the store, stamped when read.
+        """
+        root_handlers = logging.getLogger().handlers[:]
+        try:
+            bridge = ProcessLogBridge(
+                config={
+                    "drain": {"render_queue_size": 1},
+                    "store": {"enabled": True, "directory": self.directory},
+                }
+            )
+            state = bridge._make_stream_state("server", io.StringIO())  # pylint: disable=protected-access
+            # no render thread is running, so the queue stays full after the first batch
+            before = time.time()
+            # pylint: disable=protected-access
+            bridge._dispatch(state, ['{"message": "first", "request_id": "abc"}'])
+            bridge._dispatch(state, ["{", '  "message": "second",', '  "request_id": "abc"', "}", "INFO third"])
+            after = time.time()
+            bridge._record_store.close()
+        finally:
+            logging.getLogger().handlers[:] = root_handlers
+
+        self.assertEqual(5, state["dropped"])
+        records = list(LogRecordStore(self.directory).query())
+        self.assertEqual(["first", "second", "INFO third"], [r["message"] for r in records])
+        self.assertEqual(["abc", "abc", None], [r["request_id"] for r in records])
+        self.assertTrue(all(before <= r["ts"] <= after for r in records))
@@ -0,0 +1,114 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+import io
+import json
+import logging
+import urllib.request
+from unittest import TestCase
+
+from plugins.log_bridge.process_log_bridge import ProcessLogBridge
+from plugins.log_bridge.request_metrics import MetricsServer
+from plugins.log_bridge.request_metrics import RequestMetrics
+
+
+def run_request(metrics: RequestMetrics, request_id: str, start: float, seconds: float, tokens: int):
+    """Feed the log messages of one streaming chat request to the metrics."""
+    reporting = {"token_accounting": {"prompt_tokens": tokens - 10, "completion_tokens": 10, "total_tokens": tokens}}
+    metrics.observe(f"Received a hello_world.StreamingChat request for {request_id}", request_id, now=start)
+    metrics.observe("Request reporting: " + json.dumps(reporting, indent=4), request_id, now=start + seconds)
+    metrics.observe(f"Done with hello_world.StreamingChat request for {request_id}", request_id, now=start + seconds)
+
+
+class TestRequestMetrics(TestCase):
+    """
+    Unit tests for the RequestMetrics class.
+    """
+
+    def test_latency_and_tokens_per_agent(self):
+        """
+        Tests that overlapping requests are timed separately and exported as Prometheus histograms.
+        """
+        metrics = RequestMetrics(window_seconds=100)
+        for i in range(100):
+            run_request(metrics, f"req-{i}", start=1000.0 + i, seconds=0.01 * (i + 1), tokens=100 + i)
+        metrics.observe("unrelated line", None, now=1100.0)
+
+        text = metrics.render_prometheus(now=1100.0)
+
+        labels = 'agent="hello_world",method="StreamingChat"'
+        self.assertIn(f"neuro_san_request_duration_seconds_count{{{labels}}} 100", text)
+        self.assertIn(f'neuro_san_request_duration_seconds_bucket{{{labels},le="0.5"}} 50', text)
+        self.assertIn(f'neuro_san_request_duration_seconds_window{{{labels},quantile="0.95"}} 0.95', text)
+        self.assertIn('neuro_san_request_tokens_sum{agent="hello_world",kind="completion"} 1000', text)
+        self.assertIn('neuro_san_request_tokens_count{agent="hello_world",kind="total"} 100', text)
+        self.assertEqual(
+            "100 requests in the last 100s (1.00/s), latency p50 0.50s p95 0.95s p99 0.99s, 14950 tokens",
+            metrics.summary(now=1100.0),
+        )
+
+    def test_window_expires(self):
+        """
+        Tests that quantiles and the summary only cover the window while the histogram keeps every request.
+        """
+        metrics = RequestMetrics(window_seconds=10)
+        run_request(metrics, "old", start=0.0, seconds=1.0, tokens=100)
+
+        self.assertIsNone(metrics.summary(now=100.0))
+        text = metrics.render_prometheus(now=100.0)
+        self.assertIn('neuro_san_request_duration_seconds_count{agent="hello_world",method="StreamingChat"} 1', text)
+        self.assertNotIn("quantile=", text)
+
+    def test_endpoint(self):
+        """
+        Tests that the endpoint serves the metrics in the Prometheus text format.
+        """
+        metrics = RequestMetrics()
+        run_request(metrics, "req", start=0.0, seconds=1.0, tokens=100)
+        server = MetricsServer(metrics, port=0)
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+                self.assertIn("# TYPE neuro_san_request_duration_seconds histogram", response.read().decode())
+        finally:
+            server.close()
+
+    def test_bridge_observes_lines_skipped_on_the_console(self):
+        """
+        Tests that the bridge feeds the metrics lines that the "drop" policy skips on the console.
+        """
+        root_handlers = logging.getLogger().handlers[:]
+        try:
+            bridge = ProcessLogBridge(
+                config={"drain": {"render_queue_size": 1}, "metrics": {"enabled": True, "port": None}}
+            )
+            state = bridge._make_stream_state("server", io.StringIO())  # pylint: disable=protected-access
+            # no render thread is running, so the queue stays full after the first batch
+            # pylint: disable=protected-access
+            bridge._dispatch(
+                state, ['{"message": "Received a hello_world.StreamingChat request for x", "request_id": "r"}']
+            )
+            bridge._dispatch(
+                state, ['{"message": "Done with hello_world.StreamingChat request for x", "request_id": "r"}']
+            )
+        finally:
+            logging.getLogger().handlers[:] = root_handlers
+
+        self.assertEqual(1, state["dropped"])
+        self.assertIn(
+            'neuro_san_request_duration_seconds_count{agent="hello_world",method="StreamingChat"} 1',
+            bridge._metrics.render_prometheus(),  # pylint: disable=protected-access
+        )
@@ -0,0 +1,158 @@
+# Copyright © 2025 Cognizant Technology Solutions Corp, www.cognizant.com.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# END COPYRIGHT
+
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import Optional
+from unittest import TestCase
+
+from plugins.supervisor.service_supervisor import ServiceSpec
+from plugins.supervisor.service_supervisor import ServiceSupervisor
+from plugins.supervisor.service_supervisor import http_probe
+
+
+class FakeProcess:  # pylint: disable=too-few-public-methods
+    """
+    Stand-in for a subprocess.Popen whose exit code is set by the test.
+    """
+
+    def __init__(self):
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        """Return the exit code, None while running."""
+        return self.returncode
+
+
+class HealthHandler(BaseHTTPRequestHandler):
+    """
+    Answers every GET with 200 OK.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Report healthy."""
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        """Keep test output quiet."""
+
+
+class TestServiceSupervisor(TestCase):
+    """
+    Unit tests for the ServiceSupervisor class.
+    """
+
+    def setUp(self):
+        self.supervisor = ServiceSupervisor(max_restarts=2, initial_backoff=0.01, max_backoff=0.02, poll_interval=0.01)
+
+    def tearDown(self):
+        self.supervisor.stop()
+
+    def test_services_become_ready_concurrently(self):
+        """
+        Tests that slow services are probed side by side rather than one after another.
+        """
+        start = time.monotonic()
+
+        def ready_after(seconds: float):
+            return lambda: time.monotonic() - start >= seconds
+
+        specs = [ServiceSpec(name, FakeProcess, [ready_after(0.3)]) for name in ("server", "client", "phoenix")]
+
+        self.assertTrue(self.supervisor.start_all(specs))
+        self.assertLess(time.monotonic() - start, 0.6)
+        for state in self.supervisor.services.values():
+            self.assertGreaterEqual(state.ready_seconds, 0.3)
+            self.assertGreater(state.probe_attempts, 1)
+
+    def test_exit_before_ready_fails_fast(self):
+        """
+        Tests that a service whose process exits is not probed until its startup timeout.
+        """
+        process = FakeProcess()
+        process.returncode = 1
+
+        start = time.monotonic()
+        ready = self.supervisor.start_all([ServiceSpec("server", lambda: process, [lambda: False], 30.0)])
+
+        self.assertFalse(ready)
+        self.assertLess(time.monotonic() - start, 1.0)
+
+    def test_crashed_service_restarts_until_limit(self):
+        """
+        Tests that a crashing service is restarted at most max_restarts times within the restart window.
+        """
+        processes = []
+
+        def start():
+            processes.append(FakeProcess())
+            return processes[-1]
+
+        self.assertTrue(self.supervisor.start_all([ServiceSpec("server", start, [lambda: True])]))
+        state = self.supervisor.services["server"]
+        deadline = time.monotonic() + 5
+        while not state.failed and time.monotonic() < deadline:
+            processes[-1].returncode = 1
+            time.sleep(0.01)
+
+        self.assertTrue(state.failed)
+        self.assertEqual(3, len(processes))
+
+    def test_stopped_supervisor_does_not_restart(self):
+        """
+        Tests that processes exiting after stop() stay down.
+        """
+        processes = []
+
+        def start():
+            processes.append(FakeProcess())
+            return processes[-1]
+
+        self.supervisor.start_all([ServiceSpec("server", start, [lambda: True])])
+        self.supervisor.stop()
+        processes[0].returncode = -9
+        time.sleep(0.1)
+
+        self.assertEqual(1, len(processes))
+
+
+class TestProbes(TestCase):
+    """
+    Unit tests for the readiness probes.
+    """
+
+    def test_http_probe(self):
+        """
+        Tests that the http probe succeeds against a listening server and fails on a closed port.
+        """
+        server = ThreadingHTTPServer(("127.0.0.1", 0), HealthHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            self.assertTrue(http_probe(f"http://127.0.0.1:{server.server_address[1]}/healthz")())
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            closed_port = sock.getsockname()[1]
+        self.assertFalse(http_probe(f"http://127.0.0.1:{closed_port}/healthz", timeout=0.5)())